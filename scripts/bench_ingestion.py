@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+"""Ingestion throughput benchmark — no Bedrock spend.
+
+Drives EmbeddingService.generate_embeddings → AuroraClient.insert_chunks end-to-end with:
+- a fake bedrock-runtime client (configurable latency, throttle rate, deterministic vectors)
+- a synthetic BDA result.json served from moto S3 (or a local S3 endpoint)
+- the Docker Compose pgvector database (real inserts, real HNSW maintenance)
+
+Reports entities/sec, Bedrock calls, throttles, DB time and peak RSS per run.
+
+Usage:
+    docker compose up -d && uv run alembic upgrade head
+    uv run python scripts/bench_ingestion.py --entities 500 --latency-ms 40 --throttle-rate 0.02
+    uv run python scripts/bench_ingestion.py --entities 2000 --runs 3 --json
+"""
+
+import argparse
+import hashlib
+import io
+import json
+import logging
+import math
+import random
+import resource
+import statistics
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+import boto3
+import structlog
+from botocore.exceptions import ClientError
+
+# Add src to path for core imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from core.config import get_config
+from core.db.aurora import AuroraClient
+from core.services.embedding import EmbeddingService
+
+_BUCKET = "trip-cortex-bench"
+_MODEL_ID = "amazon.nova-2-multimodal-embeddings-v1:0"
+
+
+class FakeBedrockRuntime:
+    """Stand-in for the bedrock-runtime client's invoke_model used by Nova MME.
+
+    Vectors are derived from a hash of the request body, so the same entity always
+    embeds to the same unit vector across runs.
+    """
+
+    def __init__(
+        self,
+        latency_ms: float = 50.0,
+        jitter_ms: float = 10.0,
+        throttle_rate: float = 0.0,
+        dimension: int = 1024,
+        seed: int = 7,
+    ) -> None:
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.throttle_rate = throttle_rate
+        self.dimension = dimension
+        self.calls = 0
+        self.throttles = 0
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def invoke_model(self, modelId: str, body: str, accept: str, contentType: str) -> dict[str, Any]:
+        with self._lock:
+            self.calls += 1
+            delay = max(0.0, self.latency_ms + self._rng.uniform(-self.jitter_ms, self.jitter_ms))
+            throttled = self._rng.random() < self.throttle_rate
+            if throttled:
+                self.throttles += 1
+        time.sleep(delay / 1000)
+        if throttled:
+            raise ClientError(
+                {"Error": {"Code": "ThrottlingException", "Message": "Rate exceeded"}},
+                "InvokeModel",
+            )
+        payload = {"embeddings": [{"embeddingType": "TEXT", "embedding": self._vector(body)}]}
+        return {"body": io.BytesIO(json.dumps(payload).encode())}
+
+    def _vector(self, body: str) -> list[float]:
+        rng = random.Random(hashlib.sha256(body.encode()).digest())
+        values = [rng.gauss(0.0, 1.0) for _ in range(self.dimension)]
+        norm = math.sqrt(sum(v * v for v in values)) or 1.0
+        return [v / norm for v in values]
+
+
+def build_bda_result(entities: int, table_ratio: float, figure_ratio: float, text_chars: int, seed: int) -> dict:
+    """Build a synthetic BDA standard-output document with the given entity mix."""
+    rng = random.Random(seed)
+    words = ("travel", "policy", "economy", "business", "approval", "budget", "airline", "booking", "advance", "fare")
+    elements: list[dict[str, Any]] = []
+    pages = max(1, entities // 8)
+    for page in range(pages):
+        elements.append({"id": f"page-{page}", "type": "PAGE", "page_indices": [page]})
+
+    for i in range(entities):
+        text = " ".join(rng.choice(words) for _ in range(max(1, text_chars // 7)))[:text_chars]
+        location = [{"page_index": i % pages, "bounding_box": {"left": 0.1, "top": 0.1, "width": 0.8, "height": 0.1}}]
+        roll = rng.random()
+        if roll < figure_ratio:
+            elements.append(
+                {
+                    "id": f"entity-{i}",
+                    "type": "FIGURE",
+                    "sub_type": "CHART",
+                    "title": f"Figure {i}",
+                    "summary": text,
+                    "reading_order": i,
+                    "locations": location,
+                }
+            )
+        elif roll < figure_ratio + table_ratio:
+            elements.append(
+                {
+                    "id": f"entity-{i}",
+                    "type": "TABLE",
+                    "title": f"Table {i}",
+                    "representation": {"markdown": f"| class | limit |\n|---|---|\n| {text} | $500 |", "text": text},
+                    "reading_order": i,
+                    "locations": location,
+                }
+            )
+        else:
+            elements.append(
+                {
+                    "id": f"entity-{i}",
+                    "type": "TEXT",
+                    "sub_type": "PARAGRAPH",
+                    "title": f"Section {i // 10}",
+                    "representation": {"markdown": text, "text": text},
+                    "reading_order": i,
+                    "locations": location,
+                }
+            )
+    return {"metadata": {"number_of_pages": pages}, "elements": elements}
+
+
+class _TimedAuroraClient(AuroraClient):
+    """AuroraClient that accumulates wall time spent in DB writes."""
+
+    db_seconds = 0.0
+
+    def insert_chunks(self, chunks: list[dict[str, Any]]) -> int:
+        start = time.perf_counter()
+        try:
+            return super().insert_chunks(chunks)
+        finally:
+            self.db_seconds += time.perf_counter() - start
+
+    def update_policy_status(self, policy_id: str, status: str, total_chunks: int) -> None:
+        start = time.perf_counter()
+        try:
+            super().update_policy_status(policy_id, status, total_chunks)
+        finally:
+            self.db_seconds += time.perf_counter() - start
+
+
+def _peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS reports bytes
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _create_policy(aurora: AuroraClient) -> str:
+    conn = aurora._require_connection()
+    with conn.cursor() as cur:
+        cur.execute(
+            "INSERT INTO policies (source_s3_uri, file_name, uploaded_by, status) VALUES (%s, %s, %s, %s) RETURNING id",
+            (f"s3://{_BUCKET}/uploads/bench.pdf", "bench.pdf", "bench", "processing"),
+        )
+        row = cur.fetchone()
+    conn.commit()
+    return str(row[0]) if row else ""
+
+
+def _delete_policy(aurora: AuroraClient, policy_id: str) -> None:
+    conn = aurora._require_connection()
+    with conn.cursor() as cur:
+        cur.execute("DELETE FROM policies WHERE id = %s", (policy_id,))
+    conn.commit()
+
+
+def run_once(args: argparse.Namespace, s3_client: Any, bda_result: dict) -> dict[str, Any]:
+    """Run one ingestion pass and return its metrics."""
+    fake = FakeBedrockRuntime(args.latency_ms, args.jitter_ms, args.throttle_rate, seed=args.seed)
+    aurora = _TimedAuroraClient(get_config())
+    aurora.connect()
+    policy_id = _create_policy(aurora)
+    try:
+        output_prefix = f"bda-output/{policy_id}/job"
+        s3_client.put_object(
+            Bucket=_BUCKET,
+            Key=f"{output_prefix}/0/standard_output/0/result.json",
+            Body=json.dumps(bda_result).encode(),
+        )
+        service = EmbeddingService(fake, s3_client, aurora, _MODEL_ID)
+
+        start = time.perf_counter()
+        result = service.generate_embeddings(policy_id, f"s3://{_BUCKET}/{output_prefix}/job_metadata.json")
+        wall = time.perf_counter() - start
+    finally:
+        if not args.keep:
+            _delete_policy(aurora, policy_id)
+        aurora.disconnect()
+
+    processed = result.chunks_created + result.chunks_failed
+    return {
+        "policy_id": policy_id,
+        "entities": processed,
+        "chunks_created": result.chunks_created,
+        "chunks_failed": result.chunks_failed,
+        "wall_s": round(wall, 3),
+        "entities_per_s": round(processed / wall, 1) if wall else 0.0,
+        "bedrock_calls": fake.calls,
+        "bedrock_throttles": fake.throttles,
+        "db_s": round(aurora.db_seconds, 3),
+        "db_share": round(aurora.db_seconds / wall, 3) if wall else 0.0,
+        "peak_rss_mb": round(_peak_rss_mb(), 1),
+    }
+
+
+def _print_report(runs: list[dict[str, Any]]) -> None:
+    cols = ["entities", "wall_s", "entities_per_s", "bedrock_calls", "bedrock_throttles", "db_s", "peak_rss_mb"]
+    print(" | ".join(f"{c:>17}" for c in ["run"] + cols))
+    for i, run in enumerate(runs, start=1):
+        print(" | ".join(f"{v:>17}" for v in [i] + [run[c] for c in cols]))
+    if len(runs) > 1:
+        rates = [r["entities_per_s"] for r in runs]
+        print()
+        print(f"entities/sec  median={statistics.median(rates):.1f}  min={min(rates):.1f}  max={max(rates):.1f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--entities", type=int, default=200, help="BDA entities in the synthetic document")
+    parser.add_argument("--table-ratio", type=float, default=0.15)
+    parser.add_argument("--figure-ratio", type=float, default=0.05)
+    parser.add_argument("--text-chars", type=int, default=600, help="Approximate characters per entity")
+    parser.add_argument("--latency-ms", type=float, default=50.0, help="Mean fake Bedrock latency per call")
+    parser.add_argument("--jitter-ms", type=float, default=10.0)
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="Fraction of calls that throttle (0-1)")
+    parser.add_argument("--runs", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--s3-endpoint-url", default=None, help="Use a local S3 (e.g. MinIO) instead of moto")
+    parser.add_argument("--keep", action="store_true", help="Keep the benchmark policy rows after the run")
+    parser.add_argument("--json", action="store_true", help="Emit results as JSON")
+    parser.add_argument("--verbose", action="store_true", help="Show service INFO/WARNING logs")
+    args = parser.parse_args()
+
+    structlog.configure(
+        wrapper_class=structlog.make_filtering_bound_logger(logging.INFO if args.verbose else logging.ERROR)
+    )
+
+    bda_result = build_bda_result(args.entities, args.table_ratio, args.figure_ratio, args.text_chars, args.seed)
+    config = get_config()
+
+    def _run_all(s3_client: Any) -> list[dict[str, Any]]:
+        try:
+            s3_client.create_bucket(Bucket=_BUCKET)
+        except ClientError as e:
+            if e.response["Error"]["Code"] not in ("BucketAlreadyOwnedByYou", "BucketAlreadyExists"):
+                raise
+        return [run_once(args, s3_client, bda_result) for _ in range(args.runs)]
+
+    if args.s3_endpoint_url:
+        runs = _run_all(boto3.client("s3", endpoint_url=args.s3_endpoint_url, region_name=config.aws_region))
+    else:
+        from moto import mock_aws
+
+        with mock_aws():
+            runs = _run_all(boto3.client("s3", region_name="us-east-1"))
+
+    if args.json:
+        print(json.dumps({"params": vars(args), "runs": runs}, indent=2))
+    else:
+        _print_report(runs)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""Plan-parsing microbenchmark over recorded model outputs — no Bedrock spend.
+
+Times the single-pass parser (ReasoningService._parse_plan) against the previous two-stage path
+(json.loads to find the object, json.loads again, then BookingPlan.model_validate) on every
+output in tests/payloads/model_outputs.jsonl, and reports which outputs each path accepts.
+An output the legacy path rejects is a retry the model would have had to make.
+
+Usage:
+    uv run python scripts/bench_plan_parsing.py
+    uv run python scripts/bench_plan_parsing.py --number 5000 --json
+"""
+
+import argparse
+import json
+import logging
+import sys
+import timeit
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any
+
+import structlog
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from core.errors import ReasoningError
+from core.models.booking import BookingPlan
+from core.services.reasoning import ReasoningService
+
+CORPUS = Path(__file__).parent.parent / "tests" / "payloads" / "model_outputs.jsonl"
+
+
+def load_corpus(path: Path = CORPUS) -> list[dict[str, Any]]:
+    """Recorded outputs, re-dated so departure dates are always in the future."""
+    departure = (date.today() + timedelta(days=30)).isoformat()
+    rows = []
+    for line in path.read_text().splitlines():
+        if line.strip():
+            row = json.loads(line)
+            row["text"] = row["text"].replace("__DEPARTURE_DATE__", departure)
+            rows.append(row)
+    return rows
+
+
+def legacy_parse(text: str) -> BookingPlan:
+    """The pre-single-pass path: whole-block json.loads, brace-depth fallback, decode again, validate."""
+    raw = text.strip()
+    candidate = None
+    if raw.startswith("{"):
+        try:
+            json.loads(raw)
+            candidate = raw
+        except json.JSONDecodeError:
+            pass
+    if candidate is None:
+        start = raw.find("{")
+        if start == -1:
+            raise ValueError("no object")
+        depth = 0
+        for i in range(start, len(raw)):
+            if raw[i] == "{":
+                depth += 1
+            elif raw[i] == "}":
+                depth -= 1
+                if depth == 0:
+                    candidate = raw[start : i + 1]
+                    json.loads(candidate)
+                    break
+        if candidate is None:
+            raise ValueError("unclosed object")
+    return BookingPlan.model_validate(json.loads(candidate))
+
+
+def _accepts(parse: Any, text: str) -> bool:
+    try:
+        parse(text)
+        return True
+    except (ValueError, ReasoningError):
+        return False
+
+
+def bench(rows: list[dict[str, Any]], number: int) -> list[dict[str, Any]]:
+    results = []
+    for row in rows:
+        text = row["text"]
+        entry: dict[str, Any] = {"name": row["name"], "expect": row["expect"]}
+        for label, parse in (("legacy", legacy_parse), ("single_pass", ReasoningService._parse_plan)):
+            ok = _accepts(parse, text)
+            seconds = timeit.timeit(lambda: _accepts(parse, text), number=number)  # noqa: B023
+            entry[f"{label}_ok"] = ok
+            entry[f"{label}_us"] = round(seconds / number * 1e6, 2)
+        results.append(entry)
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--number", type=int, default=2000, help="Parses timed per output and path")
+    parser.add_argument("--json", action="store_true", help="Emit results as JSON")
+    args = parser.parse_args()
+    # Per-parse log lines would dominate the timings.
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.CRITICAL))
+
+    results = bench(load_corpus(), args.number)
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{'output':<26}{'expect':<10}{'legacy µs':>12}{'ok':>5}{'single µs':>12}{'ok':>5}{'speedup':>9}")
+    for r in results:
+        speedup = r["legacy_us"] / r["single_pass_us"] if r["single_pass_us"] else 0.0
+        print(
+            f"{r['name']:<26}{r['expect']:<10}{r['legacy_us']:>12.2f}{'y' if r['legacy_ok'] else 'n':>5}"
+            f"{r['single_pass_us']:>12.2f}{'y' if r['single_pass_ok'] else 'n':>5}{speedup:>8.2f}x"
+        )
+    retries_saved = sum(1 for r in results if r["single_pass_ok"] and not r["legacy_ok"])
+    print(f"\nOutputs accepted only by the single-pass parser (retries saved): {retries_saved}")
+
+
+if __name__ == "__main__":
+    main()
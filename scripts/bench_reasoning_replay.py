@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""Offline reasoning benchmark — replays recorded Converse exchanges, no Bedrock spend.
+
+Runs every query in tests/replay/fixtures/queries.jsonl through
+ReasoningService.generate_booking_plan → validate_plan → the reasoning audit write, with
+bedrock-runtime replaced by ReplayBedrockClient and DynamoDB by an in-memory stub. Reports CPU
+time per stage, parse-failure rate, escalations and exhausted ladders, so prompt, context and
+parser changes can be checked for speed regressions.
+
+With --record, the same queries run against the real bedrock-runtime client (AWS credentials
+and model access required) and every exchange is appended, scrubbed, to --cassette.
+
+Usage:
+    uv run python scripts/bench_reasoning_replay.py
+    uv run python scripts/bench_reasoning_replay.py --runs 50 --streaming --json
+    uv run python scripts/bench_reasoning_replay.py --record --cassette /tmp/converse.jsonl
+"""
+
+import argparse
+import json
+import logging
+import statistics
+import sys
+import time
+from datetime import date
+from pathlib import Path
+from typing import Any
+
+import structlog
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.errors import ReasoningError
+from core.models.booking import ReasoningRequest
+from core.services.audit import build_reasoning_audit_entry, write_audit_log
+from core.services.plan_validation import validate_plan
+from core.services.policy_rules import extract_policy_rules
+from core.services.reasoning import ReasoningService
+from tests.replay.bedrock import RecordingBedrockClient, ReplayBedrockClient, resolve_dates
+
+FIXTURES = Path(__file__).parent.parent / "tests" / "replay" / "fixtures"
+MODEL_ID = "us.amazon.nova-2-lite-v1:0"
+
+
+class _MemoryDynamo:
+    def __init__(self) -> None:
+        self.items: list[dict[str, Any]] = []
+
+    def put_item(self, TableName: str, Item: dict[str, Any]) -> None:  # noqa: N803 — boto3 signature
+        self.items.append(Item)
+
+
+def load_queries(path: Path) -> list[dict[str, Any]]:
+    today = date.today()
+    return [resolve_dates(json.loads(line), today) for line in path.read_text().splitlines() if line.strip()]
+
+
+def _request(query: dict[str, Any]) -> ReasoningRequest:
+    return ReasoningRequest(
+        booking_id=f"replay-{query['name']}",
+        employee_id="emp-replay",
+        user_query=query["user_query"],
+        context_text=query["context_text"],
+        confidence_level=query["confidence_level"],
+        max_similarity=query["max_similarity"],
+        policy_rules=extract_policy_rules(query["context_text"]),
+    )
+
+
+def run_query(
+    service: ReasoningService, client: ReplayBedrockClient, query: dict[str, Any], dynamo: _MemoryDynamo
+) -> dict[str, Any]:
+    """One pass through reasoning, validation and audit, with CPU time per stage."""
+    request = _request(query)
+    row: dict[str, Any] = {"name": query["name"]}
+    calls_before = len(client.calls)
+
+    cpu = time.process_time()
+    try:
+        result = service.generate_booking_plan(request)
+    except ReasoningError:
+        # Every attempt of an exhausted ladder failed; replayed calls only fail on the plan itself.
+        calls = len(client.calls) - calls_before
+        row.update(
+            reasoning_cpu_ms=(time.process_time() - cpu) * 1000, exhausted=True, attempts=calls, parse_failures=calls
+        )
+        return row
+    row["reasoning_cpu_ms"] = (time.process_time() - cpu) * 1000
+
+    cpu = time.process_time()
+    validated = validate_plan(result, request.policy_rules)
+    row["validation_cpu_ms"] = (time.process_time() - cpu) * 1000
+
+    cpu = time.process_time()
+    write_audit_log(
+        dynamo,
+        "AuditLog",
+        build_reasoning_audit_entry(
+            booking_id=validated.booking_id,
+            employee_id=validated.employee_id,
+            model_id=validated.model_id,
+            thinking_effort=validated.thinking_effort,
+            latency_ms=validated.latency_ms,
+            retry_count=validated.retry_count,
+            escalated=validated.escalated,
+            plan_confidence=validated.plan.confidence,
+            plan_intent=validated.plan.intent,
+            warnings_count=len(validated.plan.warnings),
+            structured_output=validated.structured_output,
+            schema_failure_count=validated.schema_failure_count,
+            hedged=validated.hedged,
+            cache_hit=validated.cache_hit,
+            attempts=[a.model_dump() for a in validated.attempts],
+            routed=validated.routed,
+        ),
+    )
+    row["audit_cpu_ms"] = (time.process_time() - cpu) * 1000
+    row.update(
+        exhausted=False,
+        effort=validated.thinking_effort,
+        escalated=validated.escalated,
+        attempts=len(validated.attempts),
+        parse_failures=sum(1 for a in validated.attempts if a.failure_class == "invalid_plan"),
+    )
+    return row
+
+
+def _pct(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))] if ordered else 0.0
+
+
+def summarize(rows: list[dict[str, Any]], client: ReplayBedrockClient) -> dict[str, Any]:
+    completed = [r for r in rows if not r["exhausted"]]
+    summary: dict[str, Any] = {"query_runs": len(rows), "converse_calls": len(client.calls)}
+    for stage in ("reasoning", "validation", "audit"):
+        values = [r[f"{stage}_cpu_ms"] for r in rows if f"{stage}_cpu_ms" in r]
+        summary[f"{stage}_cpu_ms"] = {
+            "mean": round(statistics.fmean(values), 3) if values else 0.0,
+            "p50": round(_pct(values, 50), 3),
+            "p95": round(_pct(values, 95), 3),
+        }
+    attempts = sum(r["attempts"] for r in rows)
+    parse_failures = sum(r["parse_failures"] for r in rows)
+    summary.update(
+        attempts=attempts,
+        parse_failures=parse_failures,
+        parse_failure_rate=round(parse_failures / attempts, 4) if attempts else 0.0,
+        escalations=sum(1 for r in completed if r["escalated"]),
+        exhausted=sum(1 for r in rows if r["exhausted"]),
+    )
+    return summary
+
+
+def record(queries: list[dict[str, Any]], cassette: Path) -> None:
+    import boto3
+
+    client = RecordingBedrockClient(boto3.client("bedrock-runtime"), cassette)
+    service = ReasoningService(client, MODEL_ID)
+    for query in queries:
+        try:
+            result = service.generate_booking_plan(_request(query))
+            print(f"✓ {query['name']}: {result.thinking_effort}, {len(result.attempts)} attempt(s)")
+        except ReasoningError as e:
+            print(f"✗ {query['name']}: {e.message}")
+    print(f"\nAppended exchanges to {cassette}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--cassette", type=Path, default=FIXTURES / "converse.jsonl")
+    parser.add_argument("--queries", type=Path, default=FIXTURES / "queries.jsonl")
+    parser.add_argument("--match", choices=("query", "exact"), default="query")
+    parser.add_argument("--streaming", action="store_true", help="Replay through converse_stream")
+    parser.add_argument("--runs", type=int, default=20, help="Passes over the query corpus")
+    parser.add_argument("--record", action="store_true", help="Record against Bedrock instead of replaying")
+    parser.add_argument("--json", action="store_true", help="Emit the summary as JSON")
+    args = parser.parse_args()
+    # Per-attempt log lines would dominate the timings.
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.CRITICAL))
+
+    queries = load_queries(args.queries)
+    if args.record:
+        record(queries, args.cassette)
+        return
+
+    client = ReplayBedrockClient(args.cassette, match=args.match)
+    service = ReasoningService(client, MODEL_ID, streaming=args.streaming)
+    dynamo = _MemoryDynamo()
+    rows = []
+    for _ in range(args.runs):
+        for query in queries:
+            rows.append(run_query(service, client, query, dynamo))
+        client.rewind()
+    summary = summarize(rows, client)
+
+    if args.json:
+        print(json.dumps(summary, indent=2))
+        return
+    print(f"{len(queries)} queries × {args.runs} runs ({'streaming' if args.streaming else 'converse'})\n")
+    print(f"{'stage':<12}{'mean ms':>10}{'p50 ms':>10}{'p95 ms':>10}")
+    for stage in ("reasoning", "validation", "audit"):
+        s = summary[f"{stage}_cpu_ms"]
+        print(f"{stage:<12}{s['mean']:>10.3f}{s['p50']:>10.3f}{s['p95']:>10.3f}")
+    print(
+        f"\nattempts {summary['attempts']}, parse failures {summary['parse_failures']} "
+        f"({summary['parse_failure_rate']:.1%}), escalations {summary['escalations']}, "
+        f"exhausted {summary['exhausted']}"
+    )
+
+
+if __name__ == "__main__":
+    main()
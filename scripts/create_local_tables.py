@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 """Create DynamoDB tables for local development.
 
-This script creates the three DynamoDB tables needed for local development and testing, configured
+This script creates the DynamoDB tables needed for local development and testing, configured
 against DynamoDB Local. It matches the SAM template schemas exactly.
 
 Usage:
@@ -100,6 +100,56 @@ def create_audit_log_table(dynamodb):
             raise
 
 
+def create_plan_cache_table(dynamodb):
+    """Create TripCortexPlanCache table with TTL."""
+    try:
+        dynamodb.create_table(
+            TableName="TripCortexPlanCache",
+            KeySchema=[
+                {"AttributeName": "cacheKey", "KeyType": "HASH"},
+            ],
+            AttributeDefinitions=[
+                {"AttributeName": "cacheKey", "AttributeType": "S"},
+            ],
+            BillingMode="PAY_PER_REQUEST",
+        )
+        dynamodb.update_time_to_live(
+            TableName="TripCortexPlanCache",
+            TimeToLiveSpecification={"Enabled": True, "AttributeName": "ttl"},
+        )
+        print("✓ Created TripCortexPlanCache table")
+    except ClientError as e:
+        if e.response["Error"]["Code"] == "ResourceInUseException":
+            print("✓ TripCortexPlanCache table already exists")
+        else:
+            raise
+
+
+def create_flight_search_cache_table(dynamodb):
+    """Create TripCortexFlightSearchCache table with TTL."""
+    try:
+        dynamodb.create_table(
+            TableName="TripCortexFlightSearchCache",
+            KeySchema=[
+                {"AttributeName": "cacheKey", "KeyType": "HASH"},
+            ],
+            AttributeDefinitions=[
+                {"AttributeName": "cacheKey", "AttributeType": "S"},
+            ],
+            BillingMode="PAY_PER_REQUEST",
+        )
+        dynamodb.update_time_to_live(
+            TableName="TripCortexFlightSearchCache",
+            TimeToLiveSpecification={"Enabled": True, "AttributeName": "ttl"},
+        )
+        print("✓ Created TripCortexFlightSearchCache table")
+    except ClientError as e:
+        if e.response["Error"]["Code"] == "ResourceInUseException":
+            print("✓ TripCortexFlightSearchCache table already exists")
+        else:
+            raise
+
+
 def main():
     """Create all DynamoDB tables."""
     config = get_config()
@@ -121,6 +171,8 @@ def main():
     create_bookings_table(dynamodb)
     create_connections_table(dynamodb)
     create_audit_log_table(dynamodb)
+    create_plan_cache_table(dynamodb)
+    create_flight_search_cache_table(dynamodb)
     
     print()
     print("✅ All DynamoDB tables ready")
@@ -0,0 +1,50 @@
+"""add_policy_rules_table
+
+Revision ID: add_policy_rules
+Revises: cb9fe2afb656
+Create Date: 2026-10-19 10:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "add_policy_rules"
+down_revision: Union[str, Sequence[str], None] = "cb9fe2afb656"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "policy_rules",
+        sa.Column("id", sa.UUID(), server_default=sa.text("gen_random_uuid()"), nullable=False),
+        sa.Column("policy_id", sa.UUID(), nullable=False),
+        sa.Column("policy_version", sa.Integer(), nullable=False),
+        sa.Column("rule_type", sa.String(length=30), nullable=False),
+        sa.Column("cabin_class", sa.String(length=20), nullable=True),
+        sa.Column("value_numeric", sa.Numeric(precision=12, scale=2), nullable=True),
+        sa.Column("value_text", sa.Text(), nullable=True),
+        sa.Column("section_title", sa.String(length=255), nullable=True),
+        sa.Column("source_page", sa.Integer(), nullable=True),
+        sa.Column("created_at", postgresql.TIMESTAMP(timezone=True), server_default=sa.text("NOW()"), nullable=False),
+        sa.CheckConstraint(
+            "rule_type IN ('budget_cap', 'cabin_eligibility', 'preferred_vendor', 'advance_booking')",
+            name="chk_policy_rules_type",
+        ),
+        sa.ForeignKeyConstraint(["policy_id"], ["policies.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("idx_policy_rules_policy_version", "policy_rules", ["policy_id", "policy_version"], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("idx_policy_rules_policy_version", table_name="policy_rules")
+    op.drop_table("policy_rules")
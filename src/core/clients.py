@@ -6,13 +6,21 @@ from typing import TYPE_CHECKING, Any
 import boto3
 from botocore.config import Config as BotocoreConfig
 
-from core.config import get_config
+from core.config import Config, get_config
 
 if TYPE_CHECKING:
+    from core.services.attempt_scheduler import AttemptScheduler
     from core.services.circuit_breaker import CircuitBreakerService
+    from core.services.claim_check import ClaimCheckStore
+    from core.services.flexible_search import FlexibleSearch
+    from core.services.flight_search_cache import FlightSearchCache
+    from core.services.plan_cache import PlanCache
     from core.services.policy_retrieval import PolicyRetrievalService
+    from core.services.portal_client import PortalClient
+    from core.services.progress import ProgressNotifier, QueuedProgressNotifier
     from core.services.query_embedding import QueryEmbeddingService
     from core.services.reasoning import ReasoningService
+    from core.services.reasoning_router import ReasoningRouter
 
 
 @lru_cache(maxsize=1)
@@ -48,6 +56,12 @@ def get_sfn_client() -> Any:
     return boto3.client("stepfunctions", region_name=config.aws_region)
 
 
+@lru_cache(maxsize=1)
+def get_sqs_client() -> Any:
+    config = get_config()
+    return boto3.client("sqs", region_name=config.aws_region)
+
+
 @lru_cache(maxsize=1)
 def get_bedrock_runtime_client() -> Any:
     config = get_config()
@@ -74,6 +88,95 @@ def get_acr_client() -> Any:
     )
 
 
+@lru_cache(maxsize=1)
+def get_portal_client() -> "PortalClient":
+    """Shared across invocations so searches reuse the pooled keep-alive connection to the portal."""
+    from core.services.portal_client import PortalClient
+
+    config = get_config()
+    return PortalClient(
+        config.dummy_portal_url,
+        connect_timeout=config.portal_connect_timeout_s,
+        read_timeout=config.portal_read_timeout_s,
+        max_connections=config.portal_max_connections,
+    )
+
+
+@lru_cache(maxsize=1)
+def get_flight_search() -> "PortalClient | FlightSearchCache":
+    """Portal client, behind the shared search cache when FLIGHT_SEARCH_CACHE is on."""
+    from core.services.flight_search_cache import FlightSearchCache
+
+    config = get_config()
+    if not config.flight_search_cache:
+        return get_portal_client()
+    return FlightSearchCache(
+        get_portal_client(),
+        get_dynamo_client() if config.flight_search_cache_table else None,
+        config.flight_search_cache_table,
+        fresh_seconds=config.flight_search_fresh_seconds,
+        max_stale_seconds=config.flight_search_max_stale_seconds,
+    )
+
+
+def get_prefetch_searcher() -> "PortalClient | FlightSearchCache | None":
+    """Searcher for speculative prefetches, or None unless FLIGHT_SEARCH_PREFETCH is on.
+
+    A prefetch only pays off through the shared cache tier, since InvokeFlightSearch runs in
+    another container, so the cache and its table are required too.
+    """
+    config = get_config()
+    if not (config.flight_search_prefetch and config.flight_search_cache and config.flight_search_cache_table):
+        return None
+    return get_flight_search()
+
+
+def get_flexible_search() -> "FlexibleSearch | None":
+    """FlexibleSearch when FLIGHT_SEARCH_FLEX_DAYS or FLIGHT_SEARCH_NEARBY_AIRPORTS is set, else None."""
+    from core.services.flexible_search import NEARBY_AIRPORTS, FlexibleSearch
+
+    config = get_config()
+    if config.flight_search_flex_days <= 0 and not config.flight_search_nearby_airports:
+        return None
+    return FlexibleSearch(
+        flex_days=config.flight_search_flex_days,
+        nearby_airports=NEARBY_AIRPORTS if config.flight_search_nearby_airports else None,
+        budget_s=config.flight_search_budget_s,
+        max_workers=config.portal_max_connections,
+    )
+
+
+@lru_cache(maxsize=1)
+def get_claim_check_store() -> "ClaimCheckStore":
+    """One store per container, so claims resolved by a warm Lambda stay cached across invocations."""
+    from core.services.claim_check import ClaimCheckStore
+
+    config = get_config()
+    return ClaimCheckStore(get_s3_client(), config.claim_check_bucket, config.claim_check_threshold_bytes)
+
+
+def get_progress_notifier(
+    connection_id: str | None, booking_id: str, employee_id: str, stage: int
+) -> "ProgressNotifier | QueuedProgressNotifier | None":
+    """Queued notifier when PROGRESS_QUEUE_URL is set, direct WebSocket notifier otherwise.
+
+    stage is the workflow stage (core.services.progress.STAGE_*) the calling step reports.
+    None when there is nowhere to deliver to — no connection id, or neither a queue nor an endpoint.
+    """
+    from core.services.progress import ProgressNotifier, QueuedProgressNotifier
+
+    config = get_config()
+    if not connection_id:
+        return None
+    if config.progress_queue_url:
+        return QueuedProgressNotifier(
+            get_sqs_client(), config.progress_queue_url, connection_id, booking_id, employee_id, stage
+        )
+    if config.websocket_endpoint:
+        return ProgressNotifier(get_apigw_client(), connection_id, booking_id)
+    return None
+
+
 def get_query_embedding_service() -> "QueryEmbeddingService":
     from core.services.query_embedding import QueryEmbeddingService
 
@@ -91,9 +194,65 @@ def get_policy_retrieval_service() -> "PolicyRetrievalService":
 
 def get_reasoning_service() -> "ReasoningService":
     from core.services.reasoning import ReasoningService
+    from core.services.rule_planner import RulePlanner
 
     config = get_config()
-    return ReasoningService(get_bedrock_runtime_client(), config.nova_lite_model_id)
+    return ReasoningService(
+        get_bedrock_runtime_client(),
+        config.nova_lite_model_id,
+        structured_output=config.reasoning_structured_output,
+        streaming=config.reasoning_streaming,
+        hedging=config.reasoning_hedging,
+        hedge_percentile=config.reasoning_hedge_percentile,
+        hedge_default_ms=config.reasoning_hedge_default_ms,
+        scheduler=get_attempt_scheduler(),
+        prompt_caching=config.reasoning_prompt_caching,
+        plan_cache=get_plan_cache(),
+        rule_planner=RulePlanner(config.rule_planner_min_confidence) if config.reasoning_rule_planner else None,
+        router=_reasoning_router(config),
+    )
+
+
+def _reasoning_router(config: Config) -> "ReasoningRouter | None":
+    from core.services.reasoning_router import ReasoningRouter
+
+    if not config.reasoning_routing:
+        return None
+    return ReasoningRouter(
+        fast_model_id=config.reasoning_fast_model_id or None,
+        max_query_chars=config.routing_max_query_chars,
+        min_similarity=config.routing_min_similarity,
+        min_plan_confidence=config.routing_min_plan_confidence,
+    )
+
+
+def get_plan_cache() -> "PlanCache | None":
+    """PlanCache for the configured table, or None when PLAN_CACHE_TABLE is unset."""
+    from core.services.plan_cache import PlanCache
+
+    config = get_config()
+    if not config.plan_cache_table:
+        return None
+    return PlanCache(get_dynamo_client(), config.plan_cache_table, config.plan_cache_ttl_seconds)
+
+
+@lru_cache(maxsize=1)
+def get_attempt_scheduler() -> "AttemptScheduler":
+    """Shared across invocations so attempt estimates build on this container's recent history.
+
+    With REASONING_LATENCY_PERSIST, history is also shared through the plan cache table.
+    """
+    from core.services.attempt_scheduler import AttemptScheduler, DynamoLatencyStore
+
+    config = get_config()
+    store = None
+    if config.reasoning_latency_persist and config.plan_cache_table:
+        store = DynamoLatencyStore(get_dynamo_client(), config.plan_cache_table, config.nova_lite_model_id)
+    return AttemptScheduler(
+        percentile=config.reasoning_deadline_percentile,
+        margin_ms=config.reasoning_deadline_margin_ms,
+        store=store,
+    )
 
 
 def get_circuit_breaker_service(
@@ -38,16 +38,53 @@ class Config(BaseModel):
     clerk_secret_key: str = ""
     environment: str
     websocket_endpoint: str = ""
+    progress_queue_url: str = ""
     bda_project_arn: str = ""
     bda_profile_arn: str = ""
     ingestion_workflow_arn: str = ""
     booking_workflow_arn: str = ""
+    fused_retrieval: bool = False
     policy_bucket: str = ""
+    claim_check_bucket: str = ""
+    claim_check_threshold_bytes: int = 32 * 1024
+    embedding_archive_enabled: bool = True
     hnsw_ef_search: int = 40
+    bulk_load_threshold: int = 2000
+    bulk_load_rebuild_indexes: bool = False
+    bulk_maintenance_work_mem: str = "1GB"
+    bulk_maintenance_workers: int = 4
     similarity_threshold: float = 0.65
     high_confidence_threshold: float = 0.75
     retrieval_top_k: int = 5
+    reasoning_structured_output: bool = False
+    reasoning_streaming: bool = False
+    reasoning_hedging: bool = False
+    reasoning_hedge_percentile: float = 90.0
+    reasoning_hedge_default_ms: float = 20_000.0
+    reasoning_prompt_caching: bool = True
+    reasoning_rule_planner: bool = False
+    rule_planner_min_confidence: float = 0.9
+    reasoning_routing: bool = False
+    reasoning_fast_model_id: str = ""
+    routing_max_query_chars: int = 160
+    routing_min_similarity: float = 0.5
+    routing_min_plan_confidence: float = 0.7
+    reasoning_deadline_percentile: float = 90.0
+    reasoning_deadline_margin_ms: float = 5_000.0
+    reasoning_latency_persist: bool = False
     dummy_portal_url: str = ""
+    portal_connect_timeout_s: float = 3.0
+    portal_read_timeout_s: float = 10.0
+    portal_max_connections: int = 4
+    flight_search_cache: bool = False
+    flight_search_cache_table: str = ""
+    flight_search_fresh_seconds: int = 120
+    flight_search_max_stale_seconds: int = 600
+    flight_search_flex_days: int = 0
+    flight_search_nearby_airports: bool = False
+    flight_search_budget_s: float = 8.0
+    flight_search_prefetch: bool = False
+    flight_search_prefetch_wait_s: float = 3.0
     nova_act_headless: bool = True
     nova_act_search_workflow: str = ""
     nova_act_booking_workflow: str = ""
@@ -56,6 +93,9 @@ class Config(BaseModel):
     nova_act_search_agent_arn: str = ""
     nova_act_booking_agent_arn: str = ""
     circuit_breaker_table: str = ""
+    plan_cache_table: str = ""
+    plan_cache_ttl_seconds: int = 86400
+    policy_rules_enabled: bool = False
 
 
 @lru_cache(maxsize=1)
@@ -77,16 +117,53 @@ def get_config() -> Config:
         clerk_secret_key=_resolve_clerk_secret(),
         environment=environ.get("ENVIRONMENT", "local"),
         websocket_endpoint=environ.get("WEBSOCKET_ENDPOINT", ""),
+        progress_queue_url=environ.get("PROGRESS_QUEUE_URL", ""),
         bda_project_arn=environ.get("BDA_PROJECT_ARN", ""),
         bda_profile_arn=environ.get("BDA_PROFILE_ARN", ""),
         ingestion_workflow_arn=environ.get("INGESTION_WORKFLOW_ARN", ""),
         booking_workflow_arn=environ.get("BOOKING_WORKFLOW_ARN", ""),
+        fused_retrieval=environ.get("FUSED_RETRIEVAL", "false").lower() == "true",
         policy_bucket=environ.get("POLICY_BUCKET", ""),
+        claim_check_bucket=environ.get("CLAIM_CHECK_BUCKET", ""),
+        claim_check_threshold_bytes=int(environ.get("CLAIM_CHECK_THRESHOLD_BYTES", "32768")),
+        embedding_archive_enabled=environ.get("EMBEDDING_ARCHIVE_ENABLED", "true").lower() == "true",
         hnsw_ef_search=int(environ.get("HNSW_EF_SEARCH", "40")),
+        bulk_load_threshold=int(environ.get("BULK_LOAD_THRESHOLD", "2000")),
+        bulk_load_rebuild_indexes=environ.get("BULK_LOAD_REBUILD_INDEXES", "false").lower() == "true",
+        bulk_maintenance_work_mem=environ.get("BULK_MAINTENANCE_WORK_MEM", "1GB"),
+        bulk_maintenance_workers=int(environ.get("BULK_MAINTENANCE_WORKERS", "4")),
         similarity_threshold=float(environ.get("SIMILARITY_THRESHOLD", "0.65")),
         high_confidence_threshold=float(environ.get("HIGH_CONFIDENCE_THRESHOLD", "0.75")),
         retrieval_top_k=int(environ.get("RETRIEVAL_TOP_K", "5")),
+        reasoning_structured_output=environ.get("REASONING_STRUCTURED_OUTPUT", "false").lower() == "true",
+        reasoning_streaming=environ.get("REASONING_STREAMING", "false").lower() == "true",
+        reasoning_hedging=environ.get("REASONING_HEDGING", "false").lower() == "true",
+        reasoning_hedge_percentile=float(environ.get("REASONING_HEDGE_PERCENTILE", "90")),
+        reasoning_hedge_default_ms=float(environ.get("REASONING_HEDGE_DEFAULT_MS", "20000")),
+        reasoning_prompt_caching=environ.get("REASONING_PROMPT_CACHING", "true").lower() == "true",
+        reasoning_rule_planner=environ.get("REASONING_RULE_PLANNER", "false").lower() == "true",
+        rule_planner_min_confidence=float(environ.get("RULE_PLANNER_MIN_CONFIDENCE", "0.9")),
+        reasoning_routing=environ.get("REASONING_ROUTING", "false").lower() == "true",
+        reasoning_fast_model_id=environ.get("REASONING_FAST_MODEL_ID", ""),
+        routing_max_query_chars=int(environ.get("ROUTING_MAX_QUERY_CHARS", "160")),
+        routing_min_similarity=float(environ.get("ROUTING_MIN_SIMILARITY", "0.5")),
+        routing_min_plan_confidence=float(environ.get("ROUTING_MIN_PLAN_CONFIDENCE", "0.7")),
+        reasoning_deadline_percentile=float(environ.get("REASONING_DEADLINE_PERCENTILE", "90")),
+        reasoning_deadline_margin_ms=float(environ.get("REASONING_DEADLINE_MARGIN_MS", "5000")),
+        reasoning_latency_persist=environ.get("REASONING_LATENCY_PERSIST", "false").lower() == "true",
         dummy_portal_url=environ.get("DUMMY_PORTAL_URL", ""),
+        portal_connect_timeout_s=float(environ.get("PORTAL_CONNECT_TIMEOUT_S", "3")),
+        portal_read_timeout_s=float(environ.get("PORTAL_READ_TIMEOUT_S", "10")),
+        portal_max_connections=int(environ.get("PORTAL_MAX_CONNECTIONS", "4")),
+        flight_search_cache=environ.get("FLIGHT_SEARCH_CACHE", "false").lower() == "true",
+        flight_search_cache_table=environ.get("FLIGHT_SEARCH_CACHE_TABLE", ""),
+        flight_search_fresh_seconds=int(environ.get("FLIGHT_SEARCH_FRESH_SECONDS", "120")),
+        flight_search_max_stale_seconds=int(environ.get("FLIGHT_SEARCH_MAX_STALE_SECONDS", "600")),
+        flight_search_flex_days=int(environ.get("FLIGHT_SEARCH_FLEX_DAYS", "0")),
+        flight_search_nearby_airports=environ.get("FLIGHT_SEARCH_NEARBY_AIRPORTS", "false").lower() == "true",
+        flight_search_budget_s=float(environ.get("FLIGHT_SEARCH_BUDGET_S", "8")),
+        flight_search_prefetch=environ.get("FLIGHT_SEARCH_PREFETCH", "false").lower() == "true",
+        flight_search_prefetch_wait_s=float(environ.get("FLIGHT_SEARCH_PREFETCH_WAIT_S", "3")),
         nova_act_headless=environ.get("NOVA_ACT_HEADLESS", "true").lower() == "true",
         nova_act_search_workflow=environ.get("NOVA_ACT_SEARCH_WORKFLOW", ""),
         nova_act_booking_workflow=environ.get("NOVA_ACT_BOOKING_WORKFLOW", ""),
@@ -95,6 +172,9 @@ def get_config() -> Config:
         nova_act_search_agent_arn=environ.get("NOVA_ACT_SEARCH_AGENT_ARN", ""),
         nova_act_booking_agent_arn=environ.get("NOVA_ACT_BOOKING_AGENT_ARN", ""),
         circuit_breaker_table=environ.get("CIRCUIT_BREAKER_TABLE", ""),
+        plan_cache_table=environ.get("PLAN_CACHE_TABLE", ""),
+        plan_cache_ttl_seconds=int(environ.get("PLAN_CACHE_TTL_SECONDS", "86400")),
+        policy_rules_enabled=environ.get("POLICY_RULES_ENABLED", "false").lower() == "true",
     )
 
 
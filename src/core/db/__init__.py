@@ -9,5 +9,6 @@ from core.db.aurora import AuroraClient
 from core.db.schemas.base import Base
 from core.db.schemas.policy import Policy
 from core.db.schemas.policy_chunk import PolicyChunk
+from core.db.schemas.policy_rule import PolicyRule
 
-__all__ = ["AuroraClient", "Base", "Policy", "PolicyChunk"]
+__all__ = ["AuroraClient", "Base", "Policy", "PolicyChunk", "PolicyRule"]
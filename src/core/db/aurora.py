@@ -2,6 +2,8 @@
 
 import json
 import time
+from collections.abc import Iterator
+from contextlib import contextmanager
 from typing import Any
 
 import boto3
@@ -11,7 +13,7 @@ from pgvector.psycopg import register_vector
 
 from core.config import Config
 from core.errors import ErrorCode, PolicyRetrievalError, TripCortexError
-from core.models.retrieval import PolicyChunkResult
+from core.models.retrieval import PolicyChunkResult, PolicyRule
 
 logger = structlog.get_logger()
 
@@ -26,13 +28,19 @@ _INSERT_CHUNK_SQL = """
         updated_at = NOW()
 """
 
+# Global index plus the text-only partial index — both must be maintained on every upsert.
+_HNSW_INDEXES = ("idx_policy_chunks_embedding", "idx_policy_chunks_embedding_text")
+
+# Session-scoped advisory lock so only one backfill drops/rebuilds the HNSW graphs at a time.
+_BULK_LOAD_LOCK_ID = 0x7C_0B_11
+
 _SIMILARITY_SEARCH_SQL = """
     WITH query AS (
         SELECT %s::vector AS vec
     )
     SELECT pc.id, pc.content_text, pc.section_title, pc.source_page,
            pc.content_type, pc.bda_entity_subtype,
-           1 - (pc.embedding <=> q.vec) AS similarity
+           1 - (pc.embedding <=> q.vec) AS similarity, pc.policy_id
     FROM policy_chunks pc, query q
     WHERE 1 - (pc.embedding <=> q.vec) >= %s
     ORDER BY pc.embedding <=> q.vec
@@ -45,7 +53,7 @@ _SIMILARITY_SEARCH_FILTERED_SQL = """
     )
     SELECT pc.id, pc.content_text, pc.section_title, pc.source_page,
            pc.content_type, pc.bda_entity_subtype,
-           1 - (pc.embedding <=> q.vec) AS similarity
+           1 - (pc.embedding <=> q.vec) AS similarity, pc.policy_id
     FROM policy_chunks pc, query q
     WHERE pc.content_type = %s
       AND 1 - (pc.embedding <=> q.vec) >= %s
@@ -54,6 +62,33 @@ _SIMILARITY_SEARCH_FILTERED_SQL = """
 """
 
 
+_POLICY_TEXT_SQL = """
+    SELECT pc.content_text, pc.section_title, pc.source_page, p.version
+    FROM policy_chunks pc
+    JOIN policies p ON p.id = pc.policy_id
+    WHERE pc.policy_id = %s
+      AND pc.content_type IN ('text', 'table')
+      AND pc.content_text IS NOT NULL
+    ORDER BY pc.source_page NULLS LAST, pc.reading_order NULLS LAST
+"""
+
+_INSERT_POLICY_RULE_SQL = """
+    INSERT INTO policy_rules
+        (policy_id, policy_version, rule_type, cabin_class, value_numeric, value_text, section_title, source_page)
+    VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+"""
+
+# Rules of the current version of every policy that has finished embedding.
+_POLICY_RULES_SQL = """
+    SELECT r.rule_type, r.cabin_class, r.value_numeric, r.value_text, r.section_title, r.source_page
+    FROM policy_rules r
+    JOIN policies p ON p.id = r.policy_id AND p.version = r.policy_version
+    WHERE r.policy_id = ANY(%s::uuid[])
+      AND p.status IN ('embedded', 'ready')
+    ORDER BY r.rule_type, r.cabin_class NULLS FIRST, r.value_numeric
+"""
+
+
 class AuroraClient:
     def __init__(self, config: Config) -> None:
         self._config = config
@@ -87,22 +122,22 @@ class AuroraClient:
         register_vector(self._conn)
         self.verify_hnsw_index()
 
-    def verify_hnsw_index(self) -> bool:
+    def verify_hnsw_index(self, index_name: str = _HNSW_INDEXES[0]) -> bool:
         """Verify HNSW index exists with expected configuration. Logs error but does not raise."""
         conn = self._require_connection()
         with conn.cursor() as cur:
             cur.execute(
-                "SELECT indexdef FROM pg_indexes "
-                "WHERE tablename = 'policy_chunks' AND indexname = 'idx_policy_chunks_embedding'"
+                "SELECT indexdef FROM pg_indexes WHERE tablename = 'policy_chunks' AND indexname = %s",
+                (index_name,),
             )
             row = cur.fetchone()
         if row is None:
-            logger.error("hnsw_index_missing", index="idx_policy_chunks_embedding")
+            logger.error("hnsw_index_missing", index=index_name)
             return False
         indexdef = row[0].lower()
         valid = "hnsw" in indexdef and "vector_cosine_ops" in indexdef
         if valid:
-            logger.info("hnsw_index_verified", index="idx_policy_chunks_embedding")
+            logger.info("hnsw_index_verified", index=index_name)
         else:
             logger.error("hnsw_index_misconfigured", indexdef=indexdef)
         return valid
@@ -128,9 +163,18 @@ class AuroraClient:
             return False
 
     def insert_chunks(self, chunks: list[dict[str, Any]]) -> int:
-        """Batch upsert policy chunks. Returns count inserted."""
+        """Batch upsert policy chunks. Returns count inserted.
+
+        Loads of at least ``bulk_load_threshold`` rows run inside :meth:`bulk_load`.
+        """
         if not chunks:
             return 0
+        if len(chunks) >= self._config.bulk_load_threshold:
+            with self.bulk_load(rebuild_indexes=self._config.bulk_load_rebuild_indexes):
+                return self._upsert_chunks(chunks)
+        return self._upsert_chunks(chunks)
+
+    def _upsert_chunks(self, chunks: list[dict[str, Any]]) -> int:
         conn = self._require_connection()
         rows = [
             (
@@ -157,6 +201,105 @@ class AuroraClient:
             logger.error("insert_chunks_failed", exc_info=True)
             raise PolicyRetrievalError(f"Failed to insert chunks: {e}", code=ErrorCode.RETRIEVAL_FAILED) from e
 
+    @contextmanager
+    def bulk_load(self, rebuild_indexes: bool = False) -> Iterator[None]:
+        """Session tuning for large backfills, optionally with HNSW drop + CONCURRENTLY rebuild.
+
+        Raises maintenance_work_mem and max_parallel_maintenance_workers for this session.
+        With rebuild_indexes, both HNSW indexes are dropped before the load and rebuilt
+        afterwards (even if the drop or the load fails), then checked with verify_hnsw_index. The
+        drop/rebuild is skipped when another session already holds the bulk-load lock.
+        """
+        conn = self._require_connection()
+        start = time.monotonic()
+        with conn.cursor() as cur:
+            cur.execute(
+                "SELECT set_config('maintenance_work_mem', %s, false)", (self._config.bulk_maintenance_work_mem,)
+            )
+            cur.execute(
+                "SELECT set_config('max_parallel_maintenance_workers', %s, false)",
+                (str(self._config.bulk_maintenance_workers),),
+            )
+            locked = False
+            if rebuild_indexes:
+                cur.execute("SELECT pg_try_advisory_lock(%s)", (_BULK_LOAD_LOCK_ID,))
+                row = cur.fetchone()
+                locked = bool(row and row[0])
+        conn.commit()
+
+        if rebuild_indexes and not locked:
+            logger.warning("bulk_load_index_rebuild_skipped", reason="another bulk load holds the lock")
+        index_defs: dict[str, str] = {}
+        try:
+            if locked:
+                index_defs = self._hnsw_index_defs()
+                self._drop_indexes_concurrently(index_defs)
+            logger.info(
+                "bulk_load_started",
+                maintenance_work_mem=self._config.bulk_maintenance_work_mem,
+                maintenance_workers=self._config.bulk_maintenance_workers,
+                indexes_dropped=list(index_defs),
+            )
+            yield
+        finally:
+            try:
+                if index_defs:
+                    self._create_indexes_concurrently(index_defs)
+            finally:
+                with conn.cursor() as cur:
+                    if locked:
+                        cur.execute("SELECT pg_advisory_unlock(%s)", (_BULK_LOAD_LOCK_ID,))
+                    cur.execute("RESET maintenance_work_mem")
+                    cur.execute("RESET max_parallel_maintenance_workers")
+                conn.commit()
+            verified = all(self.verify_hnsw_index(name) for name in index_defs) if index_defs else None
+            logger.info(
+                "bulk_load_finished",
+                indexes_rebuilt=list(index_defs),
+                indexes_verified=verified,
+                latency_ms=round((time.monotonic() - start) * 1000, 1),
+            )
+
+    def _hnsw_index_defs(self) -> dict[str, str]:
+        """Return the definitions of the existing HNSW indexes, keyed by index name."""
+        conn = self._require_connection()
+        with conn.cursor() as cur:
+            cur.execute(
+                "SELECT indexname, indexdef FROM pg_indexes WHERE tablename = 'policy_chunks' AND indexname = ANY(%s)",
+                (list(_HNSW_INDEXES),),
+            )
+            index_defs = {str(name): str(indexdef) for name, indexdef in cur.fetchall()}
+        conn.commit()
+        return index_defs
+
+    def _drop_indexes_concurrently(self, index_defs: dict[str, str]) -> None:
+        conn = self._require_connection()
+        # DROP/CREATE INDEX CONCURRENTLY cannot run inside a transaction block.
+        conn.autocommit = True
+        try:
+            with conn.cursor() as cur:
+                for name in index_defs:
+                    cur.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+        finally:
+            conn.autocommit = False
+        logger.info("hnsw_indexes_dropped", indexes=list(index_defs))
+
+    def _create_indexes_concurrently(self, index_defs: dict[str, str]) -> None:
+        conn = self._require_connection()
+        start = time.monotonic()
+        conn.autocommit = True
+        try:
+            with conn.cursor() as cur:
+                for indexdef in index_defs.values():
+                    cur.execute(indexdef.replace("CREATE INDEX", "CREATE INDEX CONCURRENTLY IF NOT EXISTS", 1))
+        finally:
+            conn.autocommit = False
+        logger.info(
+            "hnsw_indexes_rebuilt",
+            indexes=list(index_defs),
+            latency_ms=round((time.monotonic() - start) * 1000, 1),
+        )
+
     def update_policy_status(self, policy_id: str, status: str, total_chunks: int) -> None:
         """Update policy status and chunk count after embedding."""
         conn = self._require_connection()
@@ -171,6 +314,69 @@ class AuroraClient:
             conn.rollback()
             raise PolicyRetrievalError(f"Failed to update policy status: {e}", code=ErrorCode.RETRIEVAL_FAILED) from e
 
+    def fetch_policy_text(self, policy_id: str) -> tuple[int, list[dict[str, Any]]]:
+        """Return (policy version, text/table chunks in reading order) for rule extraction."""
+        conn = self._require_connection()
+        try:
+            with conn.cursor() as cur:
+                cur.execute(_POLICY_TEXT_SQL, (policy_id,))
+                rows = cur.fetchall()
+            conn.commit()
+        except Exception as e:
+            conn.rollback()
+            raise PolicyRetrievalError(f"Failed to fetch policy text: {e}", code=ErrorCode.RETRIEVAL_FAILED) from e
+        version = int(rows[0][3]) if rows else 1
+        return version, [{"content_text": r[0], "section_title": r[1], "source_page": r[2]} for r in rows]
+
+    def replace_policy_rules(self, policy_id: str, policy_version: int, rules: list[PolicyRule]) -> int:
+        """Atomically replace every stored rule of a policy with rules for policy_version."""
+        conn = self._require_connection()
+        rows = [
+            (
+                policy_id,
+                policy_version,
+                r.rule_type,
+                r.cabin_class,
+                r.value_numeric,
+                r.value_text,
+                r.section_title,
+                r.source_page,
+            )
+            for r in rules
+        ]
+        try:
+            with conn.cursor() as cur:
+                cur.execute("DELETE FROM policy_rules WHERE policy_id = %s", (policy_id,))
+                if rows:
+                    cur.executemany(_INSERT_POLICY_RULE_SQL, rows)
+            conn.commit()
+            return len(rows)
+        except Exception as e:
+            conn.rollback()
+            raise PolicyRetrievalError(f"Failed to store policy rules: {e}", code=ErrorCode.RETRIEVAL_FAILED) from e
+
+    def fetch_policy_rules(self, policy_ids: list[str]) -> list[PolicyRule]:
+        conn = self._require_connection()
+        try:
+            with conn.cursor() as cur:
+                cur.execute(_POLICY_RULES_SQL, (policy_ids,))
+                rows = cur.fetchall()
+            conn.commit()
+        except Exception as e:
+            conn.rollback()
+            raise PolicyRetrievalError(f"Failed to fetch policy rules: {e}", code=ErrorCode.RETRIEVAL_FAILED) from e
+        return [
+            PolicyRule(
+                rule_type=row[0],
+                cabin_class=row[1],
+                value_numeric=float(row[2]) if row[2] is not None else None,
+                value_text=row[3],
+                section_title=row[4],
+                source_page=row[5],
+            )
+            for row in rows
+        ]
+
     def similarity_search(
         self,
         query_embedding: list[float],
@@ -205,6 +411,7 @@ class AuroraClient:
                 content_type=row[4],
                 bda_entity_subtype=row[5],
                 similarity=float(row[6]),
+                policy_id=str(row[7]),
             )
             for row in rows
         ]
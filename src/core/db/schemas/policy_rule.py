@@ -0,0 +1,32 @@
+"""SQLAlchemy ORM model for the policy_rules table."""
+
+from __future__ import annotations
+
+from sqlalchemy import CheckConstraint, ForeignKey, Index, Integer, Numeric, String, Text, text
+from sqlalchemy.dialects.postgresql import TIMESTAMP, UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from core.db.schemas.base import Base
+
+
+class PolicyRule(Base):
+    __tablename__ = "policy_rules"
+
+    id: Mapped[str] = mapped_column(UUID, primary_key=True, server_default=text("gen_random_uuid()"))
+    policy_id: Mapped[str] = mapped_column(UUID, ForeignKey("policies.id", ondelete="CASCADE"), nullable=False)
+    policy_version: Mapped[int] = mapped_column(Integer, nullable=False)
+    rule_type: Mapped[str] = mapped_column(String(30), nullable=False)
+    cabin_class: Mapped[str | None] = mapped_column(String(20))
+    value_numeric = mapped_column(Numeric(12, 2))
+    value_text: Mapped[str | None] = mapped_column(Text)
+    section_title: Mapped[str | None] = mapped_column(String(255))
+    source_page: Mapped[int | None] = mapped_column(Integer)
+    created_at = mapped_column(TIMESTAMP(timezone=True), nullable=False, server_default=text("NOW()"))
+
+    __table_args__ = (
+        CheckConstraint(
+            "rule_type IN ('budget_cap', 'cabin_eligibility', 'preferred_vendor', 'advance_booking')",
+            name="chk_policy_rules_type",
+        ),
+        Index("idx_policy_rules_policy_version", "policy_id", "policy_version"),
+    )
@@ -11,24 +11,35 @@ from core.models.booking import (
     PassengerInfo,
     PolicyConstraints,
     PolicySource,
+    ReasoningAttempt,
     ReasoningRequest,
     ReasoningResult,
     ThinkingEffort,
 )
 from core.models.circuit_breaker import CircuitBreakerState, CircuitState
-from core.models.flight import FlightOption, FlightSearchInput, FlightSearchOutput, FlightSearchResult
+from core.models.flight import (
+    FlightOption,
+    FlightSearchInput,
+    FlightSearchOutput,
+    FlightSearchResult,
+    RoundTripItinerary,
+)
 from core.models.ingestion import (
+    ArchivedChunk,
     BdaEntity,
     BdaProjectResult,
     BdaStatusResult,
+    EmbeddingArchiveManifest,
     EmbeddingMessage,
     EmbeddingResult,
     FailedEntity,
     IngestionCompleteResult,
     IngestionRequest,
     IngestionStartResult,
+    RestoreEmbeddingsMessage,
+    RestoreEmbeddingsResult,
 )
-from core.models.retrieval import PolicyChunkResult
+from core.models.retrieval import PolicyChunkResult, PolicyRule
 
 # Resolve forward references after all models are imported
 BookingInput.model_rebuild()
@@ -43,10 +54,13 @@ __all__ = [
     "PolicyConstraints",
     "PolicySource",
     "PolicyChunkResult",
+    "PolicyRule",
     "FlightOption",
     "FlightSearchResult",
     "FlightSearchInput",
     "FlightSearchOutput",
+    "RoundTripItinerary",
+    "ReasoningAttempt",
     "ReasoningRequest",
     "ReasoningResult",
     "ThinkingEffort",
@@ -59,6 +73,10 @@ __all__ = [
     "FailedEntity",
     "EmbeddingMessage",
     "EmbeddingResult",
+    "ArchivedChunk",
+    "EmbeddingArchiveManifest",
+    "RestoreEmbeddingsMessage",
+    "RestoreEmbeddingsResult",
     "CircuitState",
     "CircuitBreakerState",
 ]
@@ -4,6 +4,8 @@ from typing import TYPE_CHECKING, Literal
 from dateutil import parser as dateutil_parser
 from pydantic import BaseModel, Field, field_validator, model_validator
 
+from core.models.retrieval import PolicyRule
+
 if TYPE_CHECKING:
     from core.models.flight import FlightOption
 
@@ -119,6 +121,8 @@ class ReasoningRequest(BaseModel):
     context_text: str
     confidence_level: Literal["high", "low", "none"]
     max_similarity: float = Field(ge=0.0, le=1.0)
+    connection_id: str | None = None  # WebSocket connection for in-step progress updates
+    policy_rules: list[PolicyRule] = []  # structured rules extracted at ingestion time
 
 
 class BookingPlan(BaseModel):
@@ -169,7 +173,23 @@ class BookingPlan(BaseModel):
         )
 
 
-ThinkingEffort = Literal["low", "medium", "high"]
+# "disabled" is the router's fast rung: extended thinking off, optionally on a smaller model.
+ThinkingEffort = Literal["disabled", "low", "medium", "high"]
+
+
+class ReasoningAttempt(BaseModel):
+    """Token and latency accounting for one Converse call of a reasoning run."""
+
+    attempt: int = Field(ge=1)  # 1-based ladder slot
+    effort: ThinkingEffort
+    failure_class: str | None = None  # None on success; invalid_plan, cancelled, throttled, timeout, service_error
+    input_tokens: int = 0
+    output_tokens: int = 0
+    reasoning_tokens_est: int = 0  # output tokens not accounted for by the visible plan (~4 chars/token)
+    cache_read_input_tokens: int = 0
+    cache_write_input_tokens: int = 0
+    server_latency_ms: float | None = None  # Converse metrics.latencyMs; None if the call ended before it
+    latency_ms: float = Field(ge=0.0)  # wall clock, including parsing and validation
 
 
 class ReasoningResult(BaseModel):
@@ -177,11 +197,17 @@ class ReasoningResult(BaseModel):
     employee_id: str
     plan: BookingPlan
     model_id: str
-    thinking_effort: ThinkingEffort
+    thinking_effort: ThinkingEffort | Literal["none"]  # "none" = planned by RulePlanner, no model ran
     latency_ms: float = Field(ge=0.0)
     retry_count: int = Field(default=0, ge=0)
     escalated: bool = False
     parse_failed: bool = False
+    structured_output: bool = False
+    schema_failure_count: int = Field(default=0, ge=0)  # attempts rejected for missing/invalid plan output
+    hedged: bool = False  # a concurrent high-effort attempt was raced against the first one
+    cache_hit: bool = False  # plan served from the plan cache — no Converse call was made
+    attempts: list[ReasoningAttempt] = []
+    routed: bool = False  # the router started this request on the fast rung
 
 
 class PassengerInfo(BaseModel):
@@ -14,14 +14,33 @@ class FlightOption(BaseModel):
     duration: str | None = Field(None, description="Flight duration (e.g., 3h 30m)")
     compliant: bool = Field(True, description="Whether flight meets policy constraints")
     policy_notes: list[str] = Field(default_factory=list, description="Policy violation notes")
+    origin: str | None = Field(default=None, description="Departure airport (flexible search)")
+    destination: str | None = Field(default=None, description="Arrival airport (flexible search)")
+    departure_date: str | None = Field(default=None, description="Departure date (flexible search)")
+    score: float | None = Field(default=None, description="Ranking score in [0, 1], higher is better")
+    score_breakdown: dict[str, float] = Field(default_factory=dict, description="Weighted score per criterion")
+
+
+class RoundTripItinerary(BaseModel):
+    outbound: FlightOption = Field(..., description="Outbound leg")
+    inbound: FlightOption = Field(..., description="Return leg")
+    total_price: float = Field(..., gt=0, description="Combined fare in USD")
+    compliant: bool = Field(default=True, description="Whether the pair meets policy constraints")
+    policy_notes: list[str] = Field(default_factory=list, description="Policy violation notes for the pair")
 
 
 class FlightSearchResult(BaseModel):
-    flights: list[FlightOption] = Field(..., description="List of flight options")
+    flights: list[FlightOption] = Field(..., description="List of flight options (outbound leg for round trips)")
     search_origin: str = Field(..., description="Origin airport code")
     search_destination: str = Field(..., description="Destination airport code")
     search_date: str = Field(..., description="Search date")
-    total_results: int = Field(..., ge=0, description="Total number of results found")
+    total_results: int = Field(
+        ..., ge=0, description="Total number of results found (outbound/return pairs for round trips)"
+    )
+    return_date: str | None = Field(default=None, description="Return date for round trips")
+    itineraries: list[RoundTripItinerary] = Field(
+        default_factory=list, description="Outbound/return pairs, compliant first then cheapest"
+    )
 
 
 class FlightSearchInput(BaseModel):
@@ -85,3 +85,45 @@ class EmbeddingResult(BaseModel):
     chunks_failed: int
     entity_types: dict[str, int]  # e.g. {"text": 5, "table": 2, "figure": 1}
     failed_entities: list[FailedEntity]
+
+
+class ArchivedChunk(BaseModel):
+    """One metadata.jsonl row of an embedding archive, aligned with its vectors.npy row."""
+
+    bda_entity_id: str
+    content_hash: str
+    content_type: Literal["text", "table", "figure"]
+    content_text: str
+    source_page: int | None = None
+    section_title: str | None = None
+    reading_order: int | None = None
+    bda_entity_subtype: str | None = None
+    metadata: str  # JSON string, as stored in policy_chunks.metadata
+
+
+class EmbeddingArchiveManifest(BaseModel):
+    """manifest.json of an embedding archive — written last, so its presence marks the archive complete."""
+
+    policy_id: str
+    model_id: str
+    dimension: int
+    count: int
+    format_version: int
+    created_at: str
+
+
+class RestoreEmbeddingsMessage(BaseModel):
+    """Request to reload a policy's chunks from its embedding archive."""
+
+    policy_id: str
+    source_policy_id: str | None = None  # archive to read; defaults to policy_id
+
+
+class RestoreEmbeddingsResult(BaseModel):
+    """Result of restoring a policy's chunks from an embedding archive."""
+
+    policy_id: str
+    source_policy_id: str
+    chunks_restored: int
+    model_id: str
+    dimension: int
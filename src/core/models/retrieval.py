@@ -1,6 +1,7 @@
 """Pydantic models for policy retrieval results."""
 
 from enum import Enum
+from typing import Literal
 
 from pydantic import BaseModel, Field
 
@@ -13,6 +14,21 @@ class PolicyChunkResult(BaseModel):
     content_type: str
     bda_entity_subtype: str | None
     similarity: float
+    policy_id: str | None = None
+
+
+PolicyRuleType = Literal["budget_cap", "cabin_eligibility", "preferred_vendor", "advance_booking"]
+
+
+class PolicyRule(BaseModel):
+    """One structured rule extracted from policy text at ingestion time (a policy_rules row)."""
+
+    rule_type: PolicyRuleType
+    cabin_class: str | None = None  # None = applies to every cabin
+    value_numeric: float | None = None  # budget cap in USD, or advance-booking days
+    value_text: str | None = None  # vendor name, a budget cap's route, or a cabin eligibility condition
+    section_title: str | None = None
+    source_page: int | None = None
 
 
 class QueryEmbeddingRequest(BaseModel):
@@ -61,3 +77,4 @@ class EmbedAndRetrieveResponse(BaseModel):
     confidence: ConfidenceAssessment
     total_chunks: int
     retrieval_latency_ms: float
+    policy_rules: list[PolicyRule] = []
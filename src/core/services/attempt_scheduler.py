@@ -0,0 +1,160 @@
+"""Deadline-aware scheduling of reasoning attempts.
+
+Keeps a rolling latency window per thinking effort — in process, and optionally shared through
+DynamoDB so cold containers start from the fleet's recent history — and decides before each
+attempt whether it can finish before the Lambda deadline. An attempt that would not fit is
+swapped for the most capable lower effort that does; if none fits, the ladder stops and the
+request fails fast into graceful degradation instead of hitting the hard Lambda timeout.
+"""
+
+import json
+import threading
+import time
+from typing import Any
+
+import structlog
+
+from core.models.booking import ThinkingEffort
+from core.services.latency_tracker import LatencyTracker
+
+log = structlog.get_logger()
+
+# Cheapest first. Fallbacks are only ever chosen from below the planned effort.
+EFFORT_ORDER: tuple[ThinkingEffort, ...] = ("disabled", "low", "medium", "high")
+
+# Conservative estimates used until an effort has enough samples of its own.
+DEFAULT_ESTIMATES_MS: dict[ThinkingEffort, float] = {
+    "disabled": 8_000.0,
+    "low": 15_000.0,
+    "medium": 30_000.0,
+    "high": 60_000.0,
+}
+
+_LATENCY_KEY_PREFIX = "__latency__"
+_STORE_TTL_SECONDS = 7 * 86400
+
+
+class DynamoLatencyStore:
+    """Recent attempt latencies per (model, effort), in one item each of the plan cache table.
+
+    Lives beside the plan cache's generation counter under reserved keys; items refresh their
+    own TTL on every save so an unused model's history ages out.
+    """
+
+    def __init__(self, dynamo_client: Any, table_name: str, model_id: str, max_samples: int = 50) -> None:
+        self._client = dynamo_client
+        self._table = table_name
+        self._model_id = model_id
+        self._max_samples = max_samples
+
+    def _key(self, effort: ThinkingEffort) -> dict[str, Any]:
+        return {"cacheKey": {"S": f"{_LATENCY_KEY_PREFIX}#{self._model_id}#{effort}"}}
+
+    def load(self, effort: ThinkingEffort) -> list[float]:
+        resp = self._client.get_item(TableName=self._table, Key=self._key(effort))
+        raw = resp.get("Item", {}).get("samples", {}).get("S")
+        return [float(v) for v in json.loads(raw)] if raw else []
+
+    def save(self, effort: ThinkingEffort, samples: list[float]) -> None:
+        self._client.put_item(
+            TableName=self._table,
+            Item={
+                **self._key(effort),
+                "samples": {"S": json.dumps([round(v, 1) for v in samples[-self._max_samples :]])},
+                "ttl": {"N": str(int(time.time()) + _STORE_TTL_SECONDS)},
+            },
+        )
+
+
+class AttemptScheduler:
+    """Per-effort latency estimates and the fit-before-deadline decision.
+
+    Args:
+        percentile: Latency percentile an attempt is assumed to take.
+        margin_ms: Headroom kept after the estimate for validation, audit and the Lambda response.
+        store: Optional shared history; read once per effort per container, written every flush_every samples.
+        default_estimates_ms: Per-effort estimates until min_samples exist.
+    """
+
+    def __init__(
+        self,
+        percentile: float = 90.0,
+        margin_ms: float = 5_000.0,
+        store: DynamoLatencyStore | None = None,
+        flush_every: int = 10,
+        min_samples: int = 10,
+        default_estimates_ms: dict[ThinkingEffort, float] | None = None,
+    ) -> None:
+        self._percentile = percentile
+        self._margin_ms = margin_ms
+        self._store = store
+        self._flush_every = flush_every
+        self._defaults = {**DEFAULT_ESTIMATES_MS, **(default_estimates_ms or {})}
+        self._trackers = {effort: LatencyTracker(min_samples=min_samples) for effort in EFFORT_ORDER}
+        self._loaded: set[ThinkingEffort] = set()
+        self._unflushed = dict.fromkeys(EFFORT_ORDER, 0)
+        self._lock = threading.Lock()
+
+    def record(self, effort: ThinkingEffort, latency_ms: float) -> None:
+        self._ensure_loaded(effort)
+        tracker = self._trackers[effort]
+        tracker.record(latency_ms)
+        with self._lock:
+            self._unflushed[effort] += 1
+            flush = self._store is not None and self._unflushed[effort] >= self._flush_every
+            if flush:
+                self._unflushed[effort] = 0
+        if flush:
+            self._save(effort, tracker.samples())
+
+    def percentile(self, effort: ThinkingEffort, pct: float) -> float | None:
+        """Observed latency percentile for effort, or None until there are enough samples."""
+        self._ensure_loaded(effort)
+        return self._trackers[effort].percentile(pct)
+
+    def estimate_ms(self, effort: ThinkingEffort) -> float:
+        observed = self.percentile(effort, self._percentile)
+        return observed if observed is not None else self._defaults[effort]
+
+    def fits(self, effort: ThinkingEffort, remaining_ms: float) -> bool:
+        return self.estimate_ms(effort) + self._margin_ms <= remaining_ms
+
+    def choose(self, planned: ThinkingEffort, remaining_ms: float) -> ThinkingEffort | None:
+        """planned if it fits, else the most capable lower effort that does, else None (stop the ladder)."""
+        if self.fits(planned, remaining_ms):
+            return planned
+        for effort in reversed(EFFORT_ORDER[: EFFORT_ORDER.index(planned)]):
+            if self.fits(effort, remaining_ms):
+                log.info(
+                    "reasoning_attempt_downgraded",
+                    planned_effort=planned,
+                    effort=effort,
+                    remaining_ms=round(remaining_ms),
+                    planned_estimate_ms=round(self.estimate_ms(planned)),
+                )
+                return effort
+        return None
+
+    def _ensure_loaded(self, effort: ThinkingEffort) -> None:
+        if self._store is None:
+            return
+        with self._lock:
+            if effort in self._loaded:
+                return
+            self._loaded.add(effort)
+        try:
+            samples = self._store.load(effort)
+        except Exception as e:
+            log.warning("latency_store_read_failed", effort=effort, error=str(e))
+            return
+        tracker = self._trackers[effort]
+        for sample in samples:
+            tracker.record(sample)
+
+    def _save(self, effort: ThinkingEffort, samples: list[float]) -> None:
+        if self._store is None:
+            return
+        try:
+            self._store.save(effort, samples)
+        except Exception as e:
+            log.warning("latency_store_write_failed", effort=effort, error=str(e))
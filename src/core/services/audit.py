@@ -6,8 +6,14 @@ from uuid import uuid4
 
 import structlog
 
+from core.models.booking import ReasoningResult
+
 logger = structlog.get_logger()
 
+# BatchWriteItem accepts at most 25 puts; unprocessed items are re-sent this many times.
+_BATCH_LIMIT = 25
+_BATCH_RETRIES = 2
+
 
 def write_audit_log(dynamo_client: Any, table_name: str, entry: dict[str, Any]) -> None:
     """Write an audit entry to DynamoDB. Swallows exceptions — audit failure must not block the workflow."""
@@ -18,6 +24,25 @@ def write_audit_log(dynamo_client: Any, table_name: str, entry: dict[str, Any])
         logger.error("audit_log_write_failed", table=table_name, exc_info=True)
 
 
+def write_audit_logs(dynamo_client: Any, table_name: str, entries: list[dict[str, Any]]) -> None:
+    """Write several audit entries in one BatchWriteItem call. Swallows exceptions, like write_audit_log."""
+    for start in range(0, len(entries), _BATCH_LIMIT):
+        requests = [
+            {"PutRequest": {"Item": {k: _to_dynamo(v) for k, v in entry.items()}}}
+            for entry in entries[start : start + _BATCH_LIMIT]
+        ]
+        try:
+            for _ in range(_BATCH_RETRIES + 1):
+                resp = dynamo_client.batch_write_item(RequestItems={table_name: requests})
+                requests = resp.get("UnprocessedItems", {}).get(table_name, [])
+                if not requests:
+                    break
+            else:
+                logger.error("audit_log_write_failed", table=table_name, unprocessed=len(requests))
+        except Exception:
+            logger.error("audit_log_write_failed", table=table_name, exc_info=True)
+
+
 def build_retrieval_audit_entry(
     booking_id: str,
     employee_id: str,
@@ -56,6 +81,12 @@ def build_reasoning_audit_entry(
     plan_confidence: float,
     plan_intent: str,
     warnings_count: int,
+    structured_output: bool = False,
+    schema_failure_count: int = 0,
+    hedged: bool = False,
+    cache_hit: bool = False,
+    attempts: list[dict[str, Any]] | None = None,
+    routed: bool = False,
 ) -> dict[str, Any]:
     return {
         "auditId": str(uuid4()),
@@ -67,17 +98,45 @@ def build_reasoning_audit_entry(
             "model_id": model_id,
             "thinking_effort": thinking_effort,
             "escalated": escalated,
+            "structured_output": structured_output,
+            "hedged": hedged,
+            "routed": routed,
         },
         "output": {
             "plan_confidence": plan_confidence,
             "plan_intent": plan_intent,
             "retry_count": retry_count,
+            "schema_failure_count": schema_failure_count,
             "warnings_count": warnings_count,
+            "cache_hit": cache_hit,
         },
+        "attempts": attempts or [],
         "latency_ms": latency_ms,
     }
 
 
+def reasoning_audit_entry(result: ReasoningResult) -> dict[str, Any]:
+    """build_reasoning_audit_entry for a finished ReasoningResult."""
+    return build_reasoning_audit_entry(
+        booking_id=result.booking_id,
+        employee_id=result.employee_id,
+        model_id=result.model_id,
+        thinking_effort=result.thinking_effort,
+        latency_ms=result.latency_ms,
+        retry_count=result.retry_count,
+        escalated=result.escalated,
+        plan_confidence=result.plan.confidence,
+        plan_intent=result.plan.intent,
+        warnings_count=len(result.plan.warnings),
+        structured_output=result.structured_output,
+        schema_failure_count=result.schema_failure_count,
+        hedged=result.hedged,
+        cache_hit=result.cache_hit,
+        attempts=[a.model_dump() for a in result.attempts],
+        routed=result.routed,
+    )
+
+
 def build_flight_search_audit_entry(
     booking_id: str,
     employee_id: str,
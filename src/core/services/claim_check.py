@@ -0,0 +1,130 @@
+"""Claim-check offloading for large booking workflow state.
+
+Step Functions caps state at 256 KB, and every transition and Lambda payload carries the whole
+of it. The large fields are the retrieved policy text and the flight lists. Producers hand them
+to ClaimCheckStore.offload, which writes any field whose JSON form exceeds the threshold to S3
+under ``claim-check/{booking_id}/`` and leaves ``{"claim_check": "s3://bucket/key"}`` in its
+place. ASL JSONPaths pass the reference through untouched. Consumers call resolve on the fields
+they read before validating their input.
+
+Objects are content-addressed, so the same text is written once per booking and a resolved
+object never changes. Resolved values are therefore kept in a per-container LRU, and a warm
+Lambda reading the same claim again does not go back to S3. The bucket's lifecycle rule expires
+the prefix once workflows are long finished.
+"""
+
+import hashlib
+import json
+from collections import OrderedDict
+from collections.abc import Iterable
+from typing import Any
+
+import structlog
+
+from core.errors import ErrorCode, TripCortexError
+
+log = structlog.get_logger()
+
+CLAIM_PREFIX = "claim-check"
+CLAIM_FIELD = "claim_check"
+
+
+def is_claim(value: Any) -> bool:
+    return isinstance(value, dict) and len(value) == 1 and isinstance(value.get(CLAIM_FIELD), str)
+
+
+def _split_uri(uri: str) -> tuple[str, str]:
+    bucket, _, key = uri.removeprefix("s3://").partition("/")
+    return bucket, key
+
+
+class ClaimCheckStore:
+    """Swaps large payload fields for S3 references and back.
+
+    Args:
+        s3_client: boto3 S3 client
+        bucket: Bucket claims are written to; empty disables offloading (resolve still works)
+        threshold_bytes: Fields whose compact JSON is at most this size stay inline
+        cache_entries: Resolved values kept in memory
+    """
+
+    def __init__(self, s3_client: Any, bucket: str, threshold_bytes: int = 32 * 1024, cache_entries: int = 32) -> None:
+        self.s3_client = s3_client
+        self.bucket = bucket
+        self.threshold_bytes = threshold_bytes
+        self._cache_entries = cache_entries
+        self._cache: OrderedDict[str, Any] = OrderedDict()
+
+    def offload(self, payload: dict[str, Any], booking_id: str, fields: Iterable[str]) -> dict[str, Any]:
+        """Copy of payload with each large field (dotted path) replaced by a claim reference.
+
+        A failed write leaves the field inline — the state may still fit — and is logged.
+        """
+        if not self.bucket:
+            return payload
+        out = payload
+        for path in fields:
+            value = _get_path(out, path)
+            if value is None or is_claim(value):
+                continue
+            body = json.dumps(value, separators=(",", ":")).encode()
+            if len(body) <= self.threshold_bytes:
+                continue
+            name = path.replace(".", "-")
+            key = f"{CLAIM_PREFIX}/{booking_id}/{name}-{hashlib.sha256(body).hexdigest()[:16]}.json"
+            try:
+                self.s3_client.put_object(Bucket=self.bucket, Key=key, Body=body, ContentType="application/json")
+            except Exception as e:
+                log.warning("claim_check_offload_failed", booking_id=booking_id, field=path, error=str(e))
+                continue
+            uri = f"s3://{self.bucket}/{key}"
+            self._remember(uri, value)
+            out = _set_path(out, path, {CLAIM_FIELD: uri})
+            log.info("claim_check_offloaded", booking_id=booking_id, field=path, bytes=len(body))
+        return out
+
+    def resolve(self, payload: dict[str, Any], fields: Iterable[str]) -> dict[str, Any]:
+        """Copy of payload with each claim reference among fields replaced by the stored value."""
+        out = payload
+        for path in fields:
+            value = _get_path(out, path)
+            if is_claim(value):
+                out = _set_path(out, path, self.load(value[CLAIM_FIELD]))
+        return out
+
+    def load(self, uri: str) -> Any:
+        """Stored value for a claim URI, from the in-container cache when already resolved."""
+        if uri in self._cache:
+            self._cache.move_to_end(uri)
+            return self._cache[uri]
+        bucket, key = _split_uri(uri)
+        try:
+            body = self.s3_client.get_object(Bucket=bucket, Key=key)["Body"].read()
+        except Exception as e:
+            raise TripCortexError(f"Claim check {uri} could not be read: {e}", code=ErrorCode.INTERNAL_ERROR) from e
+        value = json.loads(body)
+        self._remember(uri, value)
+        return value
+
+    def _remember(self, uri: str, value: Any) -> None:
+        self._cache[uri] = value
+        self._cache.move_to_end(uri)
+        while len(self._cache) > self._cache_entries:
+            self._cache.popitem(last=False)
+
+
+def _get_path(payload: dict[str, Any], path: str) -> Any:
+    value: Any = payload
+    for part in path.split("."):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(part)
+    return value
+
+
+def _set_path(payload: dict[str, Any], path: str, value: Any) -> dict[str, Any]:
+    """Copy of payload with path set — dicts along the path are copied, the rest is shared."""
+    head, _, rest = path.partition(".")
+    out = dict(payload)
+    out[head] = _set_path(payload[head], rest, value) if rest else value
+    return out
@@ -7,11 +7,14 @@ import structlog
 
 from core.db.aurora import AuroraClient
 from core.errors import ErrorCode, PolicyRetrievalError
-from core.models.ingestion import BdaEntity, EmbeddingResult, FailedEntity
+from core.models.ingestion import BdaEntity, EmbeddingResult, FailedEntity, RestoreEmbeddingsResult
+from core.services.embedding_archive import EmbeddingArchive, content_hash
 from core.services.nova_mme import invoke_nova_mme
 
 logger = structlog.get_logger()
 
+_EMBEDDING_DIMENSION = 1024
+
 
 class EmbeddingService:
     """Generates Nova MME embeddings from BDA output and stores in pgvector."""
@@ -22,11 +25,13 @@ class EmbeddingService:
         s3_client: Any,
         aurora_client: AuroraClient,
         model_id: str,
+        archive: EmbeddingArchive | None = None,
     ) -> None:
         self.bedrock_runtime_client = bedrock_runtime_client
         self.s3_client = s3_client
         self.aurora_client = aurora_client
         self.model_id = model_id
+        self.archive = archive
 
     def generate_embeddings(self, policy_id: str, bda_output_s3_uri: str) -> EmbeddingResult:
         """
@@ -50,13 +55,24 @@ class EmbeddingService:
                 code=ErrorCode.RETRIEVAL_FAILED,
             ) from e
 
+        archived = self._load_reusable_vectors(policy_id)
         chunks = []
+        content_hashes: dict[str, str] = {}
         failed_entities = []
         entity_types_count: dict[str, int] = {}
+        reused = 0
 
         for entity in entities:
             try:
-                vector, content_type = self._embed_entity(entity)
+                embedding_input, content_type = self._embedding_input(entity)
+                entity_hash = content_hash(embedding_input)
+                cached = archived.get(entity.entity_id)
+                if cached and cached[0] == entity_hash:
+                    vector = cached[1]
+                    reused += 1
+                else:
+                    vector, _ = self._embed_entity(entity)
+                content_hashes[entity.entity_id] = entity_hash
                 chunks.append(
                     {
                         "policy_id": policy_id,
@@ -89,12 +105,14 @@ class EmbeddingService:
 
         chunks_created = self.aurora_client.insert_chunks(chunks)
         self.aurora_client.update_policy_status(policy_id, "embedded", chunks_created)
+        self._write_archive(policy_id, chunks, content_hashes)
 
         logger.info(
             "chunks_stored",
             policy_id=policy_id,
             chunks_created=chunks_created,
             chunks_failed=len(failed_entities),
+            chunks_reused=reused,
             entity_types=entity_types_count,
         )
 
@@ -106,6 +124,97 @@ class EmbeddingService:
             failed_entities=failed_entities,
         )
 
+    def restore_from_archive(self, policy_id: str, source_policy_id: str | None = None) -> RestoreEmbeddingsResult:
+        """
+        Bulk-load a policy's chunks from its embedding archive — no Bedrock calls.
+
+        Args:
+            policy_id: UUID of the policy row the chunks are written under
+            source_policy_id: Policy whose archive to read (defaults to policy_id)
+
+        Returns:
+            RestoreEmbeddingsResult with the number of chunks restored
+
+        Raises:
+            PolicyRetrievalError: If no archive is configured or found, or it cannot be read
+        """
+        source_policy_id = source_policy_id or policy_id
+        if self.archive is None:
+            raise PolicyRetrievalError("Embedding archive is not configured", code=ErrorCode.RETRIEVAL_FAILED)
+
+        try:
+            loaded = self.archive.read(source_policy_id)
+        except Exception as e:
+            raise PolicyRetrievalError(
+                f"Failed to read embedding archive: {e}",
+                code=ErrorCode.RETRIEVAL_FAILED,
+            ) from e
+        if loaded is None:
+            raise PolicyRetrievalError(
+                f"No embedding archive for policy {source_policy_id}",
+                code=ErrorCode.RETRIEVAL_FAILED,
+            )
+
+        manifest, rows = loaded
+        chunks = [
+            {
+                "policy_id": policy_id,
+                "content_type": record.content_type,
+                "content_text": record.content_text,
+                "source_page": record.source_page,
+                "section_title": record.section_title,
+                "reading_order": record.reading_order,
+                "bda_entity_id": record.bda_entity_id,
+                "bda_entity_subtype": record.bda_entity_subtype,
+                "embedding": vector,
+                "metadata": record.metadata,
+            }
+            for record, vector in rows
+        ]
+        chunks_restored = self.aurora_client.insert_chunks(chunks)
+        self.aurora_client.update_policy_status(policy_id, "embedded", chunks_restored)
+
+        logger.info(
+            "chunks_restored",
+            policy_id=policy_id,
+            source_policy_id=source_policy_id,
+            chunks_restored=chunks_restored,
+            model_id=manifest.model_id,
+        )
+        return RestoreEmbeddingsResult(
+            policy_id=policy_id,
+            source_policy_id=source_policy_id,
+            chunks_restored=chunks_restored,
+            model_id=manifest.model_id,
+            dimension=manifest.dimension,
+        )
+
+    def _load_reusable_vectors(self, policy_id: str) -> dict[str, tuple[str, list[float]]]:
+        """Map bda_entity_id → (content_hash, vector) from a previous archive made with this model."""
+        if self.archive is None:
+            return {}
+        try:
+            loaded = self.archive.read(policy_id)
+        except Exception as e:
+            logger.warning("embedding_archive_read_failed", policy_id=policy_id, error=str(e))
+            return {}
+        if loaded is None:
+            return {}
+
+        manifest, rows = loaded
+        if manifest.model_id != self.model_id or manifest.dimension != _EMBEDDING_DIMENSION:
+            return {}
+        return {record.bda_entity_id: (record.content_hash, vector) for record, vector in rows}
+
+    def _write_archive(self, policy_id: str, chunks: list[dict[str, Any]], content_hashes: dict[str, str]) -> None:
+        """Archive the chunks written to policy_chunks so re-ingestion can reuse their vectors."""
+        if self.archive is None or not chunks:
+            return
+        try:
+            self.archive.write(policy_id, self.model_id, chunks, content_hashes, _EMBEDDING_DIMENSION)
+        except Exception as e:
+            logger.warning("embedding_archive_write_failed", policy_id=policy_id, error=str(e))
+
     def _parse_bda_output(self, bda_output_s3_uri: str) -> list[BdaEntity]:
         """Parse BDA result JSON from S3 and extract entities."""
         # Extract bucket and prefix from S3 URI
@@ -226,13 +335,13 @@ class EmbeddingService:
                 code=ErrorCode.RETRIEVAL_FAILED,
             ) from e
 
-    def _embed_entity(self, entity: BdaEntity) -> tuple[list[float], str]:
-        """Generate embedding for entity and return (vector, content_type)."""
+    def _embedding_input(self, entity: BdaEntity) -> tuple[str, str]:
+        """Return (input sent to Nova MME, content_type) — the input is what the archive content hash covers."""
         if entity.entity_type == "FIGURE":
             if entity.crop_image_s3_uri:
-                return self._embed_image(entity.crop_image_s3_uri), "figure"
+                return entity.crop_image_s3_uri, "figure"
             elif entity.content_text:
-                return self._embed_text(entity.content_text), "figure"
+                return entity.content_text, "figure"
             else:
                 raise PolicyRetrievalError(
                     "Figure has no image or text content",
@@ -245,6 +354,11 @@ class EmbeddingService:
                 f"Entity {entity.entity_id} has no content",
                 code=ErrorCode.RETRIEVAL_FAILED,
             )
+        return content, "table" if entity.entity_type == "TABLE" else "text"
 
-        content_type = "table" if entity.entity_type == "TABLE" else "text"
-        return self._embed_text(content), content_type
+    def _embed_entity(self, entity: BdaEntity) -> tuple[list[float], str]:
+        """Generate embedding for entity and return (vector, content_type)."""
+        embedding_input, content_type = self._embedding_input(entity)
+        if entity.entity_type == "FIGURE" and entity.crop_image_s3_uri:
+            return self._embed_image(embedding_input), content_type
+        return self._embed_text(embedding_input), content_type
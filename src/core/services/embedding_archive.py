@@ -0,0 +1,178 @@
+"""Per-policy embedding archive in S3 — lets re-indexing reload vectors without re-calling Bedrock.
+
+Layout under ``embedding-archive/{policy_id}/`` in the policy bucket:
+- ``vectors.npy``     float32 matrix (rows x dimension), NumPy .npy v1.0 format
+- ``metadata.jsonl``  one chunk record per line, same row order as vectors.npy
+- ``manifest.json``   model id, dimension, row count — written last, marks the archive complete
+
+The .npy file is written and read with the standard library so Lambda bundles stay NumPy-free,
+but it loads directly with ``numpy.load`` for offline analysis.
+"""
+
+import ast
+import hashlib
+import struct
+import sys
+from array import array
+from datetime import datetime, timezone
+from typing import Any
+
+import structlog
+from botocore.exceptions import ClientError
+
+from core.models.ingestion import ArchivedChunk, EmbeddingArchiveManifest
+
+logger = structlog.get_logger()
+
+ARCHIVE_PREFIX = "embedding-archive"
+_NPY_MAGIC = b"\x93NUMPY\x01\x00"
+_FORMAT_VERSION = 1
+
+
+def content_hash(embedding_input: str) -> str:
+    """Hash of the exact input sent to Nova MME (text, markdown or image URI)."""
+    return hashlib.sha256(embedding_input.encode()).hexdigest()
+
+
+def encode_npy(vectors: list[list[float]], dimension: int) -> bytes:
+    """Serialize a row-major float32 matrix in NumPy .npy v1.0 format."""
+    header = f"{{'descr': '<f4', 'fortran_order': False, 'shape': ({len(vectors)}, {dimension}), }}"
+    # Magic (8) + header length (2) + header must be a multiple of 64 bytes, newline-terminated.
+    padding = 64 - (len(_NPY_MAGIC) + 2 + len(header) + 1) % 64
+    header_bytes = (header + " " * padding + "\n").encode("latin1")
+
+    data = array("f")
+    for vector in vectors:
+        if len(vector) != dimension:
+            raise ValueError(f"Vector has {len(vector)} dimensions, expected {dimension}")
+        data.extend(vector)
+    if sys.byteorder == "big":
+        data.byteswap()
+    return _NPY_MAGIC + struct.pack("<H", len(header_bytes)) + header_bytes + data.tobytes()
+
+
+def decode_npy(raw: bytes) -> list[list[float]]:
+    """Parse a 2-D little-endian float32 .npy v1.0 payload written by encode_npy."""
+    if raw[: len(_NPY_MAGIC)] != _NPY_MAGIC:
+        raise ValueError("Not a NumPy v1.0 .npy payload")
+    (header_len,) = struct.unpack("<H", raw[8:10])
+    header = ast.literal_eval(raw[10 : 10 + header_len].decode("latin1"))
+    if header["descr"] != "<f4" or header["fortran_order"] or len(header["shape"]) != 2:
+        raise ValueError(f"Unsupported .npy layout: {header}")
+    rows, dimension = header["shape"]
+
+    data = array("f")
+    data.frombytes(raw[10 + header_len :])
+    if sys.byteorder == "big":
+        data.byteswap()
+    if len(data) != rows * dimension:
+        raise ValueError(f"Expected {rows * dimension} floats, found {len(data)}")
+    return [data[i * dimension : (i + 1) * dimension].tolist() for i in range(rows)]
+
+
+class EmbeddingArchive:
+    """Reads and writes per-policy embedding archives in the policy bucket."""
+
+    def __init__(self, s3_client: Any, bucket: str) -> None:
+        self.s3_client = s3_client
+        self.bucket = bucket
+
+    def _key(self, policy_id: str, name: str) -> str:
+        return f"{ARCHIVE_PREFIX}/{policy_id}/{name}"
+
+    def write(
+        self,
+        policy_id: str,
+        model_id: str,
+        chunks: list[dict[str, Any]],
+        content_hashes: dict[str, str],
+        dimension: int = 1024,
+    ) -> EmbeddingArchiveManifest:
+        """
+        Archive the chunks written to policy_chunks for one policy.
+
+        Args:
+            policy_id: UUID of the policy
+            model_id: Embedding model that produced the vectors
+            chunks: Chunk dicts as passed to AuroraClient.insert_chunks
+            content_hashes: bda_entity_id → content_hash of the embedded input
+            dimension: Embedding dimension
+
+        Returns:
+            Manifest describing the written archive
+        """
+        records = [
+            ArchivedChunk(
+                bda_entity_id=c["bda_entity_id"],
+                content_hash=content_hashes[c["bda_entity_id"]],
+                content_type=c["content_type"],
+                content_text=c["content_text"],
+                source_page=c["source_page"],
+                section_title=c["section_title"],
+                reading_order=c["reading_order"],
+                bda_entity_subtype=c["bda_entity_subtype"],
+                metadata=c["metadata"],
+            )
+            for c in chunks
+        ]
+        manifest = EmbeddingArchiveManifest(
+            policy_id=policy_id,
+            model_id=model_id,
+            dimension=dimension,
+            count=len(records),
+            format_version=_FORMAT_VERSION,
+            created_at=datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        )
+
+        self.s3_client.put_object(
+            Bucket=self.bucket,
+            Key=self._key(policy_id, "vectors.npy"),
+            Body=encode_npy([c["embedding"] for c in chunks], dimension),
+            ContentType="application/octet-stream",
+        )
+        self.s3_client.put_object(
+            Bucket=self.bucket,
+            Key=self._key(policy_id, "metadata.jsonl"),
+            Body="".join(r.model_dump_json() + "\n" for r in records).encode(),
+            ContentType="application/x-ndjson",
+        )
+        self.s3_client.put_object(
+            Bucket=self.bucket,
+            Key=self._key(policy_id, "manifest.json"),
+            Body=manifest.model_dump_json().encode(),
+            ContentType="application/json",
+        )
+        logger.info("embedding_archive_written", policy_id=policy_id, count=manifest.count, model_id=model_id)
+        return manifest
+
+    def read(self, policy_id: str) -> tuple[EmbeddingArchiveManifest, list[tuple[ArchivedChunk, list[float]]]] | None:
+        """
+        Load a policy's archive.
+
+        Returns:
+            (manifest, [(chunk, vector), ...]) or None if no complete archive exists
+
+        Raises:
+            ValueError: If the archive is present but inconsistent
+        """
+        try:
+            obj = self.s3_client.get_object(Bucket=self.bucket, Key=self._key(policy_id, "manifest.json"))
+        except ClientError as e:
+            if e.response["Error"]["Code"] in ("NoSuchKey", "404"):
+                return None
+            raise
+        manifest = EmbeddingArchiveManifest.model_validate_json(obj["Body"].read())
+
+        raw_vectors = self.s3_client.get_object(Bucket=self.bucket, Key=self._key(policy_id, "vectors.npy"))
+        vectors = decode_npy(raw_vectors["Body"].read())
+        raw_metadata = self.s3_client.get_object(Bucket=self.bucket, Key=self._key(policy_id, "metadata.jsonl"))
+        records = [
+            ArchivedChunk.model_validate_json(line) for line in raw_metadata["Body"].read().splitlines() if line.strip()
+        ]
+
+        if not (len(vectors) == len(records) == manifest.count):
+            raise ValueError(
+                f"Embedding archive for {policy_id} is inconsistent: "
+                f"{len(vectors)} vectors, {len(records)} records, manifest count {manifest.count}"
+            )
+        return manifest, list(zip(records, vectors, strict=True))
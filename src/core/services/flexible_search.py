@@ -0,0 +1,159 @@
+"""Flexible-date and nearby-airport search fan-out.
+
+One search becomes several variants — the exact (origin, destination, date), the same route
+±flex_days around it, and routes through nearby airports — issued concurrently on a thread
+pool so the wall-clock cost stays close to a single search. Whatever has finished when the
+time budget runs out is returned; unfinished variants are abandoned.
+"""
+
+import time
+from collections.abc import Mapping, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from datetime import date, timedelta
+from typing import Any, NamedTuple
+
+import structlog
+
+from core.errors import PortalUnavailableError
+from core.services.flight_search_cache import FlightSearchCache
+from core.services.portal_client import PortalClient
+
+log = structlog.get_logger()
+
+# Airports close enough to stand in for each other on a business trip. Only pairs the portal serves
+# are useful; the rest are kept for when it grows.
+NEARBY_AIRPORTS: dict[str, tuple[str, ...]] = {
+    "BOM": ("PNQ",),
+    "PNQ": ("BOM",),
+    "AMD": ("STV",),
+    "STV": ("AMD",),
+    "JFK": ("EWR", "LGA"),
+    "LHR": ("LGW",),
+}
+
+
+class SearchVariant(NamedTuple):
+    origin: str
+    destination: str
+    departure_date: str
+
+
+class FanOutResult(NamedTuple):
+    # Raw portal responses of the variants that succeeded, in variant order (exact search first).
+    results: list[tuple[SearchVariant, dict[str, Any]]]
+    attempted: int
+    # Variants that failed or did not finish within the budget.
+    incomplete: int
+
+
+def build_variants(
+    origin: str,
+    destination: str,
+    departure_date: date,
+    flex_days: int,
+    nearby: Mapping[str, Sequence[str]],
+    today: date,
+    max_variants: int,
+) -> list[SearchVariant]:
+    """Exact search first, then nearest dates, then nearby airports. Past alternate dates are skipped."""
+    dates = [departure_date]
+    for offset in range(1, flex_days + 1):
+        dates += [departure_date - timedelta(days=offset), departure_date + timedelta(days=offset)]
+    origins = [origin, *nearby.get(origin, ())]
+    destinations = [destination, *nearby.get(destination, ())]
+
+    variants: list[SearchVariant] = []
+    for o in origins:
+        for d in destinations:
+            if o == d:
+                continue
+            for day in dates:
+                if day == departure_date or day >= today:
+                    variants.append(SearchVariant(o, d, day.isoformat()))
+    # Stable sort keeps date order (nearest first) within each route group.
+    variants.sort(key=lambda v: (v.origin != origin) + (v.destination != destination))
+    return variants[:max_variants]
+
+
+class FlexibleSearch:
+    """Fans one search out over nearby dates and airports.
+
+    Args:
+        flex_days: Also search this many days either side of the requested date
+        nearby_airports: Alternates per airport; None disables the airport fan-out
+        budget_s: Wall-clock budget for the whole fan-out
+        max_workers: Concurrent portal requests; keep at or below the portal client's pool size
+        max_variants: Cap on variants per search, exact search included
+    """
+
+    def __init__(
+        self,
+        flex_days: int = 1,
+        nearby_airports: Mapping[str, Sequence[str]] | None = None,
+        budget_s: float = 8.0,
+        max_workers: int = 4,
+        max_variants: int = 9,
+    ) -> None:
+        self._flex_days = flex_days
+        self._nearby = nearby_airports or {}
+        self._budget_s = budget_s
+        self._max_workers = max_workers
+        self._max_variants = max_variants
+
+    def search(
+        self,
+        searcher: PortalClient | FlightSearchCache,
+        origin: str,
+        destination: str,
+        departure_date: date,
+        cabin_class: str,
+    ) -> FanOutResult:
+        """Run every variant concurrently and collect what finishes within the budget.
+
+        Raises:
+            The exact search's error (else the first variant error) when no variant succeeded;
+            PortalUnavailableError when none finished within the budget.
+        """
+        variants = build_variants(
+            origin, destination, departure_date, self._flex_days, self._nearby, date.today(), self._max_variants
+        )
+        start = time.perf_counter()
+        executor = ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="flight-search")
+        futures: dict[Future[dict[str, Any]], SearchVariant] = {
+            executor.submit(searcher.search_flights, v.origin, v.destination, v.departure_date, cabin_class): v
+            for v in variants
+        }
+        try:
+            wait(futures, timeout=self._budget_s)
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        results: list[tuple[SearchVariant, dict[str, Any]]] = []
+        errors: dict[SearchVariant, BaseException] = {}
+        for future, variant in futures.items():
+            if not future.done() or future.cancelled():
+                continue
+            error = future.exception()
+            if error is None:
+                results.append((variant, future.result()))
+            else:
+                errors[variant] = error
+                log.warning("flight_search_variant_failed", **variant._asdict(), error=str(error))
+
+        incomplete = len(variants) - len(results)
+        log.info(
+            "flight_search_fanout",
+            variants=len(variants),
+            succeeded=len(results),
+            failed=len(errors),
+            timed_out=incomplete - len(errors),
+            latency_ms=round((time.perf_counter() - start) * 1000, 1),
+        )
+        if not results:
+            exact = variants[0]
+            if exact in errors:
+                raise errors[exact]
+            if errors:
+                raise next(iter(errors.values()))
+            raise PortalUnavailableError(f"Flight search did not finish within {self._budget_s:.0f}s")
+        return FanOutResult(results=results, attempted=len(variants), incomplete=incomplete)
@@ -0,0 +1,108 @@
+"""Multi-criteria flight ranking.
+
+Flights are turned into columns (price, duration minutes, stops, departure minute), each column
+is min-max normalized once, and every flight gets a weighted score in [0, 1] in a single pass
+over the columns. Policy-compliant flights always rank ahead of non-compliant ones; within each
+group the higher score wins. Only the top N are selected, with a heap-based partial sort, and
+each returned FlightOption carries its score and per-criterion breakdown.
+"""
+
+import heapq
+import re
+from collections.abc import Mapping
+
+from core.models.flight import FlightOption
+
+DEFAULT_WEIGHTS: dict[str, float] = {"price": 0.4, "duration": 0.25, "stops": 0.2, "departure_time": 0.15}
+DEFAULT_TOP_N = 25
+
+# Departure windows in minutes after midnight; red-eye wraps past midnight.
+TIME_WINDOWS: dict[str, tuple[int, int]] = {
+    "morning": (5 * 60, 12 * 60),
+    "afternoon": (12 * 60, 17 * 60),
+    "evening": (17 * 60, 22 * 60),
+    "red_eye": (22 * 60, 5 * 60),
+}
+# Score falls linearly to 0 this many minutes outside the preferred window.
+_TIME_FALLOFF_MINUTES = 360
+
+_DURATION_RE = re.compile(r"(?:(\d+)\s*h)?\s*(?:(\d+)\s*m)?")
+
+
+def _duration_minutes(duration: str | None) -> float | None:
+    if not duration:
+        return None
+    match = _DURATION_RE.fullmatch(duration.strip())
+    if not match or not any(match.groups()):
+        return None
+    return int(match.group(1) or 0) * 60 + int(match.group(2) or 0)
+
+
+def _departure_minute(departure_time: str) -> int | None:
+    try:
+        hours, minutes = departure_time[:5].split(":")
+        return int(hours) * 60 + int(minutes)
+    except ValueError:
+        return None
+
+
+def _normalized_inverse(column: list[float | None]) -> list[float]:
+    """1.0 for the column minimum, 0.0 for the maximum or a missing value; known values score 1.0 when flat."""
+    known = [v for v in column if v is not None]
+    if not known:
+        return [0.0] * len(column)
+    low, high = min(known), max(known)
+    span = high - low
+    return [0.0 if v is None else 1.0 if span == 0 else (high - v) / span for v in column]
+
+
+def _time_fit(minute: int | None, window: tuple[int, int]) -> float:
+    if minute is None:
+        return 0.0
+    start, end = window
+    inside = start <= minute < end if start < end else (minute >= start or minute < end)
+    if inside:
+        return 1.0
+    # Circular distance to the nearer window edge.
+    distance = min(min(abs(minute - edge), 1440 - abs(minute - edge)) for edge in (start, end))
+    return max(0.0, 1.0 - distance / _TIME_FALLOFF_MINUTES)
+
+
+def rank_flights(
+    flights: list[FlightOption],
+    time_preference: str | None = None,
+    top_n: int = DEFAULT_TOP_N,
+    weights: Mapping[str, float] = DEFAULT_WEIGHTS,
+) -> list[FlightOption]:
+    """Best top_n flights, compliant first, each with score and score_breakdown set.
+
+    Without a recognized time_preference the departure-time weight is dropped and the
+    remaining weights are rescaled to sum to 1.
+    """
+    if not flights:
+        return []
+
+    # Columns — a missing duration or departure time scores 0 on that criterion.
+    columns = {
+        "price": _normalized_inverse([f.price for f in flights]),
+        "duration": _normalized_inverse([_duration_minutes(f.duration) for f in flights]),
+        "stops": _normalized_inverse([float(f.stops) for f in flights]),
+    }
+    window = TIME_WINDOWS.get((time_preference or "").lower())
+    active = dict(weights)
+    if window is None:
+        active.pop("departure_time", None)
+    else:
+        columns["departure_time"] = [_time_fit(_departure_minute(f.departure_time), window) for f in flights]
+    total_weight = sum(active.values()) or 1.0
+    scaled = {name: weight / total_weight for name, weight in active.items() if name in columns}
+
+    breakdowns = [
+        {name: round(weight * columns[name][i], 4) for name, weight in scaled.items()} for i in range(len(flights))
+    ]
+    scores = [sum(b.values()) for b in breakdowns]
+
+    best = heapq.nsmallest(top_n, range(len(flights)), key=lambda i: (not flights[i].compliant, -scores[i], i))
+    return [
+        flights[i].model_copy(update={"score": round(scores[i], 4), "score_breakdown": breakdowns[i]}) for i in best
+    ]
@@ -4,6 +4,7 @@ from urllib.parse import quote, urlencode, urlparse, urlunparse
 
 from core.models.booking import BookingPlan, PolicyConstraints
 from core.models.flight import FlightSearchResult
+from core.services.vendor_index import allowed_carriers, is_allowed_carrier
 
 
 def build_search_url(plan: BookingPlan, base_url: str) -> str:
@@ -41,12 +42,9 @@ def filter_by_constraints(
 
     flights = [f for f in flights if f.price <= constraints.max_budget_usd]
 
-    if constraints.preferred_vendors != ["any"]:
-        vendors_lower = [v.lower() for v in constraints.preferred_vendors]
-        flights = [
-            f for f in flights
-            if any(v in f.airline.lower() for v in vendors_lower)
-        ]
+    allowed = allowed_carriers(constraints.preferred_vendors)
+    if allowed is not None:
+        flights = [f for f in flights if is_allowed_carrier(allowed, f.airline, f.flight_number)]
 
     warnings: list[str] = []
     if not flights:
@@ -1,35 +1,57 @@
 """Flight search via dummy portal REST API — replaces ACR/Nova Act for search step."""
 
-import urllib.request
-import urllib.parse
-import json
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
 from typing import Any
 
-from core.config import Config
-from core.models.flight import FlightOption, FlightSearchOutput, FlightSearchResult
-
-
-def search_flights_via_api(event: dict[str, Any], config: Config) -> dict[str, Any]:
+from core.models.flight import FlightOption, FlightSearchOutput, FlightSearchResult, RoundTripItinerary
+from core.services.flexible_search import FlexibleSearch, SearchVariant
+from core.services.flight_ranking import rank_flights
+from core.services.flight_search_cache import FlightSearchCache
+from core.services.portal_client import PortalClient
+from core.services.vendor_index import allowed_carriers, is_allowed_carrier
+
+
+def search_flights_via_api(
+    event: dict[str, Any],
+    portal: PortalClient | FlightSearchCache,
+    flexible: FlexibleSearch | None = None,
+) -> dict[str, Any]:
+    """Search the portal (or its cache) and tag each flight against this employee's policy constraints.
+
+    Filtering runs on every call, so a cached raw result is safe to share between employees.
+    Results are ranked compliant first, then by price, duration, stops and time_preference fit
+    (core/services/flight_ranking.py). With flexible, nearby dates and airports are searched
+    concurrently and merged; a fan-out cut short by its time budget adds PARTIAL_RESULTS.
+    Plans with a return_date take the round-trip path instead (flexible does not apply).
+    """
     plan = event["plan"]
     params = plan["parameters"]
-
-    query = urllib.parse.urlencode({
-        "from": params["origin"],
-        "to": params["destination"],
-        "date": params["departure_date"],
-        "class": params["cabin_class"],
-    })
-    req = urllib.request.Request(
-        f"{config.dummy_portal_url}/api/flights?{query}",
-        headers={"User-Agent": "Mozilla/5.0"},
-    )
-    with urllib.request.urlopen(req, timeout=10) as resp:
-        data = json.loads(resp.read())
-
-    flights = [_to_flight_option(f) for f in data["flights"]]
+    if params.get("return_date"):
+        return _search_round_trip(event, portal).model_dump()
+    warnings: list[str] = []
+
+    if flexible is None:
+        data = portal.search_flights(
+            params["origin"], params["destination"], params["departure_date"], params["cabin_class"]
+        )
+        flights = [_to_flight_option(f) for f in data["flights"]]
+    else:
+        fanout = flexible.search(
+            portal,
+            params["origin"],
+            params["destination"],
+            date.fromisoformat(params["departure_date"]),
+            params["cabin_class"],
+        )
+        flights = _merge_variants(fanout.results)
+        if fanout.incomplete:
+            warnings.append("PARTIAL_RESULTS")
 
     constraints = plan.get("policy_constraints", {})
     flights = _apply_policy_filters(flights, constraints)
+    total_results = len(flights)
+    flights = rank_flights(flights, params.get("time_preference"))
 
     result = FlightSearchOutput(
         booking_id=event["booking_id"],
@@ -39,12 +61,104 @@ def search_flights_via_api(event: dict[str, Any], config: Config) -> dict[str, A
             search_origin=params["origin"],
             search_destination=params["destination"],
             search_date=params["departure_date"],
-            total_results=len(flights),
+            total_results=total_results,
         ),
+        warnings=warnings,
     )
     return result.model_dump()
 
 
+def _search_round_trip(event: dict[str, Any], portal: PortalClient | FlightSearchCache) -> FlightSearchOutput:
+    """Search both legs concurrently and pair them, with the budget applied to the combined fare."""
+    plan = event["plan"]
+    params = plan["parameters"]
+    origin, destination, cabin = params["origin"], params["destination"], params["cabin_class"]
+    legs = ((origin, destination, params["departure_date"]), (destination, origin, params["return_date"]))
+
+    with ThreadPoolExecutor(max_workers=2, thread_name_prefix="round-trip") as pool:
+        futures = [pool.submit(portal.search_flights, o, d, day, cabin) for o, d, day in legs]
+        # Either leg failing fails the search — an itinerary needs both.
+        outbound_raw, inbound_raw = (f.result() for f in futures)
+
+    constraints = plan.get("policy_constraints", {})
+    # Vendor rules apply per leg; the budget applies to the pair.
+    leg_constraints = {**constraints, "max_budget_usd": None}
+    outbound = _apply_policy_filters(_leg_options(outbound_raw, *legs[0]), leg_constraints)
+    inbound = _apply_policy_filters(_leg_options(inbound_raw, *legs[1]), leg_constraints)
+    total_pairs = len(outbound) * len(inbound)
+    time_preference = params.get("time_preference")
+    outbound = rank_flights(outbound, time_preference)
+    inbound = rank_flights(inbound, time_preference)
+    itineraries = _pair_itineraries(outbound, inbound, constraints.get("max_budget_usd"))
+
+    return FlightSearchOutput(
+        booking_id=event["booking_id"],
+        employee_id=event["employee_id"],
+        search_result=FlightSearchResult(
+            flights=outbound,
+            search_origin=origin,
+            search_destination=destination,
+            search_date=params["departure_date"],
+            return_date=params["return_date"],
+            itineraries=itineraries,
+            total_results=total_pairs,
+        ),
+    )
+
+
+def _leg_options(data: dict[str, Any], origin: str, destination: str, day: str) -> list[FlightOption]:
+    return [
+        _to_flight_option(f).model_copy(update={"origin": origin, "destination": destination, "departure_date": day})
+        for f in data["flights"]
+    ]
+
+
+def _pair_itineraries(
+    outbound: list[FlightOption], inbound: list[FlightOption], max_budget: float | None, per_leg: int = 10
+) -> list[RoundTripItinerary]:
+    """Pair the per_leg best options of each ranked leg.
+
+    Pairs are ordered compliant first, then by combined ranking score, then by combined fare.
+    """
+    itineraries: list[RoundTripItinerary] = []
+    for out in outbound[:per_leg]:
+        for back in inbound[:per_leg]:
+            total = out.price + back.price
+            notes = [*out.policy_notes, *back.policy_notes]
+            if max_budget and total > max_budget:
+                notes.append(f"Over budget (${total:.0f} > ${max_budget:.0f} round trip)")
+            itineraries.append(
+                RoundTripItinerary(
+                    outbound=out, inbound=back, total_price=total, compliant=not notes, policy_notes=notes
+                )
+            )
+    itineraries.sort(
+        key=lambda it: (not it.compliant, -((it.outbound.score or 0.0) + (it.inbound.score or 0.0)), it.total_price)
+    )
+    return itineraries[:per_leg]
+
+
+def _merge_variants(results: list[tuple[SearchVariant, dict[str, Any]]]) -> list[FlightOption]:
+    """Flatten variant results, tagging each flight with its route and date.
+
+    The same flight returned by two variants is kept once, at its lowest price.
+    """
+    merged: dict[tuple[str, str, str], FlightOption] = {}
+    for variant, data in results:
+        for raw in data["flights"]:
+            flight = _to_flight_option(raw).model_copy(
+                update={
+                    "origin": variant.origin,
+                    "destination": variant.destination,
+                    "departure_date": variant.departure_date,
+                }
+            )
+            key = (flight.flight_number, variant.departure_date, flight.departure_time)
+            if key not in merged or flight.price < merged[key].price:
+                merged[key] = flight
+    return list(merged.values())
+
+
 def _to_flight_option(f: dict[str, Any]) -> FlightOption:
     seg = f["segments"][0]
     dep = seg["departureTime"][11:16]  # HH:MM
@@ -68,7 +182,7 @@ def _apply_policy_filters(
     flights: list[FlightOption], constraints: dict[str, Any]
 ) -> list[FlightOption]:
     max_budget = constraints.get("max_budget_usd")
-    vendors = [v.lower() for v in constraints.get("preferred_vendors", []) if v.lower() != "any"]
+    allowed = allowed_carriers(constraints.get("preferred_vendors"))
 
     compliant: list[FlightOption] = []
     non_compliant: list[FlightOption] = []
@@ -77,7 +191,7 @@ def _apply_policy_filters(
         notes: list[str] = []
         if max_budget and f.price > max_budget:
             notes.append(f"Over budget (${f.price:.0f} > ${max_budget:.0f})")
-        if vendors and f.airline.lower() not in vendors:
+        if not is_allowed_carrier(allowed, f.airline, f.flight_number):
             notes.append(f"Non-preferred airline ({f.airline})")
 
         tagged = f.model_copy(update={"compliant": len(notes) == 0, "policy_notes": notes})
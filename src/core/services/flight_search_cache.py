@@ -0,0 +1,159 @@
+"""Short-lived cache of raw portal flight searches, with stale-while-revalidate.
+
+Many employees search the same route and date within minutes of each other. Raw portal
+results — before any per-employee policy filtering — are cached per (origin, destination,
+departure_date, cabin_class) in an in-process LRU and, when a table is configured, in
+DynamoDB so every warm container shares them.
+
+An entry younger than fresh_seconds is served as is. Up to max_stale_seconds past that it is
+still served, and a background refresh replaces it for the next search. Older entries are
+misses and wait for the portal. The background refresh is best effort: Lambda freezes the
+container between invocations, so it may finish during the next one or not at all.
+"""
+
+import json
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any
+
+import structlog
+
+from core.services.portal_client import PortalClient
+
+log = structlog.get_logger()
+
+
+def build_search_key(origin: str, destination: str, departure_date: str, cabin_class: str) -> str:
+    return "#".join([origin.strip().upper(), destination.strip().upper(), departure_date, cabin_class.strip().lower()])
+
+
+class FlightSearchCache:
+    """Caching front for PortalClient.search_flights, with the same call signature.
+
+    Args:
+        portal: Client used on misses and refreshes
+        dynamo_client: DynamoDB client for the shared tier; None keeps the cache in process only
+        table_name: Shared-tier table (hash key cacheKey, TTL attribute ttl)
+        fresh_seconds: Age below which an entry is served without a refresh
+        max_stale_seconds: How long past fresh_seconds an entry is still served while it refreshes
+        max_entries: In-process LRU capacity
+        clock: Epoch-seconds source, injectable for tests
+    """
+
+    def __init__(
+        self,
+        portal: PortalClient,
+        dynamo_client: Any = None,
+        table_name: str = "",
+        fresh_seconds: int = 120,
+        max_stale_seconds: int = 600,
+        max_entries: int = 256,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._portal = portal
+        self._client = dynamo_client if table_name else None
+        self._table = table_name
+        self._fresh_seconds = fresh_seconds
+        self._max_stale_seconds = max_stale_seconds
+        self._max_entries = max_entries
+        self._clock = clock
+        self._entries: OrderedDict[str, tuple[dict[str, Any], float]] = OrderedDict()
+        self._refreshing: set[str] = set()
+        self._lock = threading.Lock()
+
+    def search_flights(self, origin: str, destination: str, departure_date: str, cabin_class: str) -> dict[str, Any]:
+        """Raw portal response for the search, from cache when fresh enough."""
+        args = (origin, destination, departure_date, cabin_class)
+        key = build_search_key(*args)
+        now = self._clock()
+        entry, source = self._lookup(key, now)
+        if entry is not None:
+            data, fetched_at = entry
+            age = now - fetched_at
+            if age < self._fresh_seconds:
+                log.info("flight_search_cache", outcome="hit", source=source, age_s=round(age))
+                return data
+            if age < self._fresh_seconds + self._max_stale_seconds:
+                log.info("flight_search_cache", outcome="stale", source=source, age_s=round(age))
+                self._refresh_in_background(key, args)
+                return data
+
+        log.info("flight_search_cache", outcome="miss")
+        return self._fetch(key, args)
+
+    def _lookup(self, key: str, now: float) -> tuple[tuple[dict[str, Any], float] | None, str]:
+        """Newest known entry for key. The shared tier is read only when the local copy is not fresh."""
+        with self._lock:
+            local = self._entries.get(key)
+            if local is not None:
+                self._entries.move_to_end(key)
+        if local is not None and now - local[1] < self._fresh_seconds:
+            return local, "memory"
+        shared = self._load(key)
+        if shared is not None and (local is None or shared[1] > local[1]):
+            self._remember(key, shared)
+            return shared, "dynamo"
+        return local, "memory"
+
+    def _fetch(self, key: str, args: tuple[str, str, str, str]) -> dict[str, Any]:
+        data = self._portal.search_flights(*args)
+        entry = (data, self._clock())
+        self._remember(key, entry)
+        self._save(key, entry)
+        return data
+
+    def _remember(self, key: str, entry: tuple[dict[str, Any], float]) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def _refresh_in_background(self, key: str, args: tuple[str, str, str, str]) -> None:
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+
+        def _refresh() -> None:
+            try:
+                self._fetch(key, args)
+            except Exception as e:
+                log.warning("flight_search_cache_refresh_failed", error=str(e))
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        threading.Thread(target=_refresh, name="flight-search-refresh", daemon=True).start()
+
+    def _load(self, key: str) -> tuple[dict[str, Any], float] | None:
+        if self._client is None:
+            return None
+        try:
+            resp = self._client.get_item(TableName=self._table, Key={"cacheKey": {"S": key}})
+        except Exception as e:
+            log.warning("flight_search_cache_read_failed", error=str(e))
+            return None
+        item = resp.get("Item")
+        if not item:
+            return None
+        return json.loads(item["result"]["S"]), float(item["fetchedAt"]["N"])
+
+    def _save(self, key: str, entry: tuple[dict[str, Any], float]) -> None:
+        if self._client is None:
+            return
+        data, fetched_at = entry
+        try:
+            self._client.put_item(
+                TableName=self._table,
+                Item={
+                    "cacheKey": {"S": key},
+                    "result": {"S": json.dumps(data, separators=(",", ":"))},
+                    "fetchedAt": {"N": str(fetched_at)},
+                    "ttl": {"N": str(int(fetched_at) + self._fresh_seconds + self._max_stale_seconds)},
+                },
+            )
+        except Exception as e:
+            log.warning("flight_search_cache_write_failed", error=str(e))
@@ -6,43 +6,37 @@ from datetime import date, timedelta
 import structlog
 
 from core.models.booking import BookingPlan, ReasoningResult
+from core.services.rule_planner import parse_departure_date, resolve_route
 
 logger = structlog.get_logger()
 
 _ROUTE_RE = re.compile(r"from\s+([A-Z]{3})\s+to\s+([A-Z]{3})", re.IGNORECASE)
 _IATA_RE = re.compile(r"\b([A-Z]{3})\b")
-_DATE_RE = re.compile(r"(?:on|for)\s+(\w+\s+\d{1,2}(?:\s*,?\s*\d{4})?)", re.IGNORECASE)
 
 
 def _parse_query(user_query: str) -> tuple[str | None, str | None, date]:
     """Best-effort extraction of origin, destination, and date from user query.
 
-    Returns (None, None, default_date) when airports cannot be identified.
-    Airport codes are not PII — safe to log.
+    Uses the rule planner's parsers regardless of their confidence — any real airport pair
+    beats a placeholder here. When the planner finds no route, falls back to "from X to Y"
+    in any case, then to the first two three-letter words. Returns (None, None, default_date)
+    when airports cannot be identified. Airport codes are not PII — safe to log.
     """
-    origin: str | None = None
-    destination: str | None = None
-    departure_date = date.today() + timedelta(days=30)
+    origin, destination, _ = resolve_route(user_query)
+    if origin is None or destination is None:
+        origin, destination = _fallback_route(user_query)
+    departure_date, _ = parse_departure_date(user_query)
+    return origin, destination, departure_date or date.today() + timedelta(days=30)
 
+
+def _fallback_route(user_query: str) -> tuple[str | None, str | None]:
     route = _ROUTE_RE.search(user_query)
     if route:
-        origin, destination = route.group(1).upper(), route.group(2).upper()
-    else:
-        codes = _IATA_RE.findall(user_query.upper())
-        if len(codes) >= 2:
-            origin, destination = codes[0], codes[1]
-
-    date_match = _DATE_RE.search(user_query)
-    if date_match:
-        try:
-            from dateutil.parser import parse as parse_date
-            parsed = parse_date(date_match.group(1), fuzzy=True)
-            if parsed.date() >= date.today():
-                departure_date = parsed.date()
-        except (ValueError, OverflowError, ImportError):
-            pass
-
-    return origin, destination, departure_date
+        return route.group(1).upper(), route.group(2).upper()
+    codes = _IATA_RE.findall(user_query.upper())
+    if len(codes) >= 2:
+        return codes[0], codes[1]
+    return None, None
 
 
 def apply_graceful_degradation(
@@ -75,9 +69,9 @@ def apply_graceful_degradation(
         warnings.append("QUERY_PARSE_FAILED")
         # Build a dummy plan — it won't be used since parse_failed=True routes
         # to NotifyParseFailure in the ASL before reaching InvokeFlightSearch.
-        plan = BookingPlan.strict_defaults(
-            origin="DEL", destination="BOM", departure_date=departure_date
-        ).model_copy(update={"warnings": warnings})
+        plan = BookingPlan.strict_defaults(origin="DEL", destination="BOM", departure_date=departure_date).model_copy(
+            update={"warnings": warnings}
+        )
     else:
         plan = BookingPlan.strict_defaults(
             origin=origin,  # type: ignore[arg-type]
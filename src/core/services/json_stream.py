@@ -0,0 +1,88 @@
+"""Incremental JSON scanner for streamed model output.
+
+Tracks string/escape state and bracket nesting one chunk at a time, so a malformed object is
+detected as soon as the offending character arrives instead of after the full response.
+It does not build the object — the completed text is handed to the normal parser.
+"""
+
+_WHITESPACE = frozenset(" \t\r\n")
+# Characters valid outside strings once the object has started: structure, numbers, true/false/null,
+# and the Python literals True/False/None that plan_json.repair_json fixes after the stream ends.
+_BARE_CHARS = frozenset(",:-+.0123456789eEtrufalsnTFNo") | _WHITESPACE
+_ESCAPABLE = frozenset('"\\/bfnrtu')
+_CLOSERS = {"}": "{", "]": "["}
+
+
+class MalformedJsonStream(ValueError):
+    """Raised by IncrementalJsonScanner as soon as the stream can no longer be a valid JSON object."""
+
+
+class IncrementalJsonScanner:
+    """Validates the structure of the first top-level JSON object in a character stream.
+
+    Args:
+        max_preamble_chars: Non-whitespace characters tolerated before the opening ``{``
+            (markdown fences, a short preamble). 0 means the object must come first.
+    """
+
+    def __init__(self, max_preamble_chars: int = 200) -> None:
+        self._max_preamble = max_preamble_chars
+        self._preamble = 0
+        self._stack: list[str] = []
+        self._in_string = False
+        self._escape = False
+        self._chars: list[str] = []
+        self.started = False
+        self.complete = False
+
+    def feed(self, chunk: str) -> None:
+        """Consume the next chunk. Input after the object closes is ignored.
+
+        Raises:
+            MalformedJsonStream: If the stream cannot contain a valid JSON object.
+        """
+        for ch in chunk:
+            if self.complete:
+                return
+            if not self.started:
+                if ch == "{":
+                    self.started = True
+                    self._stack.append(ch)
+                    self._chars.append(ch)
+                elif ch not in _WHITESPACE:
+                    self._preamble += 1
+                    if self._preamble > self._max_preamble:
+                        raise MalformedJsonStream(f"no JSON object within {self._max_preamble} characters")
+                continue
+
+            self._chars.append(ch)
+            if self._in_string:
+                self._scan_string_char(ch)
+            elif ch == '"':
+                self._in_string = True
+            elif ch in "{[":
+                self._stack.append(ch)
+            elif ch in _CLOSERS:
+                if self._stack.pop() != _CLOSERS[ch]:
+                    raise MalformedJsonStream(f"mismatched '{ch}' at offset {len(self._chars) - 1}")
+                if not self._stack:
+                    self.complete = True
+            elif ch not in _BARE_CHARS:
+                raise MalformedJsonStream(f"unexpected {ch!r} at offset {len(self._chars) - 1}")
+
+    def _scan_string_char(self, ch: str) -> None:
+        if self._escape:
+            if ch not in _ESCAPABLE:
+                raise MalformedJsonStream(f"invalid escape '\\{ch}' at offset {len(self._chars) - 1}")
+            self._escape = False
+        elif ch == "\\":
+            self._escape = True
+        elif ch == '"':
+            self._in_string = False
+        elif ch < " ":
+            raise MalformedJsonStream(f"unescaped control character at offset {len(self._chars) - 1}")
+
+    @property
+    def text(self) -> str:
+        """The object text seen so far, from its opening brace."""
+        return "".join(self._chars)
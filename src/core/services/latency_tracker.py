@@ -0,0 +1,41 @@
+"""In-process rolling latency window — survives across warm Lambda invocations."""
+
+import math
+import threading
+from collections import deque
+
+
+class LatencyTracker:
+    """Keeps the most recent latency samples and answers percentile queries.
+
+    Args:
+        window: Number of most recent samples kept
+        min_samples: Below this many samples percentile() returns None — callers fall back to a default
+    """
+
+    def __init__(self, window: int = 200, min_samples: int = 10) -> None:
+        self._samples: deque[float] = deque(maxlen=window)
+        self._min_samples = min_samples
+        self._lock = threading.Lock()
+
+    def record(self, latency_ms: float) -> None:
+        with self._lock:
+            self._samples.append(latency_ms)
+
+    def percentile(self, pct: float) -> float | None:
+        """Nearest-rank percentile (0-100) of the current window, or None if too few samples."""
+        with self._lock:
+            if len(self._samples) < self._min_samples:
+                return None
+            ordered = sorted(self._samples)
+        rank = max(1, math.ceil(pct / 100 * len(ordered)))
+        return ordered[min(rank, len(ordered)) - 1]
+
+    def samples(self) -> list[float]:
+        """The current window, oldest first."""
+        with self._lock:
+            return list(self._samples)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._samples)
@@ -0,0 +1,93 @@
+"""DynamoDB-backed cache of validated BookingPlans.
+
+A plan is reusable when the same (normalized) request is reasoned over the same policy context,
+on the same day (relative dates resolve against today) by the same model. Re-ingesting policies
+bumps a generation counter that is part of every key, so all earlier entries stop matching at
+once and age out through the table TTL.
+"""
+
+import hashlib
+import re
+import time
+from typing import Any
+
+import structlog
+
+from core.models.booking import BookingPlan
+
+log = structlog.get_logger()
+
+_GENERATION_KEY = "__policy_generation__"
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_query(user_query: str) -> str:
+    """Case-fold, collapse whitespace and drop trailing punctuation."""
+    return _WHITESPACE.sub(" ", user_query).strip().rstrip(".!?").strip().casefold()
+
+
+class PlanCache:
+    def __init__(self, dynamo_client: Any, table_name: str, ttl_seconds: int = 86400) -> None:
+        self._client = dynamo_client
+        self._table = table_name
+        self._ttl_seconds = ttl_seconds
+
+    def generation(self) -> int:
+        """Current policy generation — 0 until the first re-ingestion."""
+        resp = self._client.get_item(
+            TableName=self._table,
+            Key={"cacheKey": {"S": _GENERATION_KEY}},
+            ConsistentRead=True,
+        )
+        return int(resp.get("Item", {}).get("generation", {}).get("N", "0"))
+
+    def bump_generation(self) -> int:
+        """Invalidate every cached plan by advancing the policy generation."""
+        resp = self._client.update_item(
+            TableName=self._table,
+            Key={"cacheKey": {"S": _GENERATION_KEY}},
+            UpdateExpression="ADD generation :one",
+            ExpressionAttributeValues={":one": {"N": "1"}},
+            ReturnValues="UPDATED_NEW",
+        )
+        generation = int(resp["Attributes"]["generation"]["N"])
+        log.info("plan_cache_invalidated", generation=generation)
+        return generation
+
+    @staticmethod
+    def build_key(user_query: str, context_text: str, today: str, model_id: str, generation: int) -> str:
+        context_hash = hashlib.sha256(context_text.encode()).hexdigest()
+        material = "\x1f".join([normalize_query(user_query), context_hash, today, model_id, str(generation)])
+        return hashlib.sha256(material.encode()).hexdigest()
+
+    def get(self, cache_key: str) -> BookingPlan | None:
+        resp = self._client.get_item(TableName=self._table, Key={"cacheKey": {"S": cache_key}})
+        item = resp.get("Item")
+        # DynamoDB TTL deletion is lazy — treat expired-but-present items as misses.
+        if not item or int(item.get("ttl", {}).get("N", "0")) < int(time.time()):
+            return None
+        return BookingPlan.model_validate_json(item["plan"]["S"])
+
+    def put(self, cache_key: str, plan: BookingPlan) -> None:
+        self._client.put_item(
+            TableName=self._table,
+            Item={
+                "cacheKey": {"S": cache_key},
+                "plan": {"S": plan.model_dump_json()},
+                "ttl": {"N": str(int(time.time()) + self._ttl_seconds)},
+            },
+        )
+
+
+def invalidate_plan_cache(plan_cache: PlanCache | None) -> None:
+    """Bump the policy generation after policy chunks change.
+
+    Failure is logged rather than raised: the chunks are already committed, and cached plans
+    still expire through the table TTL.
+    """
+    if plan_cache is None:
+        return
+    try:
+        plan_cache.bump_generation()
+    except Exception as e:
+        log.error("plan_cache_invalidation_failed", error=str(e))
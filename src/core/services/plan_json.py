@@ -0,0 +1,59 @@
+"""Locate and decode the JSON object in free-text model output, repairing common LLM defects.
+
+The object is found with the stdlib's C scanner (``JSONDecoder.raw_decode``), which is
+string/escape aware — braces inside string values and prose after the object do not confuse it.
+When the scan fails, markdown fences, trailing commas and Python literals are repaired outside
+string values and the scan is retried once, so a fixable output never costs another model call.
+"""
+
+import json
+import re
+from typing import Any
+
+_DECODER = json.JSONDecoder()
+
+# A string literal, or one of the defects. Strings match first, so their contents are never rewritten.
+_REPAIR_RE = re.compile(r'"(?:[^"\\]|\\.)*"|```[A-Za-z]*|,(?=\s*[}\]])|\b(?:True|False|None)\b')
+_PY_LITERALS = {"True": "true", "False": "false", "None": "null"}
+
+
+class PlanJsonError(ValueError):
+    """Raised when model output holds no decodable JSON object, even after repair."""
+
+
+def _repair_token(match: re.Match[str]) -> str:
+    token = match.group(0)
+    if token.startswith('"'):
+        return token
+    return _PY_LITERALS.get(token, "")
+
+
+def repair_json(text: str) -> str:
+    """Strip markdown fences and trailing commas and map True/False/None to JSON, outside strings."""
+    return _REPAIR_RE.sub(_repair_token, text)
+
+
+def decode_json_object(text: str) -> tuple[dict[str, Any], bool]:
+    """Decode the first top-level JSON object in text.
+
+    Returns:
+        (object, repaired) — repaired is True when the object only decoded after repair_json.
+
+    Raises:
+        PlanJsonError: If the text has no ``{`` or the object is malformed beyond repair.
+    """
+    start = text.find("{")
+    if start == -1:
+        raise PlanJsonError("No JSON object found in model response")
+    try:
+        obj, _ = _DECODER.raw_decode(text, start)
+        return obj, False
+    except json.JSONDecodeError as e:
+        error = e
+
+    repaired = repair_json(text[start:])
+    try:
+        obj, _ = _DECODER.raw_decode(repaired)
+    except json.JSONDecodeError:
+        raise PlanJsonError(f"Invalid JSON from model: {error}") from error
+    return obj, True
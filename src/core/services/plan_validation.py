@@ -5,15 +5,18 @@ from datetime import date
 import structlog
 
 from core.errors import ErrorCode, ValidationError
-from core.models.booking import ReasoningResult
+from core.models.booking import BookingPlan, ReasoningResult
+from core.models.retrieval import PolicyRule
+from core.services.policy_rules import advance_booking_days, budget_cap, permits_cabin
 
 logger = structlog.get_logger()
 
 
-def validate_plan(result: ReasoningResult) -> ReasoningResult:
+def validate_plan(result: ReasoningResult, policy_rules: list[PolicyRule] | None = None) -> ReasoningResult:
     """Re-validate the BookingPlan and run business rule checks.
 
     Adds warnings for soft violations. Raises ValidationError for hard violations.
+    With policy_rules (extracted at ingestion), departures from them are added as warnings.
     Returns the (possibly amended) ReasoningResult.
     """
     plan = result.plan
@@ -26,6 +29,9 @@ def validate_plan(result: ReasoningResult) -> ReasoningResult:
             code=ErrorCode.INVALID_PLAN,
         )
 
+    if policy_rules:
+        warnings.extend(_check_policy_rules(plan, policy_rules))
+
     # Soft check: advance booking requirement.
     adv = plan.policy_constraints.advance_booking_days_required
     if adv is not None:
@@ -46,3 +52,26 @@ def validate_plan(result: ReasoningResult) -> ReasoningResult:
         logger.info("plan_validation_amended", booking_id=result.booking_id, new_warnings=warnings)
 
     return result
+
+
+def _check_policy_rules(plan: BookingPlan, rules: list[PolicyRule]) -> list[str]:
+    """Warn where the plan departs from the extracted rules. Returns the warnings added.
+
+    Extraction is pattern-based, so the rules only flag a plan for review — they never change it.
+    """
+    warnings: list[str] = []
+    constraints = plan.policy_constraints
+    params = plan.parameters
+
+    cap = budget_cap(rules, params.cabin_class, params.origin, params.destination)
+    if cap is not None and constraints.max_budget_usd > cap:
+        warnings.append(f"BUDGET_ABOVE_POLICY_CAP: {cap:.0f}")
+
+    days = advance_booking_days(rules)
+    if days is not None and (constraints.advance_booking_days_required or 0) < days:
+        warnings.append(f"ADVANCE_WINDOW_BELOW_POLICY: {days} days")
+
+    if permits_cabin(rules, params.cabin_class) is False:
+        warnings.append(f"CABIN_NOT_PERMITTED: {params.cabin_class}")
+
+    return warnings
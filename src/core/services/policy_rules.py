@@ -0,0 +1,369 @@
+"""Structured policy rules — extracted once per policy version at ingestion, read on every booking.
+
+Each prose sentence of a policy chunk is matched against patterns for fare caps, cabin eligibility,
+preferred vendors and advance-booking windows; route tables become fare caps keyed by route. The
+query helpers turn a rule list into the values ReasoningService, RulePlanner and validate_plan need,
+so none of them has to re-derive the rules from raw policy text per request.
+"""
+
+import re
+from typing import Any
+
+import structlog
+
+from core.models.retrieval import PolicyChunkResult, PolicyRule
+
+logger = structlog.get_logger()
+
+_SENTENCE_SPLIT_RE = re.compile(r"(?<=[.;])\s+|\n+")
+_AMOUNT_RE = re.compile(r"(?:\$|USD\s?)(\d[\d,]*(?:\.\d+)?)", re.IGNORECASE)
+_CAP_WORDS_RE = re.compile(r"\b(?:cap(?:ped)?|limit|maximum|max|up to|not exceed|budget|at most)\b", re.IGNORECASE)
+# An amount is a fare cap only next to fare wording — "Seat upgrade up to $50" is not one.
+_FARE_WORDS_RE = re.compile(r"\b(?:air)?fares?\b|\btickets?\b", re.IGNORECASE)
+_FARE_WINDOW_CHARS = 40
+_ADVANCE_RE = re.compile(
+    r"\b(\d{1,3})\s+(?:calendar\s+|business\s+)?days?\s+(?:in\s+advance|before|prior|ahead)", re.IGNORECASE
+)
+_VENDOR_RULE_RE = re.compile(
+    r"\bpreferred\s+(?:airlines?|carriers?|vendors?)\b(?:\s+(?:are|is|include|includes))?\s*:?\s*(?P<names>[^.;\n]+)",
+    re.IGNORECASE,
+)
+_VENDOR_HEADING_RE = re.compile(r"\bpreferred\s+(?:airlines?|carriers?|vendors?)\b", re.IGNORECASE)
+_BULLET_RE = re.compile(r"^\s*[-*]\s+(?:\*\*[^*]+\*\*\s*[—–:-]\s*)?(?P<names>.+)$")
+_VENDOR_SPLIT_RE = re.compile(r"\s*(?:,|/|\band\b|\bor\b)\s*")
+# "first" and "business" alone are too common ("the first leg", "business travel"), so they need "class";
+# premium economy must match before economy.
+_CABIN_RE = re.compile(r"\b(premium economy|economy|business class|first class)\b", re.IGNORECASE)
+_RESTRICTION_RE = re.compile(r"\b(?:only|must|restricted to|limited to)\b", re.IGNORECASE)
+_PERMISSION_RE = re.compile(r"\b(?:permitted|allowed|eligible|may (?:book|fly|use))\b", re.IGNORECASE)
+# Eligibility that hangs on an approval or the employee's level needs judgement, whatever else the sentence says.
+_APPROVAL_RE = re.compile(r"\b(?:approvals?|approved|level|L[1-5]\+?|VP)\b", re.IGNORECASE)
+_NEGATION_RE = re.compile(r"\b(?:not|never|no)\b", re.IGNORECASE)
+_ROUTE_PAIR_RE = re.compile(r"\b([A-Z]{3})\s*[–—-]\s*([A-Z]{3})\b")
+_TABLE_SEPARATOR_RE = re.compile(r"^\|?[\s:|-]+\|?$")
+
+_MAX_CONDITION_CHARS = 500
+
+
+def _cabins_in(sentence: str) -> list[str]:
+    cabins: list[str] = []
+    for m in _CABIN_RE.finditer(sentence):
+        cabin = m.group(1).lower().replace(" class", "").replace(" ", "_")
+        if cabin not in cabins:
+            cabins.append(cabin)
+    return cabins
+
+
+def route_key(origin: str, destination: str) -> str:
+    """The value_text a route-keyed budget cap is stored under."""
+    return f"{origin.upper()}-{destination.upper()}"
+
+
+def extract_policy_rules(
+    text: str, section_title: str | None = None, source_page: int | None = None
+) -> list[PolicyRule]:
+    """Extract every rule stated in one chunk of policy text."""
+    prose: list[str] = []
+    table: list[str] = []
+    rules: list[PolicyRule] = []
+    for line in text.splitlines():
+        if line.lstrip().startswith("|"):
+            table.append(line)
+            continue
+        if table:
+            rules.extend(_route_caps(table, section_title, source_page))
+            table = []
+        prose.append(line)
+    rules.extend(_route_caps(table, section_title, source_page))
+    rules.extend(_vendor_list(prose, section_title, source_page))
+
+    for sentence in _SENTENCE_SPLIT_RE.split("\n".join(prose)):
+        sentence = sentence.strip()
+        if not sentence:
+            continue
+        cabins = _cabins_in(sentence)
+        # A cap names a cabin only when the sentence is about exactly one.
+        cap_cabin = cabins[0] if len(cabins) == 1 else None
+
+        if _CAP_WORDS_RE.search(sentence):
+            for m in _AMOUNT_RE.finditer(sentence):
+                window = sentence[max(0, m.start() - _FARE_WINDOW_CHARS) : m.end() + _FARE_WINDOW_CHARS]
+                if not _FARE_WORDS_RE.search(window):
+                    continue
+                rules.append(
+                    PolicyRule(
+                        rule_type="budget_cap",
+                        cabin_class=cap_cabin,
+                        value_numeric=float(m.group(1).replace(",", "")),
+                        section_title=section_title,
+                        source_page=source_page,
+                    )
+                )
+
+        for m in _ADVANCE_RE.finditer(sentence):
+            rules.append(
+                PolicyRule(
+                    rule_type="advance_booking",
+                    value_numeric=float(m.group(1)),
+                    section_title=section_title,
+                    source_page=source_page,
+                )
+            )
+
+        for m in _VENDOR_RULE_RE.finditer(sentence):
+            rules.extend(_vendors(m.group("names"), section_title, source_page))
+
+        if cabins and not _NEGATION_RE.search(sentence):
+            if _PERMISSION_RE.search(sentence) or _APPROVAL_RE.search(sentence):
+                condition = sentence[:_MAX_CONDITION_CHARS]
+                for cabin in cabins:
+                    rules.append(
+                        PolicyRule(
+                            rule_type="cabin_eligibility",
+                            cabin_class=cabin,
+                            value_text=condition,
+                            section_title=section_title,
+                            source_page=source_page,
+                        )
+                    )
+            elif _RESTRICTION_RE.search(sentence):
+                for cabin in cabins:
+                    rules.append(
+                        PolicyRule(
+                            rule_type="cabin_eligibility",
+                            cabin_class=cabin,
+                            section_title=section_title,
+                            source_page=source_page,
+                        )
+                    )
+    return _dedupe(rules)
+
+
+def _cells(row: str) -> list[str]:
+    return [cell.strip().strip("*").strip() for cell in row.strip().strip("|").split("|")]
+
+
+def _route_caps(rows: list[str], section_title: str | None, source_page: int | None) -> list[PolicyRule]:
+    """Fare caps from a markdown table whose first column is a route category.
+
+    Rows that give example airport pairs yield one cap per pair; the rest keep the category
+    label, which only the reasoning model can match to a request.
+    """
+    rows = [row for row in rows if not _TABLE_SEPARATOR_RE.match(row.strip())]
+    if not rows:
+        return []
+    header = _cells(rows[0])
+    if "route" not in header[0].lower():
+        return []
+    cap_columns = {
+        i: (cabins[0] if len(cabins) == 1 else None)
+        for i, name in enumerate(header)
+        if i and "cap" in name.lower()
+        for cabins in [_cabins_in(name)]
+    }
+    rules: list[PolicyRule] = []
+    for row in rows[1:]:
+        cells = _cells(row)
+        routes = [route_key(o, d) for o, d in _ROUTE_PAIR_RE.findall(cells[0])] or [cells[0]]
+        for i, cabin in cap_columns.items():
+            amount = _AMOUNT_RE.search(cells[i]) if i < len(cells) else None
+            if amount is None:
+                continue
+            for route in routes:
+                rules.append(
+                    PolicyRule(
+                        rule_type="budget_cap",
+                        cabin_class=cabin,
+                        value_numeric=float(amount.group(1).replace(",", "")),
+                        value_text=route,
+                        section_title=section_title,
+                        source_page=source_page,
+                    )
+                )
+    return rules
+
+
+def _vendor_list(lines: list[str], section_title: str | None, source_page: int | None) -> list[PolicyRule]:
+    """Vendors named in the bullet list under a "preferred airlines/carriers" heading or lead-in."""
+    rules: list[PolicyRule] = []
+    in_list = bool(section_title and _VENDOR_HEADING_RE.search(section_title))
+    for line in lines:
+        bullet = _BULLET_RE.match(line)
+        if bullet:
+            if in_list:
+                rules.extend(_vendors(bullet.group("names"), section_title, source_page))
+        elif line.lstrip().startswith("#"):
+            # A new heading ends the list unless it is itself about preferred carriers.
+            in_list = bool(_VENDOR_HEADING_RE.search(line))
+        elif _VENDOR_HEADING_RE.search(line):
+            in_list = True
+    return rules
+
+
+def _vendors(names: str, section_title: str | None, source_page: int | None) -> list[PolicyRule]:
+    rules: list[PolicyRule] = []
+    for name in _VENDOR_SPLIT_RE.split(names):
+        name = name.strip(" .:*")
+        if name[:1].isupper():
+            rules.append(
+                PolicyRule(
+                    rule_type="preferred_vendor",
+                    value_text=name,
+                    section_title=section_title,
+                    source_page=source_page,
+                )
+            )
+    return rules
+
+
+def _dedupe(rules: list[PolicyRule]) -> list[PolicyRule]:
+    """Drop repeats of the same rule, keeping the first source that states it."""
+    seen: set[tuple[Any, ...]] = set()
+    unique: list[PolicyRule] = []
+    for rule in rules:
+        key = (rule.rule_type, rule.cabin_class, rule.value_numeric, rule.value_text)
+        if key not in seen:
+            seen.add(key)
+            unique.append(rule)
+    return unique
+
+
+# ── Queries ─────────────────────────────────────────────────────────────────
+
+
+def budget_cap(
+    rules: list[PolicyRule], cabin_class: str, origin: str | None = None, destination: str | None = None
+) -> float | None:
+    """The fare cap for cabin_class, or None when the policy states none or it is ambiguous.
+
+    A cap stated for the route wins over caps stated for every route, and a cap stated for the
+    cabin wins over caps stated for every cabin. Caps scoped to a route category ("India Domestic")
+    are left to the reasoning model.
+    """
+    if origin and destination:
+        cap = route_cap(rules, cabin_class, origin, destination)
+        if cap is not None:
+            return cap
+    return _cabin_cap([r for r in rules if r.value_text is None], cabin_class)
+
+
+def route_cap(rules: list[PolicyRule], cabin_class: str, origin: str, destination: str) -> float | None:
+    """The fare cap the policy states for this airport pair, in either direction."""
+    keys = {route_key(origin, destination), route_key(destination, origin)}
+    return _cabin_cap([r for r in rules if r.value_text in keys], cabin_class)
+
+
+def _cabin_cap(rules: list[PolicyRule], cabin_class: str) -> float | None:
+    caps = [r for r in rules if r.rule_type == "budget_cap" and r.value_numeric is not None]
+    for candidates in (
+        {r.value_numeric for r in caps if r.cabin_class == cabin_class},
+        {r.value_numeric for r in caps if r.cabin_class is None},
+    ):
+        if len(candidates) == 1:
+            return candidates.pop()
+        if candidates:
+            return None
+    return None
+
+
+def advance_booking_days(rules: list[PolicyRule]) -> int | None:
+    """The strictest advance-booking window stated in the policy."""
+    days = [int(r.value_numeric) for r in rules if r.rule_type == "advance_booking" and r.value_numeric is not None]
+    return max(days) if days else None
+
+
+def preferred_vendors(rules: list[PolicyRule]) -> list[str]:
+    vendors: list[str] = []
+    for r in rules:
+        if r.rule_type == "preferred_vendor" and r.value_text and r.value_text not in vendors:
+            vendors.append(r.value_text)
+    return vendors
+
+
+def permits_cabin(rules: list[PolicyRule], cabin_class: str) -> bool | None:
+    """Whether the policy allows cabin_class outright.
+
+    None when the policy does not restrict cabins, or only allows this one under a condition
+    that needs judgement (e.g. "for flights over 8 hours").
+    """
+    eligibility = [r for r in rules if r.rule_type == "cabin_eligibility"]
+    unconditional = {r.cabin_class for r in eligibility if r.value_text is None}
+    if not unconditional:
+        return None
+    if cabin_class in unconditional:
+        return True
+    if any(r.cabin_class == cabin_class for r in eligibility):
+        return None
+    return False
+
+
+def format_rules_for_prompt(rules: list[PolicyRule]) -> str:
+    """Compact one-line-per-rule rendering for the reasoning prompt."""
+    lines: list[str] = []
+    for r in rules:
+        if r.rule_type == "budget_cap":
+            scope = (r.cabin_class or "any cabin").replace("_", " ") + (f", {r.value_text}" if r.value_text else "")
+            lines.append(f"- Fare cap ({scope}): ${r.value_numeric:,.0f}")
+        elif r.rule_type == "advance_booking":
+            lines.append(f"- Book at least {int(r.value_numeric or 0)} days in advance")
+        elif r.rule_type == "cabin_eligibility":
+            cabin = (r.cabin_class or "").replace("_", " ")
+            lines.append(f"- {cabin} permitted when: {r.value_text}" if r.value_text else f"- {cabin} permitted")
+    vendors = preferred_vendors(rules)
+    if vendors:
+        lines.append(f"- Preferred vendors: {', '.join(vendors)}")
+    return "\n".join(lines)
+
+
+# ── Ingestion stage ─────────────────────────────────────────────────────────
+
+
+class PolicyRuleExtractor:
+    """Runs after embedding: re-derives a policy's rules from its stored chunks."""
+
+    def __init__(self, aurora_client: Any) -> None:
+        self.aurora_client = aurora_client
+
+    def extract(self, policy_id: str) -> int:
+        """Replace the policy's stored rules with those in its current chunks. Returns rules stored."""
+        version, chunks = self.aurora_client.fetch_policy_text(policy_id)
+        rules: list[PolicyRule] = []
+        for chunk in chunks:
+            rules.extend(extract_policy_rules(chunk["content_text"], chunk["section_title"], chunk["source_page"]))
+        stored: int = self.aurora_client.replace_policy_rules(policy_id, version, _dedupe(rules))
+        logger.info(
+            "policy_rules_extracted",
+            policy_id=policy_id,
+            policy_version=version,
+            chunks_scanned=len(chunks),
+            rules_stored=stored,
+        )
+        return stored
+
+
+def refresh_policy_rules(aurora_client: Any, policy_id: str) -> None:
+    """Run rule extraction after an ingestion step, logging instead of raising.
+
+    The embeddings are already committed; until the next successful extraction, bookings
+    are planned from the previously stored rules and the raw policy excerpts.
+    """
+    try:
+        PolicyRuleExtractor(aurora_client).extract(policy_id)
+    except Exception as e:
+        logger.error("policy_rule_extraction_failed", policy_id=policy_id, error=str(e))
+
+
+def load_policy_rules(aurora_client: Any, chunks: list[PolicyChunkResult]) -> list[PolicyRule]:
+    """Rules of the policies the retrieved chunks came from; [] if they cannot be read.
+
+    Without rules the workflow still reasons over the retrieved excerpts, as before ingestion
+    extracted them.
+    """
+    policy_ids = list(dict.fromkeys(c.policy_id for c in chunks if c.policy_id))
+    if not policy_ids:
+        return []
+    try:
+        return list(aurora_client.fetch_policy_rules(policy_ids))
+    except Exception as e:
+        logger.warning("policy_rules_unavailable", policy_ids=policy_ids, error=str(e))
+        return []
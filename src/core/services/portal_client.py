@@ -0,0 +1,109 @@
+"""Pooled keep-alive HTTP client for the dummy portal REST API.
+
+One urllib3 PoolManager per container: the TCP connection and TLS session opened by the
+first search are reused by every later search in the same warm Lambda, instead of being
+set up again per call. Responses are requested gzip-compressed and decompressed chunk by
+chunk as they arrive.
+"""
+
+import json
+import time
+from typing import Any
+
+import structlog
+import urllib3
+
+from core.errors import BookingError, ErrorCode, PortalUnavailableError
+
+log = structlog.get_logger()
+
+_CHUNK_BYTES = 64 * 1024
+
+
+class PortalClient:
+    """Reusable client for the portal's JSON API.
+
+    Args:
+        base_url: Portal origin, e.g. https://flysmart.dportal.workers.dev
+        connect_timeout: Seconds to establish a connection (TCP + TLS)
+        read_timeout: Seconds to wait between bytes of the response
+        max_connections: Connections kept open per host; batch searches can run this many in parallel
+        retries: Retries on connection errors and 502/503/504, with short backoff
+        user_agent: Identifies this service to the portal
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        connect_timeout: float = 3.0,
+        read_timeout: float = 10.0,
+        max_connections: int = 4,
+        retries: int = 1,
+        user_agent: str = "trip-cortex/0.1",
+    ) -> None:
+        self._base_url = base_url.rstrip("/")
+        self._pool = urllib3.PoolManager(
+            maxsize=max_connections,
+            block=False,
+            timeout=urllib3.Timeout(connect=connect_timeout, read=read_timeout),
+            retries=urllib3.Retry(
+                total=retries,
+                backoff_factor=0.2,
+                status_forcelist=(502, 503, 504),
+                allowed_methods=frozenset({"GET"}),
+                raise_on_status=False,
+            ),
+            headers={"Accept": "application/json", "Accept-Encoding": "gzip", "User-Agent": user_agent},
+        )
+
+    def get_json(self, path: str, params: dict[str, str] | None = None) -> Any:
+        """GET base_url + path and decode the JSON body.
+
+        Raises:
+            PortalUnavailableError: On connection failure, timeout or a 5xx status.
+            BookingError: SEARCH_FAILED on a 4xx status or a body that is not JSON.
+        """
+        start = time.perf_counter()
+        try:
+            resp = self._pool.request(
+                "GET", f"{self._base_url}{path}", fields=params, preload_content=False, decode_content=True
+            )
+        except urllib3.exceptions.HTTPError as e:
+            log.warning("portal_request_failed", path=path, error=str(e))
+            raise PortalUnavailableError(f"Portal request failed: {e}") from e
+
+        try:
+            if resp.status >= 500:
+                raise PortalUnavailableError(f"Portal returned HTTP {resp.status} for {path}")
+            if resp.status >= 400:
+                raise BookingError(f"Portal returned HTTP {resp.status} for {path}", code=ErrorCode.SEARCH_FAILED)
+            # Each chunk is gunzipped as it is read, so decompression overlaps the transfer.
+            body = b"".join(resp.stream(_CHUNK_BYTES))
+        except urllib3.exceptions.HTTPError as e:
+            log.warning("portal_request_failed", path=path, error=str(e))
+            raise PortalUnavailableError(f"Portal response failed: {e}") from e
+        finally:
+            resp.release_conn()
+
+        try:
+            data = json.loads(body)
+        except json.JSONDecodeError as e:
+            raise BookingError(f"Portal returned invalid JSON for {path}: {e}", code=ErrorCode.SEARCH_FAILED) from e
+
+        log.info(
+            "portal_request",
+            path=path,
+            status=resp.status,
+            body_bytes=len(body),
+            gzip=resp.headers.get("Content-Encoding") == "gzip",
+            latency_ms=round((time.perf_counter() - start) * 1000, 1),
+        )
+        return data
+
+    def search_flights(self, origin: str, destination: str, departure_date: str, cabin_class: str) -> dict[str, Any]:
+        """One-way flight search. Returns the portal's raw response (a dict with a "flights" list)."""
+        data: dict[str, Any] = self.get_json(
+            "/api/flights",
+            {"from": origin, "to": destination, "date": departure_date, "class": cabin_class},
+        )
+        return data
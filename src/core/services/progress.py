@@ -0,0 +1,147 @@
+"""WebSocket progress updates sent from inside long-running workflow steps.
+
+Progress goes either straight to the WebSocket (ProgressNotifier) or, when a progress queue is
+configured, onto an SQS FIFO queue grouped by booking (QueuedProgressNotifier). The ASL's Notify
+states enqueue the same events. ProgressSender drains the queue, keeps only the newest message
+per booking in each batch (coalesce_progress), and posts it, so no workflow step waits on API
+Gateway.
+
+Queued progress can arrive after a message ResponseSender posted directly, so each event carries
+the workflow stage it reports. ResponseSender records the stage of every message it sends on the
+booking (record_sent_stage), and ProgressSender drops progress from an earlier stage.
+"""
+
+import json
+import uuid
+from typing import Any
+
+import structlog
+
+logger = structlog.get_logger()
+
+# Workflow stages, in the order the workflow reaches them.
+STAGE_RETRIEVAL = 1
+STAGE_REASONING = 2
+STAGE_SEARCH = 3
+STAGE_OPTIONS = 4
+STAGE_FINISHED = 5
+
+
+def build_progress_payload(booking_id: str | None, message: str) -> dict[str, Any]:
+    """Progress message in the shape the frontend already receives from the response sender."""
+    return {
+        "type": "progress",
+        "booking_id": booking_id,
+        "payload": {"message": message},
+    }
+
+
+class ProgressNotifier:
+    """Posts progress messages to one booking's WebSocket connection.
+
+    Best-effort: a failed post is logged and dropped — progress must never fail the step sending it.
+    """
+
+    def __init__(self, apigw_client: Any, connection_id: str, booking_id: str) -> None:
+        self._apigw = apigw_client
+        self._connection_id = connection_id
+        self._booking_id = booking_id
+
+    def __call__(self, message: str) -> None:
+        try:
+            self._apigw.post_to_connection(
+                ConnectionId=self._connection_id,
+                Data=json.dumps(build_progress_payload(self._booking_id, message)).encode(),
+            )
+        except Exception as e:
+            logger.warning("progress_post_failed", booking_id=self._booking_id, error=str(e))
+
+
+def build_progress_event(
+    connection_id: str, booking_id: str, message: str, employee_id: str, stage: int
+) -> dict[str, Any]:
+    """Queued progress event — the same fields the ASL's Notify states send."""
+    return {
+        "type": "progress",
+        "connection_id": connection_id,
+        "booking_id": booking_id,
+        "employee_id": employee_id,
+        "stage": stage,
+        "message": message,
+    }
+
+
+class QueuedProgressNotifier:
+    """ProgressNotifier's interface, but enqueues for ProgressSender instead of posting.
+
+    Best-effort like ProgressNotifier: a failed send is logged and dropped.
+    """
+
+    def __init__(
+        self, sqs_client: Any, queue_url: str, connection_id: str, booking_id: str, employee_id: str, stage: int
+    ) -> None:
+        self._sqs = sqs_client
+        self._queue_url = queue_url
+        self._connection_id = connection_id
+        self._booking_id = booking_id
+        self._employee_id = employee_id
+        self._stage = stage
+
+    def __call__(self, message: str) -> None:
+        event = build_progress_event(self._connection_id, self._booking_id, message, self._employee_id, self._stage)
+        try:
+            self._sqs.send_message(
+                QueueUrl=self._queue_url,
+                MessageBody=json.dumps(event),
+                MessageGroupId=self._booking_id,
+                # Repeated ticks carry the same body; content-based dedup would drop them.
+                MessageDeduplicationId=uuid.uuid4().hex,
+            )
+        except Exception as e:
+            logger.warning("progress_enqueue_failed", booking_id=self._booking_id, error=str(e))
+
+
+def coalesce_progress(events: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Newest event per (connection_id, booking_id), ordered by when each newest event arrived.
+
+    Events without a connection id cannot be delivered and are dropped.
+    """
+    latest: dict[tuple[str, str | None], dict[str, Any]] = {}
+    for event in events:
+        connection_id = event.get("connection_id")
+        if not connection_id:
+            continue
+        key = (connection_id, event.get("booking_id"))
+        latest.pop(key, None)  # re-insert so dict order follows the newest event
+        latest[key] = event
+    return list(latest.values())
+
+
+def record_sent_stage(dynamo_client: Any, table: str, employee_id: str, booking_id: str, stage: int) -> None:
+    """Raise the booking's sentStage to stage. Never lowers it; a failed write is logged and dropped."""
+    try:
+        dynamo_client.update_item(
+            TableName=table,
+            Key={"employeeId": {"S": employee_id}, "bookingId": {"S": booking_id}},
+            UpdateExpression="SET sentStage = :s",
+            ConditionExpression="attribute_exists(bookingId) AND (attribute_not_exists(sentStage) OR sentStage < :s)",
+            ExpressionAttributeValues={":s": {"N": str(stage)}},
+        )
+    except dynamo_client.exceptions.ConditionalCheckFailedException:
+        pass
+    except Exception as e:
+        logger.warning("progress_stage_record_failed", booking_id=booking_id, error=str(e))
+
+
+def sent_stage(dynamo_client: Any, table: str, employee_id: str, booking_id: str) -> int:
+    """The last stage ResponseSender sent for the booking; 0 if none or it cannot be read."""
+    try:
+        resp = dynamo_client.get_item(
+            TableName=table,
+            Key={"employeeId": {"S": employee_id}, "bookingId": {"S": booking_id}},
+            ProjectionExpression="sentStage",
+        )
+    except Exception as e:
+        logger.warning("progress_stage_read_failed", booking_id=booking_id, error=str(e))
+        return 0
+    return int(resp.get("Item", {}).get("sentStage", {}).get("N", 0))
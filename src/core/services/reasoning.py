@@ -1,7 +1,11 @@
 """Reasoning service — invokes Nova 2 Lite via Bedrock Converse API with Extended Thinking."""
 
 import json
+import threading
 import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import contextmanager
 from datetime import date
 from typing import Any
 
@@ -9,12 +13,36 @@ import structlog
 from pydantic import ValidationError as PydanticValidationError
 
 from core.errors import ErrorCode, ReasoningError
-from core.models.booking import BookingPlan, ReasoningRequest, ReasoningResult, ThinkingEffort
+from core.models.booking import BookingPlan, ReasoningAttempt, ReasoningRequest, ReasoningResult, ThinkingEffort
+from core.models.retrieval import PolicyRule
+from core.services.attempt_scheduler import AttemptScheduler
+from core.services.json_stream import IncrementalJsonScanner, MalformedJsonStream
+from core.services.plan_cache import PlanCache
+from core.services.plan_json import PlanJsonError, decode_json_object
+from core.services.policy_rules import format_rules_for_prompt
+from core.services.reasoning_router import ReasoningRouter
+from core.services.rule_planner import RULE_PLANNER_MODEL_ID, RulePlanner
 
 logger = structlog.get_logger()
 
+ProgressCallback = Callable[[str], None]
+
+_PROGRESS_INTERVAL_S = 5.0
+_PROGRESS_THINKING = "Still reasoning about your request against travel policy..."
+_PROGRESS_DRAFTING = "Drafting your booking plan..."
+_PROGRESS_RETRY = "Double-checking the plan — this can take a little longer..."
+
+_THROTTLE_CODES = frozenset({"ThrottlingException", "TooManyRequestsException", "ServiceQuotaExceededException"})
+_CHARS_PER_TOKEN = 4
+
 # ── Prompt constants ────────────────────────────────────────────────────────
 
+# The request is laid out stable → variable so Bedrock prompt caching can reuse the prefix:
+#   system:  SYSTEM_PROMPT (+ PLAN_SCHEMA_PROMPT)   [cachePoint]  — identical for every request
+#   user:    POLICY_CONTEXT_TEMPLATE                 [cachePoint]  — repeats across employees
+#            REQUEST_TEMPLATE                                      — today's date + employee request
+# Anything that varies per request (including today's date) must stay after the last cachePoint.
+
 SYSTEM_PROMPT = (
     "You are a corporate travel policy compliance engine.\n"
     "Given an employee's travel request and the relevant policy excerpts, "
@@ -24,19 +52,17 @@ SYSTEM_PROMPT = (
     "- If a parameter cannot be determined from the request or policy, set it to null.\n"
     "- Use IATA 3-letter airport codes (uppercase) for origin and destination.\n"
     "- Dates must be ISO 8601 format (YYYY-MM-DD).\n"
-    "- Today's date is {today}. Use this to resolve relative dates like 'next Monday' or 'March 18'.\n"
+    "- Resolve relative dates like 'next Monday' or 'March 18' against TODAY'S DATE given with the request.\n"
     "- cabin_class must be one of: economy, premium_economy, business, first.\n"
     "- Respond with ONLY the JSON object. No markdown fences, no explanation, no preamble."
 )
 
-USER_PROMPT_TEMPLATE = (
-    "EMPLOYEE REQUEST:\n{user_request}\n\n"
-    "RELEVANT POLICY EXCERPTS:\n{policy_context}\n\n"
+PLAN_SCHEMA_PROMPT = (
     "Produce a JSON booking plan with this exact schema:\n"
-    "{{\n"
+    "{\n"
     '  "intent": "flight_booking | flight_search | policy_query",\n'
     '  "confidence": 0.0-1.0,\n'
-    '  "parameters": {{\n'
+    '  "parameters": {\n'
     '    "origin": "IATA code",\n'
     '    "destination": "IATA code",\n'
     '    "departure_date": "YYYY-MM-DD",\n'
@@ -44,63 +70,161 @@ USER_PROMPT_TEMPLATE = (
     '    "cabin_class": "economy|premium_economy|business|first",\n'
     '    "time_preference": "morning|afternoon|evening|red_eye or null",\n'
     '    "passenger_count": 1\n'
-    "  }},\n"
-    '  "policy_constraints": {{\n'
+    "  },\n"
+    '  "policy_constraints": {\n'
     '    "max_budget_usd": number,\n'
     '    "preferred_vendors": ["airline names"],\n'
     '    "advance_booking_days_required": number or null,\n'
     '    "advance_booking_met": true|false,\n'
     '    "requires_approval": true|false,\n'
     '    "approval_reason": "string or null"\n'
-    "  }},\n"
-    '  "policy_sources": [{{\n'
+    "  },\n"
+    '  "policy_sources": [{\n'
     '    "chunk_id": "id from the policy excerpt",\n'
     '    "section_title": "section name",\n'
     '    "page": page_number,\n'
     '    "similarity_score": 0.0-1.0\n'
-    "  }}],\n"
+    "  }],\n"
     '  "reasoning_summary": "Brief explanation of how policy was applied",\n'
     '  "warnings": [],\n'
     '  "fallback_url": null\n'
-    "}}"
+    "}"
+)
+
+# Structured-output mode: the schema travels in toolConfig, so the prompt only asks for the tool call.
+STRUCTURED_SYSTEM_PROMPT = SYSTEM_PROMPT.replace(
+    "produce a structured JSON booking plan.",
+    "produce a booking plan by calling the submit_booking_plan tool.",
+).replace(
+    "- Respond with ONLY the JSON object. No markdown fences, no explanation, no preamble.",
+    "- Always answer by calling submit_booking_plan exactly once. "
+    "policy_sources.chunk_id must be an id from the policy excerpts.",
+)
+
+POLICY_CONTEXT_TEMPLATE = "RELEVANT POLICY EXCERPTS:\n{policy_context}"
+
+# Prepended to the policy context when ingestion extracted structured rules for the active policies.
+POLICY_RULES_TEMPLATE = (
+    "STRUCTURED POLICY RULES (extracted from the policy; use these values for caps, vendors and "
+    "booking windows):\n{policy_rules}\n\n"
 )
 
+REQUEST_TEMPLATE = "TODAY'S DATE: {today}\n\nEMPLOYEE REQUEST:\n{user_request}"
+
+_CACHE_POINT: dict[str, Any] = {"cachePoint": {"type": "default"}}
+
+BOOKING_PLAN_TOOL_NAME = "submit_booking_plan"
+
+BOOKING_PLAN_TOOL_CONFIG: dict[str, Any] = {
+    "tools": [
+        {
+            "toolSpec": {
+                "name": BOOKING_PLAN_TOOL_NAME,
+                "description": "Submit the policy-compliant booking plan for the employee request.",
+                "inputSchema": {"json": BookingPlan.model_json_schema()},
+            }
+        }
+    ],
+    "toolChoice": {"tool": {"name": BOOKING_PLAN_TOOL_NAME}},
+}
+
 
 # ── Service ─────────────────────────────────────────────────────────────────
 
 
 class ReasoningService:
-    """Invokes Nova 2 Lite Converse API and validates output against BookingPlan."""
-
-    def __init__(self, bedrock_client: Any, model_id: str) -> None:
+    """Invokes Nova 2 Lite Converse API and validates output against BookingPlan.
+
+    With structured_output=True the BookingPlan schema is declared as a forced tool in
+    toolConfig and the plan is read from the toolUse input instead of scanned out of text.
+    With streaming=True attempts use converse_stream: output is validated as it arrives and
+    a malformed plan aborts the attempt (and escalates) without waiting for the full response.
+    With hedging=True, if the first medium attempt is still running after the hedge_percentile
+    of recent medium-attempt latency, the next (high) attempt is started alongside it; the first
+    valid plan wins and the other call is abandoned.
+    With a rule_planner, routine one-way requests it resolves with high confidence are
+    planned deterministically and never reach the model.
+    With a router, requests it routes start on a fast rung (thinking disabled, optionally on
+    router.fast_model_id) and escalate to [medium, high] only if that plan fails validation.
+    """
+
+    def __init__(
+        self,
+        bedrock_client: Any,
+        model_id: str,
+        structured_output: bool = False,
+        streaming: bool = False,
+        hedging: bool = False,
+        hedge_percentile: float = 90.0,
+        hedge_default_ms: float = 20_000.0,
+        scheduler: AttemptScheduler | None = None,
+        prompt_caching: bool = True,
+        plan_cache: PlanCache | None = None,
+        rule_planner: RulePlanner | None = None,
+        router: ReasoningRouter | None = None,
+    ) -> None:
         self._client = bedrock_client
         self._model_id = model_id
+        self._structured_output = structured_output
+        self._streaming = streaming
+        self._hedging = hedging
+        self._hedge_percentile = hedge_percentile
+        self._hedge_default_ms = hedge_default_ms
+        self._scheduler = scheduler if scheduler is not None else AttemptScheduler()
+        self._prompt_caching = prompt_caching
+        self._plan_cache = plan_cache
+        self._rule_planner = rule_planner
+        self._router = router
+
+    def _model_for(self, effort: ThinkingEffort) -> str:
+        if effort == "disabled" and self._router is not None and self._router.fast_model_id:
+            return self._router.fast_model_id
+        return self._model_id
+
+    def _build_converse_params(
+        self,
+        user_query: str,
+        context_text: str,
+        effort: ThinkingEffort,
+        policy_rules: list[PolicyRule] | None = None,
+    ) -> dict[str, Any]:
+        """Build kwargs for bedrock_client.converse().
+
+        Stable segments come first, each closed by a cachePoint when prompt caching is on.
+        Structured policy rules share the policy-context segment — they change only on re-ingestion.
+        """
+        policy_context = POLICY_CONTEXT_TEMPLATE.format(policy_context=context_text)
+        if policy_rules:
+            rules_text = POLICY_RULES_TEMPLATE.format(policy_rules=format_rules_for_prompt(policy_rules))
+            policy_context = rules_text + policy_context
+        if self._structured_output:
+            system_text = STRUCTURED_SYSTEM_PROMPT
+        else:
+            system_text = f"{SYSTEM_PROMPT}\n\n{PLAN_SCHEMA_PROMPT}"
+        cache_point = [_CACHE_POINT] if self._prompt_caching else []
 
-    def _build_converse_params(self, user_query: str, context_text: str, effort: ThinkingEffort) -> dict[str, Any]:
-        """Build kwargs for bedrock_client.converse()."""
         params: dict[str, Any] = {
-            "modelId": self._model_id,
-            "system": [{"text": SYSTEM_PROMPT.format(today=date.today().isoformat())}],
+            "modelId": self._model_for(effort),
+            "system": [{"text": system_text}, *cache_point],
             "messages": [
                 {
                     "role": "user",
                     "content": [
-                        {
-                            "text": USER_PROMPT_TEMPLATE.format(
-                                user_request=user_query,
-                                policy_context=context_text,
-                            )
-                        }
+                        {"text": policy_context},
+                        *cache_point,
+                        {"text": REQUEST_TEMPLATE.format(today=date.today().isoformat(), user_request=user_query)},
                     ],
                 }
             ],
-            "additionalModelRequestFields": {
+        }
+        # The fast rung sends no reasoningConfig, so it also works on models without extended thinking.
+        if effort != "disabled":
+            params["additionalModelRequestFields"] = {
                 "reasoningConfig": {
                     "type": "enabled",
                     "maxReasoningEffort": effort,
                 }
-            },
-        }
+            }
         # When high effort, model controls output autonomously — do NOT set inferenceConfig.
         if effort != "high":
             params["inferenceConfig"] = {
@@ -108,17 +232,34 @@ class ReasoningService:
                 "topP": 0.9,
                 "maxTokens": 4000,
             }
+        if self._structured_output:
+            params["toolConfig"] = BOOKING_PLAN_TOOL_CONFIG
         return params
 
     @staticmethod
-    def _extract_json(response: dict[str, Any]) -> str:
-        """Extract JSON string from the last text block in the Converse response.
+    def _extract_tool_input(response: dict[str, Any]) -> dict[str, Any]:
+        """Return the submit_booking_plan toolUse input from the Converse response.
 
-        Skips reasoningContent blocks. Falls back to brace-depth extraction
-        if the last text block contains preamble text around the JSON.
+        Raises:
+            ReasoningError: If the model did not call the tool.
+        """
+        for block in response["output"]["message"]["content"]:
+            tool_use = block.get("toolUse")
+            if tool_use and tool_use.get("name") == BOOKING_PLAN_TOOL_NAME:
+                tool_input = tool_use.get("input")
+                if isinstance(tool_input, dict):
+                    return tool_input
+        raise ReasoningError(
+            f"No {BOOKING_PLAN_TOOL_NAME} toolUse block in Converse response",
+            code=ErrorCode.INVALID_PLAN,
+        )
+
+    @staticmethod
+    def _extract_text(response: dict[str, Any]) -> str:
+        """Return the last text block in the Converse response, skipping reasoningContent blocks.
 
         Raises:
-            ReasoningError: If no JSON object can be extracted.
+            ReasoningError: If the response has no text block.
         """
         text_blocks: list[str] = [
             block["text"] for block in response["output"]["message"]["content"] if "text" in block
@@ -130,58 +271,42 @@ class ReasoningService:
                 code=ErrorCode.INVALID_PLAN,
             )
 
-        raw = text_blocks[-1].strip()
+        return text_blocks[-1]
 
-        # Fast path: entire block is valid JSON.
-        if raw.startswith("{"):
-            try:
-                json.loads(raw)
-                return raw
-            except json.JSONDecodeError:
-                pass
-
-        # Fallback: extract first top-level {...} using brace-depth counter.
-        start = raw.find("{")
-        if start == -1:
-            raise ReasoningError(
-                "No JSON object found in model response",
-                code=ErrorCode.INVALID_PLAN,
-            )
+    @staticmethod
+    def _parse_plan(text: str) -> BookingPlan:
+        """Parse model text output into a validated BookingPlan in a single pass.
 
-        depth = 0
-        for i in range(start, len(raw)):
-            if raw[i] == "{":
-                depth += 1
-            elif raw[i] == "}":
-                depth -= 1
-                if depth == 0:
-                    candidate = raw[start : i + 1]
-                    try:
-                        json.loads(candidate)
-                        return candidate
-                    except json.JSONDecodeError:
-                        break
+        A block that is exactly the JSON object is decoded and validated together by
+        model_validate_json. Anything else (preamble, fences, trailing commas) goes through
+        decode_json_object, which locates the object and repairs common defects in place
+        rather than failing the attempt.
 
-        raise ReasoningError(
-            "Failed to extract valid JSON from model response",
-            code=ErrorCode.INVALID_PLAN,
-        )
+        Raises:
+            ReasoningError: If no JSON object can be decoded, or on Pydantic validation failure.
+        """
+        raw = text.strip()
+        if raw.startswith("{") and raw.endswith("}"):
+            try:
+                return BookingPlan.model_validate_json(raw)
+            except PydanticValidationError:
+                pass  # Malformed JSON or schema errors — the path below repairs or reports them.
+
+        try:
+            data, repaired = decode_json_object(raw)
+        except PlanJsonError as e:
+            raise ReasoningError(str(e), code=ErrorCode.INVALID_PLAN) from e
+        if repaired:
+            logger.info("reasoning_output_repaired", output_chars=len(raw))
+        return ReasoningService._validate_plan(data)
 
     @staticmethod
-    def _parse_plan(raw_json: str) -> BookingPlan:
-        """Parse raw JSON string into a validated BookingPlan.
+    def _validate_plan(data: Any) -> BookingPlan:
+        """Validate decoded model output against BookingPlan.
 
         Raises:
-            ReasoningError: On JSON decode failure or Pydantic validation failure.
+            ReasoningError: On Pydantic validation failure.
         """
-        try:
-            data = json.loads(raw_json)
-        except json.JSONDecodeError as e:
-            raise ReasoningError(
-                f"Invalid JSON from model: {e}",
-                code=ErrorCode.INVALID_PLAN,
-            ) from e
-
         try:
             return BookingPlan.model_validate(data)
         except PydanticValidationError as e:
@@ -212,64 +337,499 @@ class ReasoningService:
     def _escalation_sequence(initial: ThinkingEffort) -> list[ThinkingEffort]:
         """Return the 3-attempt escalation ladder.
 
-        medium start → [medium, high, high]
-        high start   → [high, high, high]
+        disabled start → [disabled, medium, high]
+        medium start   → [medium, high, high]
+        high start     → [high, high, high]
         """
+        if initial == "disabled":
+            return ["disabled", "medium", "high"]
         if initial == "high":
             return ["high", "high", "high"]
         return ["medium", "high", "high"]
 
-    def generate_booking_plan(self, request: ReasoningRequest, remaining_ms: int = 300_000) -> ReasoningResult:
+    def generate_booking_plan(
+        self,
+        request: ReasoningRequest,
+        remaining_ms: int = 300_000,
+        progress: ProgressCallback | None = None,
+    ) -> ReasoningResult:
         """Invoke Nova 2 Lite with in-service retry and dynamic escalation.
 
         Escalation ladder: attempt 1 (initial) → attempt 2 (initial) → attempt 3 (high).
         If all 3 attempts fail, raises ReasoningError for Step Functions graceful degradation.
 
+        Before each attempt the scheduler checks that the rung's observed latency fits in the
+        time left. A rung that does not fit is replaced by the most capable lower effort that
+        does; if none fits, the ladder stops early rather than run into the Lambda timeout.
+
         Args:
             remaining_ms: Milliseconds remaining in the Lambda invocation
-                          (from context.get_remaining_time_in_millis()). Used to skip
-                          attempts when insufficient time remains to avoid a hard Lambda timeout.
+                          (from context.get_remaining_time_in_millis()).
+            progress: Optional callback receiving a user-facing message every
+                      _PROGRESS_INTERVAL_S while an attempt is in flight.
         """
-        _MIN_ATTEMPT_MS = 30_000  # don't start an attempt with less than 30s left
-
         initial_effort = self._determine_initial_effort(request.confidence_level, request.max_similarity)
-        sequence = self._escalation_sequence(initial_effort)
         errors: list[str] = []
+        schema_failures = 0
+        attempts: list[ReasoningAttempt] = []
         start = time.monotonic()
 
-        for attempt, effort in enumerate(sequence):
-            elapsed_ms = (time.monotonic() - start) * 1000
-            if remaining_ms - elapsed_ms < _MIN_ATTEMPT_MS:
-                errors.append(f"attempt {attempt + 1} ({effort}): skipped — insufficient time remaining")
-                logger.warning("reasoning_attempt_skipped", attempt=attempt + 1, effort=effort)
-                break
+        rule_plan = self._rule_plan(request)
+        if rule_plan is not None:
+            return ReasoningResult(
+                booking_id=request.booking_id,
+                employee_id=request.employee_id,
+                plan=rule_plan,
+                model_id=RULE_PLANNER_MODEL_ID,
+                thinking_effort="none",
+                latency_ms=round((time.monotonic() - start) * 1000, 1),
+            )
 
-            try:
-                params = self._build_converse_params(request.user_query, request.context_text, effort)
-                response = self._client.converse(**params)
-                raw_json = self._extract_json(response)
-                plan = self._parse_plan(raw_json)
+        cache_key = self._plan_cache_key(request)
+        cached_plan = self._cached_plan(cache_key)
+        if cached_plan is not None:
+            return ReasoningResult(
+                booking_id=request.booking_id,
+                employee_id=request.employee_id,
+                plan=cached_plan,
+                model_id=self._model_id,
+                thinking_effort=initial_effort,
+                latency_ms=round((time.monotonic() - start) * 1000, 1),
+                structured_output=self._structured_output,
+                cache_hit=True,
+            )
+
+        routed = self._router is not None and self._router.route(request)
+        if routed:
+            initial_effort = "disabled"
+        sequence = self._escalation_sequence(initial_effort)
+
+        deadline = start + remaining_ms / 1000
+        hedged = False
+        attempt = 0
+        while attempt < len(sequence):
+            time_left_ms = (deadline - time.monotonic()) * 1000
+            scheduled = self._scheduler.choose(sequence[attempt], time_left_ms)
+            if scheduled is None:
+                errors.append(f"attempt {attempt + 1} ({sequence[attempt]}): skipped — insufficient time remaining")
+                logger.warning(
+                    "reasoning_attempt_skipped",
+                    attempt=attempt + 1,
+                    effort=sequence[attempt],
+                    remaining_ms=round(time_left_ms),
+                    estimate_ms=round(self._scheduler.estimate_ms(sequence[attempt])),
+                )
+                break
+            sequence[attempt] = effort = scheduled
+
+            if attempt > 0 and progress:
+                progress(_PROGRESS_RETRY)
+
+            winner: int | None
+            plan: BookingPlan | None
+            failures: list[tuple[int, ReasoningError]]
+            if attempt == 0 and self._should_hedge(sequence):
+                winner, plan, failures, hedged = self._hedged_attempts(request, sequence, progress, attempts, deadline)
+            else:
+                try:
+                    plan = self._attempt(request, effort, progress, slot=attempt, attempts=attempts)
+                    winner, failures = attempt, []
+                except ReasoningError as e:
+                    winner, plan, failures = None, None, [(attempt, e)]
+
+            for slot, error in failures:
+                if error.code == ErrorCode.INVALID_PLAN:
+                    schema_failures += 1
+                errors.append(f"attempt {slot + 1} ({sequence[slot]}): {error.message}")
+                logger.warning(
+                    "reasoning_attempt_failed",
+                    attempt=slot + 1,
+                    effort=sequence[slot],
+                    error_code=error.code.value,
+                    structured_output=self._structured_output,
+                )
 
+            if plan is not None and winner is not None:
+                self._store_plan(cache_key, plan)
+                if routed:
+                    logger.info(
+                        "reasoning_route_outcome",
+                        booking_id=request.booking_id,
+                        fast_won=sequence[winner] == "disabled",
+                        winner_effort=sequence[winner],
+                        latency_ms=round((time.monotonic() - start) * 1000, 1),
+                    )
                 return ReasoningResult(
                     booking_id=request.booking_id,
                     employee_id=request.employee_id,
                     plan=plan,
-                    model_id=self._model_id,
-                    thinking_effort=effort,
+                    model_id=self._model_for(sequence[winner]),
+                    thinking_effort=sequence[winner],
                     latency_ms=round((time.monotonic() - start) * 1000, 1),
-                    retry_count=attempt,
-                    escalated=effort != initial_effort,
+                    retry_count=len(errors),
+                    escalated=sequence[winner] != initial_effort,
+                    structured_output=self._structured_output,
+                    schema_failure_count=schema_failures,
+                    hedged=hedged,
+                    # A hedge loser may still be running — its record lands in the log, not here.
+                    attempts=sorted(attempts, key=lambda a: a.attempt),
+                    routed=routed,
                 )
-            except ReasoningError as e:
-                errors.append(f"attempt {attempt + 1} ({effort}): {e.message}")
-                logger.warning(
-                    "reasoning_attempt_failed",
-                    attempt=attempt + 1,
-                    effort=effort,
-                    error_code=e.code.value,
-                )
-
+            attempt += len(failures)
+
+        logger.warning(
+            "reasoning_exhausted",
+            attempts=len(errors),
+            schema_failure_count=schema_failures,
+            structured_output=self._structured_output,
+            routed=routed,
+            input_tokens=sum(a.input_tokens for a in attempts),
+            output_tokens=sum(a.output_tokens for a in attempts),
+        )
         raise ReasoningError(
             f"All {len(sequence)} reasoning attempts failed: {'; '.join(errors)}",
             code=ErrorCode.REASONING_FAILED,
         )
+
+    def _rule_plan(self, request: ReasoningRequest) -> BookingPlan | None:
+        """A deterministic plan, or None to use the model. Planner bugs must never fail the request."""
+        if self._rule_planner is None:
+            return None
+        try:
+            return self._rule_planner.plan(request)
+        except Exception as e:
+            logger.warning("rule_planner_failed", error=str(e))
+            return None
+
+    # ── Plan cache ──────────────────────────────────────────────────────────
+
+    def _plan_cache_key(self, request: ReasoningRequest) -> str | None:
+        if self._plan_cache is None:
+            return None
+        try:
+            generation = self._plan_cache.generation()
+        except Exception as e:
+            logger.warning("plan_cache_unavailable", error=str(e))
+            return None
+        return self._plan_cache.build_key(
+            request.user_query, request.context_text, date.today().isoformat(), self._model_id, generation
+        )
+
+    def _cached_plan(self, cache_key: str | None) -> BookingPlan | None:
+        if self._plan_cache is None or cache_key is None:
+            return None
+        try:
+            plan = self._plan_cache.get(cache_key)
+        except Exception as e:
+            logger.warning("plan_cache_read_failed", error=str(e))
+            return None
+        logger.info("plan_cache_lookup", hit=plan is not None)
+        return plan
+
+    def _store_plan(self, cache_key: str | None, plan: BookingPlan) -> None:
+        if self._plan_cache is None or cache_key is None:
+            return
+        try:
+            self._plan_cache.put(cache_key, plan)
+        except Exception as e:
+            logger.warning("plan_cache_write_failed", error=str(e))
+
+    def _should_hedge(self, sequence: list[ThinkingEffort]) -> bool:
+        """Hedge only when the second rung is a different (higher) effort than the first.
+
+        Never from the fast rung: racing extended thinking against it would spend what routing saves.
+        """
+        return self._hedging and len(sequence) > 1 and sequence[0] not in (sequence[1], "disabled")
+
+    def _hedge_delay_ms(self, effort: ThinkingEffort) -> float:
+        observed = self._scheduler.percentile(effort, self._hedge_percentile)
+        return observed if observed is not None else self._hedge_default_ms
+
+    def _hedged_attempts(
+        self,
+        request: ReasoningRequest,
+        sequence: list[ThinkingEffort],
+        progress: ProgressCallback | None,
+        attempts: list[ReasoningAttempt] | None = None,
+        deadline: float | None = None,
+    ) -> tuple[int | None, BookingPlan | None, list[tuple[int, ReasoningError]], bool]:
+        """Run ladder slot 0, racing slot 1 against it if slot 0 outlives the hedge delay
+        and slot 1 can still finish before the deadline (time.monotonic() seconds).
+
+        Returns:
+            (winning slot or None, plan or None, [(failed slot, error)], whether the hedge started)
+        """
+        cancel = threading.Event()
+        executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="reasoning-hedge")
+        futures: dict[Future[BookingPlan], int] = {
+            executor.submit(self._attempt, request, sequence[0], progress, cancel, 0, attempts): 0,
+        }
+        failures: list[tuple[int, ReasoningError]] = []
+        hedged = False
+        try:
+            delay_ms = self._hedge_delay_ms(sequence[0])
+            done, _ = wait(futures, timeout=delay_ms / 1000)
+            hedge_fits = deadline is None or self._scheduler.fits(sequence[1], (deadline - time.monotonic()) * 1000)
+            if not done and not hedge_fits:
+                logger.info("reasoning_hedge_skipped", hedge_effort=sequence[1])
+            elif not done:
+                # Progress ticks stay with the primary so the client isn't sent duplicates.
+                futures[executor.submit(self._attempt, request, sequence[1], None, cancel, 1, attempts)] = 1
+                hedged = True
+                logger.info("reasoning_hedge_started", delay_ms=round(delay_ms, 1), hedge_effort=sequence[1])
+
+            pending = set(futures)
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in sorted(done, key=futures.__getitem__):
+                    try:
+                        plan = future.result()
+                    except ReasoningError as e:
+                        failures.append((futures[future], e))
+                        continue
+                    if hedged:
+                        logger.info("reasoning_hedge_won", winner_effort=sequence[futures[future]])
+                    return futures[future], plan, sorted(failures, key=lambda f: f[0]), hedged
+            return None, None, sorted(failures, key=lambda f: f[0]), hedged
+        finally:
+            cancel.set()
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _attempt(
+        self,
+        request: ReasoningRequest,
+        effort: ThinkingEffort,
+        progress: ProgressCallback | None = None,
+        cancel: threading.Event | None = None,
+        slot: int = 0,
+        attempts: list[ReasoningAttempt] | None = None,
+    ) -> BookingPlan:
+        """Run one Converse call at the given effort and return the validated plan.
+
+        Whatever the outcome, the call's accounting is logged as a reasoning_attempt event. It is
+        appended to attempts, and a success feeds the scheduler, only while cancel is unset — a
+        call that finishes after losing a hedge race belongs to a request that has already returned.
+
+        Raises:
+            ReasoningError: INVALID_PLAN when the output is missing or fails the schema.
+        """
+        started = time.monotonic()
+        response: dict[str, Any] | None = None
+        params = self._build_converse_params(
+            request.user_query, request.context_text, effort, policy_rules=request.policy_rules
+        )
+        phase = {"drafting": False}
+        try:
+            with self._progress_ticker(
+                progress, lambda: _PROGRESS_DRAFTING if phase["drafting"] else _PROGRESS_THINKING
+            ):
+                if self._streaming:
+                    response = self._converse_streaming(
+                        params, on_output=lambda: phase.update(drafting=True), cancel=cancel
+                    )
+                else:
+                    response = self._client.converse(**params)
+            if self._structured_output:
+                plan = self._validate_plan(self._extract_tool_input(response))
+            else:
+                plan = self._parse_plan(self._extract_text(response))
+            if effort == "disabled" and self._router is not None:
+                if plan.confidence < self._router.min_plan_confidence:
+                    raise _LowConfidencePlan(
+                        f"Fast-path plan confidence {plan.confidence:.2f} below "
+                        f"{self._router.min_plan_confidence:.2f}"
+                    )
+        except Exception as e:
+            lost = cancel is not None and cancel.is_set()
+            self._record_attempt(None if lost else attempts, slot, effort, response, started, _failure_class(e))
+            raise
+        lost = cancel is not None and cancel.is_set()
+        latency_ms = self._record_attempt(None if lost else attempts, slot, effort, response, started, None)
+        # Only successful attempts feed the estimates — early aborts would drag the percentiles down.
+        if not lost:
+            self._scheduler.record(effort, latency_ms)
+        return plan
+
+    @staticmethod
+    @contextmanager
+    def _progress_ticker(progress: ProgressCallback | None, message: Callable[[], str]) -> Iterator[None]:
+        """Call progress(message()) every _PROGRESS_INTERVAL_S until the block exits.
+
+        Runs on a timer thread because reasoning output is redacted — the stream can stay
+        silent for the whole thinking phase, so event arrival can't drive the updates.
+        """
+        if progress is None:
+            yield
+            return
+
+        stop = threading.Event()
+
+        def _tick() -> None:
+            while not stop.wait(_PROGRESS_INTERVAL_S):
+                progress(message())
+
+        ticker = threading.Thread(target=_tick, name="reasoning-progress", daemon=True)
+        ticker.start()
+        try:
+            yield
+        finally:
+            stop.set()
+            ticker.join(timeout=1.0)
+
+    def _converse_streaming(
+        self,
+        params: dict[str, Any],
+        on_output: Callable[[], None],
+        cancel: threading.Event | None = None,
+    ) -> dict[str, Any]:
+        """Call converse_stream and reassemble a converse()-shaped response.
+
+        Text (free-form mode) or submit_booking_plan tool input (structured mode) is fed through
+        an IncrementalJsonScanner as it arrives; the attempt is aborted on the first character
+        repair_json could not fix instead of after the full response. Setting cancel (a lost hedge race)
+        closes the stream at the next event.
+
+        Raises:
+            ReasoningError: INVALID_PLAN if the streamed plan is malformed,
+                REASONING_FAILED if the attempt was cancelled.
+        """
+        stream = self._client.converse_stream(**params)["stream"]
+        blocks: dict[int, dict[str, Any]] = {}
+        scanners: dict[int, IncrementalJsonScanner] = {}
+        response: dict[str, Any] = {"output": {"message": {"role": "assistant", "content": []}}}
+
+        try:
+            for event in stream:
+                if cancel is not None and cancel.is_set():
+                    raise _AttemptCancelled
+                if "contentBlockStart" in event:
+                    index = event["contentBlockStart"]["contentBlockIndex"]
+                    tool_use = event["contentBlockStart"]["start"].get("toolUse")
+                    if tool_use:
+                        blocks[index] = {"toolUse": {**tool_use, "input": []}}
+                elif "contentBlockDelta" in event:
+                    index = event["contentBlockDelta"]["contentBlockIndex"]
+                    delta = event["contentBlockDelta"]["delta"]
+                    if "text" in delta:
+                        chunk = delta["text"]
+                        blocks.setdefault(index, {"text": []})["text"].append(chunk)
+                        scan = not self._structured_output
+                    elif "toolUse" in delta:
+                        chunk = delta["toolUse"]["input"]
+                        block = blocks[index]["toolUse"]
+                        block["input"].append(chunk)
+                        scan = block.get("name") == BOOKING_PLAN_TOOL_NAME
+                    else:
+                        continue  # reasoningContent
+                    on_output()
+                    if scan:
+                        if index not in scanners:
+                            scanners[index] = IncrementalJsonScanner(0 if self._structured_output else 200)
+                        scanners[index].feed(chunk)
+                elif "messageStop" in event:
+                    response["stopReason"] = event["messageStop"].get("stopReason")
+                elif "metadata" in event:
+                    response["usage"] = event["metadata"].get("usage", {})
+                    response["metrics"] = event["metadata"].get("metrics", {})
+        except MalformedJsonStream as e:
+            self._close_stream(stream)
+            logger.warning("reasoning_stream_aborted", reason=str(e))
+            raise ReasoningError(f"Malformed JSON in model stream: {e}", code=ErrorCode.INVALID_PLAN) from e
+        except _AttemptCancelled as e:
+            self._close_stream(stream)
+            raise ReasoningError("Attempt abandoned after a faster attempt won", code=ErrorCode.REASONING_FAILED) from e
+
+        content = response["output"]["message"]["content"]
+        for index in sorted(blocks):
+            block = blocks[index]
+            if "text" in block:
+                content.append({"text": "".join(block["text"])})
+                continue
+            raw_input = "".join(block["toolUse"]["input"])
+            try:
+                tool_input = json.loads(raw_input) if raw_input else {}
+            except json.JSONDecodeError as e:
+                raise ReasoningError(f"Invalid JSON in toolUse input: {e}", code=ErrorCode.INVALID_PLAN) from e
+            content.append({"toolUse": {**block["toolUse"], "input": tool_input}})
+        return response
+
+    def _record_attempt(
+        self,
+        attempts: list[ReasoningAttempt] | None,
+        slot: int,
+        effort: ThinkingEffort,
+        response: dict[str, Any] | None,
+        started: float,
+        failure_class: str | None,
+    ) -> float:
+        """Log one Converse call's tokens, latency and outcome; returns its wall-clock latency in ms."""
+        latency_ms = (time.monotonic() - started) * 1000
+        usage = (response or {}).get("usage") or {}
+        server_latency = ((response or {}).get("metrics") or {}).get("latencyMs")
+        output_tokens = usage.get("outputTokens", 0)
+        visible_tokens = _visible_output_chars(response) // _CHARS_PER_TOKEN if response else 0
+        record = ReasoningAttempt(
+            attempt=slot + 1,
+            effort=effort,
+            failure_class=failure_class,
+            input_tokens=usage.get("inputTokens", 0),
+            output_tokens=output_tokens,
+            reasoning_tokens_est=max(0, output_tokens - visible_tokens),
+            cache_read_input_tokens=usage.get("cacheReadInputTokens", 0),
+            cache_write_input_tokens=usage.get("cacheWriteInputTokens", 0),
+            server_latency_ms=float(server_latency) if server_latency is not None else None,
+            latency_ms=round(latency_ms, 1),
+        )
+        if attempts is not None:
+            attempts.append(record)
+        logger.info(
+            "reasoning_attempt",
+            model_id=self._model_for(effort),
+            structured_output=self._structured_output,
+            streaming=self._streaming,
+            **record.model_dump(),
+        )
+        return latency_ms
+
+    @staticmethod
+    def _close_stream(stream: Any) -> None:
+        close = getattr(stream, "close", None)
+        if close:
+            close()
+
+
+def _visible_output_chars(response: dict[str, Any]) -> int:
+    """Characters of plan output (text or tool input) the model returned, excluding reasoning."""
+    chars = 0
+    for block in response.get("output", {}).get("message", {}).get("content", []):
+        if "text" in block:
+            chars += len(block["text"])
+        elif "toolUse" in block:
+            chars += len(json.dumps(block["toolUse"].get("input", {})))
+    return chars
+
+
+def _failure_class(error: Exception) -> str:
+    """Coarse bucket for a failed attempt, for cost and latency breakdowns."""
+    if isinstance(error, _LowConfidencePlan):
+        return "low_confidence"
+    if isinstance(error, ReasoningError):
+        return "invalid_plan" if error.code == ErrorCode.INVALID_PLAN else "cancelled"
+    response = getattr(error, "response", None)  # botocore ClientError
+    code = response.get("Error", {}).get("Code", "") if isinstance(response, dict) else ""
+    if code in _THROTTLE_CODES:
+        return "throttled"
+    if code == "ModelTimeoutException" or "Timeout" in type(error).__name__:
+        return "timeout"
+    return "service_error"
+
+
+class _AttemptCancelled(Exception):
+    """Internal signal: a hedged attempt lost the race."""
+
+
+class _LowConfidencePlan(ReasoningError):
+    """A fast-rung plan that validated but is too unsure of itself to skip extended thinking."""
+
+    def __init__(self, message: str) -> None:
+        super().__init__(message, code=ErrorCode.REASONING_FAILED)
@@ -0,0 +1,60 @@
+"""Routes reasoning requests between a fast configuration and extended thinking.
+
+Requests with a confident retrieval and a short query rarely need extended thinking, so
+they start on a fast rung: extended thinking disabled, optionally on a smaller model.
+Everything else starts on the normal ladder. A routed request that fails validation
+escalates to the normal ladder on its next attempt.
+"""
+
+import structlog
+
+from core.models.booking import ReasoningRequest
+
+log = structlog.get_logger()
+
+
+class ReasoningRouter:
+    """Decides whether a request starts on the fast rung.
+
+    Args:
+        fast_model_id: Model for the fast rung; None runs the main model with thinking disabled.
+        max_query_chars: Longer requests tend to carry multiple legs or conditions.
+        min_similarity: Minimum top retrieval similarity, on top of a "high" confidence level.
+        min_plan_confidence: A fast-rung plan reporting lower confidence escalates like an invalid one.
+    """
+
+    def __init__(
+        self,
+        fast_model_id: str | None = None,
+        max_query_chars: int = 160,
+        min_similarity: float = 0.5,
+        min_plan_confidence: float = 0.7,
+    ) -> None:
+        self.fast_model_id = fast_model_id
+        self.min_plan_confidence = min_plan_confidence
+        self._max_query_chars = max_query_chars
+        self._min_similarity = min_similarity
+
+    def decline_reason(self, request: ReasoningRequest) -> str | None:
+        """Why the request must start with extended thinking, or None to route it fast."""
+        if request.confidence_level != "high":
+            return "retrieval_confidence"
+        if request.max_similarity < self._min_similarity:
+            return "low_similarity"
+        if len(request.user_query) > self._max_query_chars:
+            return "long_query"
+        return None
+
+    def route(self, request: ReasoningRequest) -> bool:
+        """True to start on the fast rung. Logs the decision."""
+        reason = self.decline_reason(request)
+        log.info(
+            "reasoning_route",
+            booking_id=request.booking_id,
+            fast=reason is None,
+            decline_reason=reason,
+            query_chars=len(request.user_query),
+            confidence_level=request.confidence_level,
+            max_similarity=request.max_similarity,
+        )
+        return reason is None
@@ -0,0 +1,364 @@
+"""Rule-based planner — builds a BookingPlan for routine one-way requests without a model call.
+
+Airports resolve through an in-memory IATA/city index, cabin class and dates through compiled
+patterns, and policy constraints from the structured rules extracted at ingestion
+(core/services/policy_rules.py). Anything the rules cannot settle — questions, round trips,
+multi-city routes, premium or conditional cabins, ambiguous dates, no fare cap stated for the
+route — lowers confidence below the threshold and the request goes to Nova Lite as before.
+"""
+
+import re
+from datetime import date, datetime, timedelta
+
+import structlog
+from dateutil import parser as dateutil_parser
+
+from core.models.booking import (
+    BookingParameters,
+    BookingPlan,
+    PolicyConstraints,
+    PolicySource,
+    ReasoningRequest,
+)
+from core.services.policy_rules import (
+    advance_booking_days,
+    extract_policy_rules,
+    permits_cabin,
+    preferred_vendors,
+    route_cap,
+)
+
+logger = structlog.get_logger()
+
+RULE_PLANNER_MODEL_ID = "rule-planner"
+
+# ── Airport index ───────────────────────────────────────────────────────────
+
+AIRPORTS: dict[str, tuple[str, ...]] = {
+    "DEL": ("delhi", "new delhi"),
+    "BOM": ("mumbai", "bombay"),
+    "BLR": ("bangalore", "bengaluru"),
+    "HYD": ("hyderabad",),
+    "MAA": ("chennai", "madras"),
+    "CCU": ("kolkata", "calcutta"),
+    "AMD": ("ahmedabad",),
+    "PNQ": ("pune",),
+    "GOI": ("goa",),
+    "COK": ("kochi", "cochin"),
+    "JAI": ("jaipur",),
+    "LKO": ("lucknow",),
+    "ATL": ("atlanta",),
+    "BOS": ("boston",),
+    "DFW": ("dallas",),
+    "IAD": ("washington",),
+    "JFK": ("new york",),
+    "LAX": ("los angeles",),
+    "ORD": ("chicago",),
+    "SEA": ("seattle",),
+    "SFO": ("san francisco",),
+    "CDG": ("paris",),
+    "FRA": ("frankfurt",),
+    "LHR": ("london",),
+    "DXB": ("dubai",),
+    "HKG": ("hong kong",),
+    "NRT": ("tokyo",),
+    "SIN": ("singapore",),
+    "SYD": ("sydney",),
+}
+
+_CITY_INDEX: dict[str, str] = {city: code for code, cities in AIRPORTS.items() for city in cities}
+
+# Codes must be written in capitals ("sea", "goa" are words); city names match in any case.
+# Longest names first so "new delhi" wins over "delhi".
+_CODE_RE = re.compile(r"\b([A-Z]{3})\b")
+_CITY_RE = re.compile(
+    r"\b(" + "|".join(re.escape(c) for c in sorted(_CITY_INDEX, key=len, reverse=True)) + r")\b",
+    re.IGNORECASE,
+)
+_DIRECTION_RE = re.compile(r"\b(from|to)\s+(?:the\s+)?$", re.IGNORECASE)
+
+_CODE_CONFIDENCE = 1.0
+_CITY_CONFIDENCE = 0.95
+_UNKNOWN_CODE_CONFIDENCE = 0.6  # a capitalised 3-letter word that is not in the index
+
+
+def resolve_route(text: str) -> tuple[str | None, str | None, float]:
+    """Return (origin, destination, confidence) for the airports mentioned in text.
+
+    "to X from Y" is honoured; otherwise the first airport mentioned is the origin.
+    More than two distinct airports (multi-city) or fewer than two yields (None, None, 0.0).
+    """
+    mentions: list[tuple[int, str, float]] = []
+    for m in _CODE_RE.finditer(text):
+        code = m.group(1)
+        mentions.append((m.start(), code, _CODE_CONFIDENCE if code in AIRPORTS else _UNKNOWN_CODE_CONFIDENCE))
+    for m in _CITY_RE.finditer(text):
+        mentions.append((m.start(), _CITY_INDEX[m.group(1).lower()], _CITY_CONFIDENCE))
+    mentions.sort()
+
+    # "Delhi (DEL)" names one airport twice — keep the more certain mention.
+    airports: dict[str, tuple[int, float]] = {}
+    for pos, code, confidence in mentions:
+        if code not in airports or confidence > airports[code][1]:
+            airports[code] = (airports.get(code, (pos, 0.0))[0], confidence)
+    if len(airports) != 2:
+        return None, None, 0.0
+
+    (first, (first_pos, first_conf)), (second, (second_pos, second_conf)) = sorted(
+        airports.items(), key=lambda item: item[1][0]
+    )
+    origin, destination = first, second
+    direction = _DIRECTION_RE.search(text[:first_pos])
+    if direction and direction.group(1).lower() == "to":
+        origin, destination = second, first
+    return origin, destination, min(first_conf, second_conf)
+
+
+# ── Cabin class ─────────────────────────────────────────────────────────────
+
+# "business" on its own usually means a business trip, so it needs "class" or "in business".
+_CABIN_PATTERNS: tuple[tuple[str, re.Pattern[str]], ...] = (
+    ("premium_economy", re.compile(r"\bpremium[\s-]+economy\b", re.IGNORECASE)),
+    ("business", re.compile(r"\bbusiness[\s-]+class\b|\bin\s+business\b", re.IGNORECASE)),
+    ("first", re.compile(r"\bfirst[\s-]+class\b|\bin\s+first\b", re.IGNORECASE)),
+    ("economy", re.compile(r"(?<!premium )\beconomy\b|\bcoach\b", re.IGNORECASE)),
+)
+
+
+def parse_cabin_class(text: str) -> str | None:
+    """The single cabin class the text asks for, "" when none is mentioned, None when several are."""
+    found = {cabin for cabin, pattern in _CABIN_PATTERNS if pattern.search(text)}
+    if len(found) > 1:
+        return None
+    return found.pop() if found else ""
+
+
+# ── Dates ───────────────────────────────────────────────────────────────────
+
+_WEEKDAYS = ("monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday")
+_MONTHS = (
+    r"jan(?:uary)?|feb(?:ruary)?|mar(?:ch)?|apr(?:il)?|may|june?|july?|aug(?:ust)?"
+    r"|sep(?:t(?:ember)?)?|oct(?:ober)?|nov(?:ember)?|dec(?:ember)?"
+)
+_ORDINAL = r"\d{1,2}(?:st|nd|rd|th)?"
+
+_ISO_DATE_RE = re.compile(r"\b(\d{4}-\d{2}-\d{2})\b")
+_MONTH_DATE_RE = re.compile(
+    rf"\b((?:{_ORDINAL}\s+(?:of\s+)?(?:{_MONTHS})|(?:{_MONTHS})\.?\s+{_ORDINAL})(?:,?\s*\d{{4}})?)\b",
+    re.IGNORECASE,
+)
+_RELATIVE_DAY_RE = re.compile(r"\b(day after tomorrow|tomorrow|today|tonight)\b", re.IGNORECASE)
+_IN_N_RE = re.compile(r"\bin\s+(\d{1,2}|a|one|two|three)\s+(days?|weeks?)\b", re.IGNORECASE)
+_WEEKDAY_RE = re.compile(rf"\b(?:(this|next|on)\s+)?({'|'.join(_WEEKDAYS)})\b", re.IGNORECASE)
+
+_WORD_NUMBERS = {"a": 1, "one": 1, "two": 2, "three": 3}
+_RELATIVE_DAYS = {"today": 0, "tonight": 0, "tomorrow": 1, "day after tomorrow": 2}
+
+_EXPLICIT_DATE_CONFIDENCE = 1.0
+_NEXT_WEEKDAY_CONFIDENCE = 0.8  # "next Friday" may mean this coming Friday or the one after
+
+
+def parse_departure_date(text: str, today: date | None = None) -> tuple[date | None, float]:
+    """Resolve the single departure date in text, with a confidence.
+
+    Returns (None, 0.0) when no date is found, when several different dates are mentioned,
+    or when the date is already in the past.
+    """
+    today = today or date.today()
+    candidates: list[tuple[date, float]] = []
+
+    for m in _ISO_DATE_RE.finditer(text):
+        try:
+            candidates.append((date.fromisoformat(m.group(1)), _EXPLICIT_DATE_CONFIDENCE))
+        except ValueError:
+            return None, 0.0
+    for m in _MONTH_DATE_RE.finditer(text):
+        parsed = _parse_month_date(m.group(1), today)
+        if parsed is None:
+            return None, 0.0
+        candidates.append((parsed, _EXPLICIT_DATE_CONFIDENCE))
+    for m in _RELATIVE_DAY_RE.finditer(text):
+        candidates.append((today + timedelta(days=_RELATIVE_DAYS[m.group(1).lower()]), _EXPLICIT_DATE_CONFIDENCE))
+    for m in _IN_N_RE.finditer(text):
+        n = _WORD_NUMBERS.get(m.group(1).lower()) or int(m.group(1))
+        days = n * 7 if m.group(2).lower().startswith("week") else n
+        candidates.append((today + timedelta(days=days), _EXPLICIT_DATE_CONFIDENCE))
+    for m in _WEEKDAY_RE.finditer(text):
+        ahead = (_WEEKDAYS.index(m.group(2).lower()) - today.weekday() - 1) % 7 + 1
+        qualifier = (m.group(1) or "").lower()
+        confidence = _NEXT_WEEKDAY_CONFIDENCE if qualifier == "next" else _EXPLICIT_DATE_CONFIDENCE
+        candidates.append((today + timedelta(days=ahead), confidence))
+
+    if len({d for d, _ in candidates}) != 1:
+        return None, 0.0
+    departure = candidates[0][0]
+    if departure < today:
+        return None, 0.0
+    return departure, min(c for _, c in candidates)
+
+
+def _parse_month_date(text: str, today: date) -> date | None:
+    """Parse "March 20" / "20th of March, 2027"; a date without a year rolls to the next occurrence."""
+    cleaned = re.sub(r"(?<=\d)(st|nd|rd|th)\b|\bof\b", "", text, flags=re.IGNORECASE)
+    try:
+        parsed: date = dateutil_parser.parse(cleaned, default=datetime(today.year, today.month, 1)).date()
+    except (ValueError, OverflowError):
+        return None
+    if not re.search(r"\d{4}", text) and parsed < today:
+        try:
+            parsed = parsed.replace(year=parsed.year + 1)
+        except ValueError:  # 29 February
+            return None
+    return parsed
+
+
+# ── Request shape ───────────────────────────────────────────────────────────
+
+_QUESTION_RE = re.compile(r"\?|^\s*(?:can|could|may|what|which|is|am|are|how|why|does|do|should)\b", re.IGNORECASE)
+_ROUND_TRIP_RE = re.compile(
+    r"\b(?:return(?:ing)?|round[\s-]?trip|come back|coming back|back on|then on to|multi[\s-]?city)\b",
+    re.IGNORECASE,
+)
+_PASSENGERS_RE = re.compile(
+    r"\b(\d{1,2})\s+(?:passengers?|people|persons|adults|travell?ers|seats|tickets)\b", re.IGNORECASE
+)
+_TIME_PREFERENCE_RE = re.compile(r"\b(morning|afternoon|evening|night|red[\s-]?eye)\b", re.IGNORECASE)
+# Matched words → the schema's time_preference values (flight_ranking.TIME_WINDOWS keys).
+_TIME_PREFERENCES = {"morning": "morning", "afternoon": "afternoon", "evening": "evening", "night": "red_eye"}
+
+# Caps that scale with the employee's level need the employee record, which the planner does not have.
+_LEVEL_DEPENDENT_RE = re.compile(r"\b(?:employee|job)(?:'s)?\s+level\b|\blevel\s+caps?\b", re.IGNORECASE)
+
+_DEFAULT_CABIN_CONFIDENCE = 0.95  # no cabin mentioned — economy is assumed
+_PREMIUM_CABIN_CONFIDENCE = 0.7  # premium cabins usually hinge on policy conditions the rules don't model
+
+
+def _time_preference(match: re.Match[str] | None) -> str | None:
+    if match is None:
+        return None
+    word = match.group(1).lower()
+    return "red_eye" if word.startswith("red") else _TIME_PREFERENCES.get(word)
+
+
+# ── Policy sources ────────────────────────────────────────────────────────────
+
+_SECTION_HEADER_RE = re.compile(
+    r"^\[Section: (?P<title>.*?) \| Page: (?P<page>\d+) \| Type: [^|]*\| Similarity: (?P<sim>[\d.]+)\]$",
+    re.MULTILINE,
+)
+
+
+def extract_policy_sources(context_text: str) -> list[PolicySource]:
+    """PolicySource entries from the section headers PolicyRetrievalService puts in the context."""
+    return [
+        PolicySource(section_title=m.group("title"), page=int(m.group("page")), similarity_score=float(m.group("sim")))
+        for m in _SECTION_HEADER_RE.finditer(context_text)
+    ]
+
+
+# ── Planner ─────────────────────────────────────────────────────────────────
+
+
+class RulePlanner:
+    """Produces a BookingPlan for requests the rules fully resolve.
+
+    Args:
+        min_confidence: Plans scored below this are discarded and the model is used instead.
+    """
+
+    def __init__(self, min_confidence: float = 0.9) -> None:
+        self._min_confidence = min_confidence
+
+    def plan(self, request: ReasoningRequest, today: date | None = None) -> BookingPlan | None:
+        """Return a plan when every field resolves with confidence >= min_confidence, else None."""
+        today = today or date.today()
+        reason = self._decline_reason(request)
+        if reason:
+            logger.info("rule_planner_declined", reason=reason)
+            return None
+
+        query = request.user_query
+        origin, destination, route_confidence = resolve_route(query)
+        departure, date_confidence = parse_departure_date(query, today)
+        cabin = parse_cabin_class(query)
+        if origin is None or destination is None or departure is None or cabin is None:
+            logger.info("rule_planner_declined", reason="unresolved_fields")
+            return None
+        cabin_confidence = (
+            _DEFAULT_CABIN_CONFIDENCE if not cabin else 1.0 if cabin == "economy" else _PREMIUM_CABIN_CONFIDENCE
+        )
+        cabin = cabin or "economy"
+
+        # Rules extracted at ingestion; older workflows without them fall back to the excerpts.
+        rules = request.policy_rules or extract_policy_rules(request.context_text)
+        eligible = permits_cabin(rules, cabin)
+        if eligible is False:
+            logger.info("rule_planner_declined", reason="cabin_not_permitted")
+            return None
+        if eligible is None and any(r.rule_type == "cabin_eligibility" and r.cabin_class == cabin for r in rules):
+            logger.info("rule_planner_declined", reason="cabin_conditional")
+            return None
+        if _LEVEL_DEPENDENT_RE.search(request.context_text):
+            logger.info("rule_planner_declined", reason="level_dependent_policy")
+            return None
+        # Only a cap stated for this airport pair; an all-routes or route-category cap needs judgement.
+        budget = route_cap(rules, cabin, origin, destination)
+        if budget is None:
+            logger.info("rule_planner_declined", reason="no_route_budget_rule")
+            return None
+
+        passengers = _PASSENGERS_RE.search(query)
+        passenger_count = int(passengers.group(1)) if passengers else 1
+        if not 1 <= passenger_count <= 9:
+            logger.info("rule_planner_declined", reason="passenger_count")
+            return None
+
+        confidence = round(route_confidence * date_confidence * cabin_confidence, 2)
+        if confidence < self._min_confidence:
+            logger.info("rule_planner_declined", reason="low_confidence", confidence=confidence)
+            return None
+
+        advance_days = advance_booking_days(rules)
+        days_until = (departure - today).days
+        advance_met = advance_days is None or days_until >= advance_days
+        time_preference = _TIME_PREFERENCE_RE.search(query)
+
+        plan = BookingPlan(
+            intent="flight_booking",
+            confidence=confidence,
+            parameters=BookingParameters(
+                origin=origin,
+                destination=destination,
+                departure_date=departure,
+                cabin_class=cabin,
+                time_preference=_time_preference(time_preference),
+                passenger_count=passenger_count,
+            ),
+            policy_constraints=PolicyConstraints(
+                max_budget_usd=budget,
+                preferred_vendors=preferred_vendors(rules) or ["any"],
+                advance_booking_days_required=advance_days,
+                advance_booking_met=advance_met,
+                requires_approval=not advance_met,
+                approval_reason=None
+                if advance_met
+                else f"Booked {days_until} days ahead; policy requires {advance_days}",
+            ),
+            policy_sources=extract_policy_sources(request.context_text),
+            reasoning_summary=(
+                f"Rule-based plan: one-way {origin}-{destination} on {departure.isoformat()}, "
+                f"{cabin.replace('_', ' ')}, capped at ${budget:,.0f} per policy."
+            ),
+        )
+        logger.info("rule_planner_planned", confidence=confidence, origin=origin, destination=destination)
+        return plan
+
+    @staticmethod
+    def _decline_reason(request: ReasoningRequest) -> str | None:
+        if request.confidence_level != "high":
+            return "weak_policy_retrieval"
+        if _QUESTION_RE.search(request.user_query):
+            return "question"
+        if _ROUND_TRIP_RE.search(request.user_query):
+            return "round_trip"
+        return None
@@ -0,0 +1,94 @@
+"""Speculative flight search, overlapped with reasoning.
+
+Most queries name their route and date outright ("DEL to BOM on 12 Nov"), so the search the
+plan will ask for is known before reasoning starts. ReasonAndPlan parses it with the rule
+planner's parsers and starts that search on a background thread through the flight search
+cache. InvokeFlightSearch then finds the result in the cache's shared tier instead of waiting
+for the portal. The cache key is route, date and cabin, so a plan that changes any of them
+simply misses, and nothing is lost beyond one portal call.
+
+Lambda freezes the container once the handler returns, so the handler waits a bounded time
+for the search to land in the cache before returning.
+"""
+
+import threading
+import time
+from datetime import date
+
+import structlog
+
+from core.models.booking import BookingPlan
+from core.services.flight_search_cache import FlightSearchCache
+from core.services.portal_client import PortalClient
+from core.services.rule_planner import parse_cabin_class, parse_departure_date, resolve_route
+
+log = structlog.get_logger()
+
+
+class SearchPrefetch:
+    """A speculative search running on a background thread. Build with start_search_prefetch."""
+
+    def __init__(self, origin: str, destination: str, departure_date: str, cabin_class: str) -> None:
+        self.origin = origin
+        self.destination = destination
+        self.departure_date = departure_date
+        self.cabin_class = cabin_class
+        self.error: str | None = None
+        self._started_at = time.monotonic()
+        self._done = threading.Event()
+
+    def run(self, searcher: PortalClient | FlightSearchCache) -> None:
+        try:
+            searcher.search_flights(self.origin, self.destination, self.departure_date, self.cabin_class)
+        except Exception as e:
+            # Speculative — the real search step retries and surfaces the error properly.
+            self.error = str(e)
+        finally:
+            self._done.set()
+
+    def matches(self, plan: BookingPlan) -> bool:
+        params = plan.parameters
+        return (params.origin, params.destination, params.departure_date.isoformat(), params.cabin_class) == (
+            self.origin,
+            self.destination,
+            self.departure_date,
+            self.cabin_class,
+        )
+
+    def finish(self, plan: BookingPlan, max_wait_s: float) -> bool:
+        """Wait up to max_wait_s for the search, log the outcome, and return whether the plan can reuse it.
+
+        A plan that asks for a different search cannot use the result, so it does not wait.
+        """
+        matched = self.matches(plan)
+        done = self._done.wait(max(0.0, max_wait_s)) if matched else self._done.is_set()
+        outcome = "pending" if not done else "failed" if self.error else "done"
+        log.info(
+            "search_prefetch",
+            outcome=outcome,
+            matched=matched,
+            origin=self.origin,
+            destination=self.destination,
+            elapsed_ms=round((time.monotonic() - self._started_at) * 1000, 1),
+            error=self.error,
+        )
+        return matched and outcome == "done"
+
+
+def start_search_prefetch(
+    searcher: PortalClient | FlightSearchCache, user_query: str, today: date | None = None
+) -> SearchPrefetch | None:
+    """Start the search user_query names, or return None when route, date or cabin is not explicit.
+
+    A date is required — guessing one would mostly warm searches the plan never asks for.
+    """
+    origin, destination, _ = resolve_route(user_query)
+    departure, _ = parse_departure_date(user_query, today)
+    cabin = parse_cabin_class(user_query)
+    if origin is None or destination is None or departure is None or cabin is None:
+        return None
+
+    # parse_cabin_class returns "" when no cabin is named; the planner assumes economy then.
+    prefetch = SearchPrefetch(origin, destination, departure.isoformat(), cabin or "economy")
+    threading.Thread(target=prefetch.run, args=(searcher,), name="flight-search-prefetch", daemon=True).start()
+    return prefetch
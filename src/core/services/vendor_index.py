@@ -0,0 +1,87 @@
+"""Airline vendor normalization — one index shared by every preferred-vendor check.
+
+Airline names, IATA carrier codes and common aliases all resolve to one canonical carrier
+through a hash map built once per container. Policy vendors and flight airlines are both
+resolved through it, so "Air India", "air india ltd" and "AI" match each other, while
+"Air India Express" stays a different carrier. Names the index does not know resolve to
+their own normalized form, so unknown carriers still match when spelled the same.
+"""
+
+import re
+from collections.abc import Iterable, Mapping
+from functools import lru_cache
+
+# Canonical carrier name → IATA code and aliases.
+AIRLINES: dict[str, tuple[str, ...]] = {
+    "IndiGo": ("6E", "indigo airlines", "interglobe aviation"),
+    "Air India": ("AI", "air india limited"),
+    "Air India Express": ("IX",),
+    "Vistara": ("UK", "tata sia airlines"),
+    "SpiceJet": ("SG", "spice jet"),
+    "Akasa Air": ("QP", "akasa"),
+    "Emirates": ("EK", "emirates airline"),
+    "Singapore Airlines": ("SQ", "sia"),
+    "British Airways": ("BA",),
+    "Etihad Airways": ("EY", "etihad"),
+    "Delta Air Lines": ("DL", "delta", "delta airlines"),
+    "United Airlines": ("UA", "united"),
+    "American Airlines": ("AA", "american"),
+    "Lufthansa": ("LH", "deutsche lufthansa"),
+}
+
+# Wildcards a policy uses for "no vendor restriction".
+_ANY = frozenset({"any", "all", "none", ""})
+
+_NON_ALNUM = re.compile(r"[^0-9a-z]+")
+_CARRIER_PREFIX = re.compile(r"^\s*([0-9A-Za-z]{2})(?=[\s-]*\d)")
+
+
+def normalize_vendor(name: str) -> str:
+    """Case-fold and reduce punctuation/whitespace runs to single spaces."""
+    return _NON_ALNUM.sub(" ", name.casefold()).strip()
+
+
+class VendorIndex:
+    """Resolves airline names, carrier codes and aliases to canonical carriers in O(1)."""
+
+    def __init__(self, airlines: Mapping[str, Iterable[str]]) -> None:
+        self._canonical: dict[str, str] = {}
+        for name, aliases in airlines.items():
+            for key in (name, *aliases):
+                self._canonical[normalize_vendor(key)] = name
+
+    def resolve(self, name: str) -> str:
+        """Canonical carrier for name, or its normalized form when the index does not know it."""
+        key = normalize_vendor(name)
+        return self._canonical.get(key, key)
+
+    def resolve_flight(self, airline: str, flight_number: str | None = None) -> str:
+        """Canonical carrier for a flight; the flight-number prefix (e.g. 6E-100) is used if the name is unknown."""
+        key = normalize_vendor(airline)
+        if key in self._canonical:
+            return self._canonical[key]
+        if flight_number and (match := _CARRIER_PREFIX.match(flight_number)):
+            return self._canonical.get(normalize_vendor(match.group(1)), key)
+        return key
+
+    def allowed(self, vendors: Iterable[str]) -> frozenset[str] | None:
+        """Canonical carriers a preferred-vendor list allows, or None when it allows any carrier."""
+        resolved = {self.resolve(v) for v in vendors if normalize_vendor(v) not in _ANY}
+        return frozenset(resolved) or None
+
+
+VENDOR_INDEX = VendorIndex(AIRLINES)
+
+
+@lru_cache(maxsize=256)
+def _allowed_carriers(vendors: tuple[str, ...]) -> frozenset[str] | None:
+    return VENDOR_INDEX.allowed(vendors)
+
+
+def allowed_carriers(vendors: Iterable[str] | None) -> frozenset[str] | None:
+    """VENDOR_INDEX.allowed, memoized per vendor list — policies repeat across requests."""
+    return _allowed_carriers(tuple(vendors or ()))
+
+
+def is_allowed_carrier(allowed: frozenset[str] | None, airline: str, flight_number: str | None = None) -> bool:
+    return allowed is None or VENDOR_INDEX.resolve_flight(airline, flight_number) in allowed
@@ -98,6 +98,7 @@ def handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
                 "booking_id": booking_id,
                 "employee_id": employee_id,
                 "user_query": body["user_query"],
+                "fused_retrieval": config.fused_retrieval,
             }),
         )
         execution_arn = resp["executionArn"]
@@ -2,11 +2,12 @@
 
 from typing import Any
 
-from core.clients import get_dynamo_client, get_policy_retrieval_service
+from core.clients import get_claim_check_store, get_dynamo_client, get_policy_retrieval_service
 from core.config import get_config
 from core.db.aurora import AuroraClient
 from core.models.retrieval import EmbedAndRetrieveRequest, EmbedAndRetrieveResponse
 from core.services.audit import build_retrieval_audit_entry, write_audit_log
+from core.services.policy_rules import load_policy_rules
 
 
 def handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
@@ -17,6 +18,7 @@ def handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
     with AuroraClient(config) as aurora_client:
         service._aurora_client = aurora_client
         result = service.retrieve(request.user_query)
+        policy_rules = load_policy_rules(aurora_client, result.chunks) if config.policy_rules_enabled else []
 
     write_audit_log(
         get_dynamo_client(),
@@ -33,7 +35,7 @@ def handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
         ),
     )
 
-    return EmbedAndRetrieveResponse(
+    response = EmbedAndRetrieveResponse(
         booking_id=request.booking_id,
         employee_id=request.employee_id,
         user_query=request.user_query,
@@ -41,4 +43,7 @@ def handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
         confidence=result.confidence,
         total_chunks=result.total_chunks,
         retrieval_latency_ms=result.latency_ms,
+        policy_rules=policy_rules,
     ).model_dump()
+    # Long policies would otherwise ride along in every later state transition.
+    return get_claim_check_store().offload(response, request.booking_id, ["context_text"])
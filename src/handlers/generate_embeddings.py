@@ -3,11 +3,14 @@
 import json
 from typing import Any
 
-from core.clients import get_bedrock_runtime_client, get_s3_client
+from core.clients import get_bedrock_runtime_client, get_plan_cache, get_s3_client
 from core.config import get_config
 from core.db.aurora import AuroraClient
 from core.models.ingestion import EmbeddingMessage
 from core.services.embedding import EmbeddingService
+from core.services.embedding_archive import EmbeddingArchive
+from core.services.plan_cache import invalidate_plan_cache
+from core.services.policy_rules import refresh_policy_rules
 
 
 def handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
@@ -17,11 +20,18 @@ def handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
 
     try:
         aurora_client.connect()
+        s3_client = get_s3_client()
+        archive = (
+            EmbeddingArchive(s3_client, config.policy_bucket)
+            if config.embedding_archive_enabled and config.policy_bucket
+            else None
+        )
         service = EmbeddingService(
             get_bedrock_runtime_client(),
-            get_s3_client(),
+            s3_client,
             aurora_client,
             config.nova_embeddings_model_id,
+            archive=archive,
         )
 
         if "Records" in event:
@@ -30,6 +40,9 @@ def handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
             msg = EmbeddingMessage.model_validate(event)
 
         result = service.generate_embeddings(msg.policy_id, msg.output_s3_uri)
+        if config.policy_rules_enabled:
+            refresh_policy_rules(aurora_client, msg.policy_id)
+        invalidate_plan_cache(get_plan_cache())
         return result.model_dump()
     finally:
         aurora_client.disconnect()
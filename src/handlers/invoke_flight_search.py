@@ -2,10 +2,13 @@
 
 from typing import Any
 
-from core.config import get_config
+from core.clients import get_claim_check_store, get_flexible_search, get_flight_search
 from core.services.flight_search_api import search_flights_via_api
 
+# Read by SendFlightOptions only — CheckSearchResult looks at total_results, which stays inline.
+OFFLOADED_FIELDS = ["search_result.flights", "search_result.itineraries"]
+
 
 def handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
-    config = get_config()
-    return search_flights_via_api(event, config)
+    result = search_flights_via_api(event, get_flight_search(), get_flexible_search())
+    return get_claim_check_store().offload(result, event["booking_id"], OFFLOADED_FIELDS)
@@ -0,0 +1,47 @@
+"""Lambda handler — drains the progress queue and posts to WebSocket connections.
+
+Workflow states and steps enqueue progress instead of invoking ResponseSender, so nothing on the
+booking path waits on API Gateway. Each batch is coalesced to the newest message per booking:
+progress only reports where the workflow is now. Progress from a stage earlier than the last
+message ResponseSender sent for the booking is dropped. Delivery is best-effort and the batch
+never fails — a progress message is not worth redelivering.
+"""
+
+import json
+from typing import Any
+
+import structlog
+
+from core.clients import get_apigw_client, get_dynamo_client
+from core.config import get_config
+from core.services.progress import ProgressNotifier, coalesce_progress, sent_stage
+
+logger = structlog.get_logger()
+
+
+def handler(event: dict[str, Any], context: Any) -> None:
+    records = event.get("Records", [])
+    events = []
+    for record in records:
+        try:
+            events.append(json.loads(record["body"]))
+        except (KeyError, ValueError) as e:
+            logger.warning("progress_message_invalid", message_id=record.get("messageId"), error=str(e))
+
+    latest = [item for item in coalesce_progress(events) if not _superseded(item)]
+    apigw = get_apigw_client() if latest else None
+    for item in latest:
+        ProgressNotifier(apigw, item["connection_id"], item.get("booking_id", ""))(item.get("message", ""))
+
+    logger.info("progress_delivered", received=len(records), posted=len(latest))
+
+
+def _superseded(item: dict[str, Any]) -> bool:
+    """Whether ResponseSender has already sent the booking a message from a later stage."""
+    stage, booking_id, employee_id = item.get("stage"), item.get("booking_id"), item.get("employee_id")
+    if stage is None or not booking_id or not employee_id:
+        return False
+    if int(stage) >= sent_stage(get_dynamo_client(), get_config().bookings_table, employee_id, booking_id):
+        return False
+    logger.info("progress_superseded", booking_id=booking_id, stage=stage)
+    return True
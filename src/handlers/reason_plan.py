@@ -2,32 +2,38 @@
 
 from typing import Any
 
-from core.clients import get_dynamo_client, get_reasoning_service
+from core.clients import (
+    get_claim_check_store,
+    get_dynamo_client,
+    get_prefetch_searcher,
+    get_progress_notifier,
+    get_reasoning_service,
+)
 from core.config import get_config
 from core.models.booking import ReasoningRequest
-from core.services.audit import build_reasoning_audit_entry, write_audit_log
+from core.services.audit import reasoning_audit_entry, write_audit_log
+from core.services.progress import STAGE_REASONING
+from core.services.search_prefetch import start_search_prefetch
+
+# Time left for Step Functions to receive the result after waiting on a prefetch.
+_PREFETCH_RESERVE_S = 1.0
 
 
 def handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
     config = get_config()
-    request = ReasoningRequest.model_validate(event)
-    result = get_reasoning_service().generate_booking_plan(request, context.get_remaining_time_in_millis())
-
-    write_audit_log(
-        get_dynamo_client(),
-        config.audit_log_table,
-        build_reasoning_audit_entry(
-            booking_id=result.booking_id,
-            employee_id=result.employee_id,
-            model_id=result.model_id,
-            thinking_effort=result.thinking_effort,
-            latency_ms=result.latency_ms,
-            retry_count=result.retry_count,
-            escalated=result.escalated,
-            plan_confidence=result.plan.confidence,
-            plan_intent=result.plan.intent,
-            warnings_count=len(result.plan.warnings),
-        ),
+    request = ReasoningRequest.model_validate(get_claim_check_store().resolve(event, ["context_text"]))
+    searcher = get_prefetch_searcher()
+    prefetch = start_search_prefetch(searcher, request.user_query) if searcher else None
+    result = get_reasoning_service().generate_booking_plan(
+        request,
+        context.get_remaining_time_in_millis(),
+        progress=get_progress_notifier(request.connection_id, request.booking_id, request.employee_id, STAGE_REASONING),
     )
 
+    write_audit_log(get_dynamo_client(), config.audit_log_table, reasoning_audit_entry(result))
+
+    if prefetch is not None:
+        remaining_s = context.get_remaining_time_in_millis() / 1000 - _PREFETCH_RESERVE_S
+        prefetch.finish(result.plan, min(config.flight_search_prefetch_wait_s, remaining_s))
+
     return result.model_dump(mode="json")
@@ -4,24 +4,25 @@ import json
 import logging
 from typing import Any
 
-from core.clients import get_apigw_client, get_dynamo_client
+from core.clients import get_apigw_client, get_claim_check_store, get_dynamo_client
 from core.config import get_config
+from core.services.progress import STAGE_FINISHED, STAGE_OPTIONS, build_progress_payload, record_sent_stage
 from core.services.task_token import store_task_token
 
 logger = logging.getLogger(__name__)
 
+# Stage each directly-sent message reports; queued progress from an earlier stage is then dropped.
+_SENT_STAGES = {"flight_options": STAGE_OPTIONS, "payment_confirmation": STAGE_OPTIONS}
+
 
 def handler(event: dict[str, Any], context: Any) -> None:
     config = get_config()
     msg_type = event.get("type")
 
     if msg_type == "progress":
-        payload = {
-            "type": "progress",
-            "booking_id": event.get("booking_id"),
-            "payload": {"message": event.get("message", "")},
-        }
+        payload = build_progress_payload(event.get("booking_id"), event.get("message", ""))
     elif msg_type == "flight_options":
+        event = get_claim_check_store().resolve(event, ["flights", "itineraries"])
         store_task_token(
             get_dynamo_client(),
             config.bookings_table,
@@ -34,6 +35,8 @@ def handler(event: dict[str, Any], context: Any) -> None:
             "booking_id": event["booking_id"],
             "flights": event["flights"],
         }
+        if event.get("itineraries"):
+            payload["itineraries"] = event["itineraries"]
     elif msg_type == "payment_confirmation":
         store_task_token(
             get_dynamo_client(),
@@ -79,6 +82,12 @@ def handler(event: dict[str, Any], context: Any) -> None:
             "message": "Something went wrong with your booking request. Please try again.",
         }
 
+    booking_id, employee_id = event.get("booking_id"), event.get("employee_id")
+    if msg_type != "progress" and booking_id and employee_id:
+        # Recorded before posting, so progress dequeued after the client sees this message is dropped.
+        stage = _SENT_STAGES.get(str(msg_type), STAGE_FINISHED)
+        record_sent_stage(get_dynamo_client(), config.bookings_table, employee_id, booking_id, stage)
+
     connection_id = event["connection_id"]
     data = json.dumps(payload).encode()
     apigw = get_apigw_client()
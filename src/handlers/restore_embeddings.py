@@ -0,0 +1,38 @@
+"""Lambda handler for restoring policy chunks from an S3 embedding archive."""
+
+from typing import Any
+
+from core.clients import get_bedrock_runtime_client, get_plan_cache, get_s3_client
+from core.config import get_config
+from core.db.aurora import AuroraClient
+from core.models.ingestion import RestoreEmbeddingsMessage
+from core.services.embedding import EmbeddingService
+from core.services.embedding_archive import EmbeddingArchive
+from core.services.plan_cache import invalidate_plan_cache
+from core.services.policy_rules import refresh_policy_rules
+
+
+def handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
+    """Bulk-load a policy's chunks from embedding-archive/ into pgvector without calling Bedrock."""
+    config = get_config()
+    aurora_client = AuroraClient(config)
+
+    try:
+        aurora_client.connect()
+        s3_client = get_s3_client()
+        service = EmbeddingService(
+            get_bedrock_runtime_client(),
+            s3_client,
+            aurora_client,
+            config.nova_embeddings_model_id,
+            archive=EmbeddingArchive(s3_client, config.policy_bucket),
+        )
+
+        msg = RestoreEmbeddingsMessage.model_validate(event)
+        result = service.restore_from_archive(msg.policy_id, msg.source_policy_id)
+        if config.policy_rules_enabled:
+            refresh_policy_rules(aurora_client, msg.policy_id)
+        invalidate_plan_cache(get_plan_cache())
+        return result.model_dump()
+    finally:
+        aurora_client.disconnect()
@@ -0,0 +1,137 @@
+"""Lambda handler — policy retrieval and plan generation in one invocation.
+
+The fused alternative to EmbedAndRetrieve → NotifyAnalyzing → ReasonAndPlan, chosen when the
+workflow input sets fused_retrieval. Progress goes through get_progress_notifier, both audit records
+are written in one batch, and context_text never leaves the container. The result has the shape
+of EmbedAndRetrieve's, without context_text, plus the ReasoningResult under reasoning_result.
+
+Retrieval and reasoning are retried here rather than by the state's Retry, each with the budget
+of its split-path state, so a reasoning retry does not repeat the embedding, the Aurora query and
+the retrieval audit record.
+"""
+
+import time
+from typing import Any
+
+from core.clients import (
+    get_dynamo_client,
+    get_policy_retrieval_service,
+    get_prefetch_searcher,
+    get_progress_notifier,
+    get_reasoning_service,
+)
+from core.config import Config, get_config
+from core.db.aurora import AuroraClient
+from core.errors import ReasoningError
+from core.models.booking import ReasoningRequest, ReasoningResult
+from core.models.retrieval import EmbedAndRetrieveRequest, EmbedAndRetrieveResponse, PolicyRule, RetrievalResult
+from core.services.audit import build_retrieval_audit_entry, reasoning_audit_entry, write_audit_logs
+from core.services.policy_rules import load_policy_rules
+from core.services.progress import STAGE_REASONING
+from core.services.reasoning import ProgressCallback
+from core.services.search_prefetch import start_search_prefetch
+
+ANALYZING_MESSAGE = "Policies retrieved. Analyzing your request against travel policy..."
+
+# Time left for Step Functions to receive the result after waiting on a prefetch.
+_PREFETCH_RESERVE_S = 1.0
+
+# Same budget as the EmbedAndRetrieve and ReasonAndPlan state Retries: 2 retries, 2s interval, backoff 1.5.
+_RETRIEVAL_ATTEMPTS = 3
+_REASONING_ATTEMPTS = 3
+_RETRY_INTERVAL_S = 2.0
+_RETRY_BACKOFF = 1.5
+
+
+def handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
+    config = get_config()
+    request = EmbedAndRetrieveRequest.model_validate(event)
+    connection_id = event.get("connection_id")
+    progress = get_progress_notifier(connection_id, request.booking_id, request.employee_id, STAGE_REASONING)
+    # The query is all a prefetch needs, so it can overlap retrieval as well as reasoning.
+    searcher = get_prefetch_searcher()
+    prefetch = start_search_prefetch(searcher, request.user_query) if searcher else None
+
+    retrieval, policy_rules = _retrieve(config, request.user_query)
+
+    audit_entries = [
+        build_retrieval_audit_entry(
+            booking_id=request.booking_id,
+            employee_id=request.employee_id,
+            query_length=len(request.user_query),
+            total_chunks=retrieval.total_chunks,
+            confidence_level=retrieval.confidence.level.value,
+            max_similarity=retrieval.confidence.max_similarity,
+            action=retrieval.confidence.action,
+            latency_ms=retrieval.latency_ms,
+        )
+    ]
+    if progress is not None:
+        progress(ANALYZING_MESSAGE)
+
+    reasoning_request = ReasoningRequest(
+        booking_id=request.booking_id,
+        employee_id=request.employee_id,
+        user_query=request.user_query,
+        context_text=retrieval.context_text,
+        confidence_level=retrieval.confidence.level.value,
+        max_similarity=retrieval.confidence.max_similarity,
+        connection_id=connection_id,
+        policy_rules=policy_rules,
+    )
+    try:
+        result = _generate_plan(reasoning_request, context, progress)
+        audit_entries.append(reasoning_audit_entry(result))
+    finally:
+        # The retrieval record is kept even when reasoning fails and the workflow degrades.
+        write_audit_logs(get_dynamo_client(), config.audit_log_table, audit_entries)
+
+    if prefetch is not None:
+        remaining_s = context.get_remaining_time_in_millis() / 1000 - _PREFETCH_RESERVE_S
+        prefetch.finish(result.plan, min(config.flight_search_prefetch_wait_s, remaining_s))
+
+    retrieval_result = EmbedAndRetrieveResponse(
+        booking_id=request.booking_id,
+        employee_id=request.employee_id,
+        user_query=request.user_query,
+        context_text=retrieval.context_text,
+        confidence=retrieval.confidence,
+        total_chunks=retrieval.total_chunks,
+        retrieval_latency_ms=retrieval.latency_ms,
+        policy_rules=policy_rules,
+    ).model_dump(exclude={"context_text"})
+    return {**retrieval_result, "reasoning_result": result.model_dump(mode="json")}
+
+
+def _retrieve(config: Config, user_query: str) -> tuple[RetrievalResult, list[PolicyRule]]:
+    """Policy retrieval and its rules, retried on any failure like the EmbedAndRetrieve state."""
+    delay = _RETRY_INTERVAL_S
+    for _ in range(_RETRIEVAL_ATTEMPTS - 1):
+        try:
+            return _retrieve_once(config, user_query)
+        except Exception:
+            time.sleep(delay)
+            delay *= _RETRY_BACKOFF
+    return _retrieve_once(config, user_query)
+
+
+def _retrieve_once(config: Config, user_query: str) -> tuple[RetrievalResult, list[PolicyRule]]:
+    service = get_policy_retrieval_service()
+    with AuroraClient(config) as aurora_client:
+        service._aurora_client = aurora_client
+        retrieval = service.retrieve(user_query)
+        policy_rules = load_policy_rules(aurora_client, retrieval.chunks) if config.policy_rules_enabled else []
+    return retrieval, policy_rules
+
+
+def _generate_plan(request: ReasoningRequest, context: Any, progress: ProgressCallback | None) -> ReasoningResult:
+    """generate_booking_plan, retried on ReasoningError. Each call gets the time then left."""
+    service = get_reasoning_service()
+    delay = _RETRY_INTERVAL_S
+    for _ in range(_REASONING_ATTEMPTS - 1):
+        try:
+            return service.generate_booking_plan(request, context.get_remaining_time_in_millis(), progress=progress)
+        except ReasoningError:
+            time.sleep(delay)
+            delay *= _RETRY_BACKOFF
+    return service.generate_booking_plan(request, context.get_remaining_time_in_millis(), progress=progress)
@@ -3,10 +3,12 @@
 from typing import Any
 
 from core.models.booking import ReasoningResult
+from core.models.retrieval import PolicyRule
 from core.services.plan_validation import validate_plan
 
 
 def handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
     result = ReasoningResult.model_validate(event)
-    validated = validate_plan(result)
+    policy_rules = [PolicyRule.model_validate(rule) for rule in event.get("policy_rules") or []]
+    validated = validate_plan(result, policy_rules)
     return validated.model_dump(mode="json")
@@ -0,0 +1 @@
+"""Record/replay harness for bedrock-runtime Converse calls."""
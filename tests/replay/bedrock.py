@@ -0,0 +1,198 @@
+"""Record/replay stand-ins for the bedrock-runtime client.
+
+RecordingBedrockClient wraps a real client and appends every converse() exchange to a JSONL
+cassette. ReplayBedrockClient serves those exchanges back without network access, through
+either converse() or converse_stream() (the stream is synthesized from the recorded response).
+
+Cassettes are scrubbed before they are written:
+- ResponseMetadata (request ids, HTTP headers) is dropped.
+- Emails and phone numbers in the recorded query are masked.
+- ISO dates are stored relative to the recording day ({{today+30}}), so plans recorded
+  today still have future departure dates when replayed next month.
+
+Exchanges are matched on a key built from the scrubbed request:
+- "query" (default) keys on the thinking effort and the request block (today's date + employee
+  request), so a cassette keeps replaying after prompt, schema or context changes — which is
+  what benchmarking those changes needs.
+- "exact" keys on the whole scrubbed request, for checking that a request is byte-for-byte
+  what was recorded.
+"""
+
+import hashlib
+import json
+import re
+from collections import defaultdict
+from collections.abc import Iterator
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any, Literal
+
+MatchMode = Literal["query", "exact"]
+
+_ISO_DATE_RE = re.compile(r"\b(\d{4})-(\d{2})-(\d{2})\b")
+_DATE_TOKEN_RE = re.compile(r"\{\{today([+-]\d+)\}\}")
+_EMAIL_RE = re.compile(r"[\w.+-]+@[\w-]+\.[\w.-]+")
+_PHONE_RE = re.compile(r"\+?\d[\d\s().-]{8,}\d")
+_STREAM_CHUNK_CHARS = 64
+
+
+def effort_of(params: dict[str, Any]) -> str:
+    """Thinking effort of a Converse request; "disabled" when it sends no reasoningConfig."""
+    reasoning = params.get("additionalModelRequestFields", {}).get("reasoningConfig", {})
+    return str(reasoning.get("maxReasoningEffort", "disabled"))
+
+
+def request_text(params: dict[str, Any]) -> str:
+    """The last text block of the user message — today's date and the employee request."""
+    blocks = [block["text"] for block in params["messages"][-1]["content"] if "text" in block]
+    return blocks[-1] if blocks else ""
+
+
+def _mask_dates(text: str) -> str:
+    return _ISO_DATE_RE.sub("<date>", text)
+
+
+def request_key(params: dict[str, Any], match: MatchMode = "query") -> str:
+    if match == "exact":
+        material = _mask_dates(json.dumps(params, sort_keys=True, default=str))
+    else:
+        material = f"{effort_of(params)}\x1f{_mask_dates(request_text(params))}"
+    return hashlib.sha256(material.encode()).hexdigest()[:24]
+
+
+def scrub_query(text: str) -> str:
+    return _PHONE_RE.sub("<phone>", _EMAIL_RE.sub("<email>", _mask_dates(text)))
+
+
+def relativize_dates(value: Any, today: date) -> Any:
+    """Replace ISO dates in every string of value with {{today+N}} tokens."""
+
+    def _token(m: re.Match[str]) -> str:
+        try:
+            offset = (date(int(m.group(1)), int(m.group(2)), int(m.group(3))) - today).days
+        except ValueError:
+            return m.group(0)
+        return f"{{{{today{offset:+d}}}}}"
+
+    return _map_strings(value, lambda s: _ISO_DATE_RE.sub(_token, s))
+
+
+def resolve_dates(value: Any, today: date) -> Any:
+    """Inverse of relativize_dates against a (usually later) day."""
+    return _map_strings(
+        value, lambda s: _DATE_TOKEN_RE.sub(lambda m: (today + timedelta(days=int(m.group(1)))).isoformat(), s)
+    )
+
+
+def _map_strings(value: Any, fn: Any) -> Any:
+    if isinstance(value, str):
+        return fn(value)
+    if isinstance(value, dict):
+        return {k: _map_strings(v, fn) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_map_strings(v, fn) for v in value]
+    return value
+
+
+def scrub_response(response: dict[str, Any], today: date) -> dict[str, Any]:
+    kept = {k: v for k, v in response.items() if k in ("output", "stopReason", "usage", "metrics")}
+    return relativize_dates(kept, today)
+
+
+class RecordingBedrockClient:
+    """Passes converse() through to a real client and appends each exchange to a cassette."""
+
+    def __init__(self, inner: Any, cassette: Path, today: date | None = None) -> None:
+        self._inner = inner
+        self._cassette = cassette
+        self._today = today or date.today()
+
+    def converse(self, **params: Any) -> dict[str, Any]:
+        response: dict[str, Any] = self._inner.converse(**params)
+        entry = {
+            "query_key": request_key(params, "query"),
+            "exact_key": request_key(params, "exact"),
+            "model_id": params.get("modelId"),
+            "effort": effort_of(params),
+            "request": scrub_query(request_text(params)),
+            "response": scrub_response(response, self._today),
+        }
+        self._cassette.parent.mkdir(parents=True, exist_ok=True)
+        with self._cassette.open("a") as f:
+            f.write(json.dumps(entry) + "\n")
+        return response
+
+    def converse_stream(self, **params: Any) -> dict[str, Any]:
+        raise NotImplementedError("Record with streaming disabled; replay can still stream the cassette")
+
+
+class ReplayMiss(LookupError):
+    """No recorded exchange matches the request."""
+
+
+class ReplayBedrockClient:
+    """Serves recorded exchanges. Repeated requests get successive recordings, then the last one again.
+
+    Args:
+        cassette: JSONL written by RecordingBedrockClient.
+        match: "query" or "exact" — see the module docstring.
+        today: Day the {{today+N}} tokens resolve against.
+    """
+
+    def __init__(self, cassette: Path, match: MatchMode = "query", today: date | None = None) -> None:
+        self._match = match
+        self._today = today or date.today()
+        self._recordings: dict[str, list[dict[str, Any]]] = defaultdict(list)
+        self._served: dict[str, int] = defaultdict(int)
+        for line in cassette.read_text().splitlines():
+            if line.strip():
+                entry = json.loads(line)
+                self._recordings[entry[f"{match}_key"]].append(entry["response"])
+        self.calls: list[dict[str, Any]] = []
+
+    def rewind(self) -> None:
+        """Serve every key's recordings from the first again, e.g. before the next benchmark run."""
+        self._served.clear()
+
+    def converse(self, **params: Any) -> dict[str, Any]:
+        key = request_key(params, self._match)
+        recordings = self._recordings.get(key)
+        if not recordings:
+            raise ReplayMiss(
+                f"No recorded {effort_of(params)} exchange for request {scrub_query(request_text(params))!r} "
+                f"(key {key}); re-record with scripts/bench_reasoning_replay.py --record"
+            )
+        index = min(self._served[key], len(recordings) - 1)
+        self._served[key] += 1
+        self.calls.append(params)
+        response: dict[str, Any] = resolve_dates(recordings[index], self._today)
+        return response
+
+    def converse_stream(self, **params: Any) -> dict[str, Any]:
+        return {"stream": _stream_events(self.converse(**params))}
+
+
+def _chunks(text: str) -> Iterator[str]:
+    for i in range(0, len(text), _STREAM_CHUNK_CHARS):
+        yield text[i : i + _STREAM_CHUNK_CHARS]
+
+
+def _stream_events(response: dict[str, Any]) -> Iterator[dict[str, Any]]:
+    """The converse_stream event sequence that would have produced response."""
+    yield {"messageStart": {"role": "assistant"}}
+    for index, block in enumerate(response["output"]["message"]["content"]):
+        if "toolUse" in block:
+            tool_use = block["toolUse"]
+            start = {"toolUseId": tool_use.get("toolUseId", f"tooluse_{index}"), "name": tool_use["name"]}
+            yield {"contentBlockStart": {"contentBlockIndex": index, "start": {"toolUse": start}}}
+            for chunk in _chunks(json.dumps(tool_use["input"])):
+                yield {"contentBlockDelta": {"contentBlockIndex": index, "delta": {"toolUse": {"input": chunk}}}}
+        elif "text" in block:
+            for chunk in _chunks(block["text"]):
+                yield {"contentBlockDelta": {"contentBlockIndex": index, "delta": {"text": chunk}}}
+        elif "reasoningContent" in block:
+            delta = {"reasoningContent": block["reasoningContent"].get("reasoningText", {})}
+            yield {"contentBlockDelta": {"contentBlockIndex": index, "delta": delta}}
+        yield {"contentBlockStop": {"contentBlockIndex": index}}
+    yield {"messageStop": {"stopReason": response.get("stopReason", "end_turn")}}
+    yield {"metadata": {"usage": response.get("usage", {}), "metrics": response.get("metrics", {})}}
@@ -0,0 +1,83 @@
+"""Unit tests for AttemptScheduler and DynamoLatencyStore."""
+
+import json
+from unittest.mock import MagicMock
+
+from core.services.attempt_scheduler import AttemptScheduler, DynamoLatencyStore
+
+
+class TestEstimates:
+    def test_default_estimate_until_enough_samples(self):
+        scheduler = AttemptScheduler(min_samples=3)
+        scheduler.record("medium", 1_000.0)
+        assert scheduler.estimate_ms("medium") == 30_000.0
+
+    def test_observed_percentile_per_effort(self):
+        scheduler = AttemptScheduler(percentile=50, min_samples=1)
+        for ms in (1_000.0, 2_000.0, 3_000.0):
+            scheduler.record("medium", ms)
+        assert scheduler.estimate_ms("medium") == 2_000.0
+        assert scheduler.estimate_ms("high") == 60_000.0
+
+
+class TestChoose:
+    def test_planned_effort_when_it_fits(self):
+        assert AttemptScheduler(margin_ms=0).choose("high", 60_000) == "high"
+
+    def test_downgrades_to_most_capable_effort_that_fits(self):
+        assert AttemptScheduler(margin_ms=0).choose("high", 45_000) == "medium"
+        assert AttemptScheduler(margin_ms=0).choose("high", 20_000) == "low"
+
+    def test_never_upgrades(self):
+        assert AttemptScheduler(margin_ms=0).choose("disabled", 7_000) is None
+
+    def test_margin_counts_against_remaining_time(self):
+        assert AttemptScheduler(margin_ms=5_000).choose("medium", 34_000) == "low"
+
+
+class TestDynamoStore:
+    def test_history_loaded_once_per_effort(self):
+        store = MagicMock()
+        store.load.return_value = [500.0] * 10
+        scheduler = AttemptScheduler(store=store)
+
+        assert scheduler.estimate_ms("medium") == 500.0
+        scheduler.estimate_ms("medium")
+        store.load.assert_called_once_with("medium")
+
+    def test_flushes_every_n_samples(self):
+        store = MagicMock()
+        store.load.return_value = []
+        scheduler = AttemptScheduler(store=store, flush_every=2)
+
+        scheduler.record("high", 1.0)
+        store.save.assert_not_called()
+        scheduler.record("high", 2.0)
+        store.save.assert_called_once_with("high", [1.0, 2.0])
+
+    def test_store_failures_are_swallowed(self):
+        store = MagicMock()
+        store.load.side_effect = RuntimeError("throttled")
+        store.save.side_effect = RuntimeError("throttled")
+        scheduler = AttemptScheduler(store=store, flush_every=1)
+
+        scheduler.record("medium", 1.0)
+        assert scheduler.estimate_ms("medium") == 30_000.0
+
+    def test_store_round_trip_item_shape(self):
+        dynamo = MagicMock()
+        store = DynamoLatencyStore(dynamo, "PlanCache", "nova-lite", max_samples=2)
+
+        store.save("medium", [1.0, 2.04, 3.0])
+        item = dynamo.put_item.call_args.kwargs["Item"]
+        assert item["cacheKey"] == {"S": "__latency__#nova-lite#medium"}
+        assert json.loads(item["samples"]["S"]) == [2.0, 3.0]
+        assert "ttl" in item
+
+        dynamo.get_item.return_value = {"Item": item}
+        assert store.load("medium") == [2.0, 3.0]
+
+    def test_missing_item_loads_empty(self):
+        dynamo = MagicMock()
+        dynamo.get_item.return_value = {}
+        assert DynamoLatencyStore(dynamo, "PlanCache", "nova-lite").load("high") == []
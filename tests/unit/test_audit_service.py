@@ -4,7 +4,12 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
-from core.services.audit import build_reasoning_audit_entry, build_retrieval_audit_entry, write_audit_log
+from core.services.audit import (
+    build_reasoning_audit_entry,
+    build_retrieval_audit_entry,
+    write_audit_log,
+    write_audit_logs,
+)
 
 
 @pytest.fixture
@@ -46,6 +51,37 @@ def test_write_audit_log_emits_structlog_error_on_failure(dynamo, entry):
         assert mock_logger.error.call_args[0][0] == "audit_log_write_failed"
 
 
+def test_write_audit_logs_single_batch(dynamo, entry):
+    dynamo.batch_write_item.return_value = {"UnprocessedItems": {}}
+
+    write_audit_logs(dynamo, "AuditLogTable", [entry, entry])
+
+    dynamo.batch_write_item.assert_called_once()
+    requests = dynamo.batch_write_item.call_args[1]["RequestItems"]["AuditLogTable"]
+    assert [r["PutRequest"]["Item"]["event"] for r in requests] == [{"S": "policy_retrieval"}] * 2
+    dynamo.put_item.assert_not_called()
+
+
+def test_write_audit_logs_resends_unprocessed(dynamo, entry):
+    unprocessed = [{"PutRequest": {"Item": {"auditId": {"S": "x"}}}}]
+    dynamo.batch_write_item.side_effect = [
+        {"UnprocessedItems": {"AuditLogTable": unprocessed}},
+        {"UnprocessedItems": {}},
+    ]
+
+    write_audit_logs(dynamo, "AuditLogTable", [entry, entry])
+
+    assert dynamo.batch_write_item.call_count == 2
+    assert dynamo.batch_write_item.call_args[1]["RequestItems"] == {"AuditLogTable": unprocessed}
+
+
+def test_write_audit_logs_swallows_exception(dynamo, entry):
+    dynamo.batch_write_item.side_effect = Exception("DynamoDB unavailable")
+    with patch("core.services.audit.logger") as mock_logger:
+        write_audit_logs(dynamo, "AuditLogTable", [entry])  # must not raise
+        assert mock_logger.error.call_args[0][0] == "audit_log_write_failed"
+
+
 def test_build_retrieval_audit_entry_structure(entry):
     assert entry["event"] == "policy_retrieval"
     assert entry["bookingId"] == "b-1"
@@ -139,6 +175,28 @@ def test_reasoning_audit_entry_structure(reasoning_entry):
     assert out["warnings_count"] == 0
 
 
+def test_reasoning_audit_entry_attempts():
+    attempts = [{"attempt": 1, "effort": "medium", "failure_class": "invalid_plan", "input_tokens": 900}]
+    entry = build_reasoning_audit_entry(
+        booking_id="b-2",
+        employee_id="emp-2",
+        model_id="us.amazon.nova-2-lite-v1:0",
+        thinking_effort="high",
+        latency_ms=3200.5,
+        retry_count=1,
+        escalated=True,
+        plan_confidence=0.92,
+        plan_intent="flight_booking",
+        warnings_count=0,
+        attempts=attempts,
+    )
+    assert entry["attempts"] == attempts
+
+
+def test_reasoning_audit_entry_attempts_default_empty(reasoning_entry):
+    assert reasoning_entry["attempts"] == []
+
+
 def test_reasoning_audit_entry_no_pii(reasoning_entry):
     import json
 
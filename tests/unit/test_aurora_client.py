@@ -1,10 +1,14 @@
 """Unit tests for AuroraClient."""
 
+from decimal import Decimal
 from unittest.mock import MagicMock, call, patch
 
 import pytest
+from structlog.testing import capture_logs
 
 from core.db.aurora import AuroraClient
+from core.errors import PolicyRetrievalError
+from core.models.retrieval import PolicyRule
 
 
 @pytest.fixture
@@ -59,6 +63,22 @@ def test_similarity_search_default_ef_search(client):
     assert first_call == call(f"SET LOCAL hnsw.ef_search = {40}")
 
 
+def test_similarity_search_maps_policy_id(client):
+    """Each chunk carries the id of the policy it belongs to."""
+    aurora, mock_conn = client
+
+    mock_cur = MagicMock()
+    mock_cur.fetchall.return_value = [("c-1", "Economy only.", "Air Travel", 3, "text", None, 0.91, "p-1")]
+    mock_conn.transaction.return_value.__enter__ = MagicMock(return_value=None)
+    mock_conn.transaction.return_value.__exit__ = MagicMock(return_value=False)
+    mock_conn.cursor.return_value.__enter__ = MagicMock(return_value=mock_cur)
+    mock_conn.cursor.return_value.__exit__ = MagicMock(return_value=False)
+
+    [chunk] = aurora.similarity_search([0.1] * 1024)
+
+    assert (chunk.id, chunk.policy_id, chunk.similarity) == ("c-1", "p-1", 0.91)
+
+
 def test_verify_hnsw_index_true(client):
     """verify_hnsw_index() returns True when index exists with correct config."""
     aurora, mock_conn = client
@@ -109,3 +129,196 @@ def test_similarity_search_logs_metrics(client):
     assert "query_latency_ms" in kwargs
     # Embedding vector must NOT be logged
     assert "query_embedding" not in kwargs
+
+
+# ── Bulk load ────────────────────────────────────────────────────────────────
+
+
+def _chunk(i: int) -> dict:
+    return {
+        "policy_id": "p-1",
+        "content_type": "text",
+        "content_text": f"chunk {i}",
+        "source_page": 0,
+        "section_title": None,
+        "reading_order": i,
+        "bda_entity_id": f"e-{i}",
+        "bda_entity_subtype": None,
+        "embedding": [0.1] * 1024,
+        "metadata": "{}",
+    }
+
+
+@pytest.fixture
+def bulk_client(client):
+    aurora, mock_conn = client
+    aurora._config.bulk_load_threshold = 3
+    aurora._config.bulk_load_rebuild_indexes = False
+    aurora._config.bulk_maintenance_work_mem = "2GB"
+    aurora._config.bulk_maintenance_workers = 6
+    mock_cur = MagicMock()
+    mock_conn.cursor.return_value.__enter__ = MagicMock(return_value=mock_cur)
+    mock_conn.cursor.return_value.__exit__ = MagicMock(return_value=False)
+    return aurora, mock_conn, mock_cur
+
+
+def _executed_sql(mock_cur) -> list[str]:
+    return [c[0][0] for c in mock_cur.execute.call_args_list]
+
+
+def test_insert_chunks_small_load_skips_bulk_mode(bulk_client):
+    aurora, _, mock_cur = bulk_client
+
+    assert aurora.insert_chunks([_chunk(0), _chunk(1)]) == 2
+
+    assert not any("set_config" in sql for sql in _executed_sql(mock_cur))
+    mock_cur.executemany.assert_called_once()
+
+
+def test_insert_chunks_large_load_tunes_session(bulk_client):
+    aurora, _, mock_cur = bulk_client
+
+    assert aurora.insert_chunks([_chunk(i) for i in range(3)]) == 3
+
+    calls = mock_cur.execute.call_args_list
+    assert call("SELECT set_config('maintenance_work_mem', %s, false)", ("2GB",)) in calls
+    assert call("SELECT set_config('max_parallel_maintenance_workers', %s, false)", ("6",)) in calls
+    sql = _executed_sql(mock_cur)
+    assert "RESET maintenance_work_mem" in sql
+    assert not any("DROP INDEX" in s for s in sql)
+
+
+def test_bulk_load_rebuilds_indexes_concurrently(bulk_client):
+    aurora, mock_conn, mock_cur = bulk_client
+    mock_cur.fetchone.side_effect = [
+        (True,),  # pg_try_advisory_lock
+        ("CREATE INDEX idx_policy_chunks_embedding ON public.policy_chunks USING hnsw (embedding vector_cosine_ops)",),
+        (
+            "CREATE INDEX idx_policy_chunks_embedding_text ON public.policy_chunks "
+            "USING hnsw (embedding vector_cosine_ops) WHERE content_type = 'text'",
+        ),
+    ]
+    mock_cur.fetchall.return_value = [
+        ("idx_policy_chunks_embedding", "CREATE INDEX idx_policy_chunks_embedding ON public.policy_chunks USING hnsw"),
+        ("idx_policy_chunks_embedding_text", "CREATE INDEX idx_policy_chunks_embedding_text ON public.policy_chunks"),
+    ]
+
+    with aurora.bulk_load(rebuild_indexes=True):
+        sql_during_load = _executed_sql(mock_cur)
+
+    assert "DROP INDEX CONCURRENTLY IF EXISTS idx_policy_chunks_embedding" in sql_during_load
+    assert "DROP INDEX CONCURRENTLY IF EXISTS idx_policy_chunks_embedding_text" in sql_during_load
+    sql = _executed_sql(mock_cur)
+    rebuilt = [s for s in sql if s.startswith("CREATE INDEX CONCURRENTLY IF NOT EXISTS")]
+    assert len(rebuilt) == 2
+    assert sql.index(rebuilt[0]) > sql.index("DROP INDEX CONCURRENTLY IF EXISTS idx_policy_chunks_embedding_text")
+    assert mock_conn.autocommit is False
+
+
+def test_bulk_load_rebuilds_indexes_even_when_load_fails(bulk_client):
+    aurora, _, mock_cur = bulk_client
+    mock_cur.fetchone.side_effect = [
+        (True,),
+        ("create index idx_policy_chunks_embedding using hnsw (vector_cosine_ops)",),
+    ]
+    mock_cur.fetchall.return_value = [("idx_policy_chunks_embedding", "CREATE INDEX idx_policy_chunks_embedding ON t")]
+
+    with pytest.raises(RuntimeError):
+        with aurora.bulk_load(rebuild_indexes=True):
+            raise RuntimeError("load failed")
+
+    assert "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_policy_chunks_embedding ON t" in _executed_sql(mock_cur)
+
+
+def test_bulk_load_unlocks_and_rebuilds_when_drop_fails(bulk_client):
+    aurora, mock_conn, mock_cur = bulk_client
+    mock_cur.fetchone.side_effect = [
+        (True,),
+        ("create index idx_policy_chunks_embedding using hnsw (vector_cosine_ops)",),
+    ]
+    mock_cur.fetchall.return_value = [("idx_policy_chunks_embedding", "CREATE INDEX idx_policy_chunks_embedding ON t")]
+
+    def _execute(sql, *args):
+        if sql.startswith("DROP INDEX"):
+            raise RuntimeError("drop failed")
+
+    mock_cur.execute.side_effect = _execute
+
+    with pytest.raises(RuntimeError, match="drop failed"):
+        with aurora.bulk_load(rebuild_indexes=True):
+            pass
+
+    sql = _executed_sql(mock_cur)
+    assert "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_policy_chunks_embedding ON t" in sql
+    assert "SELECT pg_advisory_unlock(%s)" in sql
+    assert mock_conn.autocommit is False
+
+
+def test_bulk_load_reports_no_verification_without_rebuild(bulk_client):
+    aurora, _, mock_cur = bulk_client
+    mock_cur.fetchone.return_value = (True,)
+    mock_cur.fetchall.return_value = []
+
+    with capture_logs() as logs:
+        with aurora.bulk_load(rebuild_indexes=True):
+            pass
+
+    finished = next(e for e in logs if e["event"] == "bulk_load_finished")
+    assert finished["indexes_verified"] is None
+
+
+def test_bulk_load_skips_rebuild_when_lock_held(bulk_client):
+    aurora, _, mock_cur = bulk_client
+    mock_cur.fetchone.return_value = (False,)
+
+    with aurora.bulk_load(rebuild_indexes=True):
+        pass
+
+    assert not any("DROP INDEX" in s for s in _executed_sql(mock_cur))
+
+
+# ── policy rules ─────────────────────────────────────────────────────────────
+
+
+def test_replace_policy_rules_deletes_then_inserts(bulk_client):
+    aurora, mock_conn, mock_cur = bulk_client
+    rules = [
+        PolicyRule(rule_type="budget_cap", cabin_class="economy", value_numeric=500.0, source_page=3),
+        PolicyRule(rule_type="preferred_vendor", value_text="Delta"),
+    ]
+
+    assert aurora.replace_policy_rules("p-1", 2, rules) == 2
+
+    assert _executed_sql(mock_cur) == ["DELETE FROM policy_rules WHERE policy_id = %s"]
+    rows = mock_cur.executemany.call_args[0][1]
+    assert rows[0] == ("p-1", 2, "budget_cap", "economy", 500.0, None, None, 3)
+    mock_conn.commit.assert_called_once()
+
+
+def test_replace_policy_rules_rolls_back_on_error(bulk_client):
+    aurora, mock_conn, mock_cur = bulk_client
+    mock_cur.executemany.side_effect = Exception("check constraint violated")
+
+    with pytest.raises(PolicyRetrievalError):
+        aurora.replace_policy_rules("p-1", 1, [PolicyRule(rule_type="advance_booking", value_numeric=14.0)])
+
+    mock_conn.rollback.assert_called_once()
+
+
+def test_fetch_policy_rules_maps_rows(bulk_client):
+    aurora, _, mock_cur = bulk_client
+    mock_cur.fetchall.return_value = [("budget_cap", "economy", Decimal("500.00"), None, "Air Travel", 3)]
+
+    rules = aurora.fetch_policy_rules(["p-1"])
+
+    assert mock_cur.execute.call_args.args[1] == (["p-1"],)
+
+    assert rules == [
+        PolicyRule(
+            rule_type="budget_cap",
+            cabin_class="economy",
+            value_numeric=500.0,
+            section_title="Air Travel",
+            source_page=3,
+        )
+    ]
@@ -34,7 +34,9 @@ def _make_event(action: str | None = None, extra: dict | None = None) -> dict[st
 def test_handler_starts_execution(mock_config, mock_dynamo, mock_sfn):
     from handlers.booking_request import handler
 
-    mock_config.return_value = MagicMock(bookings_table="Bookings", booking_workflow_arn="arn:aws:states:::sm")
+    mock_config.return_value = MagicMock(
+        bookings_table="Bookings", booking_workflow_arn="arn:aws:states:::sm", fused_retrieval=False
+    )
     sfn = mock_sfn.return_value
     sfn.start_execution.return_value = {"executionArn": "arn:aws:states:::exec/1"}
     dynamo = mock_dynamo.return_value
@@ -49,6 +51,7 @@ def test_handler_starts_execution(mock_config, mock_dynamo, mock_sfn):
     payload = json.loads(call_kwargs["input"])
     assert payload["booking_id"] == "book-123"
     assert payload["employee_id"] == "emp-1"
+    assert payload["fused_retrieval"] is False
     assert result["statusCode"] == 200
     assert json.loads(result["body"])["bookingId"] == "book-123"
 
@@ -60,7 +63,9 @@ def test_handler_starts_execution(mock_config, mock_dynamo, mock_sfn):
 def test_handler_rejects_active_booking(mock_config, mock_dynamo, mock_sfn, mock_guard):
     from handlers.booking_request import handler
 
-    mock_config.return_value = MagicMock(bookings_table="Bookings", booking_workflow_arn="arn:aws:states:::sm")
+    mock_config.return_value = MagicMock(
+        bookings_table="Bookings", booking_workflow_arn="arn:aws:states:::sm", fused_retrieval=False
+    )
     mock_guard.side_effect = ValidationError("active", code=ErrorCode.VALIDATION_ERROR)
 
     result = handler(_make_event(), MagicMock())
@@ -75,7 +80,9 @@ def test_handler_rejects_active_booking(mock_config, mock_dynamo, mock_sfn, mock
 def test_handler_writes_booking_record(mock_config, mock_dynamo, mock_sfn):
     from handlers.booking_request import handler
 
-    mock_config.return_value = MagicMock(bookings_table="Bookings", booking_workflow_arn="arn:aws:states:::sm")
+    mock_config.return_value = MagicMock(
+        bookings_table="Bookings", booking_workflow_arn="arn:aws:states:::sm", fused_retrieval=False
+    )
     sfn = mock_sfn.return_value
     sfn.start_execution.return_value = {"executionArn": "arn:aws:states:::exec/1"}
     dynamo = mock_dynamo.return_value
@@ -96,7 +103,9 @@ def test_handler_writes_booking_record(mock_config, mock_dynamo, mock_sfn):
 def test_handler_rejects_invalid_booking_id(mock_config, mock_dynamo, mock_sfn):
     from handlers.booking_request import handler
 
-    mock_config.return_value = MagicMock(bookings_table="Bookings", booking_workflow_arn="arn:aws:states:::sm")
+    mock_config.return_value = MagicMock(
+        bookings_table="Bookings", booking_workflow_arn="arn:aws:states:::sm", fused_retrieval=False
+    )
     mock_dynamo.return_value.query.return_value = {"Count": 0}
 
     result = handler(_make_event(extra={"booking_id": "bad id!@#"}), MagicMock())
@@ -111,7 +120,9 @@ def test_handler_rejects_invalid_booking_id(mock_config, mock_dynamo, mock_sfn):
 def test_handler_rolls_back_on_sfn_failure(mock_config, mock_dynamo, mock_sfn):
     from handlers.booking_request import handler
 
-    mock_config.return_value = MagicMock(bookings_table="Bookings", booking_workflow_arn="arn:aws:states:::sm")
+    mock_config.return_value = MagicMock(
+        bookings_table="Bookings", booking_workflow_arn="arn:aws:states:::sm", fused_retrieval=False
+    )
     dynamo = mock_dynamo.return_value
     dynamo.query.return_value = {"Count": 0}
     mock_sfn.return_value.start_execution.side_effect = RuntimeError("SFN unavailable")
@@ -133,7 +144,9 @@ def test_handler_rejects_on_conditional_check_failure(mock_config, mock_dynamo,
     """Race condition: guard passes but conditional put_item fails — should return 409."""
     from handlers.booking_request import handler
 
-    mock_config.return_value = MagicMock(bookings_table="Bookings", booking_workflow_arn="arn:aws:states:::sm")
+    mock_config.return_value = MagicMock(
+        bookings_table="Bookings", booking_workflow_arn="arn:aws:states:::sm", fused_retrieval=False
+    )
     dynamo = mock_dynamo.return_value
     dynamo.query.return_value = {"Count": 0}
     dynamo.exceptions.ConditionalCheckFailedException = Exception
@@ -152,7 +165,9 @@ def test_handler_persists_execution_arn(mock_config, mock_dynamo, mock_sfn):
     """After start_execution, executionArn is written back to the booking record."""
     from handlers.booking_request import handler
 
-    mock_config.return_value = MagicMock(bookings_table="Bookings", booking_workflow_arn="arn:aws:states:::sm")
+    mock_config.return_value = MagicMock(
+        bookings_table="Bookings", booking_workflow_arn="arn:aws:states:::sm", fused_retrieval=False
+    )
     sfn = mock_sfn.return_value
     sfn.start_execution.return_value = {"executionArn": "arn:aws:states:::exec/1"}
     dynamo = mock_dynamo.return_value
@@ -173,7 +188,9 @@ def test_handler_persists_execution_arn(mock_config, mock_dynamo, mock_sfn):
 def test_handler_select_flight_sends_task_success(mock_config, mock_dynamo, mock_sfn, mock_pop):
     from handlers.booking_request import handler
 
-    mock_config.return_value = MagicMock(bookings_table="Bookings", booking_workflow_arn="arn:aws:states:::sm")
+    mock_config.return_value = MagicMock(
+        bookings_table="Bookings", booking_workflow_arn="arn:aws:states:::sm", fused_retrieval=False
+    )
     mock_pop.return_value = "token-xyz"
 
     result = handler(_make_event(action="select_flight"), MagicMock())
@@ -193,7 +210,9 @@ def test_handler_select_flight_sends_task_success(mock_config, mock_dynamo, mock
 def test_handler_select_flight_missing_token_raises(mock_config, mock_dynamo, mock_sfn, mock_pop):
     from handlers.booking_request import handler
 
-    mock_config.return_value = MagicMock(bookings_table="Bookings", booking_workflow_arn="arn:aws:states:::sm")
+    mock_config.return_value = MagicMock(
+        bookings_table="Bookings", booking_workflow_arn="arn:aws:states:::sm", fused_retrieval=False
+    )
     mock_pop.side_effect = KeyError("No task token")
 
     with pytest.raises(KeyError):
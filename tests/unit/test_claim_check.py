@@ -0,0 +1,123 @@
+"""Unit tests for claim-check offloading of large workflow state fields."""
+
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from core.errors import TripCortexError
+from core.services.claim_check import ClaimCheckStore, is_claim
+
+
+def _s3() -> MagicMock:
+    """In-memory stand-in for the S3 put/get calls the store makes."""
+    objects: dict[tuple[str, str], bytes] = {}
+    s3 = MagicMock()
+    s3.put_object.side_effect = lambda Bucket, Key, Body, ContentType: objects.__setitem__((Bucket, Key), Body)
+
+    def _get(Bucket, Key):
+        body = MagicMock()
+        body.read.return_value = objects[(Bucket, Key)]
+        return {"Body": body}
+
+    s3.get_object.side_effect = _get
+    s3.objects = objects
+    return s3
+
+
+LONG_TEXT = "Economy class for flights under 6 hours. " * 100
+
+
+class TestOffload:
+    def test_large_field_replaced_with_reference(self):
+        s3 = _s3()
+        store = ClaimCheckStore(s3, "artifacts", threshold_bytes=1024)
+        payload = {"booking_id": "b-1", "context_text": LONG_TEXT}
+
+        out = store.offload(payload, "b-1", ["context_text"])
+
+        assert is_claim(out["context_text"])
+        assert out["context_text"]["claim_check"].startswith("s3://artifacts/claim-check/b-1/context_text-")
+        assert out["booking_id"] == "b-1"
+        assert payload["context_text"] == LONG_TEXT  # input not mutated
+        ((_, key),) = s3.objects
+        assert json.loads(s3.objects[("artifacts", key)]) == LONG_TEXT
+
+    def test_small_field_stays_inline(self):
+        s3 = _s3()
+        store = ClaimCheckStore(s3, "artifacts", threshold_bytes=1024)
+
+        out = store.offload({"context_text": "short"}, "b-1", ["context_text"])
+
+        assert out == {"context_text": "short"}
+        s3.put_object.assert_not_called()
+
+    def test_nested_path_copies_only_along_the_path(self):
+        store = ClaimCheckStore(_s3(), "artifacts", threshold_bytes=100)
+        flights = [{"flight_number": f"6E-{i}", "price": 100.0 + i} for i in range(20)]
+        payload = {"search_result": {"flights": flights, "total_results": 20}, "warnings": []}
+
+        out = store.offload(payload, "b-1", ["search_result.flights", "search_result.itineraries"])
+
+        assert is_claim(out["search_result"]["flights"])
+        assert out["search_result"]["total_results"] == 20
+        assert payload["search_result"]["flights"] is flights
+
+    def test_no_bucket_disables_offloading(self):
+        s3 = _s3()
+        payload = {"context_text": LONG_TEXT}
+
+        assert ClaimCheckStore(s3, "", threshold_bytes=10).offload(payload, "b-1", ["context_text"]) is payload
+        s3.put_object.assert_not_called()
+
+    def test_failed_write_leaves_field_inline(self):
+        s3 = MagicMock()
+        s3.put_object.side_effect = RuntimeError("throttled")
+        store = ClaimCheckStore(s3, "artifacts", threshold_bytes=10)
+
+        out = store.offload({"context_text": LONG_TEXT}, "b-1", ["context_text"])
+
+        assert out["context_text"] == LONG_TEXT
+
+    def test_same_content_same_key(self):
+        store = ClaimCheckStore(_s3(), "artifacts", threshold_bytes=10)
+
+        first = store.offload({"context_text": LONG_TEXT}, "b-1", ["context_text"])
+        second = store.offload({"context_text": LONG_TEXT}, "b-1", ["context_text"])
+
+        assert first == second
+
+
+class TestResolve:
+    def test_round_trip_across_containers(self):
+        s3 = _s3()
+        producer = ClaimCheckStore(s3, "artifacts", threshold_bytes=10)
+        consumer = ClaimCheckStore(s3, "")  # consumers need no bucket — the reference carries it
+        state = producer.offload({"context_text": LONG_TEXT, "user_query": "q"}, "b-1", ["context_text"])
+
+        resolved = consumer.resolve(state, ["context_text"])
+
+        assert resolved == {"context_text": LONG_TEXT, "user_query": "q"}
+
+    def test_resolved_values_cached_in_container(self):
+        s3 = _s3()
+        state = ClaimCheckStore(s3, "artifacts", threshold_bytes=10).offload(
+            {"context_text": LONG_TEXT}, "b-1", ["context_text"]
+        )
+        consumer = ClaimCheckStore(s3, "")
+
+        consumer.resolve(state, ["context_text"])
+        consumer.resolve(state, ["context_text"])
+
+        s3.get_object.assert_called_once()
+
+    def test_inline_values_untouched(self):
+        payload = {"context_text": "inline", "flights": []}
+        assert ClaimCheckStore(MagicMock(), "").resolve(payload, ["context_text", "flights"]) is payload
+
+    def test_unreadable_claim_raises(self):
+        s3 = MagicMock()
+        s3.get_object.side_effect = RuntimeError("NoSuchKey")
+
+        with pytest.raises(TripCortexError, match="could not be read"):
+            ClaimCheckStore(s3, "").resolve({"context_text": {"claim_check": "s3://a/k.json"}}, ["context_text"])
@@ -5,7 +5,13 @@ from unittest.mock import MagicMock, patch
 import pytest
 from pydantic import ValidationError
 
-from core.models.retrieval import ConfidenceAssessment, ConfidenceLevel, PolicyChunkResult, RetrievalResult
+from core.models.retrieval import (
+    ConfidenceAssessment,
+    ConfidenceLevel,
+    PolicyChunkResult,
+    PolicyRule,
+    RetrievalResult,
+)
 
 
 @pytest.fixture
@@ -20,6 +26,7 @@ def mock_result():
                 content_type="text",
                 bda_entity_subtype=None,
                 similarity=0.89,
+                policy_id="p-1",
             )
         ],
         confidence=ConfidenceAssessment(level=ConfidenceLevel.HIGH, max_similarity=0.89, action="normal"),
@@ -34,7 +41,7 @@ def valid_event():
     return {"booking_id": "b-1", "employee_id": "emp-1", "user_query": "book a flight to Chicago"}
 
 
-def _call_handler(valid_event, mock_result):
+def _call_handler(valid_event, mock_result, policy_rules=None):
     with (
         patch("handlers.embed_and_retrieve.get_config") as mock_cfg,
         patch("handlers.embed_and_retrieve.get_policy_retrieval_service") as mock_factory,
@@ -46,7 +53,9 @@ def _call_handler(valid_event, mock_result):
         mock_service = MagicMock()
         mock_service.retrieve.return_value = mock_result
         mock_factory.return_value = mock_service
-        mock_aurora_cls.return_value.__enter__ = MagicMock(return_value=MagicMock())
+        mock_aurora = MagicMock()
+        mock_aurora.fetch_policy_rules.return_value = policy_rules or []
+        mock_aurora_cls.return_value.__enter__ = MagicMock(return_value=mock_aurora)
         mock_aurora_cls.return_value.__exit__ = MagicMock(return_value=False)
 
         from handlers.embed_and_retrieve import handler
@@ -178,3 +187,16 @@ def test_handler_audit_failure_does_not_prevent_response(valid_event, mock_resul
 
         response = handler(valid_event, None)
         assert response["booking_id"] == "b-1"
+
+
+def test_handler_returns_rules_of_retrieved_policy(valid_event, mock_result):
+    rules = [PolicyRule(rule_type="budget_cap", cabin_class="economy", value_numeric=500.0)]
+    response, _, mock_aurora_cls, _ = _call_handler(valid_event, mock_result, policy_rules=rules)
+
+    assert response["policy_rules"] == [rules[0].model_dump()]
+    mock_aurora_cls.return_value.__enter__.return_value.fetch_policy_rules.assert_called_once_with(["p-1"])
+
+
+def test_handler_policy_rules_default_empty(valid_event, mock_result):
+    response, *_ = _call_handler(valid_event, mock_result)
+    assert response["policy_rules"] == []
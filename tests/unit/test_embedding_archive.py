@@ -0,0 +1,122 @@
+"""Unit tests for the S3 embedding archive."""
+
+import io
+import json
+import struct
+from unittest.mock import MagicMock
+
+import pytest
+from botocore.exceptions import ClientError
+
+from core.services.embedding_archive import EmbeddingArchive, content_hash, decode_npy, encode_npy
+
+POLICY_ID = "policy-1"
+MODEL_ID = "amazon.nova-2-multimodal-embeddings-v1:0"
+
+
+@pytest.fixture
+def s3_store():
+    return {}
+
+
+@pytest.fixture
+def mock_s3_client(s3_store):
+    """MagicMock S3 client backed by a dict of key → bytes."""
+    client = MagicMock()
+
+    def put_object(Bucket, Key, Body, ContentType):
+        s3_store[Key] = Body
+
+    def get_object(Bucket, Key):
+        if Key not in s3_store:
+            raise ClientError({"Error": {"Code": "NoSuchKey", "Message": "Not found"}}, "GetObject")
+        return {"Body": io.BytesIO(s3_store[Key])}
+
+    client.put_object.side_effect = put_object
+    client.get_object.side_effect = get_object
+    return client
+
+
+@pytest.fixture
+def archive(mock_s3_client):
+    return EmbeddingArchive(mock_s3_client, "policy-bucket")
+
+
+def _chunk(entity_id: str, vector: list[float]) -> dict:
+    return {
+        "policy_id": POLICY_ID,
+        "content_type": "text",
+        "content_text": f"text for {entity_id}",
+        "source_page": 0,
+        "section_title": "Air Travel",
+        "reading_order": 1,
+        "bda_entity_id": entity_id,
+        "bda_entity_subtype": "PARAGRAPH",
+        "embedding": vector,
+        "metadata": json.dumps({"bounding_box": None}),
+    }
+
+
+def test_npy_round_trip():
+    vectors = [[0.5, -1.0, 0.25], [1.0, 2.0, 3.0]]
+    raw = encode_npy(vectors, 3)
+
+    assert raw.startswith(b"\x93NUMPY\x01\x00")
+    (header_len,) = struct.unpack("<H", raw[8:10])
+    assert (10 + header_len) % 64 == 0
+    assert b"'shape': (2, 3)" in raw[10 : 10 + header_len]
+    assert len(raw) == 10 + header_len + 2 * 3 * 4
+    assert decode_npy(raw) == vectors
+
+
+def test_encode_npy_rejects_wrong_dimension():
+    with pytest.raises(ValueError, match="expected 3"):
+        encode_npy([[1.0, 2.0]], 3)
+
+
+def test_decode_npy_rejects_truncated_payload():
+    raw = encode_npy([[1.0, 2.0, 3.0]], 3)
+    with pytest.raises(ValueError, match="Expected 3 floats"):
+        decode_npy(raw[:-4])
+
+
+def test_write_then_read(archive, s3_store):
+    chunks = [_chunk("e1", [0.5] * 4), _chunk("e2", [0.25] * 4)]
+    hashes = {"e1": content_hash("a"), "e2": content_hash("b")}
+
+    manifest = archive.write(POLICY_ID, MODEL_ID, chunks, hashes, dimension=4)
+
+    assert manifest.count == 2
+    assert set(s3_store) == {
+        f"embedding-archive/{POLICY_ID}/vectors.npy",
+        f"embedding-archive/{POLICY_ID}/metadata.jsonl",
+        f"embedding-archive/{POLICY_ID}/manifest.json",
+    }
+
+    loaded = archive.read(POLICY_ID)
+    assert loaded is not None
+    read_manifest, rows = loaded
+    assert read_manifest.model_id == MODEL_ID
+    assert read_manifest.dimension == 4
+    assert [(r.bda_entity_id, r.content_hash) for r, _ in rows] == [("e1", hashes["e1"]), ("e2", hashes["e2"])]
+    assert rows[0][1] == [0.5] * 4
+    assert rows[0][0].section_title == "Air Travel"
+
+
+def test_manifest_written_last(archive, mock_s3_client):
+    archive.write(POLICY_ID, MODEL_ID, [_chunk("e1", [0.5] * 4)], {"e1": "h"}, dimension=4)
+
+    keys = [c.kwargs["Key"] for c in mock_s3_client.put_object.call_args_list]
+    assert keys[-1].endswith("manifest.json")
+
+
+def test_read_missing_archive_returns_none(archive):
+    assert archive.read("unknown-policy") is None
+
+
+def test_read_inconsistent_archive_raises(archive, s3_store):
+    archive.write(POLICY_ID, MODEL_ID, [_chunk("e1", [0.5] * 4)], {"e1": "h"}, dimension=4)
+    s3_store[f"embedding-archive/{POLICY_ID}/vectors.npy"] = encode_npy([[0.5] * 4, [0.5] * 4], 4)
+
+    with pytest.raises(ValueError, match="inconsistent"):
+        archive.read(POLICY_ID)
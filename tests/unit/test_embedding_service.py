@@ -5,7 +5,10 @@ from unittest.mock import MagicMock
 
 import pytest
 
+from core.errors import PolicyRetrievalError
+from core.models.ingestion import ArchivedChunk, EmbeddingArchiveManifest
 from core.services.embedding import EmbeddingService
+from core.services.embedding_archive import content_hash
 
 
 @pytest.fixture
@@ -269,3 +272,134 @@ def test_policy_status_updated_to_embedded(embedding_service, mock_bedrock_clien
     embedding_service.generate_embeddings("test-policy-id", "s3://bucket/prefix/")
 
     mock_aurora_client.update_policy_status.assert_called_once_with("test-policy-id", "embedded", 1)
+
+
+def _text_element(entity_id: str, text: str) -> dict:
+    return {
+        "id": entity_id,
+        "type": "TEXT",
+        "representation": {"text": text, "markdown": text},
+        "reading_order": 1,
+        "locations": [{"page_index": 0}],
+    }
+
+
+def test_archive_written_after_insert(mock_bedrock_client, mock_s3_client, mock_aurora_client):
+    """Stored chunks are archived with the content hash of their embedding input."""
+    archive = MagicMock()
+    archive.read.return_value = None
+    service = EmbeddingService(mock_bedrock_client, mock_s3_client, mock_aurora_client, "model", archive=archive)
+    _mock_s3(mock_s3_client, [_text_element("entity-1", "Economy only")])
+    _mock_bedrock(mock_bedrock_client)
+    mock_aurora_client.insert_chunks.return_value = 1
+
+    service.generate_embeddings("test-policy-id", "s3://bucket/prefix/")
+
+    policy_id, model_id, chunks, hashes, dimension = archive.write.call_args.args
+    assert (policy_id, model_id, dimension) == ("test-policy-id", "model", 1024)
+    assert chunks[0]["bda_entity_id"] == "entity-1"
+    assert hashes == {"entity-1": content_hash("Economy only")}
+
+
+def test_archive_write_failure_does_not_fail_ingestion(mock_bedrock_client, mock_s3_client, mock_aurora_client):
+    archive = MagicMock()
+    archive.read.return_value = None
+    archive.write.side_effect = Exception("S3 down")
+    service = EmbeddingService(mock_bedrock_client, mock_s3_client, mock_aurora_client, "model", archive=archive)
+    _mock_s3(mock_s3_client, [_text_element("entity-1", "Economy only")])
+    _mock_bedrock(mock_bedrock_client)
+    mock_aurora_client.insert_chunks.return_value = 1
+
+    result = service.generate_embeddings("test-policy-id", "s3://bucket/prefix/")
+
+    assert result.chunks_created == 1
+
+
+def test_archived_vectors_reused_when_content_unchanged(mock_bedrock_client, mock_s3_client, mock_aurora_client):
+    """Entities whose content hash matches the archive skip Bedrock; changed ones are re-embedded."""
+    archive = MagicMock()
+    archive.read.return_value = (
+        EmbeddingArchiveManifest(
+            policy_id="test-policy-id", model_id="model", dimension=1024, count=2, format_version=1, created_at="now"
+        ),
+        [
+            (_archived("entity-1", content_hash("Economy only")), [0.9] * 1024),
+            (_archived("entity-2", content_hash("old text")), [0.8] * 1024),
+        ],
+    )
+    service = EmbeddingService(mock_bedrock_client, mock_s3_client, mock_aurora_client, "model", archive=archive)
+    _mock_s3(mock_s3_client, [_text_element("entity-1", "Economy only"), _text_element("entity-2", "new text")])
+    _mock_bedrock(mock_bedrock_client)
+    mock_aurora_client.insert_chunks.return_value = 2
+
+    service.generate_embeddings("test-policy-id", "s3://bucket/prefix/")
+
+    assert mock_bedrock_client.invoke_model.call_count == 1
+    chunks = mock_aurora_client.insert_chunks.call_args.args[0]
+    assert chunks[0]["embedding"] == [0.9] * 1024
+    assert chunks[1]["embedding"] == [0.1] * 1024
+
+
+def test_archive_from_other_model_not_reused(mock_bedrock_client, mock_s3_client, mock_aurora_client):
+    archive = MagicMock()
+    archive.read.return_value = (
+        EmbeddingArchiveManifest(
+            policy_id="test-policy-id",
+            model_id="old-model",
+            dimension=1024,
+            count=1,
+            format_version=1,
+            created_at="now",
+        ),
+        [(_archived("entity-1", content_hash("Economy only")), [0.9] * 1024)],
+    )
+    service = EmbeddingService(mock_bedrock_client, mock_s3_client, mock_aurora_client, "model", archive=archive)
+    _mock_s3(mock_s3_client, [_text_element("entity-1", "Economy only")])
+    _mock_bedrock(mock_bedrock_client)
+
+    service.generate_embeddings("test-policy-id", "s3://bucket/prefix/")
+
+    assert mock_bedrock_client.invoke_model.call_count == 1
+
+
+def test_restore_from_archive(mock_bedrock_client, mock_s3_client, mock_aurora_client):
+    """Restore bulk-loads archived chunks under the target policy without calling Bedrock."""
+    archive = MagicMock()
+    archive.read.return_value = (
+        EmbeddingArchiveManifest(
+            policy_id="source-policy", model_id="model", dimension=1024, count=1, format_version=1, created_at="now"
+        ),
+        [(_archived("entity-1", "hash"), [0.9] * 1024)],
+    )
+    service = EmbeddingService(mock_bedrock_client, mock_s3_client, mock_aurora_client, "model", archive=archive)
+    mock_aurora_client.insert_chunks.return_value = 1
+
+    result = service.restore_from_archive("target-policy", "source-policy")
+
+    archive.read.assert_called_once_with("source-policy")
+    mock_bedrock_client.invoke_model.assert_not_called()
+    chunks = mock_aurora_client.insert_chunks.call_args.args[0]
+    assert chunks[0]["policy_id"] == "target-policy"
+    assert chunks[0]["embedding"] == [0.9] * 1024
+    mock_aurora_client.update_policy_status.assert_called_once_with("target-policy", "embedded", 1)
+    assert result.chunks_restored == 1
+    assert result.source_policy_id == "source-policy"
+
+
+def test_restore_from_archive_missing_raises(mock_bedrock_client, mock_s3_client, mock_aurora_client):
+    archive = MagicMock()
+    archive.read.return_value = None
+    service = EmbeddingService(mock_bedrock_client, mock_s3_client, mock_aurora_client, "model", archive=archive)
+
+    with pytest.raises(PolicyRetrievalError, match="No embedding archive"):
+        service.restore_from_archive("policy-1")
+
+
+def _archived(entity_id: str, entity_hash: str) -> ArchivedChunk:
+    return ArchivedChunk(
+        bda_entity_id=entity_id,
+        content_hash=entity_hash,
+        content_type="text",
+        content_text="text",
+        metadata="{}",
+    )
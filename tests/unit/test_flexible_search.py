@@ -0,0 +1,205 @@
+"""Unit tests for flexible-date / nearby-airport fan-out and merging in search_flights_via_api."""
+
+import threading
+from datetime import date, timedelta
+from unittest.mock import MagicMock
+
+import pytest
+
+from core.errors import BookingError, ErrorCode, PortalUnavailableError
+from core.services.flexible_search import FlexibleSearch, SearchVariant, build_variants
+from core.services.flight_search_api import search_flights_via_api
+
+DEPARTURE = date.today() + timedelta(days=10)
+
+
+def _raw_flight(number: str, price: float, day: str, airline: str = "IndiGo") -> dict:
+    return {
+        "segments": [
+            {
+                "airline": {"name": airline},
+                "flightNumber": number,
+                "departureTime": f"{day}T08:00:00",
+                "arrivalTime": f"{day}T10:00:00",
+            }
+        ],
+        "totalDurationMinutes": 120,
+        "pricing": {"pricePerPassenger": price},
+        "flightClass": {"name": "economy"},
+    }
+
+
+class TestBuildVariants:
+    def test_exact_first_then_nearest_dates_then_airports(self):
+        variants = build_variants("DEL", "BOM", DEPARTURE, 1, {"BOM": ("PNQ",)}, date.today(), 10)
+
+        d = DEPARTURE.isoformat
+        assert variants == [
+            SearchVariant("DEL", "BOM", d()),
+            SearchVariant("DEL", "BOM", (DEPARTURE - timedelta(days=1)).isoformat()),
+            SearchVariant("DEL", "BOM", (DEPARTURE + timedelta(days=1)).isoformat()),
+            SearchVariant("DEL", "PNQ", d()),
+            SearchVariant("DEL", "PNQ", (DEPARTURE - timedelta(days=1)).isoformat()),
+            SearchVariant("DEL", "PNQ", (DEPARTURE + timedelta(days=1)).isoformat()),
+        ]
+
+    def test_past_alternate_dates_skipped(self):
+        today = date.today()
+        variants = build_variants("DEL", "BOM", today, 2, {}, today, 10)
+
+        assert [v.departure_date for v in variants] == [
+            today.isoformat(),
+            (today + timedelta(days=1)).isoformat(),
+            (today + timedelta(days=2)).isoformat(),
+        ]
+
+    def test_capped_and_same_airport_routes_dropped(self):
+        variants = build_variants("BOM", "PNQ", DEPARTURE, 3, {"BOM": ("PNQ",), "PNQ": ("BOM",)}, date.today(), 4)
+
+        assert len(variants) == 4
+        assert all(v.origin != v.destination for v in variants)
+        assert variants[0] == SearchVariant("BOM", "PNQ", DEPARTURE.isoformat())
+
+
+class TestFanOut:
+    def test_all_variants_searched_concurrently(self):
+        barrier = threading.Barrier(3, timeout=2)
+        searcher = MagicMock()
+
+        def _search(origin, destination, day, cabin):
+            barrier.wait()  # only passes if all three run at once
+            return {"flights": []}
+
+        searcher.search_flights.side_effect = _search
+        result = FlexibleSearch(flex_days=1, max_workers=3).search(searcher, "DEL", "BOM", DEPARTURE, "economy")
+
+        assert result.attempted == 3
+        assert result.incomplete == 0
+
+    def test_partial_results_on_timeout(self):
+        release = threading.Event()
+        searcher = MagicMock()
+
+        def _search(origin, destination, day, cabin):
+            if day != DEPARTURE.isoformat():
+                release.wait(2)
+            return {"flights": [_raw_flight("6E-1", 100.0, day)]}
+
+        searcher.search_flights.side_effect = _search
+        try:
+            result = FlexibleSearch(flex_days=1, budget_s=0.2).search(searcher, "DEL", "BOM", DEPARTURE, "economy")
+        finally:
+            release.set()
+
+        assert [v for v, _ in result.results] == [SearchVariant("DEL", "BOM", DEPARTURE.isoformat())]
+        assert result.incomplete == 2
+
+    def test_failed_variants_do_not_fail_the_search(self):
+        searcher = MagicMock()
+
+        def _search(origin, destination, day, cabin):
+            if day != DEPARTURE.isoformat():
+                raise PortalUnavailableError()
+            return {"flights": []}
+
+        searcher.search_flights.side_effect = _search
+        result = FlexibleSearch(flex_days=1).search(searcher, "DEL", "BOM", DEPARTURE, "economy")
+
+        assert len(result.results) == 1
+        assert result.incomplete == 2
+
+    def test_all_failed_raises_exact_search_error(self):
+        searcher = MagicMock()
+
+        def _search(origin, destination, day, cabin):
+            if day == DEPARTURE.isoformat():
+                raise BookingError("bad request", code=ErrorCode.SEARCH_FAILED)
+            raise PortalUnavailableError()
+
+        searcher.search_flights.side_effect = _search
+
+        with pytest.raises(BookingError, match="bad request"):
+            FlexibleSearch(flex_days=1).search(searcher, "DEL", "BOM", DEPARTURE, "economy")
+
+    def test_nothing_finished_raises_portal_unavailable(self):
+        release = threading.Event()
+        searcher = MagicMock()
+        searcher.search_flights.side_effect = lambda *a: release.wait(2)
+
+        try:
+            with pytest.raises(PortalUnavailableError, match="did not finish"):
+                FlexibleSearch(flex_days=0, budget_s=0.1).search(searcher, "DEL", "BOM", DEPARTURE, "economy")
+        finally:
+            release.set()
+
+
+class TestFlexibleSearchViaApi:
+    def _event(self) -> dict:
+        return {
+            "booking_id": "b1",
+            "employee_id": "e1",
+            "plan": {
+                "parameters": {
+                    "origin": "DEL",
+                    "destination": "BOM",
+                    "departure_date": DEPARTURE.isoformat(),
+                    "cabin_class": "economy",
+                },
+                "policy_constraints": {"max_budget_usd": 200.0, "preferred_vendors": ["any"]},
+            },
+        }
+
+    def test_merged_deduplicated_and_ranked(self):
+        day = DEPARTURE.isoformat()
+        before = (DEPARTURE - timedelta(days=1)).isoformat()
+        responses = {
+            day: {"flights": [_raw_flight("6E-1", 150.0, day), _raw_flight("AI-9", 300.0, day)]},
+            before: {"flights": [_raw_flight("6E-1", 90.0, before)]},
+        }
+        searcher = MagicMock()
+        searcher.search_flights.side_effect = lambda o, d, when, c: responses.get(when, {"flights": []})
+
+        out = search_flights_via_api(self._event(), searcher, FlexibleSearch(flex_days=1))
+
+        flights = out["search_result"]["flights"]
+        assert [(f["flight_number"], f["departure_date"], f["compliant"]) for f in flights] == [
+            ("6E-1", before, True),
+            ("6E-1", day, True),
+            ("AI-9", day, False),
+        ]
+        assert out["warnings"] == []
+
+    def test_duplicate_flight_kept_at_lowest_price(self):
+        day = DEPARTURE.isoformat()
+        searcher = MagicMock()
+        searcher.search_flights.side_effect = [
+            {"flights": [_raw_flight("6E-1", 150.0, day), _raw_flight("6E-1", 120.0, day)]},
+        ]
+
+        out = search_flights_via_api(self._event(), searcher, FlexibleSearch(flex_days=0))
+
+        assert [f["price"] for f in out["search_result"]["flights"]] == [120.0]
+
+    def test_partial_fanout_flagged(self):
+        searcher = MagicMock()
+
+        def _search(origin, destination, when, cabin):
+            if when != DEPARTURE.isoformat():
+                raise PortalUnavailableError()
+            return {"flights": [_raw_flight("6E-1", 100.0, when)]}
+
+        searcher.search_flights.side_effect = _search
+
+        out = search_flights_via_api(self._event(), searcher, FlexibleSearch(flex_days=1))
+
+        assert out["warnings"] == ["PARTIAL_RESULTS"]
+        assert out["search_result"]["total_results"] == 1
+
+    def test_single_search_without_flexible(self):
+        searcher = MagicMock()
+        searcher.search_flights.return_value = {"flights": [_raw_flight("6E-1", 100.0, DEPARTURE.isoformat())]}
+
+        out = search_flights_via_api(self._event(), searcher)
+
+        searcher.search_flights.assert_called_once_with("DEL", "BOM", DEPARTURE.isoformat(), "economy")
+        assert out["search_result"]["flights"][0]["departure_date"] is None
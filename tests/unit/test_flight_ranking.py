@@ -0,0 +1,90 @@
+"""Unit tests for rank_flights — scoring, time preference, policy grouping and top-N."""
+
+import pytest
+
+from core.models.flight import FlightOption
+from core.services.flight_ranking import rank_flights
+
+
+def _f(
+    number: str,
+    price: float,
+    departure: str = "08:00",
+    stops: int = 0,
+    duration: str | None = "2h 0m",
+    compliant: bool = True,
+) -> FlightOption:
+    return FlightOption(
+        airline="IndiGo",
+        flight_number=number,
+        price=price,
+        departure_time=departure,
+        arrival_time="12:00",
+        stops=stops,
+        cabin_class="economy",
+        duration=duration,
+        compliant=compliant,
+    )
+
+
+class TestRankFlights:
+    def test_empty(self):
+        assert rank_flights([]) == []
+
+    def test_cheaper_ranks_first_when_otherwise_equal(self):
+        ranked = rank_flights([_f("A", 300.0), _f("B", 100.0), _f("C", 200.0)])
+        assert [f.flight_number for f in ranked] == ["B", "C", "A"]
+
+    def test_stops_and_duration_can_outweigh_small_price_gap(self):
+        cheap_slow = _f("SLOW", 100.0, stops=2, duration="9h 30m")
+        direct = _f("DIRECT", 110.0, stops=0, duration="2h 0m")
+        priciest = _f("PRICEY", 300.0, stops=0, duration="2h 0m")
+
+        ranked = rank_flights([cheap_slow, direct, priciest])
+
+        assert ranked[0].flight_number == "DIRECT"
+
+    def test_time_preference_scored(self):
+        flights = [_f("AM", 100.0, departure="07:30"), _f("PM", 100.0, departure="18:30")]
+
+        assert rank_flights(flights, "evening")[0].flight_number == "PM"
+        assert rank_flights(flights, "morning")[0].flight_number == "AM"
+
+    def test_red_eye_window_wraps_midnight(self):
+        flights = [_f("NOON", 100.0, departure="12:00"), _f("LATE", 100.0, departure="01:15")]
+        assert rank_flights(flights, "red_eye")[0].flight_number == "LATE"
+
+    def test_compliant_always_ahead(self):
+        ranked = rank_flights([_f("OVER", 50.0, compliant=False), _f("OK", 400.0, stops=2)])
+        assert [f.flight_number for f in ranked] == ["OK", "OVER"]
+
+    def test_top_n(self):
+        flights = [_f(str(i), 100.0 + i) for i in range(50)]
+
+        ranked = rank_flights(flights, top_n=5)
+
+        assert [f.flight_number for f in ranked] == ["0", "1", "2", "3", "4"]
+
+    def test_breakdown_attached_and_sums_to_score(self):
+        ranked = rank_flights([_f("A", 100.0), _f("B", 200.0, departure="20:00")], "morning")
+
+        best = ranked[0]
+        assert set(best.score_breakdown) == {"price", "duration", "stops", "departure_time"}
+        assert best.score == pytest.approx(sum(best.score_breakdown.values()), abs=1e-3)
+        assert best.score == pytest.approx(1.0)
+
+    def test_no_preference_drops_time_weight(self):
+        (only,) = rank_flights([_f("A", 100.0)])
+        assert "departure_time" not in only.score_breakdown
+        assert only.score == pytest.approx(1.0)
+
+    def test_missing_duration_scored_as_worst(self):
+        ranked = rank_flights([_f("UNKNOWN", 100.0, duration=None), _f("SHORT", 100.0, duration="1h 30m")])
+
+        assert ranked[0].flight_number == "SHORT"
+        assert ranked[1].score_breakdown["duration"] == 0.0
+
+    def test_input_not_mutated(self):
+        flights = [_f("A", 100.0)]
+        rank_flights(flights)
+        assert flights[0].score is None
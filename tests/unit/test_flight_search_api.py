@@ -0,0 +1,165 @@
+"""Unit tests for round-trip search in search_flights_via_api — portal mocked."""
+
+import threading
+from datetime import date, timedelta
+from unittest.mock import MagicMock
+
+import pytest
+
+from core.errors import PortalUnavailableError
+from core.services.flight_search_api import search_flights_via_api
+
+DEPARTURE = (date.today() + timedelta(days=10)).isoformat()
+RETURN = (date.today() + timedelta(days=14)).isoformat()
+
+
+def _raw_flight(number: str, price: float, day: str, airline: str = "IndiGo", hour: int = 8) -> dict:
+    return {
+        "segments": [
+            {
+                "airline": {"name": airline},
+                "flightNumber": number,
+                "departureTime": f"{day}T{hour:02d}:00:00",
+                "arrivalTime": f"{day}T{hour + 2:02d}:00:00",
+            }
+        ],
+        "totalDurationMinutes": 120,
+        "pricing": {"pricePerPassenger": price},
+        "flightClass": {"name": "economy"},
+    }
+
+
+def _event(max_budget: float = 300.0, vendors: list[str] | None = None, time_preference: str | None = None) -> dict:
+    return {
+        "booking_id": "b1",
+        "employee_id": "e1",
+        "plan": {
+            "parameters": {
+                "origin": "DEL",
+                "destination": "BOM",
+                "departure_date": DEPARTURE,
+                "return_date": RETURN,
+                "cabin_class": "economy",
+                "time_preference": time_preference,
+            },
+            "policy_constraints": {"max_budget_usd": max_budget, "preferred_vendors": vendors or ["any"]},
+        },
+    }
+
+
+def _portal(outbound: list[dict], inbound: list[dict]) -> MagicMock:
+    portal = MagicMock()
+    portal.search_flights.side_effect = lambda o, d, day, c: {"flights": outbound if o == "DEL" else inbound}
+    return portal
+
+
+class TestRoundTrip:
+    def test_both_legs_searched(self):
+        portal = _portal([], [])
+
+        search_flights_via_api(_event(), portal)
+
+        calls = {c.args for c in portal.search_flights.call_args_list}
+        assert calls == {("DEL", "BOM", DEPARTURE, "economy"), ("BOM", "DEL", RETURN, "economy")}
+
+    def test_legs_searched_concurrently(self):
+        barrier = threading.Barrier(2, timeout=2)
+        portal = MagicMock()
+
+        def _search(o, d, day, c):
+            barrier.wait()  # only passes if both legs are in flight at once
+            return {"flights": []}
+
+        portal.search_flights.side_effect = _search
+
+        out = search_flights_via_api(_event(), portal)
+
+        assert out["search_result"]["total_results"] == 0
+
+    def test_budget_applies_to_combined_fare(self):
+        portal = _portal(
+            [_raw_flight("6E-1", 200.0, DEPARTURE), _raw_flight("6E-2", 120.0, DEPARTURE)],
+            [_raw_flight("6E-9", 150.0, RETURN)],
+        )
+
+        result = search_flights_via_api(_event(max_budget=300.0), portal)["search_result"]
+
+        pairs = [(it["outbound"]["flight_number"], it["total_price"], it["compliant"]) for it in result["itineraries"]]
+        assert pairs == [("6E-2", 270.0, True), ("6E-1", 350.0, False)]
+        assert result["itineraries"][1]["policy_notes"] == ["Over budget ($350 > $300 round trip)"]
+        # A 200 USD leg is within a 300 USD trip budget on its own; it is the pair that is over.
+        assert all(f["compliant"] for f in result["flights"])
+        assert result["return_date"] == RETURN
+        assert result["total_results"] == 2
+
+    def test_vendor_rules_apply_per_leg(self):
+        portal = _portal(
+            [_raw_flight("6E-1", 100.0, DEPARTURE)],
+            [_raw_flight("AI-9", 100.0, RETURN, airline="Air India")],
+        )
+
+        result = search_flights_via_api(_event(vendors=["IndiGo"]), portal)["search_result"]
+
+        (itinerary,) = result["itineraries"]
+        assert itinerary["compliant"] is False
+        assert itinerary["policy_notes"] == ["Non-preferred airline (Air India)"]
+        assert itinerary["inbound"]["origin"] == "BOM"
+        assert itinerary["inbound"]["departure_date"] == RETURN
+
+    def test_pairs_capped(self):
+        portal = _portal(
+            [_raw_flight(f"6E-{i}", 50.0 + i, DEPARTURE) for i in range(15)],
+            [_raw_flight(f"SG-{i}", 50.0 + i, RETURN) for i in range(15)],
+        )
+
+        result = search_flights_via_api(_event(max_budget=1000.0), portal)["search_result"]
+
+        assert len(result["itineraries"]) == 10
+        assert result["itineraries"][0]["total_price"] == 100.0
+        assert result["total_results"] == 225
+
+    def test_legs_ranked_with_time_preference(self):
+        portal = _portal(
+            [_raw_flight("6E-1", 100.0, DEPARTURE, hour=7), _raw_flight("6E-2", 100.0, DEPARTURE, hour=18)],
+            [_raw_flight("6E-9", 100.0, RETURN, hour=19)],
+        )
+
+        result = search_flights_via_api(_event(max_budget=1000.0, time_preference="evening"), portal)["search_result"]
+
+        assert [f["flight_number"] for f in result["flights"]] == ["6E-2", "6E-1"]
+        assert result["flights"][0]["score"] is not None
+        assert result["itineraries"][0]["outbound"]["flight_number"] == "6E-2"
+
+    def test_failed_leg_fails_search(self):
+        portal = MagicMock()
+
+        def _search(o, d, day, c):
+            if o == "BOM":
+                raise PortalUnavailableError()
+            return {"flights": []}
+
+        portal.search_flights.side_effect = _search
+
+        with pytest.raises(PortalUnavailableError):
+            search_flights_via_api(_event(), portal)
+
+    def test_one_way_has_no_itineraries(self):
+        event = _event()
+        del event["plan"]["parameters"]["return_date"]
+        portal = _portal([_raw_flight("6E-1", 100.0, DEPARTURE)], [])
+
+        result = search_flights_via_api(event, portal)["search_result"]
+
+        portal.search_flights.assert_called_once()
+        assert result["itineraries"] == []
+        assert result["return_date"] is None
+
+    def test_one_way_total_counts_flights_before_top_n_cut(self):
+        event = _event(max_budget=1000.0)
+        del event["plan"]["parameters"]["return_date"]
+        portal = _portal([_raw_flight(f"6E-{i}", 50.0 + i, DEPARTURE) for i in range(30)], [])
+
+        result = search_flights_via_api(event, portal)["search_result"]
+
+        assert len(result["flights"]) == 25
+        assert result["total_results"] == 30
@@ -0,0 +1,203 @@
+"""Unit tests for FlightSearchCache — fresh/stale/miss decisions and the DynamoDB tier."""
+
+import json
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from core.errors import PortalUnavailableError
+from core.services.flight_search_api import search_flights_via_api
+from core.services.flight_search_cache import FlightSearchCache, build_search_key
+
+SEARCH = ("DEL", "BOM", "2026-11-20", "economy")
+
+
+class _Clock:
+    def __init__(self, now: float = 1_000_000.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _portal(*results: dict) -> MagicMock:
+    portal = MagicMock()
+    portal.search_flights.side_effect = list(results) or None
+    return portal
+
+
+def _wait_for_refresh(cache: FlightSearchCache) -> None:
+    for thread in threading.enumerate():
+        if thread.name == "flight-search-refresh":
+            thread.join(timeout=2)
+
+
+class TestBuildSearchKey:
+    def test_normalizes_case_and_whitespace(self):
+        assert build_search_key(" del", "bom ", "2026-11-20", "Economy") == "DEL#BOM#2026-11-20#economy"
+
+
+class TestInProcess:
+    def test_fresh_entry_served_without_portal_call(self):
+        portal = _portal({"flights": [1]})
+        clock = _Clock()
+        cache = FlightSearchCache(portal, clock=clock)
+
+        cache.search_flights(*SEARCH)
+        clock.now += 60
+        assert cache.search_flights(*SEARCH) == {"flights": [1]}
+
+        portal.search_flights.assert_called_once_with(*SEARCH)
+
+    def test_stale_entry_served_and_refreshed(self):
+        portal = _portal({"flights": [1]}, {"flights": [2]})
+        clock = _Clock()
+        cache = FlightSearchCache(portal, fresh_seconds=120, max_stale_seconds=600, clock=clock)
+
+        cache.search_flights(*SEARCH)
+        clock.now += 300
+        assert cache.search_flights(*SEARCH) == {"flights": [1]}
+        _wait_for_refresh(cache)
+
+        assert portal.search_flights.call_count == 2
+        assert cache.search_flights(*SEARCH) == {"flights": [2]}
+
+    def test_expired_entry_is_a_miss(self):
+        portal = _portal({"flights": [1]}, {"flights": [2]})
+        clock = _Clock()
+        cache = FlightSearchCache(portal, fresh_seconds=120, max_stale_seconds=600, clock=clock)
+
+        cache.search_flights(*SEARCH)
+        clock.now += 721
+        assert cache.search_flights(*SEARCH) == {"flights": [2]}
+
+    def test_refresh_failure_keeps_stale_entry(self):
+        portal = _portal({"flights": [1]})
+        clock = _Clock()
+        cache = FlightSearchCache(portal, clock=clock)
+        cache.search_flights(*SEARCH)
+        portal.search_flights.side_effect = PortalUnavailableError()
+
+        clock.now += 300
+        assert cache.search_flights(*SEARCH) == {"flights": [1]}
+        _wait_for_refresh(cache)
+        assert cache.search_flights(*SEARCH) == {"flights": [1]}
+
+    def test_lru_evicts_least_recent(self):
+        portal = MagicMock()
+        portal.search_flights.return_value = {"flights": []}
+        cache = FlightSearchCache(portal, max_entries=2)
+
+        cache.search_flights("DEL", "BOM", "2026-11-20", "economy")
+        cache.search_flights("DEL", "BLR", "2026-11-20", "economy")
+        cache.search_flights("DEL", "BOM", "2026-11-20", "economy")
+        cache.search_flights("DEL", "GOI", "2026-11-20", "economy")
+        cache.search_flights("DEL", "BLR", "2026-11-20", "economy")
+
+        assert portal.search_flights.call_count == 4
+
+    def test_miss_propagates_portal_errors(self):
+        portal = MagicMock()
+        portal.search_flights.side_effect = PortalUnavailableError()
+
+        with pytest.raises(PortalUnavailableError):
+            FlightSearchCache(portal).search_flights(*SEARCH)
+
+
+class TestDynamoTier:
+    def _item(self, data: dict, fetched_at: float) -> dict:
+        return {
+            "Item": {
+                "cacheKey": {"S": build_search_key(*SEARCH)},
+                "result": {"S": json.dumps(data)},
+                "fetchedAt": {"N": str(fetched_at)},
+            }
+        }
+
+    def test_shared_entry_served_to_cold_container(self):
+        clock = _Clock()
+        dynamo = MagicMock()
+        dynamo.get_item.return_value = self._item({"flights": [9]}, clock.now - 30)
+        portal = MagicMock()
+
+        cache = FlightSearchCache(portal, dynamo, "FlightSearchCache", clock=clock)
+
+        assert cache.search_flights(*SEARCH) == {"flights": [9]}
+        portal.search_flights.assert_not_called()
+
+    def test_miss_written_with_ttl(self):
+        clock = _Clock()
+        dynamo = MagicMock()
+        dynamo.get_item.return_value = {}
+        cache = FlightSearchCache(
+            _portal({"flights": [1]}),
+            dynamo,
+            "FlightSearchCache",
+            fresh_seconds=120,
+            max_stale_seconds=600,
+            clock=clock,
+        )
+
+        cache.search_flights(*SEARCH)
+
+        item = dynamo.put_item.call_args.kwargs["Item"]
+        assert item["cacheKey"] == {"S": "DEL#BOM#2026-11-20#economy"}
+        assert json.loads(item["result"]["S"]) == {"flights": [1]}
+        assert item["ttl"] == {"N": str(int(clock.now) + 720)}
+
+    def test_dynamo_errors_fall_back_to_portal(self):
+        dynamo = MagicMock()
+        dynamo.get_item.side_effect = RuntimeError("throttled")
+        dynamo.put_item.side_effect = RuntimeError("throttled")
+
+        cache = FlightSearchCache(_portal({"flights": [1]}), dynamo, "FlightSearchCache")
+
+        assert cache.search_flights(*SEARCH) == {"flights": [1]}
+
+
+class TestPolicyFilteringOnCachedResults:
+    def _raw(self) -> dict:
+        def _flight(airline: str, price: float) -> dict:
+            return {
+                "segments": [
+                    {
+                        "airline": {"name": airline},
+                        "flightNumber": "6E-100",
+                        "departureTime": "2026-11-20T08:00:00",
+                        "arrivalTime": "2026-11-20T10:00:00",
+                    }
+                ],
+                "totalDurationMinutes": 120,
+                "pricing": {"pricePerPassenger": price},
+                "flightClass": {"name": "economy"},
+            }
+
+        return {"flights": [_flight("IndiGo", 80.0), _flight("Air India", 400.0)]}
+
+    def _event(self, employee_id: str, max_budget: float) -> dict:
+        return {
+            "booking_id": f"b-{employee_id}",
+            "employee_id": employee_id,
+            "plan": {
+                "parameters": {
+                    "origin": "DEL",
+                    "destination": "BOM",
+                    "departure_date": "2026-11-20",
+                    "cabin_class": "economy",
+                },
+                "policy_constraints": {"max_budget_usd": max_budget},
+            },
+        }
+
+    def test_each_employee_filtered_against_own_constraints(self):
+        portal = MagicMock()
+        portal.search_flights.return_value = self._raw()
+        cache = FlightSearchCache(portal)
+
+        strict = search_flights_via_api(self._event("e1", 100.0), cache)
+        loose = search_flights_via_api(self._event("e2", 500.0), cache)
+
+        portal.search_flights.assert_called_once()
+        assert [f["compliant"] for f in strict["search_result"]["flights"]] == [True, False]
+        assert [f["compliant"] for f in loose["search_result"]["flights"]] == [True, True]
@@ -51,6 +51,7 @@ def _patched_handler(mock_config, mock_aurora_client, mock_embedding_service):
     stack.enter_context(patch("handlers.generate_embeddings.EmbeddingService", return_value=mock_embedding_service))
     stack.enter_context(patch("handlers.generate_embeddings.get_bedrock_runtime_client"))
     stack.enter_context(patch("handlers.generate_embeddings.get_s3_client"))
+    stack.enter_context(patch("handlers.generate_embeddings.get_plan_cache", return_value=None))
     return stack
 
 
@@ -130,3 +131,40 @@ def test_handler_aurora_disconnect_on_error(mock_config, mock_aurora_client, moc
             pass
 
         mock_aurora_client.disconnect.assert_called_once()
+
+
+def test_handler_invalidates_plan_cache_after_embedding(mock_config, mock_aurora_client, mock_embedding_service):
+    """Re-ingested policy chunks bump the plan cache generation."""
+    mock_embedding_service.generate_embeddings.return_value = EMBEDDING_RESULT
+    plan_cache = MagicMock()
+    with _patched_handler(mock_config, mock_aurora_client, mock_embedding_service) as stack:
+        stack.enter_context(patch("handlers.generate_embeddings.get_plan_cache", return_value=plan_cache))
+        from handlers.generate_embeddings import handler
+
+        handler(DIRECT_EVENT, None)
+
+    plan_cache.bump_generation.assert_called_once()
+
+
+def test_handler_does_not_invalidate_when_embedding_fails(mock_config, mock_aurora_client, mock_embedding_service):
+    mock_embedding_service.generate_embeddings.side_effect = PolicyRetrievalError("S3 error")
+    plan_cache = MagicMock()
+    with _patched_handler(mock_config, mock_aurora_client, mock_embedding_service) as stack:
+        stack.enter_context(patch("handlers.generate_embeddings.get_plan_cache", return_value=plan_cache))
+        from handlers.generate_embeddings import handler
+
+        with pytest.raises(PolicyRetrievalError):
+            handler(DIRECT_EVENT, None)
+
+    plan_cache.bump_generation.assert_not_called()
+
+
+def test_handler_extracts_policy_rules_after_embedding(mock_config, mock_aurora_client, mock_embedding_service):
+    mock_embedding_service.generate_embeddings.return_value = EMBEDDING_RESULT
+    with _patched_handler(mock_config, mock_aurora_client, mock_embedding_service) as stack:
+        mock_refresh = stack.enter_context(patch("handlers.generate_embeddings.refresh_policy_rules"))
+        from handlers.generate_embeddings import handler
+
+        handler(DIRECT_EVENT, None)
+
+    mock_refresh.assert_called_once_with(mock_aurora_client, DIRECT_EVENT["policy_id"])
@@ -46,6 +46,33 @@ def test_output_matches_reasoning_result_schema():
     assert reparsed.booking_id == "b-1"
 
 
+def test_parses_route_from_query():
+    result = apply_graceful_degradation("b-1", "e-1", user_query="Book a flight from HYD to ORD")
+    assert (result.plan.parameters.origin, result.plan.parameters.destination) == ("HYD", "ORD")
+    assert result.parse_failed is False
+
+
+def test_parses_city_names_from_query():
+    result = apply_graceful_degradation("b-1", "e-1", user_query="Need to get to Mumbai from Delhi")
+    assert (result.plan.parameters.origin, result.plan.parameters.destination) == ("DEL", "BOM")
+
+
+@pytest.mark.parametrize(
+    "query",
+    ["Book a flight from DEL to BOM on March 20 for the AWS summit", "from del to bom on March 20"],
+)
+def test_falls_back_to_from_to_extraction(query):
+    result = apply_graceful_degradation("b-1", "e-1", user_query=query)
+    assert (result.plan.parameters.origin, result.plan.parameters.destination) == ("DEL", "BOM")
+    assert result.parse_failed is False
+
+
+def test_unparseable_query_sets_parse_failed():
+    result = apply_graceful_degradation("b-1", "e-1", user_query="book me something")
+    assert result.parse_failed is True
+    assert "QUERY_PARSE_FAILED" in result.plan.warnings
+
+
 # ── build_degradation_audit_entry ────────────────────────────────────────────
 
 
@@ -0,0 +1,83 @@
+"""Unit tests for the incremental JSON scanner."""
+
+import json
+
+import pytest
+
+from core.services.json_stream import IncrementalJsonScanner, MalformedJsonStream
+
+
+def _feed_in_chunks(scanner: IncrementalJsonScanner, text: str, size: int = 3) -> None:
+    for i in range(0, len(text), size):
+        scanner.feed(text[i : i + size])
+
+
+def test_complete_object_across_chunks():
+    text = json.dumps({"a": {"b": [1, 2, {"c": "x}y"}]}, "d": True, "e": None, "f": -1.5e3})
+    scanner = IncrementalJsonScanner()
+    _feed_in_chunks(scanner, text)
+
+    assert scanner.complete
+    assert scanner.text == text
+
+
+def test_braces_and_escaped_quotes_inside_strings_ignored():
+    text = '{"s": "a \\"quoted\\" {brace] and \\\\ backslash"}'
+    scanner = IncrementalJsonScanner()
+    _feed_in_chunks(scanner, text, size=1)
+
+    assert scanner.complete
+    assert json.loads(scanner.text)["s"].startswith("a ")
+
+
+def test_preamble_and_trailing_text_tolerated():
+    scanner = IncrementalJsonScanner(max_preamble_chars=20)
+    scanner.feed('```json\n{"a": 1}\n```')
+
+    assert scanner.complete
+    assert scanner.text == '{"a": 1}'
+
+
+def test_incomplete_object_not_complete():
+    scanner = IncrementalJsonScanner()
+    scanner.feed('{"a": [1, 2')
+
+    assert scanner.started
+    assert not scanner.complete
+
+
+def test_long_preamble_aborts():
+    scanner = IncrementalJsonScanner(max_preamble_chars=10)
+    with pytest.raises(MalformedJsonStream, match="no JSON object within 10"):
+        scanner.feed("Here is the booking plan you asked for: {")
+
+
+def test_zero_preamble_requires_object_first():
+    with pytest.raises(MalformedJsonStream):
+        IncrementalJsonScanner(max_preamble_chars=0).feed('x{"a": 1}')
+
+
+def test_mismatched_bracket_aborts():
+    with pytest.raises(MalformedJsonStream, match="mismatched"):
+        IncrementalJsonScanner().feed('{"a": [1, 2}')
+
+
+def test_repairable_python_literals_tolerated():
+    scanner = IncrementalJsonScanner()
+    _feed_in_chunks(scanner, '{"a": None, "b": True, "c": [False]}')
+    assert scanner.complete
+
+
+def test_single_quotes_abort():
+    with pytest.raises(MalformedJsonStream, match="unexpected"):
+        IncrementalJsonScanner().feed("{'a': 1}")
+
+
+def test_invalid_escape_aborts():
+    with pytest.raises(MalformedJsonStream, match="invalid escape"):
+        IncrementalJsonScanner().feed('{"a": "\\q"}')
+
+
+def test_raw_newline_in_string_aborts():
+    with pytest.raises(MalformedJsonStream, match="control character"):
+        IncrementalJsonScanner().feed('{"a": "line\nbreak"}')
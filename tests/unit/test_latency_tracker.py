@@ -0,0 +1,31 @@
+"""Unit tests for LatencyTracker."""
+
+from core.services.latency_tracker import LatencyTracker
+
+
+def test_percentile_none_until_min_samples():
+    tracker = LatencyTracker(min_samples=3)
+    tracker.record(100.0)
+    tracker.record(200.0)
+
+    assert tracker.percentile(90) is None
+
+
+def test_nearest_rank_percentile():
+    tracker = LatencyTracker(min_samples=1)
+    for ms in range(1, 101):
+        tracker.record(float(ms))
+
+    assert tracker.percentile(50) == 50.0
+    assert tracker.percentile(90) == 90.0
+    assert tracker.percentile(100) == 100.0
+    assert tracker.percentile(0) == 1.0
+
+
+def test_window_keeps_most_recent_samples():
+    tracker = LatencyTracker(window=3, min_samples=1)
+    for ms in (1000.0, 1.0, 2.0, 3.0):
+        tracker.record(ms)
+
+    assert len(tracker) == 3
+    assert tracker.percentile(100) == 3.0
@@ -0,0 +1,110 @@
+"""Unit tests for PlanCache — mocked DynamoDB, no AWS calls."""
+
+import json
+import time
+from datetime import date, timedelta
+from unittest.mock import MagicMock
+
+import pytest
+
+from core.models.booking import BookingPlan
+from core.services.plan_cache import PlanCache, invalidate_plan_cache, normalize_query
+
+TABLE = "TripCortexPlanCache"
+MODEL_ID = "us.amazon.nova-2-lite-v1:0"
+FUTURE = (date.today() + timedelta(days=30)).isoformat()
+
+PLAN = BookingPlan.model_validate(
+    {
+        "intent": "flight_booking",
+        "confidence": 0.9,
+        "parameters": {"origin": "HYD", "destination": "ORD", "departure_date": FUTURE, "cabin_class": "economy"},
+        "policy_constraints": {"max_budget_usd": 500.0, "preferred_vendors": ["Delta"], "advance_booking_met": True},
+        "policy_sources": [],
+        "reasoning_summary": "Economy, $500 cap.",
+    }
+)
+
+
+@pytest.fixture
+def dynamo() -> MagicMock:
+    client = MagicMock()
+    client.get_item.return_value = {}
+    return client
+
+
+@pytest.fixture
+def cache(dynamo) -> PlanCache:
+    return PlanCache(dynamo, TABLE, ttl_seconds=3600)
+
+
+def test_normalize_query():
+    assert normalize_query("  Book a flight   HYD to ORD!  ") == "book a flight hyd to ord"
+
+
+def test_key_ignores_formatting_differences():
+    a = PlanCache.build_key("Book HYD to ORD.", "ctx", "2026-10-19", MODEL_ID, 0)
+    b = PlanCache.build_key("book  hyd to ord", "ctx", "2026-10-19", MODEL_ID, 0)
+    assert a == b
+
+
+@pytest.mark.parametrize(
+    "change",
+    [
+        {"context_text": "other ctx"},
+        {"today": "2026-10-20"},
+        {"model_id": "other-model"},
+        {"generation": 1},
+        {"user_query": "book hyd to del"},
+    ],
+)
+def test_key_changes_with_each_component(change):
+    base = {"user_query": "book hyd to ord", "context_text": "ctx", "today": "2026-10-19", "model_id": MODEL_ID}
+    base["generation"] = 0
+    assert PlanCache.build_key(**base) != PlanCache.build_key(**{**base, **change})
+
+
+def test_generation_defaults_to_zero(cache, dynamo):
+    assert cache.generation() == 0
+    assert dynamo.get_item.call_args.kwargs["ConsistentRead"] is True
+
+
+def test_generation_read_from_item(cache, dynamo):
+    dynamo.get_item.return_value = {"Item": {"cacheKey": {"S": "__policy_generation__"}, "generation": {"N": "4"}}}
+    assert cache.generation() == 4
+
+
+def test_bump_generation(cache, dynamo):
+    dynamo.update_item.return_value = {"Attributes": {"generation": {"N": "5"}}}
+
+    assert cache.bump_generation() == 5
+    assert dynamo.update_item.call_args.kwargs["UpdateExpression"] == "ADD generation :one"
+
+
+def test_put_then_get_round_trip(cache, dynamo):
+    cache.put("k", PLAN)
+    item = dynamo.put_item.call_args.kwargs["Item"]
+    assert int(item["ttl"]["N"]) > time.time()
+
+    dynamo.get_item.return_value = {"Item": item}
+    assert cache.get("k") == PLAN
+
+
+def test_get_miss(cache):
+    assert cache.get("missing") is None
+
+
+def test_expired_item_is_a_miss(cache, dynamo):
+    dynamo.get_item.return_value = {
+        "Item": {"cacheKey": {"S": "k"}, "plan": {"S": json.dumps({})}, "ttl": {"N": str(int(time.time()) - 10)}}
+    }
+    assert cache.get("k") is None
+
+
+def test_invalidate_swallows_errors(dynamo):
+    dynamo.update_item.side_effect = Exception("throttled")
+    invalidate_plan_cache(PlanCache(dynamo, TABLE))  # does not raise
+
+
+def test_invalidate_without_cache_is_noop():
+    invalidate_plan_cache(None)
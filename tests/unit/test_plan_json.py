@@ -0,0 +1,43 @@
+"""Unit tests for plan_json — object location and repair of model output."""
+
+import pytest
+
+from core.services.plan_json import PlanJsonError, decode_json_object, repair_json
+
+
+class TestRepairJson:
+    def test_removes_trailing_commas(self):
+        assert repair_json('{"a": [1, 2,], "b": {"c": 1,},}') == '{"a": [1, 2], "b": {"c": 1}}'
+
+    def test_strips_fences(self):
+        assert repair_json('```json\n{"a": 1}\n```').strip() == '{"a": 1}'
+
+    def test_maps_python_literals(self):
+        assert repair_json('{"a": True, "b": False, "c": None}') == '{"a": true, "b": false, "c": null}'
+
+    def test_leaves_string_contents_alone(self):
+        text = '{"note": "keep ,] and True and ``` and \\" quotes,}",}'
+        assert repair_json(text) == '{"note": "keep ,] and True and ``` and \\" quotes,}"}'
+
+
+class TestDecodeJsonObject:
+    def test_clean_object_not_repaired(self):
+        assert decode_json_object('{"a": 1}') == ({"a": 1}, False)
+
+    def test_skips_preamble_and_epilogue(self):
+        assert decode_json_object('Plan:\n{"a": 1}\nThanks {bye}') == ({"a": 1}, False)
+
+    def test_braces_inside_strings(self):
+        obj, _ = decode_json_object('{"s": "a } b { c", "n": 2}')
+        assert obj == {"s": "a } b { c", "n": 2}
+
+    def test_repaired_flag(self):
+        assert decode_json_object('Sure!\n```json\n{"a": [1,], "b": None,}\n```') == ({"a": [1], "b": None}, True)
+
+    def test_no_object_raises(self):
+        with pytest.raises(PlanJsonError, match="No JSON object found"):
+            decode_json_object("no plan here")
+
+    def test_unrepairable_raises(self):
+        with pytest.raises(PlanJsonError, match="Invalid JSON"):
+            decode_json_object('{"a": 1, "b": ')
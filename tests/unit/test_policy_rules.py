@@ -0,0 +1,256 @@
+"""Unit tests for structured policy rule extraction and queries — no database."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from core.models.retrieval import PolicyChunkResult, PolicyRule
+from core.services.policy_rules import (
+    PolicyRuleExtractor,
+    advance_booking_days,
+    budget_cap,
+    extract_policy_rules,
+    format_rules_for_prompt,
+    load_policy_rules,
+    permits_cabin,
+    preferred_vendors,
+    refresh_policy_rules,
+    route_cap,
+)
+
+POLICY_TEXT = (
+    "Economy fares are capped at $500 per trip. Business class fares up to $2,000 for flights over 8 hours.\n"
+    "Preferred airlines: Delta, United and IndiGo. Book at least 14 days in advance."
+)
+
+
+def _rule(rule_type: str, **fields) -> PolicyRule:
+    return PolicyRule(rule_type=rule_type, **fields)
+
+
+# ── extract_policy_rules ─────────────────────────────────────────────────────
+
+
+def test_extracts_caps_per_cabin():
+    caps = [r for r in extract_policy_rules(POLICY_TEXT) if r.rule_type == "budget_cap"]
+    assert [(r.cabin_class, r.value_numeric) for r in caps] == [("economy", 500.0), ("business", 2000.0)]
+
+
+def test_cap_without_single_cabin_applies_to_all():
+    rules = extract_policy_rules("Airfare must not exceed USD 750 in economy or premium economy.")
+    assert [(r.cabin_class, r.value_numeric) for r in rules if r.rule_type == "budget_cap"] == [(None, 750.0)]
+
+
+def test_amount_without_fare_wording_is_not_a_cap():
+    assert extract_policy_rules("Seat upgrade up to $50 permitted without approval.") == []
+
+
+ROUTE_TABLE = (
+    "| Route Category | Economy Cap | Approval if Exceeded |\n"
+    "|---|---|---|\n"
+    "| India Domestic (any route) | $150 | L1 Manager |\n"
+    "| India Domestic Short-Haul (e.g. DEL–BOM, BOM–BLR) | $100 | L1 Manager |\n"
+    "| US–India (e.g. JFK–DEL) | $1,200 | L1 + Finance |"
+)
+
+
+def test_route_table_yields_caps_keyed_by_route():
+    rules = extract_policy_rules(ROUTE_TABLE)
+    assert [(r.cabin_class, r.value_text, r.value_numeric) for r in rules] == [
+        ("economy", "India Domestic (any route)", 150.0),
+        ("economy", "DEL-BOM", 100.0),
+        ("economy", "BOM-BLR", 100.0),
+        ("economy", "JFK-DEL", 1200.0),
+    ]
+
+
+def test_table_without_route_column_is_ignored():
+    table = "| Level | Domestic Cap | Cabin Class |\n|---|---|---|\n| L1 | $300 | Economy only |"
+    assert extract_policy_rules(table) == []
+
+
+def test_cabin_tied_to_approval_is_conditional():
+    rules = extract_policy_rules("Economy class only. Business class requires VP-level (L3+) approval.")
+    assert rules[0] == _rule("cabin_eligibility", cabin_class="economy")
+    assert rules[1].value_text == "Business class requires VP-level (L3+) approval."
+    assert permits_cabin(rules, "business") is None
+
+
+def test_business_needs_class_to_name_a_cabin():
+    assert extract_policy_rules("Written business justification must be submitted.") == []
+
+
+def test_extracts_vendor_bullet_list():
+    text = (
+        "Book with preferred carriers when available:\n\n"
+        "- **US Domestic** — United Airlines, Delta Air Lines\n"
+        "- **India routes** — Air India, IndiGo\n\n"
+        "### 2.4 Baggage\n"
+        "- **Carry-on** — Included"
+    )
+    assert preferred_vendors(extract_policy_rules(text)) == [
+        "United Airlines",
+        "Delta Air Lines",
+        "Air India",
+        "IndiGo",
+    ]
+
+
+def test_extracts_vendors_and_advance_window():
+    rules = extract_policy_rules(POLICY_TEXT, section_title="Air Travel", source_page=3)
+
+    assert preferred_vendors(rules) == ["Delta", "United", "IndiGo"]
+    assert advance_booking_days(rules) == 14
+    assert all(r.section_title == "Air Travel" and r.source_page == 3 for r in rules)
+
+
+def test_cabin_restriction_is_unconditional():
+    rules = extract_policy_rules("Employees must book economy class for all domestic flights.")
+    assert rules == [_rule("cabin_eligibility", cabin_class="economy")]
+
+
+def test_cabin_permission_keeps_condition():
+    rules = extract_policy_rules("Business class is permitted for flights over 8 hours.")
+    assert rules == [
+        _rule(
+            "cabin_eligibility",
+            cabin_class="business",
+            value_text="Business class is permitted for flights over 8 hours.",
+        )
+    ]
+
+
+def test_negated_permission_is_ignored():
+    assert extract_policy_rules("First class is not permitted.") == []
+
+
+def test_duplicate_rules_are_dropped():
+    rules = extract_policy_rules("Book 14 days in advance. Remember: book 14 days in advance.")
+    assert len(rules) == 1
+
+
+# ── queries ──────────────────────────────────────────────────────────────────
+
+
+def test_budget_cap_prefers_cabin_specific_cap():
+    rules = [_rule("budget_cap", value_numeric=750.0), _rule("budget_cap", cabin_class="economy", value_numeric=500.0)]
+    assert budget_cap(rules, "economy") == 500.0
+    assert budget_cap(rules, "business") == 750.0
+
+
+def test_budget_cap_none_when_ambiguous_or_missing():
+    rules = [_rule("budget_cap", value_numeric=300.0), _rule("budget_cap", value_numeric=900.0)]
+    assert budget_cap(rules, "economy") is None
+    assert budget_cap([], "economy") is None
+
+
+def test_route_cap_wins_in_either_direction():
+    rules = extract_policy_rules(ROUTE_TABLE) + [_rule("budget_cap", value_numeric=900.0)]
+    assert budget_cap(rules, "economy", "BOM", "DEL") == 100.0
+    assert route_cap(rules, "economy", "DEL", "BOM") == 100.0
+    assert budget_cap(rules, "economy", "DEL", "MAA") == 900.0
+    assert route_cap(rules, "economy", "DEL", "MAA") is None
+
+
+def test_route_category_caps_left_to_reasoning():
+    rules = [_rule("budget_cap", cabin_class="economy", value_numeric=150.0, value_text="India Domestic (any route)")]
+    assert budget_cap(rules, "economy") is None
+    assert budget_cap(rules, "economy", "DEL", "MAA") is None
+
+
+def test_advance_booking_takes_strictest():
+    rules = [_rule("advance_booking", value_numeric=7.0), _rule("advance_booking", value_numeric=21.0)]
+    assert advance_booking_days(rules) == 21
+
+
+@pytest.mark.parametrize(
+    ("cabin", "expected"),
+    [("economy", True), ("business", None), ("first", False)],
+)
+def test_permits_cabin(cabin, expected):
+    rules = [
+        _rule("cabin_eligibility", cabin_class="economy"),
+        _rule("cabin_eligibility", cabin_class="business", value_text="flights over 8 hours"),
+    ]
+    assert permits_cabin(rules, cabin) is expected
+
+
+def test_permits_cabin_unrestricted_policy():
+    assert permits_cabin([_rule("budget_cap", value_numeric=500.0)], "first") is None
+
+
+def test_format_route_cap_for_prompt():
+    rules = [_rule("budget_cap", cabin_class="economy", value_numeric=100.0, value_text="DEL-BOM")]
+    assert format_rules_for_prompt(rules) == "- Fare cap (economy, DEL-BOM): $100"
+
+
+def test_format_rules_for_prompt():
+    rules = extract_policy_rules(POLICY_TEXT)
+    assert format_rules_for_prompt(rules) == (
+        "- Fare cap (economy): $500\n"
+        "- Fare cap (business): $2,000\n"
+        "- Book at least 14 days in advance\n"
+        "- Preferred vendors: Delta, United, IndiGo"
+    )
+
+
+# ── ingestion stage ──────────────────────────────────────────────────────────
+
+
+def test_extractor_replaces_rules_for_current_version():
+    aurora = MagicMock()
+    aurora.fetch_policy_text.return_value = (
+        3,
+        [
+            {"content_text": POLICY_TEXT, "section_title": "Air Travel", "source_page": 3},
+            {"content_text": "Book at least 14 days in advance.", "section_title": "Summary", "source_page": 9},
+        ],
+    )
+    aurora.replace_policy_rules.side_effect = lambda policy_id, version, rules: len(rules)
+
+    assert PolicyRuleExtractor(aurora).extract("p-1") == 6
+
+    policy_id, version, rules = aurora.replace_policy_rules.call_args.args
+    assert (policy_id, version) == ("p-1", 3)
+    assert sum(r.rule_type == "advance_booking" for r in rules) == 1
+
+
+def test_refresh_swallows_errors():
+    aurora = MagicMock()
+    aurora.fetch_policy_text.side_effect = Exception("connection reset")
+    refresh_policy_rules(aurora, "p-1")  # does not raise
+
+
+def _chunk(policy_id: str | None) -> PolicyChunkResult:
+    return PolicyChunkResult(
+        id="c-1",
+        content_text="Economy only.",
+        section_title=None,
+        source_page=None,
+        content_type="text",
+        bda_entity_subtype=None,
+        similarity=0.9,
+        policy_id=policy_id,
+    )
+
+
+def test_load_rules_scoped_to_retrieved_policies():
+    aurora = MagicMock()
+    aurora.fetch_policy_rules.return_value = [_rule("advance_booking", value_numeric=14.0)]
+
+    rules = load_policy_rules(aurora, [_chunk("p-1"), _chunk("p-1"), _chunk("p-2")])
+
+    assert rules == [_rule("advance_booking", value_numeric=14.0)]
+    aurora.fetch_policy_rules.assert_called_once_with(["p-1", "p-2"])
+
+
+def test_load_rules_without_policy_ids_skips_query():
+    aurora = MagicMock()
+    assert load_policy_rules(aurora, [_chunk(None)]) == []
+    aurora.fetch_policy_rules.assert_not_called()
+
+
+def test_load_rules_returns_empty_on_error():
+    aurora = MagicMock()
+    aurora.fetch_policy_rules.side_effect = Exception('relation "policy_rules" does not exist')
+    assert load_policy_rules(aurora, [_chunk("p-1")]) == []
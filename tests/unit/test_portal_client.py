@@ -0,0 +1,116 @@
+"""Unit tests for PortalClient against a local HTTP server — no network access."""
+
+import gzip
+import json
+import threading
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from core.errors import BookingError, ErrorCode, PortalUnavailableError
+from core.services.portal_client import PortalClient
+
+FLIGHTS = {"flights": [{"id": i, "airline": "IndiGo"} for i in range(200)]}
+
+
+class _PortalHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+    server: Any
+
+    def do_GET(self) -> None:  # noqa: N802
+        self.server.requests.append(
+            {
+                "path": urlparse(self.path).path,
+                "query": parse_qs(urlparse(self.path).query),
+                "headers": dict(self.headers),
+                "port": self.client_address[1],
+            }
+        )
+        status, body = self.server.responses.get(urlparse(self.path).path, (200, json.dumps(FLIGHTS).encode()))
+        gzipped = "gzip" in self.headers.get("Accept-Encoding", "")
+        if gzipped:
+            body = gzip.compress(body)
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        if gzipped:
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+class _PortalServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def handle_error(self, request: Any, client_address: Any) -> None:
+        pass  # keep-alive connections reset by the client at teardown
+
+
+@pytest.fixture
+def portal() -> Iterator[ThreadingHTTPServer]:
+    server = _PortalServer(("127.0.0.1", 0), _PortalHandler)
+    server.requests = []  # type: ignore[attr-defined]
+    server.responses = {}  # type: ignore[attr-defined]
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _client(server: ThreadingHTTPServer, **kwargs: Any) -> PortalClient:
+    return PortalClient(f"http://127.0.0.1:{server.server_address[1]}/", **kwargs)
+
+
+class TestSearchFlights:
+    def test_sends_query_and_decodes_gzip(self, portal):
+        data = _client(portal).search_flights("DEL", "BOM", "2026-11-20", "economy")
+
+        assert data == FLIGHTS
+        req = portal.requests[0]
+        assert req["path"] == "/api/flights"
+        assert req["query"] == {"from": ["DEL"], "to": ["BOM"], "date": ["2026-11-20"], "class": ["economy"]}
+        assert "gzip" in req["headers"]["Accept-Encoding"]
+
+    def test_connection_reused_across_searches(self, portal):
+        client = _client(portal)
+        for _ in range(3):
+            client.search_flights("DEL", "BOM", "2026-11-20", "economy")
+
+        assert len({r["port"] for r in portal.requests}) == 1
+
+
+class TestErrors:
+    def test_server_error_is_portal_unavailable(self, portal):
+        portal.responses["/api/flights"] = (500, b"{}")
+
+        with pytest.raises(PortalUnavailableError):
+            _client(portal, retries=0).search_flights("DEL", "BOM", "2026-11-20", "economy")
+
+    def test_client_error_is_search_failed(self, portal):
+        portal.responses["/api/flights"] = (400, b'{"error": "bad date"}')
+
+        with pytest.raises(BookingError) as exc_info:
+            _client(portal).search_flights("DEL", "BOM", "not-a-date", "economy")
+
+        assert exc_info.value.code == ErrorCode.SEARCH_FAILED
+
+    def test_invalid_json_is_search_failed(self, portal):
+        portal.responses["/api/flights"] = (200, b"<html>maintenance</html>")
+
+        with pytest.raises(BookingError, match="invalid JSON") as exc_info:
+            _client(portal).search_flights("DEL", "BOM", "2026-11-20", "economy")
+
+        assert exc_info.value.code == ErrorCode.SEARCH_FAILED
+
+    def test_connection_refused_is_portal_unavailable(self):
+        client = PortalClient("http://127.0.0.1:9", connect_timeout=0.5, retries=0)
+
+        with pytest.raises(PortalUnavailableError):
+            client.search_flights("DEL", "BOM", "2026-11-20", "economy")
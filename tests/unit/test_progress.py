@@ -0,0 +1,144 @@
+"""Unit tests for in-step WebSocket progress updates."""
+
+import json
+from unittest.mock import MagicMock
+
+from core.services.progress import (
+    STAGE_OPTIONS,
+    STAGE_REASONING,
+    STAGE_SEARCH,
+    ProgressNotifier,
+    QueuedProgressNotifier,
+    build_progress_event,
+    build_progress_payload,
+    coalesce_progress,
+    record_sent_stage,
+    sent_stage,
+)
+
+QUEUE_URL = "https://sqs/progress.fifo"
+
+
+class _ConditionalCheckFailed(Exception):
+    pass
+
+
+def _dynamo() -> MagicMock:
+    dynamo = MagicMock()
+    dynamo.exceptions.ConditionalCheckFailedException = _ConditionalCheckFailed
+    return dynamo
+
+
+def _event(connection_id: str, booking_id: str, message: str, stage: int = STAGE_REASONING) -> dict:
+    return build_progress_event(connection_id, booking_id, message, "emp-1", stage)
+
+
+def test_build_progress_payload_shape():
+    assert build_progress_payload("b-1", "Working...") == {
+        "type": "progress",
+        "booking_id": "b-1",
+        "payload": {"message": "Working..."},
+    }
+
+
+def test_notifier_posts_to_connection():
+    apigw = MagicMock()
+
+    ProgressNotifier(apigw, "conn-1", "b-1")("Still reasoning...")
+
+    kwargs = apigw.post_to_connection.call_args.kwargs
+    assert kwargs["ConnectionId"] == "conn-1"
+    assert json.loads(kwargs["Data"]) == build_progress_payload("b-1", "Still reasoning...")
+
+
+def test_notifier_swallows_post_errors():
+    apigw = MagicMock()
+    apigw.post_to_connection.side_effect = Exception("GoneException")
+
+    ProgressNotifier(apigw, "conn-1", "b-1")("Still reasoning...")  # does not raise
+
+
+def test_queued_notifier_sends_event_grouped_by_booking():
+    sqs = MagicMock()
+
+    QueuedProgressNotifier(sqs, QUEUE_URL, "conn-1", "b-1", "emp-1", STAGE_REASONING)("Still reasoning...")
+
+    kwargs = sqs.send_message.call_args.kwargs
+    assert kwargs["QueueUrl"] == QUEUE_URL
+    assert kwargs["MessageGroupId"] == "b-1"
+    assert json.loads(kwargs["MessageBody"]) == {
+        "type": "progress",
+        "connection_id": "conn-1",
+        "booking_id": "b-1",
+        "employee_id": "emp-1",
+        "stage": STAGE_REASONING,
+        "message": "Still reasoning...",
+    }
+
+
+def test_queued_notifier_repeats_are_not_deduplicated():
+    sqs = MagicMock()
+    notifier = QueuedProgressNotifier(sqs, QUEUE_URL, "conn-1", "b-1", "emp-1", STAGE_REASONING)
+
+    notifier("Still reasoning...")
+    notifier("Still reasoning...")
+
+    first, second = (c.kwargs["MessageDeduplicationId"] for c in sqs.send_message.call_args_list)
+    assert first != second
+
+
+def test_queued_notifier_swallows_send_errors():
+    sqs = MagicMock()
+    sqs.send_message.side_effect = Exception("Throttling")
+
+    notifier = QueuedProgressNotifier(sqs, QUEUE_URL, "conn-1", "b-1", "emp-1", STAGE_REASONING)
+    notifier("Still reasoning...")  # does not raise
+
+
+def test_coalesce_keeps_newest_event_per_booking():
+    events = [
+        _event("conn-1", "b-1", "Searching flights...", STAGE_SEARCH),
+        _event("conn-2", "b-2", "Analyzing..."),
+        _event("conn-1", "b-1", "Analyzing..."),
+        {"type": "progress", "booking_id": "b-3", "message": "No connection"},
+    ]
+
+    assert coalesce_progress(events) == [
+        _event("conn-2", "b-2", "Analyzing..."),
+        _event("conn-1", "b-1", "Analyzing..."),
+    ]
+
+
+def test_record_sent_stage_only_raises_stage():
+    dynamo = _dynamo()
+
+    record_sent_stage(dynamo, "Bookings", "emp-1", "b-1", STAGE_OPTIONS)
+
+    kwargs = dynamo.update_item.call_args.kwargs
+    assert kwargs["Key"] == {"employeeId": {"S": "emp-1"}, "bookingId": {"S": "b-1"}}
+    assert kwargs["ExpressionAttributeValues"] == {":s": {"N": str(STAGE_OPTIONS)}}
+    assert "sentStage < :s" in kwargs["ConditionExpression"]
+
+
+def test_record_sent_stage_swallows_errors():
+    dynamo = _dynamo()
+    dynamo.update_item.side_effect = _ConditionalCheckFailed()
+    record_sent_stage(dynamo, "Bookings", "emp-1", "b-1", STAGE_REASONING)  # later stage already recorded
+
+    dynamo.update_item.side_effect = Exception("Throttling")
+    record_sent_stage(dynamo, "Bookings", "emp-1", "b-1", STAGE_REASONING)  # does not raise
+
+
+def test_sent_stage_reads_item():
+    dynamo = _dynamo()
+    dynamo.get_item.return_value = {"Item": {"sentStage": {"N": "4"}}}
+    assert sent_stage(dynamo, "Bookings", "emp-1", "b-1") == 4
+
+
+def test_sent_stage_zero_when_missing_or_unreadable():
+    dynamo = _dynamo()
+    dynamo.get_item.return_value = {"Item": {}}
+    assert sent_stage(dynamo, "Bookings", "emp-1", "b-1") == 0
+
+    dynamo.get_item.side_effect = Exception("Throttling")
+    assert sent_stage(dynamo, "Bookings", "emp-1", "b-1") == 0
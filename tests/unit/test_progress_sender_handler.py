@@ -0,0 +1,93 @@
+"""Unit tests for the progress_sender Lambda handler."""
+
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from core.services.progress import STAGE_FINISHED, STAGE_REASONING, STAGE_SEARCH, build_progress_event
+
+
+def _record(body: dict | str) -> dict:
+    return {"messageId": "m-1", "body": body if isinstance(body, str) else json.dumps(body)}
+
+
+def _event(connection_id: str, booking_id: str, message: str, stage: int = STAGE_REASONING) -> dict:
+    return build_progress_event(connection_id, booking_id, message, "emp-1", stage)
+
+
+@pytest.fixture(autouse=True)
+def mock_dynamo():
+    with (
+        patch("handlers.progress_sender.get_dynamo_client") as dynamo,
+        patch("handlers.progress_sender.get_config", return_value=MagicMock(bookings_table="Bookings")),
+    ):
+        dynamo.return_value.get_item.return_value = {}
+        yield dynamo.return_value
+
+
+@patch("handlers.progress_sender.get_apigw_client")
+def test_posts_newest_message_per_booking(mock_apigw):
+    from handlers.progress_sender import handler
+
+    handler(
+        {
+            "Records": [
+                _record(_event("conn-1", "b-1", "Analyzing...")),
+                _record(_event("conn-1", "b-1", "Searching flights...", STAGE_SEARCH)),
+                _record(_event("conn-2", "b-2", "Analyzing...")),
+            ]
+        },
+        None,
+    )
+
+    calls = mock_apigw.return_value.post_to_connection.call_args_list
+    assert [c.kwargs["ConnectionId"] for c in calls] == ["conn-1", "conn-2"]
+    assert json.loads(calls[0].kwargs["Data"]) == {
+        "type": "progress",
+        "booking_id": "b-1",
+        "payload": {"message": "Searching flights..."},
+    }
+
+
+@patch("handlers.progress_sender.get_apigw_client")
+def test_post_failures_and_bad_records_do_not_fail_batch(mock_apigw):
+    from handlers.progress_sender import handler
+
+    mock_apigw.return_value.post_to_connection.side_effect = Exception("GoneException")
+
+    handler({"Records": [_record("not json"), _record(_event("conn-1", "b-1", "Analyzing..."))]}, None)
+
+    mock_apigw.return_value.post_to_connection.assert_called_once()
+
+
+@patch("handlers.progress_sender.get_apigw_client")
+def test_empty_batch_posts_nothing(mock_apigw):
+    from handlers.progress_sender import handler
+
+    handler({"Records": []}, None)
+
+    mock_apigw.assert_not_called()
+
+
+@patch("handlers.progress_sender.get_apigw_client")
+def test_progress_from_earlier_stage_than_sent_message_dropped(mock_apigw, mock_dynamo):
+    from handlers.progress_sender import handler
+
+    # The booking has already been sent its result; a late "Searching flights..." must not follow it.
+    mock_dynamo.get_item.return_value = {"Item": {"sentStage": {"N": str(STAGE_FINISHED)}}}
+
+    handler({"Records": [_record(_event("conn-1", "b-1", "Searching flights...", STAGE_SEARCH))]}, None)
+
+    mock_apigw.return_value.post_to_connection.assert_not_called()
+    assert mock_dynamo.get_item.call_args.kwargs["Key"] == {"employeeId": {"S": "emp-1"}, "bookingId": {"S": "b-1"}}
+
+
+@patch("handlers.progress_sender.get_apigw_client")
+def test_progress_without_stage_delivered_unchecked(mock_apigw, mock_dynamo):
+    from handlers.progress_sender import handler
+
+    handler({"Records": [_record({"type": "progress", "connection_id": "conn-1", "booking_id": "b-1"})]}, None)
+
+    mock_apigw.return_value.post_to_connection.assert_called_once()
+    mock_dynamo.get_item.assert_not_called()
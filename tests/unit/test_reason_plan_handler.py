@@ -12,6 +12,7 @@ from core.models.booking import (
     BookingPlan,
     PolicyConstraints,
     PolicySource,
+    ReasoningAttempt,
     ReasoningResult,
 )
 
@@ -41,6 +42,9 @@ def _make_result() -> ReasoningResult:
         model_id="us.amazon.nova-2-lite-v1:0",
         thinking_effort="medium",
         latency_ms=1500.0,
+        attempts=[
+            ReasoningAttempt(attempt=1, effort="medium", input_tokens=1200, output_tokens=700, latency_ms=1490.0)
+        ],
     )
 
 
@@ -97,6 +101,8 @@ def test_handler_writes_audit_log(mock_config, mock_dynamo, mock_audit, mock_svc
     entry = call_args[0][2]
     assert entry["event"] == "reasoning_plan"
     assert entry["input"]["model_id"] == "us.amazon.nova-2-lite-v1:0"
+    assert entry["attempts"][0]["input_tokens"] == 1200
+    assert entry["attempts"][0]["failure_class"] is None
 
 
 @patch("handlers.reason_plan.get_reasoning_service")
@@ -113,3 +119,27 @@ def test_handler_propagates_reasoning_error(mock_config, mock_svc):
 
     with pytest.raises(ReasoningError, match="All 3 attempts failed"):
         handler(_make_event(), mock_context)
+
+
+@patch("handlers.reason_plan.start_search_prefetch")
+@patch("handlers.reason_plan.get_prefetch_searcher")
+@patch("handlers.reason_plan.get_reasoning_service")
+@patch("handlers.reason_plan.write_audit_log")
+@patch("handlers.reason_plan.get_dynamo_client")
+@patch("handlers.reason_plan.get_config")
+def test_handler_prefetches_search_while_reasoning(
+    mock_config, mock_dynamo, mock_audit, mock_svc, mock_searcher, mock_prefetch
+):
+    from handlers.reason_plan import handler
+
+    mock_config.return_value = MagicMock(audit_log_table="AuditLog", flight_search_prefetch_wait_s=3.0)
+    result = _make_result()
+    mock_svc.return_value.generate_booking_plan.return_value = result
+    mock_context = MagicMock()
+    mock_context.get_remaining_time_in_millis.return_value = 2_500
+
+    handler(_make_event(), mock_context)
+
+    mock_prefetch.assert_called_once_with(mock_searcher.return_value, "Book a flight from HYD to ORD")
+    # Waits no longer than the invocation has left, less the reserve.
+    mock_prefetch.return_value.finish.assert_called_once_with(result.plan, 1.5)
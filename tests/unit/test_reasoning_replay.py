@@ -0,0 +1,159 @@
+"""Replay tests — recorded Converse exchanges through ReasoningService, no network."""
+
+import json
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from core.errors import ReasoningError
+from core.models.booking import ReasoningRequest
+from core.services.policy_rules import extract_policy_rules
+from core.services.reasoning import ReasoningService
+from tests.replay.bedrock import (
+    RecordingBedrockClient,
+    ReplayBedrockClient,
+    ReplayMiss,
+    relativize_dates,
+    request_key,
+    resolve_dates,
+)
+
+FIXTURES = Path(__file__).parent.parent / "replay" / "fixtures"
+MODEL_ID = "us.amazon.nova-2-lite-v1:0"
+
+
+def _queries() -> list[dict[str, Any]]:
+    lines = (FIXTURES / "queries.jsonl").read_text().splitlines()
+    return [resolve_dates(json.loads(line), date.today()) for line in lines if line.strip()]
+
+
+def _request(query: dict[str, Any]) -> ReasoningRequest:
+    return ReasoningRequest(
+        booking_id=f"replay-{query['name']}",
+        employee_id="emp-replay",
+        user_query=query["user_query"],
+        context_text=query["context_text"],
+        confidence_level=query["confidence_level"],
+        max_similarity=query["max_similarity"],
+        policy_rules=extract_policy_rules(query["context_text"]),
+    )
+
+
+def _params(user_request: str, effort: str = "medium", context: str = "ctx") -> dict[str, Any]:
+    return ReasoningService(None, MODEL_ID)._build_converse_params(user_request, context, effort)
+
+
+# ── Recorded corpus ─────────────────────────────────────────────────────────
+
+
+@pytest.mark.parametrize("streaming", [False, True], ids=["converse", "stream"])
+@pytest.mark.parametrize("query", _queries(), ids=lambda q: q["name"])
+def test_recorded_query_replays(query, streaming):
+    client = ReplayBedrockClient(FIXTURES / "converse.jsonl")
+    service = ReasoningService(client, MODEL_ID, streaming=streaming)
+
+    if query["expect"] == "exhausted":
+        with pytest.raises(ReasoningError, match="All 3 reasoning attempts failed"):
+            service.generate_booking_plan(_request(query))
+        return
+
+    result = service.generate_booking_plan(_request(query))
+    assert result.thinking_effort == query["expect_effort"]
+    assert result.plan.parameters.departure_date > date.today()
+    assert len(result.attempts) == len(client.calls)
+
+
+# ── Harness ─────────────────────────────────────────────────────────────────
+
+
+def _response(text: str) -> dict[str, Any]:
+    return {
+        "ResponseMetadata": {"RequestId": "req-1", "HTTPHeaders": {"x-amzn-requestid": "req-1"}},
+        "output": {"message": {"role": "assistant", "content": [{"text": text}]}},
+        "stopReason": "end_turn",
+        "usage": {"inputTokens": 10, "outputTokens": 20},
+        "metrics": {"latencyMs": 900},
+    }
+
+
+class TestRecording:
+    def test_cassette_entry_is_scrubbed(self, tmp_path):
+        inner = MagicMock()
+        recorded_on = date(2026, 1, 10)
+        inner.converse.return_value = _response('{"departure_date": "2026-02-09"}')
+        cassette = tmp_path / "c.jsonl"
+
+        RecordingBedrockClient(inner, cassette, today=recorded_on).converse(
+            **_params("Fly HYD-ORD, mail jane.doe@example.com or call +1 415 555 0100")
+        )
+
+        entry = json.loads(cassette.read_text())
+        assert "ResponseMetadata" not in entry["response"]
+        assert "jane.doe" not in entry["request"] and "555" not in entry["request"]
+        assert "<email>" in entry["request"] and "<phone>" in entry["request"]
+        assert entry["response"]["output"]["message"]["content"][0]["text"] == '{"departure_date": "{{today+30}}"}'
+        assert entry["effort"] == "medium"
+
+    def test_replay_resolves_dates_against_replay_day(self, tmp_path):
+        inner = MagicMock()
+        inner.converse.return_value = _response('{"d": "2026-02-09"}')
+        cassette = tmp_path / "c.jsonl"
+        params = _params("Fly HYD to ORD")
+        RecordingBedrockClient(inner, cassette, today=date(2026, 1, 10)).converse(**params)
+
+        replayed = ReplayBedrockClient(cassette, today=date(2027, 5, 1)).converse(**params)
+
+        assert replayed["output"]["message"]["content"][0]["text"] == '{"d": "2027-05-31"}'
+        assert replayed["metrics"] == {"latencyMs": 900}
+
+
+class TestReplay:
+    def _cassette(self, tmp_path, texts: list[str], params: dict[str, Any]) -> Path:
+        inner = MagicMock()
+        inner.converse.side_effect = [_response(t) for t in texts]
+        cassette = tmp_path / "c.jsonl"
+        recorder = RecordingBedrockClient(inner, cassette)
+        for _ in texts:
+            recorder.converse(**params)
+        return cassette
+
+    def test_repeated_requests_get_successive_recordings(self, tmp_path):
+        params = _params("Fly HYD to ORD")
+        client = ReplayBedrockClient(self._cassette(tmp_path, ["first", "second"], params))
+
+        texts = [client.converse(**params)["output"]["message"]["content"][0]["text"] for _ in range(3)]
+
+        assert texts == ["first", "second", "second"]
+        client.rewind()
+        assert client.converse(**params)["output"]["message"]["content"][0]["text"] == "first"
+
+    def test_query_match_ignores_context_changes(self, tmp_path):
+        cassette = self._cassette(tmp_path, ["plan"], _params("Fly HYD to ORD", context="old policy"))
+
+        client = ReplayBedrockClient(cassette)
+        assert client.converse(**_params("Fly HYD to ORD", context="new policy"))
+
+        with pytest.raises(ReplayMiss):
+            ReplayBedrockClient(cassette, match="exact").converse(**_params("Fly HYD to ORD", context="new policy"))
+
+    def test_effort_is_part_of_the_key(self, tmp_path):
+        cassette = self._cassette(tmp_path, ["plan"], _params("Fly HYD to ORD", effort="medium"))
+
+        with pytest.raises(ReplayMiss, match="high"):
+            ReplayBedrockClient(cassette).converse(**_params("Fly HYD to ORD", effort="high"))
+
+    def test_key_ignores_todays_date(self):
+        params = _params("Fly HYD to ORD")
+        later = json.loads(json.dumps(params).replace(date.today().isoformat(), "2031-01-01"))
+        assert request_key(params, "exact") == request_key(later, "exact")
+
+
+def test_relativize_and_resolve_round_trip():
+    today = date(2026, 3, 1)
+    value = {"a": ["2026-03-31", "x 2026-02-27 y"], "n": 3}
+    tokens = relativize_dates(value, today)
+    assert tokens == {"a": ["{{today+30}}", "x {{today-2}} y"], "n": 3}
+    assert resolve_dates(tokens, today + timedelta(days=1)) == {"a": ["2026-04-01", "x 2026-02-28 y"], "n": 3}
@@ -0,0 +1,46 @@
+"""Unit tests for ReasoningRouter — fast-rung routing decisions."""
+
+from core.models.booking import ReasoningRequest
+from core.services.reasoning_router import ReasoningRouter
+
+
+def _request(**overrides) -> ReasoningRequest:
+    base = {
+        "booking_id": "b-1",
+        "employee_id": "e-1",
+        "user_query": "Book a flight from HYD to ORD next Monday",
+        "context_text": "Economy only, $500 cap.",
+        "confidence_level": "high",
+        "max_similarity": 0.82,
+    }
+    base.update(overrides)
+    return ReasoningRequest(**base)
+
+
+class TestDeclineReason:
+    def test_confident_short_request_routes_fast(self):
+        assert ReasoningRouter().decline_reason(_request()) is None
+
+    def test_non_high_confidence_declined(self):
+        assert ReasoningRouter().decline_reason(_request(confidence_level="low")) == "retrieval_confidence"
+
+    def test_low_similarity_declined(self):
+        assert ReasoningRouter(min_similarity=0.9).decline_reason(_request()) == "low_similarity"
+
+    def test_long_query_declined(self):
+        query = "Book HYD to ORD on Monday, back Friday, aisle seat, and check if business is allowed " * 3
+        assert ReasoningRouter().decline_reason(_request(user_query=query)) == "long_query"
+
+    def test_max_query_chars_configurable(self):
+        assert ReasoningRouter(max_query_chars=10).decline_reason(_request()) == "long_query"
+
+
+def test_route_logs_decision():
+    from structlog.testing import capture_logs
+
+    with capture_logs() as logs:
+        routed = ReasoningRouter().route(_request(confidence_level="none"))
+
+    assert routed is False
+    assert logs[0]["event"] == "reasoning_route"
+    assert logs[0]["decline_reason"] == "retrieval_confidence"
@@ -1,7 +1,10 @@
-"""Unit tests for ReasoningService — Converse API, JSON extraction, escalation, retry."""
+"""Unit tests for ReasoningService — Converse API, plan parsing, escalation, retry."""
 
 import json
+import threading
+import time
 from datetime import date, timedelta
+from pathlib import Path
 from typing import Any
 from unittest.mock import MagicMock
 
@@ -9,11 +12,16 @@ import pytest
 
 from core.errors import ErrorCode, ReasoningError
 from core.models.booking import ReasoningRequest
+from core.models.retrieval import PolicyRule
+from core.services.attempt_scheduler import AttemptScheduler
 from core.services.reasoning import ReasoningService
+from core.services.reasoning_router import ReasoningRouter
 
 FUTURE = (date.today() + timedelta(days=30)).isoformat()
 FUTURE2 = (date.today() + timedelta(days=37)).isoformat()
 
+MODEL_OUTPUTS = Path(__file__).parent.parent / "payloads" / "model_outputs.jsonl"
+
 # A valid BookingPlan JSON that passes Pydantic validation.
 VALID_PLAN_JSON = json.dumps(
     {
@@ -92,7 +100,7 @@ class TestBuildConverseParams:
         svc = _make_service()
         params = svc._build_converse_params("fly HYD to ORD", "economy only $500", "medium")
 
-        user_text = params["messages"][0]["content"][0]["text"]
+        user_text = "".join(block.get("text", "") for block in params["messages"][0]["content"])
         assert "fly HYD to ORD" in user_text
         assert "economy only $500" in user_text
 
@@ -101,12 +109,50 @@ class TestBuildConverseParams:
         params = svc._build_converse_params("q", "ctx", "medium")
         assert params["modelId"] == "us.amazon.nova-2-lite-v1:0"
 
+    def test_cache_points_split_stable_and_variable_segments(self):
+        params = _make_service()._build_converse_params("fly HYD to ORD", "economy only $500", "medium")
+
+        system_text, system_cache = params["system"]
+        assert "exact schema" in system_text["text"]
+        assert system_cache == {"cachePoint": {"type": "default"}}
+
+        context, context_cache, variable = params["messages"][0]["content"]
+        assert "economy only $500" in context["text"]
+        assert context_cache == {"cachePoint": {"type": "default"}}
+        assert "fly HYD to ORD" in variable["text"]
+        assert date.today().isoformat() in variable["text"]
+
+    def test_stable_segments_do_not_vary_with_request_or_date(self):
+        svc = _make_service()
+        a = svc._build_converse_params("fly HYD to ORD", "same policy", "medium")
+        b = svc._build_converse_params("fly BLR to DEL tomorrow", "same policy", "medium")
+
+        assert a["system"] == b["system"]
+        assert a["messages"][0]["content"][:2] == b["messages"][0]["content"][:2]
+        assert date.today().isoformat() not in a["system"][0]["text"]
+
+    def test_policy_rules_prepended_to_cached_context_segment(self):
+        rules = [PolicyRule(rule_type="budget_cap", cabin_class="economy", value_numeric=500.0)]
+        params = _make_service()._build_converse_params("fly HYD to ORD", "excerpts", "medium", policy_rules=rules)
+
+        context = params["messages"][0]["content"][0]["text"]
+        assert context.startswith("STRUCTURED POLICY RULES")
+        assert "- Fare cap (economy): $500" in context
+        assert context.index("Fare cap") < context.index("RELEVANT POLICY EXCERPTS")
+
+    def test_prompt_caching_disabled_omits_cache_points(self):
+        svc = ReasoningService(None, "us.amazon.nova-2-lite-v1:0", prompt_caching=False)
+        params = svc._build_converse_params("q", "ctx", "medium")
+
+        assert all("cachePoint" not in block for block in params["system"])
+        assert all("cachePoint" not in block for block in params["messages"][0]["content"])
+
 
-# ── _extract_json ───────────────────────────────────────────────────────────
+# ── _extract_text ───────────────────────────────────────────────────────────
 
 
-class TestExtractJson:
-    def test_last_text_block_pure_json(self):
+class TestExtractText:
+    def test_returns_last_text_block(self):
         response = _converse_response(
             [
                 {"reasoningContent": {"reasoningText": {"text": "[REDACTED]"}}},
@@ -114,8 +160,7 @@ class TestExtractJson:
                 {"text": VALID_PLAN_JSON},
             ]
         )
-        result = ReasoningService._extract_json(response)
-        assert json.loads(result)["intent"] == "flight_booking"
+        assert ReasoningService._extract_text(response) == VALID_PLAN_JSON
 
     def test_skips_reasoning_content_blocks(self):
         response = _converse_response(
@@ -124,33 +169,23 @@ class TestExtractJson:
                 {"text": VALID_PLAN_JSON},
             ]
         )
-        result = ReasoningService._extract_json(response)
-        assert json.loads(result)["confidence"] == 0.92
-
-    def test_regex_fallback_with_preamble(self):
-        text_with_preamble = f"Here is your booking plan:\n{VALID_PLAN_JSON}\nDone."
-        response = _converse_response([{"text": text_with_preamble}])
-        result = ReasoningService._extract_json(response)
-        assert json.loads(result)["intent"] == "flight_booking"
+        assert ReasoningService._extract_text(response) == VALID_PLAN_JSON
 
     def test_no_text_blocks_raises(self):
         response = _converse_response([{"reasoningContent": {"reasoningText": {"text": "[REDACTED]"}}}])
         with pytest.raises(ReasoningError, match="No text blocks") as exc_info:
-            ReasoningService._extract_json(response)
+            ReasoningService._extract_text(response)
         assert exc_info.value.code == ErrorCode.INVALID_PLAN
 
-    def test_no_json_in_text_raises(self):
-        response = _converse_response([{"text": "I cannot produce a plan for this request."}])
-        with pytest.raises(ReasoningError, match="No JSON object found"):
-            ReasoningService._extract_json(response)
 
-    def test_malformed_json_braces_raises(self):
-        response = _converse_response([{"text": '{"broken": true, "missing_close'}])
-        with pytest.raises(ReasoningError):
-            ReasoningService._extract_json(response)
+# ── _parse_plan ─────────────────────────────────────────────────────────────
 
 
-# ── _parse_plan ─────────────────────────────────────────────────────────────
+def _recorded_outputs() -> list[dict[str, Any]]:
+    rows = [json.loads(line) for line in MODEL_OUTPUTS.read_text().splitlines() if line.strip()]
+    for row in rows:
+        row["text"] = row["text"].replace("__DEPARTURE_DATE__", FUTURE)
+    return rows
 
 
 class TestParsePlan:
@@ -160,6 +195,28 @@ class TestParsePlan:
         assert plan.parameters.origin == "HYD"
         assert plan.policy_constraints.max_budget_usd == 500.0
 
+    def test_preamble_and_epilogue(self):
+        plan = ReasoningService._parse_plan(f"Here is your booking plan:\n{VALID_PLAN_JSON}\nDone.")
+        assert plan.intent == "flight_booking"
+
+    def test_markdown_fence(self):
+        plan = ReasoningService._parse_plan(f"```json\n{VALID_PLAN_JSON}\n```")
+        assert plan.parameters.destination == "ORD"
+
+    def test_trailing_commas_repaired(self):
+        text = VALID_PLAN_JSON.replace('"United"]', '"United",]')[:-1] + ",}"
+        plan = ReasoningService._parse_plan(text)
+        assert plan.policy_constraints.preferred_vendors == ["Delta", "United"]
+
+    def test_no_json_in_text_raises(self):
+        with pytest.raises(ReasoningError, match="No JSON object found") as exc_info:
+            ReasoningService._parse_plan("I cannot produce a plan for this request.")
+        assert exc_info.value.code == ErrorCode.INVALID_PLAN
+
+    def test_malformed_json_braces_raises(self):
+        with pytest.raises(ReasoningError, match="Invalid JSON"):
+            ReasoningService._parse_plan('{"broken": true, "missing_close')
+
     def test_invalid_json_raises(self):
         with pytest.raises(ReasoningError, match="Invalid JSON") as exc_info:
             ReasoningService._parse_plan("{not valid json}")
@@ -171,6 +228,14 @@ class TestParsePlan:
             ReasoningService._parse_plan(bad_plan)
         assert exc_info.value.code == ErrorCode.INVALID_PLAN
 
+    @pytest.mark.parametrize("row", _recorded_outputs(), ids=lambda row: row["name"])
+    def test_recorded_outputs(self, row):
+        if row["expect"] == "error":
+            with pytest.raises(ReasoningError):
+                ReasoningService._parse_plan(row["text"])
+        else:
+            assert ReasoningService._parse_plan(row["text"]).parameters.origin == "HYD"
+
 
 # ── Task 2: Escalation logic & generate_booking_plan ────────────────────────
 
@@ -265,6 +330,16 @@ class TestGenerateBookingPlan:
         assert result.thinking_effort == "high"
         assert client.converse.call_count == 2
 
+    def test_repairable_output_does_not_retry(self):
+        client = MagicMock()
+        client.converse.return_value = _mock_converse_response("```json\n" + VALID_PLAN_JSON[:-1] + ",}\n```")
+        svc = ReasoningService(client, "us.amazon.nova-2-lite-v1:0")
+
+        result = svc.generate_booking_plan(_make_request())
+
+        assert result.retry_count == 0
+        client.converse.assert_called_once()
+
     def test_all_attempts_fail_raises(self):
         client = MagicMock()
         client.converse.return_value = _mock_converse_response("garbage")
@@ -335,3 +410,669 @@ class TestGenerateBookingPlan:
         # First call (medium effort) should have inferenceConfig
         first_call_kwargs = client.converse.call_args_list[0][1]
         assert "inferenceConfig" in first_call_kwargs
+
+
+def _tool_use_response(tool_input: Any, name: str = "submit_booking_plan") -> dict:
+    """Build a Converse response whose answer is a toolUse block."""
+    return _converse_response(
+        [
+            {"reasoningContent": {"reasoningText": {"text": "[REDACTED]"}}},
+            {"toolUse": {"toolUseId": "t-1", "name": name, "input": tool_input}},
+        ]
+    )
+
+
+class TestStructuredOutput:
+    def test_tool_config_forces_booking_plan_tool(self):
+        svc = ReasoningService(None, "us.amazon.nova-2-lite-v1:0", structured_output=True)
+        params = svc._build_converse_params("query", "context", "medium")
+
+        tool_spec = params["toolConfig"]["tools"][0]["toolSpec"]
+        assert tool_spec["name"] == "submit_booking_plan"
+        assert "parameters" in tool_spec["inputSchema"]["json"]["properties"]
+        assert params["toolConfig"]["toolChoice"] == {"tool": {"name": "submit_booking_plan"}}
+        assert "exact schema" not in params["system"][0]["text"]
+
+    def test_free_form_mode_has_no_tool_config(self):
+        params = _make_service()._build_converse_params("query", "context", "medium")
+        assert "toolConfig" not in params
+
+    def test_reads_plan_from_tool_use_input(self):
+        client = MagicMock()
+        client.converse.return_value = _tool_use_response(json.loads(VALID_PLAN_JSON))
+        svc = ReasoningService(client, "us.amazon.nova-2-lite-v1:0", structured_output=True)
+
+        result = svc.generate_booking_plan(_make_request())
+
+        assert result.plan.parameters.origin == "HYD"
+        assert result.structured_output is True
+        assert result.schema_failure_count == 0
+        assert result.retry_count == 0
+
+    def test_missing_tool_use_raises(self):
+        with pytest.raises(ReasoningError, match="No submit_booking_plan toolUse block") as exc_info:
+            ReasoningService._extract_tool_input(_converse_response([{"text": VALID_PLAN_JSON}]))
+        assert exc_info.value.code == ErrorCode.INVALID_PLAN
+
+    def test_other_tool_name_ignored(self):
+        with pytest.raises(ReasoningError, match="toolUse"):
+            ReasoningService._extract_tool_input(_tool_use_response({"intent": "x"}, name="other_tool"))
+
+    def test_schema_failures_counted_separately_from_retries(self):
+        client = MagicMock()
+        invalid = json.loads(VALID_PLAN_JSON)
+        invalid["confidence"] = 5.0
+        client.converse.side_effect = [
+            _tool_use_response(invalid),
+            _tool_use_response(json.loads(VALID_PLAN_JSON)),
+        ]
+        svc = ReasoningService(client, "us.amazon.nova-2-lite-v1:0", structured_output=True)
+
+        result = svc.generate_booking_plan(_make_request())
+
+        assert result.retry_count == 1
+        assert result.schema_failure_count == 1
+
+
+def _stream(events: list[dict]) -> dict:
+    """Wrap events as a converse_stream() response."""
+    return {"stream": iter(events)}
+
+
+def _text_stream(text: str, chunk: int = 40) -> dict:
+    events: list[dict] = [
+        {"messageStart": {"role": "assistant"}},
+        {"contentBlockDelta": {"contentBlockIndex": 0, "delta": {"reasoningContent": {"text": "[REDACTED]"}}}},
+    ]
+    events += [
+        {"contentBlockDelta": {"contentBlockIndex": 1, "delta": {"text": text[i : i + chunk]}}}
+        for i in range(0, len(text), chunk)
+    ]
+    events += [
+        {"messageStop": {"stopReason": "end_turn"}},
+        {"metadata": {"usage": {"inputTokens": 10, "outputTokens": 20}, "metrics": {"latencyMs": 900}}},
+    ]
+    return _stream(events)
+
+
+class TestStreaming:
+    def test_streamed_text_plan_parsed(self):
+        client = MagicMock()
+        client.converse_stream.return_value = _text_stream(VALID_PLAN_JSON)
+        svc = ReasoningService(client, "us.amazon.nova-2-lite-v1:0", streaming=True)
+
+        result = svc.generate_booking_plan(_make_request())
+
+        assert result.plan.intent == "flight_booking"
+        client.converse.assert_not_called()
+
+    def test_streamed_tool_use_plan_parsed(self):
+        client = MagicMock()
+        client.converse_stream.return_value = _stream(
+            [
+                {
+                    "contentBlockStart": {
+                        "contentBlockIndex": 0,
+                        "start": {"toolUse": {"toolUseId": "t-1", "name": "submit_booking_plan"}},
+                    }
+                },
+                *[
+                    {
+                        "contentBlockDelta": {
+                            "contentBlockIndex": 0,
+                            "delta": {"toolUse": {"input": VALID_PLAN_JSON[i : i + 25]}},
+                        }
+                    }
+                    for i in range(0, len(VALID_PLAN_JSON), 25)
+                ],
+                {"messageStop": {"stopReason": "tool_use"}},
+            ]
+        )
+        svc = ReasoningService(client, "us.amazon.nova-2-lite-v1:0", structured_output=True, streaming=True)
+
+        result = svc.generate_booking_plan(_make_request())
+
+        assert result.plan.parameters.destination == "ORD"
+
+    def test_malformed_stream_aborts_before_end_and_escalates(self):
+        events = [
+            {"contentBlockDelta": {"contentBlockIndex": 0, "delta": {"text": "{'intent': "}}},
+            {"contentBlockDelta": {"contentBlockIndex": 0, "delta": {"text": "never consumed"}}},
+        ]
+        consumed: list[dict] = []
+
+        def _tracking(events):
+            for event in events:
+                consumed.append(event)
+                yield event
+
+        client = MagicMock()
+        client.converse_stream.side_effect = [
+            {"stream": _tracking(events)},
+            _text_stream(VALID_PLAN_JSON),
+        ]
+        svc = ReasoningService(client, "us.amazon.nova-2-lite-v1:0", streaming=True)
+
+        result = svc.generate_booking_plan(_make_request())
+
+        assert len(consumed) == 1
+        assert result.retry_count == 1
+        assert result.schema_failure_count == 1
+        assert result.thinking_effort == "high"
+
+    def test_repairable_stream_parsed_without_escalation(self):
+        client = MagicMock()
+        client.converse_stream.return_value = _text_stream(VALID_PLAN_JSON.replace("null", "None"))
+        svc = ReasoningService(client, "us.amazon.nova-2-lite-v1:0", streaming=True)
+
+        result = svc.generate_booking_plan(_make_request())
+
+        assert client.converse_stream.call_count == 1
+        assert result.retry_count == 0
+        assert result.thinking_effort == "medium"
+
+    def test_malformed_stream_error_message(self):
+        client = MagicMock()
+        client.converse_stream.return_value = _text_stream("I cannot produce a plan for this request. " * 10)
+        svc = ReasoningService(client, "us.amazon.nova-2-lite-v1:0", streaming=True)
+
+        with pytest.raises(ReasoningError, match="Malformed JSON in model stream"):
+            svc._attempt(_make_request(), "medium")
+
+    def test_progress_ticks_while_attempt_runs(self, monkeypatch):
+        import core.services.reasoning as reasoning
+
+        monkeypatch.setattr(reasoning, "_PROGRESS_INTERVAL_S", 0.01)
+        client = MagicMock()
+
+        def _slow_converse(**kwargs):
+            time.sleep(0.05)
+            return _mock_converse_response(VALID_PLAN_JSON)
+
+        client.converse.side_effect = _slow_converse
+        progress = MagicMock()
+        svc = ReasoningService(client, "us.amazon.nova-2-lite-v1:0")
+
+        svc.generate_booking_plan(_make_request(), progress=progress)
+
+        assert progress.call_count >= 1
+        progress.assert_called_with(reasoning._PROGRESS_THINKING)
+
+    def test_progress_message_on_retry(self):
+        client = MagicMock()
+        client.converse.side_effect = [
+            _mock_converse_response("bad"),
+            _mock_converse_response(VALID_PLAN_JSON),
+        ]
+        progress = MagicMock()
+        svc = ReasoningService(client, "us.amazon.nova-2-lite-v1:0")
+
+        svc.generate_booking_plan(_make_request(), progress=progress)
+
+        progress.assert_any_call("Double-checking the plan — this can take a little longer...")
+
+
+class TestHedging:
+    def _svc(self, client, **kwargs) -> ReasoningService:
+        return ReasoningService(client, "us.amazon.nova-2-lite-v1:0", hedging=True, hedge_default_ms=20, **kwargs)
+
+    def test_fast_primary_does_not_hedge(self):
+        client = MagicMock()
+        client.converse.return_value = _mock_converse_response(VALID_PLAN_JSON)
+
+        result = self._svc(client).generate_booking_plan(_make_request())
+
+        assert result.hedged is False
+        assert result.thinking_effort == "medium"
+        client.converse.assert_called_once()
+
+    def test_slow_primary_loses_to_hedge(self):
+        release = threading.Event()
+
+        def _converse(**kwargs):
+            effort = kwargs["additionalModelRequestFields"]["reasoningConfig"]["maxReasoningEffort"]
+            if effort == "medium":
+                release.wait(2)
+            return _mock_converse_response(VALID_PLAN_JSON)
+
+        client = MagicMock()
+        client.converse.side_effect = _converse
+
+        result = self._svc(client).generate_booking_plan(_make_request())
+        release.set()
+
+        assert result.hedged is True
+        assert result.thinking_effort == "high"
+        assert result.escalated is True
+        assert result.retry_count == 0
+        assert client.converse.call_count == 2
+
+    def test_lost_hedge_attempt_not_recorded(self):
+        release = threading.Event()
+        finished = threading.Event()
+
+        def _converse(**kwargs):
+            effort = kwargs["additionalModelRequestFields"]["reasoningConfig"]["maxReasoningEffort"]
+            if effort == "medium":
+                release.wait(2)
+            return _mock_converse_response(VALID_PLAN_JSON)
+
+        client = MagicMock()
+        client.converse.side_effect = _converse
+        scheduler = AttemptScheduler(min_samples=1)
+        svc = self._svc(client, scheduler=scheduler)
+        record = svc._record_attempt
+        appended_to = {}
+
+        def _record_attempt(attempts, slot, *args):
+            appended_to[slot] = attempts
+            latency_ms = record(attempts, slot, *args)
+            if slot == 0:
+                finished.set()
+            return latency_ms
+
+        svc._record_attempt = _record_attempt
+
+        result = svc.generate_booking_plan(_make_request())
+        release.set()
+        assert finished.wait(2)
+
+        assert result.thinking_effort == "high"
+        assert [a.effort for a in result.attempts] == ["high"]
+        assert appended_to[0] is None
+        assert scheduler.percentile("medium", 50) is None
+        assert scheduler.percentile("high", 50) is not None
+
+    def test_slow_primary_wins_when_hedge_fails(self):
+        def _converse(**kwargs):
+            effort = kwargs["additionalModelRequestFields"]["reasoningConfig"]["maxReasoningEffort"]
+            if effort == "high":
+                return _mock_converse_response("not json")
+            time.sleep(0.1)
+            return _mock_converse_response(VALID_PLAN_JSON)
+
+        client = MagicMock()
+        client.converse.side_effect = _converse
+
+        result = self._svc(client).generate_booking_plan(_make_request())
+
+        assert result.hedged is True
+        assert result.thinking_effort == "medium"
+        assert result.retry_count == 1
+        assert result.schema_failure_count == 1
+
+    def test_both_hedged_attempts_fail_then_third_runs(self):
+        def _converse(**kwargs):
+            time.sleep(0.05)
+            return _mock_converse_response("garbage")
+
+        client = MagicMock()
+        client.converse.side_effect = _converse
+
+        with pytest.raises(ReasoningError, match="All 3 reasoning attempts failed"):
+            self._svc(client).generate_booking_plan(_make_request())
+        assert client.converse.call_count == 3
+
+    def test_no_hedge_when_ladder_starts_high(self):
+        client = MagicMock()
+        client.converse.return_value = _mock_converse_response(VALID_PLAN_JSON)
+
+        result = self._svc(client).generate_booking_plan(_make_request(confidence_level="none", max_similarity=0.0))
+
+        assert result.hedged is False
+        client.converse.assert_called_once()
+
+    def test_hedge_delay_uses_tracked_percentile(self):
+        scheduler = AttemptScheduler(min_samples=1)
+        for ms in (100.0, 200.0, 300.0):
+            scheduler.record("medium", ms)
+        scheduler.record("high", 5000.0)
+        svc = self._svc(MagicMock(), scheduler=scheduler, hedge_percentile=50)
+
+        assert svc._hedge_delay_ms("medium") == 200.0
+
+    def test_successful_attempts_recorded(self):
+        scheduler = AttemptScheduler(min_samples=1)
+        client = MagicMock()
+        client.converse.return_value = _mock_converse_response(VALID_PLAN_JSON)
+
+        ReasoningService(client, "us.amazon.nova-2-lite-v1:0", scheduler=scheduler).generate_booking_plan(
+            _make_request()
+        )
+
+        assert scheduler.percentile("medium", 50) is not None
+        assert scheduler.percentile("high", 50) is None
+
+    def test_hedge_skipped_when_it_cannot_finish(self):
+        release = threading.Event()
+
+        def _converse(**kwargs):
+            release.wait(0.2)
+            return _mock_converse_response(VALID_PLAN_JSON)
+
+        client = MagicMock()
+        client.converse.side_effect = _converse
+        # medium (30s default) fits in 50s, high (60s default) does not.
+        result = self._svc(client).generate_booking_plan(_make_request(), remaining_ms=50_000)
+
+        assert result.hedged is False
+        assert result.thinking_effort == "medium"
+        client.converse.assert_called_once()
+
+    def test_cancelled_stream_closes(self):
+        cancel = threading.Event()
+        cancel.set()
+        stream = MagicMock()
+        stream.__iter__.return_value = iter([{"messageStart": {"role": "assistant"}}])
+        client = MagicMock()
+        client.converse_stream.return_value = {"stream": stream}
+        svc = ReasoningService(client, "us.amazon.nova-2-lite-v1:0", streaming=True)
+
+        with pytest.raises(ReasoningError, match="abandoned") as exc_info:
+            svc._attempt(_make_request(), "high", cancel=cancel)
+        assert exc_info.value.code == ErrorCode.REASONING_FAILED
+        stream.close.assert_called_once()
+
+
+class TestAttemptAccounting:
+    def test_attempt_logged_with_usage_and_server_latency(self):
+        from structlog.testing import capture_logs
+
+        response = _mock_converse_response(VALID_PLAN_JSON)
+        response["usage"] = {
+            "inputTokens": 300,
+            "outputTokens": 500,
+            "cacheReadInputTokens": 2500,
+            "cacheWriteInputTokens": 0,
+        }
+        response["metrics"] = {"latencyMs": 4210}
+        client = MagicMock()
+        client.converse.return_value = response
+
+        with capture_logs() as logs:
+            result = ReasoningService(client, "us.amazon.nova-2-lite-v1:0").generate_booking_plan(_make_request())
+
+        event = next(entry for entry in logs if entry["event"] == "reasoning_attempt")
+        assert event["cache_read_input_tokens"] == 2500
+        assert event["cache_write_input_tokens"] == 0
+        assert event["input_tokens"] == 300
+        assert event["server_latency_ms"] == 4210.0
+        assert event["failure_class"] is None
+        # 500 output tokens, of which the visible plan accounts for len(VALID_PLAN_JSON) // 4.
+        assert event["reasoning_tokens_est"] == 500 - len(VALID_PLAN_JSON) // 4
+        assert result.attempts[0].model_dump() == {k: event[k] for k in result.attempts[0].model_dump()}
+
+    def test_failed_attempts_recorded_on_result(self):
+        failed = _mock_converse_response("not json")
+        failed["usage"] = {"inputTokens": 100, "outputTokens": 40}
+        client = MagicMock()
+        client.converse.side_effect = [failed, _mock_converse_response(VALID_PLAN_JSON)]
+
+        result = ReasoningService(client, "us.amazon.nova-2-lite-v1:0").generate_booking_plan(_make_request())
+
+        assert [(a.attempt, a.effort, a.failure_class) for a in result.attempts] == [
+            (1, "medium", "invalid_plan"),
+            (2, "high", None),
+        ]
+        assert result.attempts[0].input_tokens == 100
+        assert result.attempts[1].server_latency_ms is None
+
+    def test_throttled_call_classified_before_propagating(self):
+        from botocore.exceptions import ClientError
+        from structlog.testing import capture_logs
+
+        client = MagicMock()
+        client.converse.side_effect = ClientError({"Error": {"Code": "ThrottlingException"}}, "Converse")
+
+        with capture_logs() as logs, pytest.raises(ClientError):
+            ReasoningService(client, "us.amazon.nova-2-lite-v1:0").generate_booking_plan(_make_request())
+
+        event = next(entry for entry in logs if entry["event"] == "reasoning_attempt")
+        assert event["failure_class"] == "throttled"
+        assert event["input_tokens"] == 0
+
+
+class TestPlanCache:
+    def test_miss_calls_model_and_stores_plan(self):
+        plan_cache = MagicMock()
+        plan_cache.generation.return_value = 3
+        plan_cache.build_key.return_value = "key-1"
+        plan_cache.get.return_value = None
+        client = MagicMock()
+        client.converse.return_value = _mock_converse_response(VALID_PLAN_JSON)
+
+        result = ReasoningService(client, "us.amazon.nova-2-lite-v1:0", plan_cache=plan_cache).generate_booking_plan(
+            _make_request()
+        )
+
+        assert result.cache_hit is False
+        client.converse.assert_called_once()
+        plan_cache.put.assert_called_once_with("key-1", result.plan)
+        assert plan_cache.build_key.call_args.args == (
+            "Book a flight from HYD to ORD",
+            "Policy: economy only, $500 cap, Delta/United preferred.",
+            date.today().isoformat(),
+            "us.amazon.nova-2-lite-v1:0",
+            3,
+        )
+
+    def test_hit_skips_model(self):
+        plan_cache = MagicMock()
+        plan_cache.generation.return_value = 0
+        plan_cache.get.return_value = ReasoningService._parse_plan(VALID_PLAN_JSON)
+        client = MagicMock()
+
+        result = ReasoningService(client, "us.amazon.nova-2-lite-v1:0", plan_cache=plan_cache).generate_booking_plan(
+            _make_request()
+        )
+
+        assert result.cache_hit is True
+        assert result.plan.intent == "flight_booking"
+        client.converse.assert_not_called()
+        plan_cache.put.assert_not_called()
+
+    def test_cache_errors_fall_back_to_model(self):
+        plan_cache = MagicMock()
+        plan_cache.generation.side_effect = Exception("DynamoDB unavailable")
+        client = MagicMock()
+        client.converse.return_value = _mock_converse_response(VALID_PLAN_JSON)
+
+        result = ReasoningService(client, "us.amazon.nova-2-lite-v1:0", plan_cache=plan_cache).generate_booking_plan(
+            _make_request()
+        )
+
+        assert result.cache_hit is False
+        plan_cache.put.assert_not_called()
+
+    def test_cache_write_failure_still_returns_plan(self):
+        plan_cache = MagicMock()
+        plan_cache.generation.return_value = 0
+        plan_cache.get.return_value = None
+        plan_cache.put.side_effect = Exception("throttled")
+        client = MagicMock()
+        client.converse.return_value = _mock_converse_response(VALID_PLAN_JSON)
+
+        result = ReasoningService(client, "us.amazon.nova-2-lite-v1:0", plan_cache=plan_cache).generate_booking_plan(
+            _make_request()
+        )
+
+        assert result.plan.intent == "flight_booking"
+
+
+class TestRulePlanner:
+    def test_rule_plan_skips_model(self):
+        rule_planner = MagicMock()
+        rule_planner.plan.return_value = ReasoningService._parse_plan(VALID_PLAN_JSON)
+        client = MagicMock()
+
+        result = ReasoningService(
+            client, "us.amazon.nova-2-lite-v1:0", rule_planner=rule_planner
+        ).generate_booking_plan(_make_request())
+
+        assert result.model_id == "rule-planner"
+        assert result.thinking_effort == "none"
+        assert result.retry_count == 0
+        client.converse.assert_not_called()
+
+    def test_declined_request_uses_model(self):
+        rule_planner = MagicMock()
+        rule_planner.plan.return_value = None
+        client = MagicMock()
+        client.converse.return_value = _mock_converse_response(VALID_PLAN_JSON)
+
+        result = ReasoningService(
+            client, "us.amazon.nova-2-lite-v1:0", rule_planner=rule_planner
+        ).generate_booking_plan(_make_request())
+
+        assert result.model_id == "us.amazon.nova-2-lite-v1:0"
+        client.converse.assert_called_once()
+
+    def test_planner_error_falls_back_to_model(self):
+        rule_planner = MagicMock()
+        rule_planner.plan.side_effect = RuntimeError("bad regex")
+        client = MagicMock()
+        client.converse.return_value = _mock_converse_response(VALID_PLAN_JSON)
+
+        result = ReasoningService(
+            client, "us.amazon.nova-2-lite-v1:0", rule_planner=rule_planner
+        ).generate_booking_plan(_make_request())
+
+        assert result.model_id == "us.amazon.nova-2-lite-v1:0"
+
+
+class TestRouting:
+    FAST_MODEL = "us.amazon.nova-micro-v1:0"
+
+    def _svc(self, client, **kwargs) -> ReasoningService:
+        router = ReasoningRouter(fast_model_id=self.FAST_MODEL)
+        return ReasoningService(client, "us.amazon.nova-2-lite-v1:0", router=router, **kwargs)
+
+    def test_fast_rung_params_have_no_reasoning_config(self):
+        params = self._svc(None)._build_converse_params("q", "ctx", "disabled")
+
+        assert params["modelId"] == self.FAST_MODEL
+        assert "additionalModelRequestFields" not in params
+        assert params["inferenceConfig"]["maxTokens"] == 4000
+
+    def test_routed_request_served_by_fast_rung(self):
+        client = MagicMock()
+        client.converse.return_value = _mock_converse_response(VALID_PLAN_JSON)
+
+        result = self._svc(client).generate_booking_plan(_make_request())
+
+        assert result.routed is True
+        assert result.thinking_effort == "disabled"
+        assert result.model_id == self.FAST_MODEL
+        assert result.escalated is False
+        client.converse.assert_called_once()
+
+    def test_invalid_fast_plan_escalates_to_thinking(self):
+        client = MagicMock()
+        client.converse.side_effect = [
+            _mock_converse_response("not json"),
+            _mock_converse_response(VALID_PLAN_JSON),
+        ]
+
+        result = self._svc(client).generate_booking_plan(_make_request())
+
+        second = client.converse.call_args_list[1].kwargs
+        assert second["modelId"] == "us.amazon.nova-2-lite-v1:0"
+        assert second["additionalModelRequestFields"]["reasoningConfig"]["maxReasoningEffort"] == "medium"
+        assert result.thinking_effort == "medium"
+        assert result.model_id == "us.amazon.nova-2-lite-v1:0"
+        assert result.escalated is True
+
+    def test_low_confidence_fast_plan_escalates(self):
+        unsure = json.loads(VALID_PLAN_JSON)
+        unsure["confidence"] = 0.4
+        client = MagicMock()
+        client.converse.side_effect = [
+            _mock_converse_response(json.dumps(unsure)),
+            _mock_converse_response(VALID_PLAN_JSON),
+        ]
+
+        result = self._svc(client).generate_booking_plan(_make_request())
+
+        assert [a.failure_class for a in result.attempts] == ["low_confidence", None]
+        assert result.schema_failure_count == 0
+        assert result.plan.confidence == 0.92
+
+    def test_declined_request_starts_with_thinking(self):
+        client = MagicMock()
+        client.converse.return_value = _mock_converse_response(VALID_PLAN_JSON)
+
+        result = self._svc(client).generate_booking_plan(_make_request(confidence_level="low"))
+
+        assert result.routed is False
+        assert result.thinking_effort == "medium"
+        assert client.converse.call_args.kwargs["modelId"] == "us.amazon.nova-2-lite-v1:0"
+
+    def test_fast_rung_never_hedged(self):
+        svc = self._svc(MagicMock(), hedging=True)
+        assert svc._should_hedge(["disabled", "medium", "high"]) is False
+        assert svc._should_hedge(["medium", "high", "high"]) is True
+
+    def test_route_decision_and_outcome_logged(self):
+        from structlog.testing import capture_logs
+
+        client = MagicMock()
+        client.converse.return_value = _mock_converse_response(VALID_PLAN_JSON)
+
+        with capture_logs() as logs:
+            self._svc(client).generate_booking_plan(_make_request())
+
+        events = {entry["event"]: entry for entry in logs}
+        assert events["reasoning_route"]["fast"] is True
+        assert events["reasoning_route_outcome"]["fast_won"] is True
+
+
+class TestDeadlineScheduling:
+    def test_attempt_downgraded_to_effort_that_fits(self):
+        client = MagicMock()
+        client.converse.return_value = _mock_converse_response(VALID_PLAN_JSON)
+        svc = ReasoningService(client, "us.amazon.nova-2-lite-v1:0")
+
+        # Low confidence starts at high (60s default estimate); only medium (30s) fits in 40s.
+        result = svc.generate_booking_plan(_make_request(confidence_level="none", max_similarity=0.0), 40_000)
+
+        assert result.thinking_effort == "medium"
+        effort = client.converse.call_args.kwargs["additionalModelRequestFields"]["reasoningConfig"]
+        assert effort["maxReasoningEffort"] == "medium"
+
+    def test_observed_latency_drives_the_decision(self):
+        scheduler = AttemptScheduler(min_samples=1)
+        scheduler.record("high", 12_000.0)
+        client = MagicMock()
+        client.converse.return_value = _mock_converse_response(VALID_PLAN_JSON)
+        svc = ReasoningService(client, "us.amazon.nova-2-lite-v1:0", scheduler=scheduler)
+
+        result = svc.generate_booking_plan(_make_request(confidence_level="none", max_similarity=0.0), 40_000)
+
+        assert result.thinking_effort == "high"
+
+    def test_fails_fast_when_nothing_fits(self):
+        client = MagicMock()
+        svc = ReasoningService(client, "us.amazon.nova-2-lite-v1:0", scheduler=AttemptScheduler(margin_ms=5_000))
+
+        with pytest.raises(ReasoningError, match="insufficient time remaining") as exc_info:
+            svc.generate_booking_plan(_make_request(), remaining_ms=9_000)
+
+        assert exc_info.value.code == ErrorCode.REASONING_FAILED
+        client.converse.assert_not_called()
+
+    def test_escalation_held_at_effort_that_fits(self):
+        scheduler = AttemptScheduler(min_samples=1)
+        scheduler.record("medium", 1_000.0)
+        scheduler.record("high", 100_000.0)
+        client = MagicMock()
+        client.converse.return_value = _mock_converse_response("not json")
+        svc = ReasoningService(client, "us.amazon.nova-2-lite-v1:0", scheduler=scheduler)
+
+        with pytest.raises(ReasoningError, match=r"attempt 2 \(medium\)"):
+            svc.generate_booking_plan(_make_request(), remaining_ms=60_000)
+
+        efforts = [
+            c.kwargs["additionalModelRequestFields"]["reasoningConfig"]["maxReasoningEffort"]
+            for c in client.converse.call_args_list
+        ]
+        assert efforts == ["medium", "medium", "medium"]
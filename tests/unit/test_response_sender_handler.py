@@ -4,6 +4,10 @@ import json
 from typing import Any
 from unittest.mock import MagicMock, call, patch
 
+import pytest
+
+from core.services.progress import STAGE_FINISHED, STAGE_OPTIONS
+
 
 def _make_event(msg_type: str, extra: dict | None = None) -> dict[str, Any]:
     base: dict[str, Any] = {
@@ -43,6 +47,41 @@ def test_flight_options_stores_token_and_sends(mock_config, mock_dynamo, mock_ap
     assert payload["booking_id"] == "book-1"
 
 
+@patch("handlers.response_sender.store_task_token")
+@patch("handlers.response_sender.get_apigw_client")
+@patch("handlers.response_sender.get_dynamo_client")
+@patch("handlers.response_sender.get_config")
+def test_flight_options_include_round_trip_itineraries(mock_config, mock_dynamo, mock_apigw, mock_store):
+    from handlers.response_sender import handler
+
+    mock_config.return_value = MagicMock(bookings_table="Bookings")
+    itineraries = [{"outbound": {"id": "f1"}, "inbound": {"id": "f2"}, "total_price": 250.0}]
+    event = _make_event("flight_options", {"task_token": "tok", "flights": [{"id": "f1"}], "itineraries": itineraries})
+
+    handler(event, MagicMock())
+
+    assert _sent_payload(mock_apigw)["itineraries"] == itineraries
+
+
+@patch("handlers.response_sender.get_claim_check_store")
+@patch("handlers.response_sender.store_task_token")
+@patch("handlers.response_sender.get_apigw_client")
+@patch("handlers.response_sender.get_dynamo_client")
+@patch("handlers.response_sender.get_config")
+def test_flight_options_resolve_claim_checked_flights(mock_config, mock_dynamo, mock_apigw, mock_store, mock_claims):
+    from handlers.response_sender import handler
+
+    mock_config.return_value = MagicMock(bookings_table="Bookings")
+    claim = {"claim_check": "s3://artifacts/claim-check/b-1/flights.json"}
+    mock_claims.return_value.resolve.side_effect = lambda event, fields: {**event, "flights": [{"id": "f1"}]}
+    event = _make_event("flight_options", {"task_token": "tok", "flights": claim})
+
+    handler(event, MagicMock())
+
+    mock_claims.return_value.resolve.assert_called_once_with(event, ["flights", "itineraries"])
+    assert _sent_payload(mock_apigw)["flights"] == [{"id": "f1"}]
+
+
 @patch("handlers.response_sender.get_apigw_client")
 @patch("handlers.response_sender.get_dynamo_client")
 @patch("handlers.response_sender.get_config")
@@ -124,3 +163,39 @@ def test_gone_connection_logs_warning(mock_config, mock_dynamo, mock_apigw):
 
     # Must not raise
     handler(_make_event("error", {"message": "oops"}), MagicMock())
+
+
+@pytest.mark.parametrize(
+    ("msg_type", "stage"),
+    [("flight_options", STAGE_OPTIONS), ("booking_complete", STAGE_FINISHED), ("error", STAGE_FINISHED)],
+)
+@patch("handlers.response_sender.store_task_token")
+@patch("handlers.response_sender.record_sent_stage")
+@patch("handlers.response_sender.get_apigw_client")
+@patch("handlers.response_sender.get_dynamo_client")
+@patch("handlers.response_sender.get_config")
+def test_stage_recorded_before_posting(mock_config, mock_dynamo, mock_apigw, mock_record, mock_store, msg_type, stage):
+    from handlers.response_sender import handler
+
+    mock_config.return_value = MagicMock(bookings_table="Bookings")
+    mock_record.side_effect = lambda *args: mock_apigw.return_value.post_to_connection.assert_not_called()
+
+    handler(_make_event(msg_type, {"task_token": "tok-xyz", "flights": []}), MagicMock())
+
+    mock_record.assert_called_once_with(mock_dynamo.return_value, "Bookings", "emp-1", "book-1", stage)
+    mock_apigw.return_value.post_to_connection.assert_called_once()
+
+
+@patch("handlers.response_sender.record_sent_stage")
+@patch("handlers.response_sender.get_apigw_client")
+@patch("handlers.response_sender.get_dynamo_client")
+@patch("handlers.response_sender.get_config")
+def test_stage_not_recorded_without_employee(mock_config, mock_dynamo, mock_apigw, mock_record):
+    from handlers.response_sender import handler
+
+    event = _make_event("error")
+    del event["employee_id"]
+
+    handler(event, MagicMock())
+
+    mock_record.assert_not_called()
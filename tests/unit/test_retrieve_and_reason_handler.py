@@ -0,0 +1,185 @@
+"""Unit tests for the fused RetrieveAndReason Lambda handler."""
+
+from datetime import date, timedelta
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from core.errors import ErrorCode, PolicyRetrievalError, ReasoningError
+from core.models.booking import BookingParameters, BookingPlan, PolicyConstraints, ReasoningResult
+from core.models.retrieval import ConfidenceAssessment, ConfidenceLevel, RetrievalResult
+from core.services.progress import STAGE_REASONING
+
+FUTURE = date.today() + timedelta(days=30)
+
+EVENT = {
+    "booking_id": "b-1",
+    "employee_id": "e-1",
+    "connection_id": "conn-1",
+    "user_query": "Book a flight from HYD to ORD",
+}
+
+
+def _retrieval() -> RetrievalResult:
+    return RetrievalResult(
+        chunks=[],
+        confidence=ConfidenceAssessment(level=ConfidenceLevel.HIGH, max_similarity=0.89, action="normal"),
+        context_text="[Section: Air Travel]\nEconomy only, $500 cap.",
+        total_chunks=1,
+        latency_ms=120.5,
+    )
+
+
+def _result() -> ReasoningResult:
+    return ReasoningResult(
+        booking_id="b-1",
+        employee_id="e-1",
+        plan=BookingPlan(
+            intent="flight_booking",
+            confidence=0.92,
+            parameters=BookingParameters(origin="HYD", destination="ORD", departure_date=FUTURE, cabin_class="economy"),
+            policy_constraints=PolicyConstraints(
+                max_budget_usd=500.0, preferred_vendors=["any"], advance_booking_met=True
+            ),
+            policy_sources=[],
+            reasoning_summary="Economy, $500 cap.",
+        ),
+        model_id="us.amazon.nova-2-lite-v1:0",
+        thinking_effort="medium",
+        latency_ms=1500.0,
+    )
+
+
+@pytest.fixture
+def deps():
+    with (
+        patch("handlers.retrieve_and_reason.get_config") as config,
+        patch("handlers.retrieve_and_reason.get_policy_retrieval_service") as retrieval,
+        patch("handlers.retrieve_and_reason.AuroraClient") as aurora,
+        patch("handlers.retrieve_and_reason.get_reasoning_service") as reasoning,
+        patch("handlers.retrieve_and_reason.get_progress_notifier") as progress,
+        patch("handlers.retrieve_and_reason.get_dynamo_client"),
+        patch("handlers.retrieve_and_reason.get_prefetch_searcher", return_value=None),
+        patch("handlers.retrieve_and_reason.write_audit_logs") as audit,
+        patch("handlers.retrieve_and_reason.time.sleep") as sleep,
+    ):
+        config.return_value = MagicMock(audit_log_table="AuditLog", policy_rules_enabled=False)
+        retrieval.return_value.retrieve.return_value = _retrieval()
+        aurora.return_value.__enter__ = MagicMock(return_value=MagicMock())
+        aurora.return_value.__exit__ = MagicMock(return_value=False)
+        reasoning.return_value.generate_booking_plan.return_value = _result()
+        yield MagicMock(
+            retrieval=retrieval.return_value,
+            reasoning=reasoning.return_value,
+            progress=progress,
+            audit=audit,
+            sleep=sleep,
+        )
+
+
+def _context() -> MagicMock:
+    context = MagicMock()
+    context.get_remaining_time_in_millis.return_value = 300_000
+    return context
+
+
+def test_retrieval_feeds_reasoning_in_one_invocation(deps):
+    from handlers.retrieve_and_reason import handler
+
+    handler(EVENT, _context())
+
+    request = deps.reasoning.generate_booking_plan.call_args[0][0]
+    assert request.context_text == "[Section: Air Travel]\nEconomy only, $500 cap."
+    assert request.confidence_level == "high"
+    assert request.max_similarity == 0.89
+    assert request.connection_id == "conn-1"
+
+
+def test_output_matches_split_path_state_without_context_text(deps):
+    from handlers.retrieve_and_reason import handler
+
+    output = handler(EVENT, _context())
+
+    assert "context_text" not in output
+    assert output["user_query"] == EVENT["user_query"]
+    assert output["confidence"]["level"] == "high"
+    assert output["policy_rules"] == []
+    assert output["reasoning_result"]["plan"]["parameters"]["departure_date"] == FUTURE.isoformat()
+
+
+def test_progress_sent_through_notifier(deps):
+    from handlers.retrieve_and_reason import ANALYZING_MESSAGE, handler
+
+    handler(EVENT, _context())
+
+    deps.progress.assert_called_once_with("conn-1", EVENT["booking_id"], EVENT["employee_id"], STAGE_REASONING)
+    deps.progress.return_value.assert_called_once_with(ANALYZING_MESSAGE)
+    assert deps.reasoning.generate_booking_plan.call_args[1]["progress"] is deps.progress.return_value
+
+
+def test_both_audit_records_written_in_one_batch(deps):
+    from handlers.retrieve_and_reason import handler
+
+    handler(EVENT, _context())
+
+    deps.audit.assert_called_once()
+    entries = deps.audit.call_args[0][2]
+    assert [e["event"] for e in entries] == ["policy_retrieval", "reasoning_plan"]
+
+
+def test_reasoning_failure_still_audits_retrieval(deps):
+    from handlers.retrieve_and_reason import handler
+
+    deps.reasoning.generate_booking_plan.side_effect = ReasoningError("failed", code=ErrorCode.REASONING_FAILED)
+
+    with pytest.raises(ReasoningError):
+        handler(EVENT, _context())
+
+    entries = deps.audit.call_args[0][2]
+    assert [e["event"] for e in entries] == ["policy_retrieval"]
+    assert deps.reasoning.generate_booking_plan.call_count == 3
+
+
+def test_reasoning_retried_without_repeating_retrieval(deps):
+    from handlers.retrieve_and_reason import handler
+
+    deps.reasoning.generate_booking_plan.side_effect = [
+        ReasoningError("failed", code=ErrorCode.REASONING_FAILED),
+        _result(),
+    ]
+
+    output = handler(EVENT, _context())
+
+    assert output["reasoning_result"]["booking_id"] == "b-1"
+    deps.retrieval.retrieve.assert_called_once()
+    deps.sleep.assert_called_once_with(2.0)
+    deps.audit.assert_called_once()
+    entries = deps.audit.call_args[0][2]
+    assert [e["event"] for e in entries] == ["policy_retrieval", "reasoning_plan"]
+
+
+def test_transient_retrieval_failure_retried(deps):
+    from handlers.retrieve_and_reason import handler
+
+    deps.retrieval.retrieve.side_effect = [
+        PolicyRetrievalError("connection reset", code=ErrorCode.RETRIEVAL_FAILED),
+        _retrieval(),
+    ]
+
+    output = handler(EVENT, _context())
+
+    assert output["confidence"]["level"] == "high"
+    assert deps.retrieval.retrieve.call_count == 2
+    deps.sleep.assert_called_once_with(2.0)
+
+
+def test_retrieval_failure_raised_after_retries(deps):
+    from handlers.retrieve_and_reason import handler
+
+    deps.retrieval.retrieve.side_effect = PolicyRetrievalError("connection reset", code=ErrorCode.RETRIEVAL_FAILED)
+
+    with pytest.raises(PolicyRetrievalError):
+        handler(EVENT, _context())
+
+    assert deps.retrieval.retrieve.call_count == 3
+    deps.reasoning.generate_booking_plan.assert_not_called()
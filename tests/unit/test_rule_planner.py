@@ -0,0 +1,233 @@
+"""Unit tests for the rule-based planner — pure parsing, no AWS calls."""
+
+from datetime import date
+from typing import Any
+
+import pytest
+
+from core.models.booking import ReasoningRequest
+from core.models.retrieval import PolicyRule
+from core.services.rule_planner import (
+    RulePlanner,
+    extract_policy_sources,
+    parse_cabin_class,
+    parse_departure_date,
+    resolve_route,
+)
+
+TODAY = date(2026, 10, 19)  # a Monday
+
+POLICY = (
+    "[Section: Air Travel | Page: 3 | Type: text | Similarity: 0.88]\n"
+    "Business class is permitted for flights over 8 hours.\n"
+    "---\n"
+    "[Section: Flight Budget Caps | Page: 4 | Type: table | Similarity: 0.85]\n"
+    "| Route Category | Economy Cap |\n"
+    "|---|---|\n"
+    "| US–India (e.g. ORD–HYD, JFK–DEL) | $500 |\n"
+    "---\n"
+    "[Section: Vendors | Page: 5 | Type: text | Similarity: 0.81]\n"
+    "Preferred airlines: Delta, United and IndiGo. Book at least 14 days in advance."
+)
+
+
+def _request(**overrides: Any) -> ReasoningRequest:
+    base = {
+        "booking_id": "b-1",
+        "employee_id": "e-1",
+        "user_query": "Book a flight from HYD to ORD on November 20",
+        "context_text": POLICY,
+        "confidence_level": "high",
+        "max_similarity": 0.88,
+    }
+    base.update(overrides)
+    return ReasoningRequest(**base)
+
+
+# ── resolve_route ────────────────────────────────────────────────────────────
+
+
+@pytest.mark.parametrize(
+    ("query", "expected"),
+    [
+        ("Book a flight from HYD to ORD", ("HYD", "ORD", 1.0)),
+        ("Fly to Mumbai from Delhi", ("DEL", "BOM", 0.95)),
+        ("new delhi to bengaluru please", ("DEL", "BLR", 0.95)),
+        ("From Delhi (DEL) to BOM", ("DEL", "BOM", 1.0)),
+        ("HYD to XYZ", ("HYD", "XYZ", 0.6)),
+    ],
+)
+def test_resolve_route(query, expected):
+    assert resolve_route(query) == expected
+
+
+@pytest.mark.parametrize("query", ["Book a flight to ORD", "HYD to DEL then on to BOM", "fly to the sea"])
+def test_resolve_route_requires_exactly_two_airports(query):
+    assert resolve_route(query) == (None, None, 0.0)
+
+
+# ── parse_cabin_class ────────────────────────────────────────────────────────
+
+
+@pytest.mark.parametrize(
+    ("query", "expected"),
+    [
+        ("economy seat HYD to ORD", "economy"),
+        ("premium economy please", "premium_economy"),
+        ("business class to London", "business"),
+        ("a business trip to London", ""),
+        ("first class, or economy if not allowed", None),
+    ],
+)
+def test_parse_cabin_class(query, expected):
+    assert parse_cabin_class(query) == expected
+
+
+# ── parse_departure_date ─────────────────────────────────────────────────────
+
+
+@pytest.mark.parametrize(
+    ("query", "expected"),
+    [
+        ("on 2026-12-01", (date(2026, 12, 1), 1.0)),
+        ("on November 20", (date(2026, 11, 20), 1.0)),
+        ("on the 5th of March", (date(2027, 3, 5), 1.0)),
+        ("tomorrow morning", (date(2026, 10, 20), 1.0)),
+        ("in 2 weeks", (date(2026, 11, 2), 1.0)),
+        ("on Friday", (date(2026, 10, 23), 1.0)),
+        ("next Monday", (date(2026, 10, 26), 0.8)),
+        ("Friday, October 23", (date(2026, 10, 23), 1.0)),
+    ],
+)
+def test_parse_departure_date(query, expected):
+    assert parse_departure_date(query, TODAY) == expected
+
+
+@pytest.mark.parametrize("query", ["sometime soon", "tomorrow or Friday", "on 2026-01-05", "on 2026-02-30"])
+def test_parse_departure_date_rejects_missing_ambiguous_or_past(query):
+    assert parse_departure_date(query, TODAY) == (None, 0.0)
+
+
+# ── policy sources ────────────────────────────────────────────────────────
+
+
+def test_extract_policy_sources():
+    sources = extract_policy_sources(POLICY)
+    assert [(s.section_title, s.page, s.similarity_score) for s in sources] == [
+        ("Air Travel", 3, 0.88),
+        ("Flight Budget Caps", 4, 0.85),
+        ("Vendors", 5, 0.81),
+    ]
+
+
+# ── RulePlanner ──────────────────────────────────────────────────────────────
+
+
+def test_plans_routine_one_way_request():
+    plan = RulePlanner().plan(_request(), TODAY)
+
+    assert plan is not None
+    assert plan.intent == "flight_booking"
+    assert plan.confidence == 0.95  # cabin not stated — economy assumed
+    assert plan.parameters.origin == "HYD"
+    assert plan.parameters.destination == "ORD"
+    assert plan.parameters.departure_date == date(2026, 11, 20)
+    assert plan.parameters.cabin_class == "economy"
+    assert plan.policy_constraints.max_budget_usd == 500.0
+    assert plan.policy_constraints.preferred_vendors == ["Delta", "United", "IndiGo"]
+    assert plan.policy_constraints.advance_booking_met is True
+    assert plan.policy_constraints.requires_approval is False
+    assert len(plan.policy_sources) == 3
+
+
+@pytest.mark.parametrize(
+    ("phrase", "expected"),
+    [
+        ("morning", "morning"),
+        ("Evening", "evening"),
+        ("night", "red_eye"),
+        ("red-eye", "red_eye"),
+        ("red eye", "red_eye"),
+        ("redeye", "red_eye"),
+    ],
+)
+def test_time_preference_uses_schema_values(phrase, expected):
+    plan = RulePlanner().plan(_request(user_query=f"Book a {phrase} flight from HYD to ORD on November 20"), TODAY)
+
+    assert plan is not None
+    assert plan.parameters.time_preference == expected
+
+
+def test_flags_approval_when_advance_booking_not_met():
+    plan = RulePlanner().plan(_request(user_query="Economy flight HYD to ORD tomorrow, 2 passengers"), TODAY)
+
+    assert plan is not None
+    assert plan.parameters.passenger_count == 2
+    assert plan.policy_constraints.advance_booking_met is False
+    assert plan.policy_constraints.requires_approval is True
+    assert "14" in plan.policy_constraints.approval_reason
+
+
+@pytest.mark.parametrize(
+    "overrides",
+    [
+        {"confidence_level": "low"},
+        {"user_query": "Can I book business class from HYD to ORD on November 20?"},
+        {"user_query": "Round trip HYD to ORD on November 20"},
+        {"user_query": "HYD to ORD next Friday"},
+        {"user_query": "Business class HYD to ORD on November 20"},
+        {"user_query": "Book a flight from HYD to ORD"},
+        {"context_text": "Employees should fly economy."},
+        {"context_text": "Economy fares are capped at $500 per trip."},
+        {"context_text": POLICY + "\nWhen an employee's level cap is lower than the route cap, the lower cap applies."},
+    ],
+)
+def test_declines_requests_the_rules_cannot_settle(overrides):
+    assert RulePlanner().plan(_request(**overrides), TODAY) is None
+
+
+def test_min_confidence_is_configurable():
+    request = _request(user_query="HYD to ORD next Friday")
+    assert RulePlanner(min_confidence=0.75).plan(request, TODAY) is not None
+
+
+def test_prefers_structured_rules_over_excerpts():
+    rules = [
+        PolicyRule(rule_type="budget_cap", cabin_class="economy", value_numeric=450.0, value_text="HYD-ORD"),
+        PolicyRule(rule_type="preferred_vendor", value_text="Vistara"),
+    ]
+    plan = RulePlanner().plan(_request(policy_rules=rules), TODAY)
+
+    assert plan is not None
+    assert plan.policy_constraints.max_budget_usd == 450.0
+    assert plan.policy_constraints.preferred_vendors == ["Vistara"]
+    assert plan.policy_constraints.advance_booking_days_required is None
+
+
+def test_falls_back_to_any_vendor_without_vendor_rule():
+    rules = [PolicyRule(rule_type="budget_cap", value_numeric=450.0, value_text="HYD-ORD")]
+    plan = RulePlanner().plan(_request(policy_rules=rules), TODAY)
+
+    assert plan is not None
+    assert plan.policy_constraints.preferred_vendors == ["any"]
+
+
+def test_declines_cabin_the_rules_do_not_permit():
+    rules = [
+        PolicyRule(rule_type="budget_cap", value_numeric=450.0, value_text="HYD-ORD"),
+        PolicyRule(rule_type="cabin_eligibility", cabin_class="business"),
+    ]
+    assert RulePlanner().plan(_request(policy_rules=rules), TODAY) is None
+
+
+def test_declines_cabin_tied_to_employee_level():
+    rules = [
+        PolicyRule(rule_type="budget_cap", value_numeric=450.0, value_text="HYD-ORD"),
+        PolicyRule(rule_type="cabin_eligibility", cabin_class="economy", value_text="Economy with L1 approval."),
+    ]
+    assert RulePlanner().plan(_request(policy_rules=rules), TODAY) is None
+
+
+def test_declines_cap_not_tied_to_route():
+    rules = [PolicyRule(rule_type="budget_cap", cabin_class="economy", value_numeric=100.0, value_text="DEL-BOM")]
+    assert RulePlanner().plan(_request(policy_rules=rules), TODAY) is None
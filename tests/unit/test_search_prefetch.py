@@ -0,0 +1,97 @@
+"""Unit tests for the speculative flight search started alongside reasoning."""
+
+import threading
+import time
+from datetime import date, timedelta
+from unittest.mock import MagicMock
+
+from core.models.booking import BookingParameters, BookingPlan, PolicyConstraints
+from core.services.search_prefetch import start_search_prefetch
+
+TODAY = date.today()
+DAY = TODAY + timedelta(days=12)
+QUERY = f"Fly me from Delhi to BOM on {DAY.isoformat()}"
+
+
+def _plan(destination: str = "BOM", cabin: str = "economy") -> BookingPlan:
+    return BookingPlan(
+        intent="flight_booking",
+        confidence=0.9,
+        parameters=BookingParameters(origin="DEL", destination=destination, departure_date=DAY, cabin_class=cabin),
+        policy_constraints=PolicyConstraints(max_budget_usd=400.0, preferred_vendors=["any"], advance_booking_met=True),
+        policy_sources=[],
+        reasoning_summary="",
+    )
+
+
+class TestStartSearchPrefetch:
+    def test_searches_parsed_route_date_and_cabin(self):
+        searcher = MagicMock()
+
+        prefetch = start_search_prefetch(searcher, QUERY + " in business class", TODAY)
+
+        assert prefetch is not None
+        assert prefetch.finish(_plan(cabin="business"), 2.0) is True
+        searcher.search_flights.assert_called_once_with("DEL", "BOM", DAY.isoformat(), "business")
+
+    def test_economy_assumed_without_cabin(self):
+        searcher = MagicMock()
+
+        prefetch = start_search_prefetch(searcher, QUERY, TODAY)
+
+        assert prefetch is not None
+        assert prefetch.cabin_class == "economy"
+
+    def test_nothing_started_without_explicit_date(self):
+        searcher = MagicMock()
+
+        assert start_search_prefetch(searcher, "Fly me from Delhi to BOM", TODAY) is None
+        searcher.search_flights.assert_not_called()
+
+    def test_nothing_started_for_ambiguous_cabin(self):
+        query = QUERY + " in business class or economy"
+        assert start_search_prefetch(MagicMock(), query, TODAY) is None
+
+
+class TestFinish:
+    def test_plan_with_other_route_does_not_match(self):
+        prefetch = start_search_prefetch(MagicMock(), QUERY, TODAY)
+
+        assert prefetch is not None
+        assert prefetch.finish(_plan(destination="GOI"), 2.0) is False
+
+    def test_mismatched_plan_does_not_wait(self):
+        release = threading.Event()
+        searcher = MagicMock()
+        searcher.search_flights.side_effect = lambda *a: release.wait(5)
+
+        try:
+            prefetch = start_search_prefetch(searcher, QUERY, TODAY)
+            assert prefetch is not None
+            started = time.monotonic()
+            assert prefetch.finish(_plan(destination="GOI"), 5.0) is False
+            assert time.monotonic() - started < 1.0
+        finally:
+            release.set()
+
+    def test_failed_search_is_swallowed(self):
+        searcher = MagicMock()
+        searcher.search_flights.side_effect = RuntimeError("portal down")
+
+        prefetch = start_search_prefetch(searcher, QUERY, TODAY)
+
+        assert prefetch is not None
+        assert prefetch.finish(_plan(), 2.0) is False
+        assert prefetch.error == "portal down"
+
+    def test_wait_is_bounded(self):
+        release = threading.Event()
+        searcher = MagicMock()
+        searcher.search_flights.side_effect = lambda *a: release.wait(2)
+
+        try:
+            prefetch = start_search_prefetch(searcher, QUERY, TODAY)
+            assert prefetch is not None
+            assert prefetch.finish(_plan(), 0.05) is False
+        finally:
+            release.set()
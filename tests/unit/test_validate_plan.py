@@ -14,6 +14,7 @@ from core.models.booking import (
     PolicySource,
     ReasoningResult,
 )
+from core.models.retrieval import PolicyRule
 from core.services.plan_validation import validate_plan
 
 FUTURE = date.today() + timedelta(days=30)
@@ -123,6 +124,73 @@ class TestValidatePlan:
         assert validated.plan.warnings == []
 
 
+class TestPolicyRuleChecks:
+    def test_budget_above_cap_warns_without_changing_plan(self):
+        rules = [PolicyRule(rule_type="budget_cap", cabin_class="economy", value_numeric=400.0)]
+        validated = validate_plan(_make_result(), rules)
+
+        assert validated.plan.policy_constraints.max_budget_usd == 500.0
+        assert "BUDGET_ABOVE_POLICY_CAP: 400" in validated.plan.warnings
+
+    def test_budget_checked_against_route_cap(self):
+        rules = [
+            PolicyRule(rule_type="budget_cap", cabin_class="economy", value_numeric=300.0, value_text="DEL-BOM"),
+            PolicyRule(rule_type="budget_cap", cabin_class="economy", value_numeric=800.0, value_text="ORD-HYD"),
+        ]
+        validated = validate_plan(_make_result(), rules)
+
+        assert validated.plan.warnings == []
+
+    def test_budget_within_cap_unchanged(self):
+        rules = [PolicyRule(rule_type="budget_cap", value_numeric=800.0)]
+        validated = validate_plan(_make_result(), rules)
+
+        assert validated.plan.policy_constraints.max_budget_usd == 500.0
+        assert validated.plan.warnings == []
+
+    def test_shorter_advance_window_warns(self):
+        rules = [PolicyRule(rule_type="advance_booking", value_numeric=45.0)]
+        validated = validate_plan(_make_result(), rules)
+
+        constraints = validated.plan.policy_constraints
+        assert constraints.advance_booking_days_required == 14
+        assert constraints.advance_booking_met is True
+        assert "ADVANCE_WINDOW_BELOW_POLICY: 45 days" in validated.plan.warnings
+
+    def test_cabin_not_permitted_warns(self):
+        rules = [PolicyRule(rule_type="cabin_eligibility", cabin_class="economy")]
+        result = _make_result(
+            parameters=BookingParameters(origin="HYD", destination="ORD", departure_date=FUTURE, cabin_class="business")
+        )
+        validated = validate_plan(result, rules)
+
+        assert validated.plan.policy_constraints.requires_approval is False
+        assert "CABIN_NOT_PERMITTED: business" in validated.plan.warnings
+
+    def test_conditional_cabin_left_to_reasoning(self):
+        rules = [
+            PolicyRule(rule_type="cabin_eligibility", cabin_class="economy"),
+            PolicyRule(rule_type="cabin_eligibility", cabin_class="business", value_text="flights over 8 hours"),
+        ]
+        result = _make_result(
+            parameters=BookingParameters(origin="HYD", destination="ORD", departure_date=FUTURE, cabin_class="business")
+        )
+        validated = validate_plan(result, rules)
+
+        assert validated.plan.warnings == []
+
+    def test_policy_vendors_do_not_replace_plan_vendors(self):
+        result = _make_result(
+            policy_constraints=PolicyConstraints(
+                max_budget_usd=500.0, preferred_vendors=["any"], advance_booking_met=True
+            )
+        )
+        rules = [PolicyRule(rule_type="preferred_vendor", value_text="Delta")]
+        validated = validate_plan(result, rules)
+
+        assert validated.plan.policy_constraints.preferred_vendors == ["any"]
+
+
 # ── Handler tests ───────────────────────────────────────────────────────────
 
 
@@ -138,3 +206,17 @@ def test_handler_returns_validated_result(mock_validate):
     mock_validate.assert_called_once()
     assert output["booking_id"] == "b-1"
     assert output["plan"]["intent"] == "flight_booking"
+
+
+@patch("handlers.validate_plan.validate_plan")
+def test_handler_passes_policy_rules(mock_validate):
+    from handlers.validate_plan import handler
+
+    result = _make_result()
+    mock_validate.return_value = result
+    event = result.model_dump(mode="json") | {"policy_rules": [{"rule_type": "budget_cap", "value_numeric": 400.0}]}
+
+    handler(event, None)
+
+    rules = mock_validate.call_args[0][1]
+    assert rules == [PolicyRule(rule_type="budget_cap", value_numeric=400.0)]
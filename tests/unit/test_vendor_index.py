@@ -0,0 +1,78 @@
+"""Unit tests for the shared airline vendor index and both preferred-vendor filter paths."""
+
+import pytest
+
+from core.models.booking import PolicyConstraints
+from core.models.flight import FlightOption, FlightSearchResult
+from core.services.flight_search import filter_by_constraints
+from core.services.flight_search_api import _apply_policy_filters
+from core.services.vendor_index import VENDOR_INDEX, allowed_carriers, is_allowed_carrier, normalize_vendor
+
+
+def _f(airline: str, number: str = "XX-1", price: float = 100.0) -> FlightOption:
+    return FlightOption(
+        airline=airline,
+        flight_number=number,
+        price=price,
+        departure_time="08:00",
+        arrival_time="10:00",
+        stops=0,
+        cabin_class="economy",
+    )
+
+
+class TestVendorIndex:
+    def test_normalize(self):
+        assert normalize_vendor("  Air-India   Ltd. ") == "air india ltd"
+
+    @pytest.mark.parametrize("name", ["IndiGo", "indigo", "6E", "InterGlobe Aviation", " INDIGO AIRLINES "])
+    def test_aliases_resolve_to_canonical(self, name):
+        assert VENDOR_INDEX.resolve(name) == "IndiGo"
+
+    def test_air_india_express_is_distinct(self):
+        assert VENDOR_INDEX.resolve("Air India Express") == "Air India Express"
+        assert VENDOR_INDEX.resolve("AI") == "Air India"
+
+    def test_unknown_name_resolves_to_normalized_form(self):
+        assert VENDOR_INDEX.resolve("Blue Dart Air") == "blue dart air"
+
+    def test_flight_number_prefix_used_for_unknown_airline_name(self):
+        assert VENDOR_INDEX.resolve_flight("Tata SIA", "UK-955") == "Vistara"
+        assert VENDOR_INDEX.resolve_flight("Unknown Carrier", "ZZ 12") == "unknown carrier"
+
+    @pytest.mark.parametrize("vendors", [["any"], ["Any"], ["all"], [], None])
+    def test_wildcards_allow_any_carrier(self, vendors):
+        assert allowed_carriers(vendors) is None
+        assert is_allowed_carrier(None, "Anything")
+
+    def test_allowed_set(self):
+        assert allowed_carriers(["6E", "Delta"]) == frozenset({"IndiGo", "Delta Air Lines"})
+
+
+class TestFilterPathsAgree:
+    FLIGHTS = [_f("IndiGo", "6E-1"), _f("Air India", "AI-2"), _f("Air India Express", "IX-3"), _f("Delta Air Lines")]
+
+    @pytest.mark.parametrize(
+        ("vendors", "expected"),
+        [
+            (["indigo airlines"], {"6E-1"}),
+            (["Air India"], {"AI-2"}),
+            (["IX", "Delta"], {"IX-3", "XX-1"}),
+            (["any"], {"6E-1", "AI-2", "IX-3", "XX-1"}),
+        ],
+    )
+    def test_same_flights_allowed(self, vendors, expected):
+        constraints = PolicyConstraints(max_budget_usd=500.0, preferred_vendors=vendors, advance_booking_met=True)
+        search_result = FlightSearchResult(
+            flights=self.FLIGHTS,
+            search_origin="DEL",
+            search_destination="BOM",
+            search_date="2026-11-01",
+            total_results=4,
+        )
+
+        filtered, _ = filter_by_constraints(search_result, constraints)
+        tagged = _apply_policy_filters(self.FLIGHTS, constraints.model_dump())
+
+        assert {f.flight_number for f in filtered.flights} == expected
+        assert {f.flight_number for f in tagged if f.compliant} == expected